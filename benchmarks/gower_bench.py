@@ -0,0 +1,71 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import numpy as np
+import pandas as pd
+
+from deepchecks.utils.gower_distance import calculate_nearest_neighbors_distances
+
+NUM_QUERY_SAMPLES = 1_000
+NUM_NEIGHBORS = 50
+
+
+def generate_data(num_samples: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame({f'numeric_{i}': rng.normal(size=num_samples) for i in range(6)})
+    for i in range(4):
+        data[f'cat_{i}'] = rng.choice(['a', 'b', 'c', 'd', None], size=num_samples)
+    data.loc[rng.random(num_samples) < 0.05, 'numeric_0'] = np.nan
+    return data
+
+
+class BenchmarkGowerNearestNeighbors:
+    """Scaling of the nearest neighbors search over the number of reference samples.
+
+    A full search over N samples is quadratic, so the search is done for a fixed number of query samples, against
+    a growing number of reference samples.
+    """
+
+    params = ([100_000, 300_000, 1_000_000], [1, -1])
+    param_names = ['num_samples', 'n_jobs']
+    timeout = 600
+
+    def setup(self, num_samples, n_jobs):
+        self.data = generate_data(num_samples)
+        self.cat_cols = [c for c in self.data.columns if c.startswith('cat')]
+        self.numeric_cols = [c for c in self.data.columns if c.startswith('numeric')]
+        self.query = self.data.iloc[:NUM_QUERY_SAMPLES]
+
+    def _run(self, n_jobs):
+        calculate_nearest_neighbors_distances(self.data, self.cat_cols, self.numeric_cols, NUM_NEIGHBORS,
+                                              samples_to_calc_neighbors_for=self.query, n_jobs=n_jobs)
+
+    def time_nearest_neighbors(self, num_samples, n_jobs):
+        self._run(n_jobs)
+
+    def peakmem_nearest_neighbors(self, num_samples, n_jobs):
+        self._run(n_jobs)
+
+
+class BenchmarkGowerAllNearestNeighbors:
+    """Nearest neighbors of all the samples, as calculated by the OutlierSampleDetection check."""
+
+    params = ([1_000, 5_000, 10_000], [1, -1])
+    param_names = ['num_samples', 'n_jobs']
+    timeout = 600
+
+    def setup(self, num_samples, n_jobs):
+        self.data = generate_data(num_samples)
+        self.cat_cols = [c for c in self.data.columns if c.startswith('cat')]
+        self.numeric_cols = [c for c in self.data.columns if c.startswith('numeric')]
+
+    def time_all_nearest_neighbors(self, num_samples, n_jobs):
+        calculate_nearest_neighbors_distances(self.data, self.cat_cols, self.numeric_cols,
+                                              max(5, num_samples // 100), n_jobs=n_jobs)
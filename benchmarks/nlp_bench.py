@@ -0,0 +1,90 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import inspect
+from typing import Callable
+
+from deepchecks.core import DatasetKind
+from deepchecks.core.errors import DeepchecksBaseError
+from deepchecks.nlp import Context, SingleDatasetCheck, checks
+from deepchecks.nlp.datasets.classification import tweet_emotion
+from deepchecks.nlp.utils.text_properties import calculate_builtin_properties
+
+# Properties which are not long running (transformer models or POS tagging). Calculating them still loads the fasttext
+# language detection model and uses nltk data (punkt, cmudict), which are downloaded once by setup_cache, so the
+# benchmarks time the calculation and not the downloads.
+PROPERTIES = ['Text Length', 'Average Word Length', 'Max Word Length', '% Special Characters', '% Punctuation',
+              'Sentiment', 'Subjectivity', 'Average Words Per Sentence', 'Reading Ease', 'Lexical Density',
+              'URLs Count', 'Email Addresses Count', 'Reading Time', 'Sentences Count', 'Average Syllable Length']
+
+
+def run_check_fn(check_class) -> Callable:
+    def run(self, cache, dataset_name):
+        context = cache[dataset_name]
+        check = check_class()
+        try:
+            if isinstance(check, SingleDatasetCheck):
+                check.run_logic(context, DatasetKind.TRAIN)
+            else:
+                check.run_logic(context)
+        except DeepchecksBaseError:
+            pass
+    return run
+
+
+def setup_tweet_emotion() -> Context:
+    train, test = tweet_emotion.load_data(include_properties=True, include_embeddings=True)
+    train_proba, test_proba = tweet_emotion.load_precalculated_predictions(pred_format='probabilities')
+    train_preds, test_preds = tweet_emotion.load_precalculated_predictions(pred_format='predictions')
+    return Context(train, test, train_pred=train_preds, test_pred=test_preds,
+                   train_proba=train_proba, test_proba=test_proba)
+
+
+class BenchmarkNLP:
+    timeout = 300
+    params = ['tweet_emotion']
+    param_names = ['dataset_name']
+
+    def setup_cache(self):
+        cache = {}
+        cache['tweet_emotion'] = setup_tweet_emotion()
+        return cache
+
+
+for name, check_class in inspect.getmembers(checks):
+    if inspect.isclass(check_class):
+        run_fn = run_check_fn(check_class)
+        setattr(BenchmarkNLP, f'time_{name}', run_fn)
+        setattr(BenchmarkNLP, f'peakmem_{name}', run_fn)
+
+
+class BenchmarkNLPProperties:
+    """Calculation of each of the built-in text properties over a growing number of texts."""
+
+    params = (PROPERTIES, [1_000, 10_000])
+    param_names = ['property_name', 'num_samples']
+    timeout = 600
+
+    def setup_cache(self):
+        texts = tweet_emotion.load_data(data_format='DataFrame', as_train_test=False)['text'].tolist()
+        # downloading the models and data used by the properties in advance
+        calculate_builtin_properties(texts[:10], include_properties=PROPERTIES)
+        return texts
+
+    def _run(self, texts, property_name, num_samples):
+        # repeating the texts to reach the required number of samples
+        texts = (texts * (num_samples // len(texts) + 1))[:num_samples]
+        calculate_builtin_properties(texts, include_properties=[property_name])
+
+    def time_calculate_property(self, texts, property_name, num_samples):
+        self._run(texts, property_name, num_samples)
+
+    def peakmem_calculate_property(self, texts, property_name, num_samples):
+        self._run(texts, property_name, num_samples)
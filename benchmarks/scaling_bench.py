@@ -0,0 +1,82 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import numpy as np
+import pandas as pd
+
+from deepchecks.tabular import Dataset
+from deepchecks.tabular import suites as tabular_suites
+
+SUITES = ['data_integrity', 'train_test_validation']
+DEFAULT_NUM_COLUMNS = 20
+DEFAULT_NUM_SAMPLES = 10_000
+
+
+def generate_data(num_samples: int, num_columns: int, seed: int = 42, shift: float = 0) -> pd.DataFrame:
+    """Generate data of half numerical and half categorical columns, with a binary label and some nulls."""
+    rng = np.random.default_rng(seed)
+    num_numeric = num_columns - num_columns // 2
+    data = pd.DataFrame(rng.normal(loc=shift, size=(num_samples, num_numeric)),
+                        columns=[f'numeric_{i}' for i in range(num_numeric)])
+    for i in range(num_columns // 2):
+        data[f'cat_{i}'] = rng.choice(['a', 'b', 'c', 'd', 'e', None], size=num_samples)
+    data.loc[rng.random(num_samples) < 0.05, 'numeric_0'] = np.nan
+    data['label'] = (data['numeric_0'].fillna(0) + rng.normal(size=num_samples) > shift).astype(int)
+    return data
+
+
+def create_datasets(num_samples: int, num_columns: int):
+    cat_features = [f'cat_{i}' for i in range(num_columns // 2)]
+    train = Dataset(generate_data(num_samples, num_columns), label='label', cat_features=cat_features)
+    test = Dataset(generate_data(num_samples, num_columns, seed=0, shift=0.1), label='label',
+                   cat_features=cat_features)
+    return train, test
+
+
+def run_suite(suite_name: str, train: Dataset, test: Dataset):
+    suite = getattr(tabular_suites, suite_name)()
+    if suite_name == 'data_integrity':
+        suite.run(train, with_display=False)
+    else:
+        suite.run(train, test, with_display=False)
+
+
+class BenchmarkRowsScaling:
+    """Scaling of the default suites over the number of samples, with a fixed number of columns."""
+
+    params = ([10_000, 100_000, 1_000_000], SUITES)
+    param_names = ['num_samples', 'suite_name']
+    timeout = 1800
+
+    def setup(self, num_samples, suite_name):
+        self.train, self.test = create_datasets(num_samples, DEFAULT_NUM_COLUMNS)
+
+    def time_suite(self, num_samples, suite_name):
+        run_suite(suite_name, self.train, self.test)
+
+    def peakmem_suite(self, num_samples, suite_name):
+        run_suite(suite_name, self.train, self.test)
+
+
+class BenchmarkColumnsScaling:
+    """Scaling of the default suites over the number of columns, with a fixed number of samples."""
+
+    params = ([10, 50, 200], SUITES)
+    param_names = ['num_columns', 'suite_name']
+    timeout = 1800
+
+    def setup(self, num_columns, suite_name):
+        self.train, self.test = create_datasets(DEFAULT_NUM_SAMPLES, num_columns)
+
+    def time_suite(self, num_columns, suite_name):
+        run_suite(suite_name, self.train, self.test)
+
+    def peakmem_suite(self, num_columns, suite_name):
+        run_suite(suite_name, self.train, self.test)
@@ -0,0 +1,70 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+from deepchecks.nlp import suites as nlp_suites
+from deepchecks.nlp.datasets.classification import tweet_emotion
+from deepchecks.tabular import suites as tabular_suites
+from deepchecks.tabular.datasets.classification import lending_club
+
+
+class BenchmarkTabularSuites:
+    """End to end runs of the tabular default suites, including the context creation and the display."""
+
+    params = ['full_suite', 'data_integrity', 'train_test_validation']
+    param_names = ['suite_name']
+    timeout = 1200
+
+    def setup_cache(self):
+        train, test = lending_club.load_data()
+        model = lending_club.load_fitted_model()
+        return train, test, model
+
+    def _run(self, cache, suite_name):
+        train, test, model = cache
+        suite = getattr(tabular_suites, suite_name)()
+        if suite_name == 'data_integrity':
+            suite.run(train)
+        else:
+            suite.run(train, test, model)
+
+    def time_suite(self, cache, suite_name):
+        self._run(cache, suite_name)
+
+    def peakmem_suite(self, cache, suite_name):
+        self._run(cache, suite_name)
+
+
+class BenchmarkNLPSuites:
+    """End to end runs of the NLP default suites, on data with precalculated properties and predictions."""
+
+    params = ['full_suite', 'data_integrity', 'train_test_validation']
+    param_names = ['suite_name']
+    timeout = 1200
+
+    def setup_cache(self):
+        train, test = tweet_emotion.load_data(include_properties=True, include_embeddings=True)
+        train_preds, test_preds = tweet_emotion.load_precalculated_predictions(pred_format='predictions')
+        train_proba, test_proba = tweet_emotion.load_precalculated_predictions(pred_format='probabilities')
+        return train, test, train_preds, test_preds, train_proba, test_proba
+
+    def _run(self, cache, suite_name):
+        train, test, train_preds, test_preds, train_proba, test_proba = cache
+        suite = getattr(nlp_suites, suite_name)()
+        if suite_name == 'data_integrity':
+            suite.run(train)
+        else:
+            suite.run(train, test, train_predictions=train_preds, test_predictions=test_preds,
+                      train_probabilities=train_proba, test_probabilities=test_proba)
+
+    def time_suite(self, cache, suite_name):
+        self._run(cache, suite_name)
+
+    def peakmem_suite(self, cache, suite_name):
+        self._run(cache, suite_name)
@@ -10,12 +10,17 @@
 #
 from typing import Callable
 
+import numpy as np
 import torch
 
 from deepchecks.core.errors import DeepchecksBaseError
 from deepchecks.vision import SingleDatasetCheck, TrainTestCheck
 from deepchecks.vision.datasets.classification import mnist_torch as mnist
 from deepchecks.vision.datasets.detection import coco_torch as coco
+from deepchecks.vision.metrics_utils import ObjectDetectionAveragePrecision, ObjectDetectionTpFpFn
+from deepchecks.vision.metrics_utils.iou_utils import compute_pairwise_ious, jaccard_iou
+from deepchecks.vision.utils.image_properties import (brightness, calc_default_image_properties, rms_contrast,
+                                                      texture_level)
 from deepchecks.vision.vision_data import VisionData
 
 device = torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
@@ -80,6 +85,74 @@ class BenchmarkVision:
         return cache
 
 
+def generate_detections(num_images: int, num_boxes: int, num_classes: int = 5, seed: int = 42):
+    """Generate random predictions and labels of object detection, with half of the predictions near the labels."""
+    rng = np.random.default_rng(seed)
+    predictions, labels = [], []
+    for _ in range(num_images):
+        label = np.column_stack([rng.integers(0, num_classes, num_boxes), rng.integers(0, 600, (num_boxes, 2)),
+                                 rng.integers(5, 150, (num_boxes, 2))]).astype(float)
+        prediction = np.column_stack([rng.integers(0, 600, (num_boxes, 2)), rng.integers(5, 150, (num_boxes, 2)),
+                                      rng.random(num_boxes), rng.integers(0, num_classes, num_boxes)])
+        prediction[:num_boxes // 2, :4] = label[:num_boxes // 2, 1:] + rng.normal(scale=3, size=(num_boxes // 2, 4))
+        prediction[:num_boxes // 2, 5] = label[:num_boxes // 2, 0]
+        predictions.append(prediction)
+        labels.append(label)
+    return predictions, labels
+
+
+class BenchmarkDetectionMetrics:
+    """Object detection metrics over a growing number of boxes per image."""
+
+    params = [10, 100, 500]
+    param_names = ['num_boxes']
+    timeout = 600
+
+    def setup(self, num_boxes):
+        self.predictions, self.labels = generate_detections(20, num_boxes)
+
+    def time_pairwise_ious(self, num_boxes):
+        for prediction, label in zip(self.predictions, self.labels):
+            compute_pairwise_ious(prediction, label, jaccard_iou)
+
+    def time_average_precision(self, num_boxes):
+        metric = ObjectDetectionAveragePrecision(return_option=None)
+        metric.update((self.predictions, self.labels))
+        metric.compute()
+
+    def time_tp_fp_fn(self, num_boxes):
+        metric = ObjectDetectionTpFpFn()
+        metric.update((self.predictions, self.labels))
+        metric.compute()
+
+
+class BenchmarkImageProperties:
+    """Image properties of a batch of images sharing a shape, and of a batch of images of different shapes."""
+
+    params = ([(64, 64), (480, 640)], [True, False])
+    param_names = ['image_size', 'same_shape']
+    timeout = 600
+
+    def setup(self, image_size, same_shape):
+        rng = np.random.default_rng(42)
+        height, width = image_size
+        self.images = [rng.integers(0, 256, (height + (0 if same_shape else i), width, 3), dtype=np.uint8)
+                       for i in range(64)]
+
+    def time_default_properties(self, image_size, same_shape):
+        calc_default_image_properties(self.images)
+
+    def peakmem_default_properties(self, image_size, same_shape):
+        calc_default_image_properties(self.images)
+
+    def time_brightness_and_contrast(self, image_size, same_shape):
+        brightness(self.images)
+        rms_contrast(self.images)
+
+    def time_texture_level(self, image_size, same_shape):
+        texture_level(self.images)
+
+
 # for name, check_class in inspect.getmembers(checks):
 #     if inspect.isclass(check_class):
 #         run_fn = run_check_fn(check_class)
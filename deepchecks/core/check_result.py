@@ -65,6 +65,9 @@ class BaseCheckResult:
     check: Optional['BaseCheck']
     header: Optional[str]
     run_time: Optional[int] = 0
+    # Runtime metadata of the check run within a suite, with the keys: wall_time, cpu_time (seconds),
+    # prediction_cache_misses and process_peak_rss_mb (process-wide, not of the check itself)
+    run_profile: Optional[Dict[str, Any]] = None
 
     @staticmethod
     def from_json(json_dict: Union[str, Dict]) -> 'BaseCheckResult':
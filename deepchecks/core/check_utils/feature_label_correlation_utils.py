@@ -83,7 +83,8 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
                                   min_pps_to_show: float = 0.05,
                                   random_state: int = None,
                                   with_display: bool = True,
-                                  dataset_names: Tuple[str] = DEFAULT_DATASET_NAMES
+                                  dataset_names: Tuple[str] = DEFAULT_DATASET_NAMES,
+                                  pps_cache: Optional[dict] = None
                                   ):
     """
     Calculate the PPS for train, test and difference for feature label correlation checks.
@@ -112,6 +113,8 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
             Random state for the ppscore.predictors function
         dataset_names: tuple, default: DEFAULT_DATASET_NAMES
             The names to show in the display for the first and second datasets.
+        pps_cache: dict, default None
+            Cache of the PPS of the features, features which were calculated on the same data are not calculated again.
 
     Returns:
         CheckResult
@@ -119,11 +122,11 @@ def get_feature_label_correlation(train_df: pd.DataFrame, train_label_name: Opti
             display: bar graph of the PPS of each feature.
     """
     df_pps_train = pps.predictors(df=train_df, y=train_label_name,
-                                  random_seed=random_state,
+                                  random_seed=random_state, cache=pps_cache,
                                   **ppscore_params)
     df_pps_test = pps.predictors(df=test_df,
                                  y=test_label_name,
-                                 random_seed=random_state, **ppscore_params)
+                                 random_seed=random_state, cache=pps_cache, **ppscore_params)
 
     s_pps_train = df_pps_train.set_index('x', drop=True)['ppscore']
     s_pps_test = df_pps_test.set_index('x', drop=True)['ppscore']
@@ -63,6 +63,13 @@ class BaseContext(ABC):
         """Return the task type."""
         raise NotImplementedError()
 
+    def count_prediction_cache_misses(self):
+        """Return the number of model predictions cache misses of the current thread, or None if not tracked."""
+        return None
+
+    def prepare_shared_state(self):
+        """Compute lazily calculated attributes in advance, in order to share them between concurrently run checks."""
+
     def get_data_by_kind(self, kind: DatasetKind):
         """Return the relevant Dataset by given kind."""
         if kind == DatasetKind.TRAIN:
@@ -11,14 +11,20 @@
 # pylint: disable=unused-argument, import-outside-toplevel
 """Module containing the Suite object, used for running a set of checks together."""
 import abc
+import copy
 import io
 import json
+import os
 import pathlib
+import sys
+import time
 import warnings
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
 
 import jsonpickle
+import pandas as pd
 from bs4 import BeautifulSoup
 from ipywidgets import Widget
 from typing_extensions import Self, TypedDict
@@ -33,6 +39,7 @@ from deepchecks.core.serialization.suite_result.html import SuiteResultSerialize
 from deepchecks.core.serialization.suite_result.ipython import SuiteResultSerializer as SuiteResultIPythonSerializer
 from deepchecks.core.serialization.suite_result.json import SuiteResultSerializer as SuiteResultJsonSerializer
 from deepchecks.core.serialization.suite_result.widget import SuiteResultSerializer as SuiteResultWidgetSerializer
+from deepchecks.utils.ipython import create_progress_bar
 from deepchecks.utils.strings import get_random_string, widget_to_html_string
 from deepchecks.utils.wandb_utils import wandb_run
 
@@ -504,6 +511,42 @@ class SuiteResult(DisplayableResult):
         conditions_pass = len(self.get_not_passed_checks(fail_if_warning)) == 0
         return conditions_pass and not_run_pass
 
+    def get_run_profile(self) -> pd.DataFrame:
+        """Return the runtime metadata of the checks run by the suite, sorted by the wall time of the checks.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with a row per check, containing its wall time and CPU time in seconds and the number of
+            misses of the model predictions cache, each calling the user model. Metadata that could not be measured
+            is None (e.g. the cache misses when only precomputed predictions were passed).
+        """
+        columns = ['Check', 'Wall Time', 'CPU Time', 'Prediction Cache Misses']
+        rows = [
+            [result.check.name(), result.run_profile['wall_time'], result.run_profile['cpu_time'],
+             result.run_profile['prediction_cache_misses']]
+            for result in self.results
+            if result.run_profile is not None
+        ]
+        return pd.DataFrame(rows, columns=columns).sort_values('Wall Time', ascending=False, ignore_index=True)
+
+    def run_profile_to_json(self) -> str:
+        """Return the runtime metadata of the checks run by the suite as json.
+
+        Returns
+        -------
+        str
+            json list with an object per check, containing the keys: check, wall_time, cpu_time,
+            prediction_cache_misses and process_peak_rss_mb. process_peak_rss_mb is the peak memory (RSS) of the
+            whole process up to the end of the check, so it is not a measurement of the check itself (especially
+            when checks run concurrently).
+        """
+        return json.dumps([
+            {'check': result.check.name(), **result.run_profile}
+            for result in self.results
+            if result.run_profile is not None
+        ])
+
     @classmethod
     def from_json(cls, json_res: str):
         """Convert a json object that was returned from SuiteResult.to_json.
@@ -684,6 +727,128 @@ class BaseSuite:
     def _get_unsupported_failure(cls, check, msg):
         return check_types.CheckFailure(check, DeepchecksNotSupportedError(msg))
 
+    def _run_checks(
+        self,
+        run_check: Callable[['BaseCheck'], List['check_types.BaseCheckResult']],
+        context,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> List['check_types.BaseCheckResult']:
+        """Run all the suite checks using the given function, either sequentially or concurrently.
+
+        Parameters
+        ----------
+        run_check : Callable[[BaseCheck], List[BaseCheckResult]]
+            Function running a single check and returning its results. Must be picklable in order to run the
+            checks with a process pool executor.
+        context :
+            The context the checks are running on.
+        n_jobs : Optional[int] , default: None
+            Number of threads to run the checks on. None or 1 run the checks sequentially and -1 uses all CPUs.
+        executor : Optional[concurrent.futures.Executor] , default: None
+            Executor to run the checks on (e.g. a process pool), overrides n_jobs if passed.
+
+        Returns
+        -------
+        List[BaseCheckResult]
+            The results of all checks, ordered by the checks order in the suite.
+        """
+        checks = list(self.checks.values())
+        run_check = _ProfiledCheckRunner(run_check, context)
+
+        if executor is None and n_jobs in (None, 1):
+            progress_bar = create_progress_bar(iterable=checks, name=self.name, unit='Check')
+            results = []
+            for check in progress_bar:
+                progress_bar.set_postfix({'Check': check.name()}, refresh=False)
+                results.extend(run_check(check))
+            return results
+
+        if executor is not None:
+            return self._run_checks_concurrently(run_check, checks, context, executor)
+
+        if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+            raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
+            return self._run_checks_concurrently(run_check, checks, context, thread_executor)
+
+    def _run_checks_concurrently(
+        self,
+        run_check: Callable[['BaseCheck'], List['check_types.BaseCheckResult']],
+        checks: List['BaseCheck'],
+        context,
+        executor: Executor
+    ) -> List['check_types.BaseCheckResult']:
+        """Submit all checks to the executor and collect their results in the checks order."""
+        # Lazily computed attributes (predictions, feature importance, etc.) are computed once in advance,
+        # so they are shared by all the checks instead of being computed by each worker
+        context.prepare_shared_state()
+        # Conditions are usually local functions which can't be pickled, so the workers run a copy of the check
+        # without its conditions, which are processed afterwards on the results with the original check
+        futures = []
+        for check in checks:
+            worker_check = copy.copy(check)
+            worker_check._conditions = OrderedDict()  # pylint: disable=protected-access
+            futures.append(executor.submit(run_check, worker_check))
+
+        progress_bar = create_progress_bar(iterable=list(zip(checks, futures)), name=self.name, unit='Check')
+        results = []
+        for check, future in progress_bar:
+            progress_bar.set_postfix({'Check': check.name()}, refresh=False)
+            try:
+                check_results = future.result()
+            except Exception as exp:  # pylint: disable=broad-except
+                # Errors raised outside of the check run itself, e.g. failure to pickle the context
+                check_results = [check_types.CheckFailure(check, exp)]
+            for result in check_results:
+                result.check = check
+                if isinstance(result, check_types.CheckResult):
+                    result.process_conditions()
+            results.extend(check_results)
+        return results
+
+
+class _ProfiledCheckRunner:
+    """Picklable wrapper of a check running function, recording the runtime metadata of each check run."""
+
+    def __init__(self, run_check: Callable[['BaseCheck'], List['check_types.BaseCheckResult']], context):
+        self.run_check = run_check
+        self.context = context
+
+    def __call__(self, check: 'BaseCheck') -> List['check_types.BaseCheckResult']:
+        cache_misses_before = self.context.count_prediction_cache_misses()
+        cpu_start = time.thread_time()
+        start = time.perf_counter()
+
+        results = self.run_check(check)
+
+        wall_time = time.perf_counter() - start
+        cpu_time = time.thread_time() - cpu_start
+        cache_misses_after = self.context.count_prediction_cache_misses()
+        if results:
+            # Metadata is set only on the last result of the check, since it covers all the results of the check
+            results[-1].run_time = int(round(wall_time, 0))
+            results[-1].run_profile = {
+                'wall_time': wall_time,
+                'cpu_time': cpu_time,
+                'prediction_cache_misses': (None if cache_misses_before is None
+                                            else cache_misses_after - cache_misses_before),
+                'process_peak_rss_mb': _get_process_peak_rss_mb(),
+            }
+        return results
+
+
+def _get_process_peak_rss_mb() -> Optional[float]:
+    """Return the lifetime peak resident set size of the current process in MB, or None if not available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on other platforms
+    return peak_rss / 2 ** 20 if sys.platform == 'darwin' else peak_rss / 2 ** 10
+
 
 def sort_check_results(
     check_results: Sequence['check_types.BaseCheckResult']
@@ -20,7 +20,7 @@ from deepchecks.nlp import Context, SingleDatasetCheck
 from deepchecks.nlp._shared_docs import docstrings
 from deepchecks.nlp.task_type import TaskType
 from deepchecks.nlp.text_data import TextData
-from deepchecks.nlp.utils.text import cut_string, hash_samples, normalize_samples
+from deepchecks.nlp.utils.text import hash_truncated_samples
 from deepchecks.utils.abstracts.conflicting_labels import ConflictingLabelsAbstract
 from deepchecks.utils.other import to_ordional_enumeration
 from deepchecks.utils.strings import format_list, truncate_string
@@ -103,12 +103,9 @@ class ConflictingLabels(SingleDatasetCheck, ConflictingLabelsAbstract):
         ambiguous_samples_hashes = n_of_labels_per_sample[n_of_labels_per_sample > 1]
         return frozenset(ambiguous_samples_hashes.index.to_list())
 
-    def _get_df_and_labels(self, dataset, samples):
-        samples_hashes = hash_samples(normalize_samples(
-            samples,
-            **self._text_normalization_kwargs
-        ))
-
+    def _get_df_and_labels(self, dataset, samples_hashes=None):
+        if samples_hashes is None:
+            samples_hashes = dataset.get_normalized_text_hashes(**self._text_normalization_kwargs)
         labels = self._get_labels(dataset)
 
         df = pd.DataFrame({
@@ -123,6 +120,10 @@ class ConflictingLabels(SingleDatasetCheck, ConflictingLabelsAbstract):
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check."""
         dataset = context.get_data_by_kind(dataset_kind)
+        if self.n_samples >= len(dataset):
+            # The sample is the whole dataset, so the hashes are calculated on the context dataset to be reused by
+            # the other checks
+            dataset.get_normalized_text_hashes(**self._text_normalization_kwargs)
         dataset = dataset.sample(self.n_samples, random_state=self.random_state, drop_na_label=True)
         dataset = t.cast(TextData, dataset)
         n_of_samples = len(dataset)
@@ -130,27 +131,26 @@ class ConflictingLabels(SingleDatasetCheck, ConflictingLabelsAbstract):
         if n_of_samples == 0:
             raise DeepchecksValueError('Dataset cannot be empty')
 
-        # Reduce dataset by first checking on truncated strings
-        truncated_samples = [cut_string(x) for x in dataset.text]
-
-        df = self._get_df_and_labels(dataset, truncated_samples)
+        if not dataset.has_normalized_text_hashes(**self._text_normalization_kwargs):
+            # Reduce dataset by first checking on truncated strings, so only the candidates are normalized in full
+            truncated_hashes = hash_truncated_samples(dataset.text, **self._text_normalization_kwargs)
+            df = self._get_df_and_labels(dataset, truncated_hashes)
+            ambiguous_samples_hashes = self._get_conflicting_indices(df)
+            indices_to_reinspect = df[df['hash'].isin(ambiguous_samples_hashes)].index.to_list()
+            dataset = dataset.copy(rows_to_use=indices_to_reinspect)
 
-        ambiguous_samples_hashes = self._get_conflicting_indices(df)
-        indices_to_reinspect = df[df['hash'].isin(ambiguous_samples_hashes)].index.to_list()
-        dataset = dataset.copy(rows_to_use=indices_to_reinspect)
+        if len(dataset) > 0:
+            # Now that we have narrowed down the dataset, we can check on full strings
+            df = self._get_df_and_labels(dataset)
+            ambiguous_samples_hashes = self._get_conflicting_indices(df)
 
         # Rest of the code can't handle empty dataset
-        if len(dataset) == 0:
+        if len(ambiguous_samples_hashes) == 0:
             result_value = dict(percent_of_conflicting_samples=0, conflicting_samples=pd.DataFrame(
                 index=pd.MultiIndex(levels=[[], [], []], codes=[[], [], []], names=['Duplicate', 'Sample ID', 'Label']),
                 columns=['Text']))
             return CheckResult(value=result_value)
 
-        # Now that we have narrowed down the dataset, we can check on full strings
-        df = self._get_df_and_labels(dataset, dataset.text)
-
-        ambiguous_samples_hashes = self._get_conflicting_indices(df)
-
         ambiguous_samples = df[df['hash'].isin(ambiguous_samples_hashes)].copy()
         num_of_ambiguous_samples = ambiguous_samples['Text'].count()
         percent_of_ambiguous_samples = num_of_ambiguous_samples / n_of_samples
@@ -11,13 +11,14 @@
 """Module contains Data Duplicates check."""
 import typing as t
 
+import numpy as np
 import pandas as pd
 
 from deepchecks.core import CheckResult
 from deepchecks.nlp import Context, SingleDatasetCheck
 from deepchecks.nlp._shared_docs import docstrings
 from deepchecks.nlp.text_data import TextData
-from deepchecks.nlp.utils.text import cut_string, hash_samples, normalize_samples
+from deepchecks.nlp.utils.text import hash_truncated_samples
 from deepchecks.utils.abstracts.data_duplicates import DataDuplicatesAbstract
 from deepchecks.utils.dataframes import hide_index_for_display
 from deepchecks.utils.other import to_ordional_enumeration
@@ -79,45 +80,38 @@ class TextDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
     def _truncate_text(self, x: str) -> str:
         return truncate_string(x, self.max_text_length_for_display)
 
-    def _create_df(self, dataset, samples):
-        sample_hashes = hash_samples(normalize_samples(samples, **self._text_normalization_kwargs))
-        df = pd.DataFrame({
-            'Text': samples,
-            'hash': sample_hashes,
-            'Sample ID': dataset.get_original_text_indexes()
-        })
-        return df
-
     def run_logic(self, context: Context, dataset_kind):
         """Run check."""
-        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
+        dataset = context.get_data_by_kind(dataset_kind)
+        if self.n_samples >= len(dataset):
+            # The sample is the whole dataset, so the hashes are calculated on the context dataset to be reused by
+            # the other checks
+            dataset.get_normalized_text_hashes(**self._text_normalization_kwargs)
+        dataset = dataset.sample(self.n_samples, random_state=self.random_state)
         dataset = t.cast(TextData, dataset)
-        n_of_unique = 0
         n_of_samples = len(dataset)
+        n_of_unique = 0
 
-        # First run logic on truncated samples to speed up computation
-        truncated_samples = [cut_string(x) for x in dataset.text]
-        df_truncated = self._create_df(dataset, truncated_samples)
-
-        grouped_samples_truncated = df_truncated.groupby(by=['hash'], dropna=False, group_keys=True)
-        reinspect_idx = df_truncated[grouped_samples_truncated['Text'].transform('count') > 1].index.to_list()
-        # At this stage, what was detected as unique is actually unique
-        n_of_unique += sum(grouped_samples_truncated['Text'].transform('count') == 1)
-
-        # Reinspect samples that are truncated
-        dataset = dataset.copy(rows_to_use=reinspect_idx)
-        if len(dataset) == 0:
-            return CheckResult(value={'percent_of_duplicates': 0,
-                                      'duplicates': pd.DataFrame()})
-
-        samples = dataset.text
+        if not dataset.has_normalized_text_hashes(**self._text_normalization_kwargs):
+            # First find the duplicates candidates by the truncated samples, so only them are normalized in full
+            truncated_hashes = pd.Series(hash_truncated_samples(dataset.text, **self._text_normalization_kwargs))
+            is_candidate = truncated_hashes.duplicated(keep=False).to_numpy()
+            # At this stage, what was detected as unique is actually unique
+            n_of_unique += int((~is_candidate).sum())
+            dataset = dataset.copy(rows_to_use=np.flatnonzero(is_candidate).tolist())
 
-        df = self._create_df(dataset, samples)
+        df = pd.DataFrame({
+            'Text': dataset.text,
+            'hash': dataset.get_normalized_text_hashes(**self._text_normalization_kwargs),
+            'Sample ID': dataset.get_original_text_indexes()
+        })
         grouped_samples = df.groupby(by=['hash'], dropna=False)
         counted_samples = grouped_samples['Text'].size()
-        # Once we arrived here (inspecting only samples suspected to be duplicates), we can add them to the count
         n_of_unique += len(counted_samples)
-        percent_of_duplicates = 1 - n_of_unique / n_of_samples
+        percent_of_duplicates = 1 - n_of_unique / n_of_samples if n_of_samples else 0
+        if percent_of_duplicates == 0:
+            return CheckResult(value={'percent_of_duplicates': 0,
+                                      'duplicates': pd.DataFrame()})
 
         counted_duplicates = counted_samples[counted_samples > 1]
         duplicates_hashes = set(counted_duplicates.index)
@@ -19,7 +19,7 @@ from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.nlp import Context, TrainTestCheck
 from deepchecks.nlp._shared_docs import docstrings
 from deepchecks.nlp.text_data import TextData
-from deepchecks.nlp.utils.text import cut_string, hash_samples, normalize_samples
+from deepchecks.nlp.utils.text import hash_truncated_samples
 from deepchecks.utils.abstracts.train_test_samples_mix import TrainTestSamplesMixAbstract
 from deepchecks.utils.other import to_ordional_enumeration
 from deepchecks.utils.strings import format_list, format_percent, truncate_string
@@ -80,12 +80,11 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
     def _truncate_text(self, x: str) -> str:
         return truncate_string(x, self.max_text_length_for_display)
 
-    def _get_duplicate_indices(self, train: TextData, test: TextData,
-                               train_samples: t.Sequence[str], test_samples: t.Sequence[str]):
-        normalization_kwargs = self._text_normalization_kwargs
-        train_sample_hashes = hash_samples(normalize_samples(train_samples, **normalization_kwargs))
-        test_sample_hashes = hash_samples(normalize_samples(test_samples, **normalization_kwargs))
-
+    @staticmethod
+    def _get_duplicate_indices(train: TextData, test: TextData,
+                               train_sample_hashes: np.ndarray, test_sample_hashes: np.ndarray):
+        train_samples = t.cast(t.Sequence[str], train.text)
+        test_samples = t.cast(t.Sequence[str], test.text)
         train_df = pd.DataFrame({
             'hash': train_sample_hashes,
             'Text': train_samples,
@@ -105,37 +104,44 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
 
     def run_logic(self, context: Context) -> CheckResult:
         """Run check."""
+        normalization_kwargs = self._text_normalization_kwargs
+        for dataset in (context.train, context.test):
+            if self.n_samples >= len(dataset):
+                # The sample is the whole dataset, so the hashes are calculated on the context dataset to be reused
+                # by the other checks
+                dataset.get_normalized_text_hashes(**normalization_kwargs)
         train = context.train.sample(self.n_samples, random_state=self.random_state)
         test = context.test.sample(self.n_samples, random_state=self.random_state)
         train = t.cast(TextData, train)
         test = t.cast(TextData, test)
-        train_samples = t.cast(t.Sequence[str], train.text)
-        test_samples = t.cast(t.Sequence[str], test.text)
-        n_of_test_samples = len(test_samples)
+        n_of_test_samples = len(test)
 
-        if len(train_samples) == 0:
+        if len(train) == 0:
             raise DeepchecksValueError('Train dataset cannot be empty')
-        if len(test_samples) == 0:
+        if len(test) == 0:
             raise DeepchecksValueError('Test dataset cannot be empty')
 
-        # First run on truncated dataset
-        train_truncated = [cut_string(x) for x in train_samples]
-        test_truncated = [cut_string(x) for x in test_samples]
-
-        duplicate_bool_df = self._get_duplicate_indices(train, test, train_truncated, test_truncated)[0]
-        train_indices_reinspect = duplicate_bool_df.iloc[len(test_samples):]
-        train_indices_reinspect = np.where(train_indices_reinspect.values)[0]
-        test_indices_reinspect = duplicate_bool_df.iloc[:len(test_samples)]
-        test_indices_reinspect = np.where(test_indices_reinspect.values)[0]
-
-        # keep only samples that where found to be duplicates after cut_string
-        train = train.copy(train_indices_reinspect.tolist())
-        test = test.copy(test_indices_reinspect.tolist())
-
-        train_samples = t.cast(t.Sequence[str], train.text)
-        test_samples = t.cast(t.Sequence[str], test.text)
+        if not (train.has_normalized_text_hashes(**normalization_kwargs)
+                and test.has_normalized_text_hashes(**normalization_kwargs)):
+            # First run on truncated samples, so only the candidates are normalized in full
+            duplicate_bool_df = self._get_duplicate_indices(
+                train, test,
+                hash_truncated_samples(train.text, **normalization_kwargs),
+                hash_truncated_samples(test.text, **normalization_kwargs)
+            )[0]
+            train_indices_reinspect = np.where(duplicate_bool_df.iloc[len(test):].values)[0]
+            test_indices_reinspect = np.where(duplicate_bool_df.iloc[:len(test)].values)[0]
+
+            # keep only samples that where found to be duplicates after cut_string
+            train = train.copy(train_indices_reinspect.tolist())
+            test = test.copy(test_indices_reinspect.tolist())
+
+        bool_df, df = self._get_duplicate_indices(train, test,
+                                                  train.get_normalized_text_hashes(**normalization_kwargs),
+                                                  test.get_normalized_text_hashes(**normalization_kwargs))
+        df = df[bool_df]
 
-        if (len(train_samples) == 0) or (len(test_samples) == 0):
+        if len(df) == 0:
             result_value = {
                 'ratio': 0,
                 'duplicates': pd.DataFrame(
@@ -145,9 +151,6 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
             }
             return CheckResult(value=result_value)
 
-        bool_df, df = self._get_duplicate_indices(train, test, train_samples, test_samples)
-        df = df[bool_df]
-
         n_of_test_duplicates = df[df['Dataset'] == 'test']['Text'].count()
         duplicates_ratio = n_of_test_duplicates / n_of_test_samples
 
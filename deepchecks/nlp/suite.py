@@ -10,16 +10,17 @@
 #
 """Module for base nlp suite."""
 # pylint: disable=broad-except
+from concurrent.futures import Executor
+from functools import partial
 from typing import List, Optional, Tuple, Union
 
 from deepchecks.core import DatasetKind
-from deepchecks.core.check_result import CheckFailure
+from deepchecks.core.check_result import BaseCheckResult, CheckFailure
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.nlp._shared_docs import docstrings
 from deepchecks.nlp.base_checks import SingleDatasetCheck, TrainTestCheck
 from deepchecks.nlp.context import Context, TTextPred, TTextProba
 from deepchecks.nlp.text_data import TextData
-from deepchecks.utils.ipython import create_progress_bar
 
 __all__ = ['Suite']
 
@@ -44,6 +45,8 @@ class Suite(BaseSuite):
         test_probabilities: Optional[TTextProba] = None,
         model_classes: Optional[List] = None,
         random_state: int = 42,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> SuiteResult:
         """Run all checks.
 
@@ -67,6 +70,12 @@ class Suite(BaseSuite):
             For classification: list of classes known to the model
         random_state : int, default 42
             A seed to set for pseudo-random functions, primarily sampling.
+        n_jobs : Optional[int] , default: None
+            Number of threads to run the checks on concurrently. None or 1 run the checks sequentially,
+            and -1 uses all the available CPUs.
+        executor : Optional[concurrent.futures.Executor] , default: None
+            Executor to run the checks on concurrently, overrides n_jobs if passed. A ProcessPoolExecutor sends
+            the context to the workers with each check.
 
         {prediction_formats:2*indent}
 
@@ -87,54 +96,57 @@ class Suite(BaseSuite):
             random_state=random_state
         )
 
-        progress_bar = create_progress_bar(
-            iterable=list(self.checks.values()),
-            name=self.name,
-            unit='Check'
+        run_check = partial(
+            self._run_check,
+            context=context,
+            has_train=train_dataset is not None,
+            has_test=test_dataset is not None
         )
+        results = self._run_checks(run_check, context, n_jobs=n_jobs, executor=executor)
 
-        # Run all checks
+        return SuiteResult(self.name, results)
+
+    @classmethod
+    def _run_check(cls, check, context: Context, has_train: bool, has_test: bool) -> List[BaseCheckResult]:
+        """Run a single check of the suite and return its results."""
         results = []
-        for check in progress_bar:
-            try:
-                progress_bar.set_postfix({'Check': check.name()}, refresh=False)
-                if isinstance(check, TrainTestCheck):
-                    if train_dataset is not None and test_dataset is not None:
-                        check_result = check.run_logic(context)
-                        context.finalize_check_result(check_result, check)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if not supplied with both train and test datasets'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, SingleDatasetCheck):
-                    if train_dataset is not None:
-                        # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
-                        # wrap it in try/except
-                        try:
-                            check_result = check.run_logic(context, dataset_kind=DatasetKind.TRAIN)
-                            context.finalize_check_result(check_result, check, DatasetKind.TRAIN)
-                            # In case of single dataset not need to edit the header
-                            if test_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Train Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Train Dataset')
-                        results.append(check_result)
-                    if train_dataset is not None:
-                        try:
-                            check_result = check.run_logic(context, dataset_kind=DatasetKind.TEST)
-                            context.finalize_check_result(check_result, check, DatasetKind.TEST)
-                            # In case of single dataset not need to edit the header
-                            if train_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Test Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Test Dataset')
-                        results.append(check_result)
-                    if train_dataset is None and test_dataset is None:
-                        msg = 'Check is irrelevant if dataset is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
+        try:
+            if isinstance(check, TrainTestCheck):
+                if has_train and has_test:
+                    check_result = check.run_logic(context)
+                    context.finalize_check_result(check_result, check)
+                    results.append(check_result)
                 else:
-                    raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
-            except Exception as exp:
-                results.append(CheckFailure(check, exp))
-
-        return SuiteResult(self.name, results)
+                    msg = 'Check is irrelevant if not supplied with both train and test datasets'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            elif isinstance(check, SingleDatasetCheck):
+                if has_train:
+                    # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
+                    # wrap it in try/except
+                    try:
+                        check_result = check.run_logic(context, dataset_kind=DatasetKind.TRAIN)
+                        context.finalize_check_result(check_result, check, DatasetKind.TRAIN)
+                        # In case of single dataset not need to edit the header
+                        if has_test:
+                            check_result.header = f'{check_result.get_header()} - Train Dataset'
+                    except Exception as exp:
+                        check_result = CheckFailure(check, exp, ' - Train Dataset')
+                    results.append(check_result)
+                if has_train:
+                    try:
+                        check_result = check.run_logic(context, dataset_kind=DatasetKind.TEST)
+                        context.finalize_check_result(check_result, check, DatasetKind.TEST)
+                        # In case of single dataset not need to edit the header
+                        if has_train:
+                            check_result.header = f'{check_result.get_header()} - Test Dataset'
+                    except Exception as exp:
+                        check_result = CheckFailure(check, exp, ' - Test Dataset')
+                    results.append(check_result)
+                if not has_train and not has_test:
+                    msg = 'Check is irrelevant if dataset is not supplied'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            else:
+                raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
+        except Exception as exp:
+            results.append(CheckFailure(check, exp))
+        return results
@@ -23,7 +23,7 @@ from deepchecks.nlp.input_validations import (ColumnTypes, validate_length_and_c
                                               validate_length_and_type_numpy_array, validate_modify_label,
                                               validate_raw_text, validate_tokenized_text)
 from deepchecks.nlp.task_type import TaskType, TTextLabel
-from deepchecks.nlp.utils.text import break_to_lines_and_trim
+from deepchecks.nlp.utils.text import break_to_lines_and_trim, hash_samples, normalize_samples
 from deepchecks.nlp.utils.text_data_plot import text_data_describe_plot
 from deepchecks.nlp.utils.text_embeddings import calculate_builtin_embeddings
 from deepchecks.nlp.utils.text_properties import calculate_builtin_properties, get_builtin_properties_types
@@ -120,6 +120,7 @@ class TextData:
     _cat_metadata: t.Optional[t.List[str]] = None
     _numeric_metadata: t.Optional[t.List[str]] = None
     _original_text_index: t.Optional[t.Sequence[int]] = None  # Sequence is np array
+    _text_hashes: t.Dict[t.Tuple[bool, ...], np.ndarray]  # hashes of the texts per normalization options
 
     def __init__(
             self,
@@ -163,6 +164,7 @@ class TextData:
                 raise DeepchecksValueError('raw_text and tokenized_text sequences must have the same length')
 
         self._label = validate_modify_label(label, self._task_type, len(self), tokenized_text)
+        self._text_hashes = {}
 
         if name is not None and not isinstance(name, str):
             raise DeepchecksNotSupportedError(f'name must be a string, got {type(name)}')
@@ -218,6 +220,8 @@ class TextData:
                     new_copy.set_embeddings(self._embeddings)
 
                 new_copy._original_text_index = self._original_text_index
+                # a full copy has the same texts, so it shares the hashes cache with this dataset
+                new_copy._text_hashes = self._text_hashes
                 return new_copy
 
             if not isinstance(rows_to_use, t.Sequence) or any(not isinstance(x, Number) for x in rows_to_use):
@@ -249,6 +253,7 @@ class TextData:
                 new_copy.set_embeddings(embeddings)
 
             new_copy._original_text_index = self._original_text_index[rows_to_use]
+            new_copy._text_hashes = {key: hashes[rows_to_use] for key, hashes in self._text_hashes.items()}
             return new_copy
 
     def sample(self: TDataset, n_samples: int, replace: bool = False, random_state: t.Optional[int] = None,
@@ -419,6 +424,8 @@ class TextData:
             batch_size: t.Optional[int] = 16,
             cache_models: bool = False,
             use_onnx_models: bool = True,
+            cache_properties: bool = False,
+            n_jobs: int = 1,
     ):
         """Calculate the default properties of the dataset.
 
@@ -468,6 +475,12 @@ class TextData:
         use_onnx_models : bool, default True
             If True, will use onnx gpu optimized models for the calculation. Requires the optimum[onnxruntime-gpu]
             library to be installed as well as the availability of GPU.
+        cache_properties : bool, default False
+            If True, will store the calculated properties values on disk under the models_storage directory, so
+            that only texts which were not seen before are calculated in future calls.
+        n_jobs : int, default 1
+            Number of processes to calculate the properties which do not use a model on. -1 uses all the available
+            CPUs.
         """
         if self._properties is not None:
             warnings.warn('Properties already exist, overwriting them', UserWarning)
@@ -483,6 +496,9 @@ class TextData:
             batch_size=batch_size,
             cache_models=cache_models,
             use_onnx_models=use_onnx_models,
+            cache_properties=cache_properties,
+            n_jobs=n_jobs,
+            text_hashes=self.text_hashes if cache_properties else None,
         )
 
         self._properties = pd.DataFrame(properties, index=self.get_original_text_indexes())
@@ -603,6 +619,68 @@ class TextData:
         """
         return self._text
 
+    @property
+    def text_hashes(self) -> np.ndarray:
+        """Return the hash of each text sample, calculated once.
+
+        The hashes are the same in every process and run (see hash_samples), so they can be stored or compared
+        between datasets.
+
+        Returns
+        -------
+        np.ndarray
+           uint64 array of the hash of each text sample.
+        """
+        return self.get_normalized_text_hashes(ignore_case=False, remove_punct=False, normalize_uni=False,
+                                               remove_stops=False, ignore_whitespace=False)
+
+    def get_normalized_text_hashes(
+            self,
+            ignore_case: bool = True,
+            remove_punct: bool = True,
+            normalize_uni: bool = True,
+            remove_stops: bool = True,
+            ignore_whitespace: bool = False
+    ) -> np.ndarray:
+        """Return the hash of each text sample after normalizing it, calculated once per normalization options.
+
+        Samples whose normalized texts are equal have equal hashes. The parameters are the normalization options of
+        normalize_samples, if none of them is set the hashes are of the raw texts.
+
+        Returns
+        -------
+        np.ndarray
+           uint64 array of the hash of each normalized text sample.
+        """
+        options = (ignore_case, remove_punct, normalize_uni, remove_stops, ignore_whitespace)
+        if options not in self._text_hashes:
+            if not any(options):
+                self._text_hashes[options] = hash_samples(self._text)
+            else:
+                # equal texts have equal normalized texts, so each unique text is normalized once
+                _, first_indices, inverse = np.unique(self.text_hashes, return_index=True, return_inverse=True)
+                normalized = normalize_samples(
+                    [self._text[i] for i in first_indices], ignore_case=ignore_case, remove_punct=remove_punct,
+                    normalize_uni=normalize_uni, remove_stops=remove_stops, ignore_whitespace=ignore_whitespace
+                )
+                self._text_hashes[options] = hash_samples(normalized)[inverse.reshape(-1)]
+        return self._text_hashes[options]
+
+    def has_normalized_text_hashes(
+            self,
+            ignore_case: bool = True,
+            remove_punct: bool = True,
+            normalize_uni: bool = True,
+            remove_stops: bool = True,
+            ignore_whitespace: bool = False
+    ) -> bool:
+        """Return whether the hashes of the texts normalized with the given options are already calculated.
+
+        The hashes are kept by copies and samples of the dataset, so checks can skip cheaper approximations
+        (like comparing truncated texts) when they are available.
+        """
+        return (ignore_case, remove_punct, normalize_uni, remove_stops, ignore_whitespace) in self._text_hashes
+
     @property
     def tokenized_text(self) -> t.Sequence[t.Sequence[str]]:
         """Return sequence of tokenized text samples.
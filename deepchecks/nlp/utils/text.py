@@ -9,13 +9,16 @@
 # ----------------------------------------------------------------------------
 #
 """Module of text utils for NLP package."""
+import hashlib
 import re
 import string
 import typing as t
 import unicodedata
 import warnings
+from functools import lru_cache
 
 import nltk
+import numpy as np
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
@@ -24,9 +27,13 @@ __all__ = [
     'normalize_text',
     'hash_text',
     'normalize_samples',
-    'hash_samples'
+    'hash_samples',
+    'hash_truncated_samples'
 ]
 
+# precompiled translation table deleting the punctuation characters
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
 
 def break_to_lines_and_trim(s, max_lines: int = 10, min_line_length: int = 50, max_line_length: int = 60):
     """Break a string to lines and trim it to a maximum number of lines.
@@ -70,7 +77,7 @@ def break_to_lines_and_trim(s, max_lines: int = 10, min_line_length: int = 50, m
 
 def remove_punctuation(text: str) -> str:
     """Remove punctuation characters from a string."""
-    return text.translate(str.maketrans('', '', string.punctuation))
+    return text.translate(PUNCTUATION_TABLE)
 
 
 def normalize_unicode(text: str) -> str:
@@ -78,20 +85,55 @@ def normalize_unicode(text: str) -> str:
     return unicodedata.normalize('NFKC', text)
 
 
+@lru_cache(maxsize=None)
+def _get_stop_words() -> t.Optional[t.FrozenSet[str]]:
+    """Load the english stop words once per process, None if they are not available."""
+    if nltk.download('stopwords', quiet=True):
+        return frozenset(stopwords.words('english'))
+    warnings.warn('nltk stopwords not found, stopwords won\'t be ignored when considering text duplicates.'
+                  ' Please check your internet connection.')
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_word_tokenizer() -> t.Callable[[str], t.List[str]]:
+    """Return the word tokenizer, loaded once per process."""
+    return word_tokenize if nltk.download('punkt', quiet=True) else str.split
+
+
 def remove_stopwords(text: str) -> str:
     """Remove stop words from a string."""
-    if nltk.download('stopwords', quiet=True):
-        stop_words = set(stopwords.words('english'))
-    else:
-        warnings.warn('nltk stopwords not found, stopwords won\'t be ignored when considering text duplicates.'
-                      ' Please check your internet connection.')
-        return text
-    if nltk.download('punkt', quiet=True):
-        tokenize = word_tokenize
-    else:
-        tokenize = str.split
-    words = tokenize(text)
-    return ' '.join([word for word in words if word.lower() not in stop_words])
+    return _remove_stopwords_of_texts([text])[0]
+
+
+def _remove_stopwords_of_texts(texts: t.List[str]) -> t.List[str]:
+    stop_words = _get_stop_words()
+    if stop_words is None:
+        return texts
+    tokenize = _get_word_tokenizer()
+    return [' '.join([word for word in tokenize(text) if word.lower() not in stop_words]) for text in texts]
+
+
+def _normalize_texts(
+    texts: t.List[str],
+    ignore_case: bool,
+    remove_punct: bool,
+    normalize_uni: bool,
+    remove_stops: bool,
+    ignore_whitespace: bool
+) -> t.List[str]:
+    """Normalize the texts, each normalization step is applied on all of them."""
+    if ignore_case:
+        texts = [text.lower() for text in texts]
+    if remove_punct:
+        texts = [text.translate(PUNCTUATION_TABLE) for text in texts]
+    if normalize_uni:
+        texts = [unicodedata.normalize('NFKC', text) for text in texts]
+    if remove_stops:
+        texts = _remove_stopwords_of_texts(texts)
+    if ignore_whitespace:
+        texts = [''.join(text.split()) for text in texts]
+    return texts
 
 
 def normalize_text(
@@ -104,17 +146,8 @@ def normalize_text(
     ignore_whitespace: bool = False
 ) -> str:
     """Normalize given text sample."""
-    if ignore_case:
-        text_sample = text_sample.lower()
-    if remove_punct:
-        text_sample = remove_punctuation(text_sample)
-    if normalize_uni:
-        text_sample = normalize_unicode(text_sample)
-    if remove_stops:
-        text_sample = remove_stopwords(text_sample)
-    if ignore_whitespace:
-        text_sample = ''.join(text_sample.split())
-    return text_sample
+    return _normalize_texts([text_sample], ignore_case, remove_punct, normalize_uni, remove_stops,
+                            ignore_whitespace)[0]
 
 
 def cut_string(input_str: str, cut_length: int = 200) -> str:
@@ -135,27 +168,40 @@ def normalize_samples(
     remove_stops: bool = True,
     ignore_whitespace: bool = False
 ) -> t.List[str]:
-    """Normalize given sequence of text samples."""
-    return [
-        normalize_text(
-            it,
-            ignore_case=ignore_case,
-            remove_punct=remove_punct,
-            normalize_uni=normalize_uni,
-            remove_stops=remove_stops,
-            ignore_whitespace=ignore_whitespace
-        )
-        for it in text_samples
-    ]
+    """Normalize given sequence of text samples.
+
+    Each unique text is normalized once, and every normalization step is applied on all the unique texts together.
+    """
+    uniques = list(dict.fromkeys(text_samples))
+    normalized = dict(zip(uniques, _normalize_texts(uniques, ignore_case, remove_punct, normalize_uni, remove_stops,
+                                                    ignore_whitespace)))
+    return [normalized[it] for it in text_samples]
 
 
 def hash_text(text: str) -> int:
-    """Hash a text sample."""
+    """Hash a text sample.
+
+    The hash is a 64 bit blake2b digest of the text, so unlike the builtin hash it is the same in every process and
+    run, and can be stored or compared between workers.
+    """
     assert isinstance(text, str)
-    return hash(text)
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).digest(), 'little')
+
+
+def hash_truncated_samples(text_samples: t.Sequence[str], **normalization_kwargs) -> np.ndarray:
+    """Hash the normalized beginnings of the text samples (see cut_string).
+
+    Samples with equal normalized texts usually have equal hashes, so the hashes find the candidates for equal
+    samples without normalizing the full texts, which is expensive for long texts.
+    """
+    return hash_samples(normalize_samples([cut_string(x) for x in text_samples], **normalization_kwargs))
 
 
-def hash_samples(text: t.Sequence[str]) -> t.List[int]:
-    """Hash a sequence of text samples."""
+def hash_samples(text: t.Sequence[str]) -> np.ndarray:
+    """Hash a sequence of text samples, returning a uint64 array of their hashes (see hash_text).
+
+    Each unique text is hashed once.
+    """
     assert not isinstance(text, str)
-    return [hash_text(it) for it in text]
+    unique_hashes = {it: hash_text(it) for it in set(text)}
+    return np.fromiter((unique_hashes[it] for it in text), dtype=np.uint64, count=len(text))
@@ -9,14 +9,17 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the text properties for the NLP module."""
+import os
 import pathlib
 import pickle as pkl
 import re
 import string
 import warnings
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from importlib.util import find_spec
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -28,10 +31,14 @@ from nltk import sent_tokenize, word_tokenize
 from tqdm import tqdm
 from typing_extensions import TypedDict
 
+import deepchecks
 from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.nlp.utils.text import cut_string, hash_text, normalize_text, remove_punctuation
-from deepchecks.nlp.utils.text_properties_models import get_cmudict_dict, get_fasttext_model, get_transformer_pipeline
+from deepchecks.nlp.utils.text import cut_string, hash_samples, hash_text, normalize_text, remove_punctuation
+from deepchecks.nlp.utils.text_properties_cache import MISSING, PropertiesCache
+from deepchecks.nlp.utils.text_properties_models import (download_fasttext_model, get_cmudict_dict, get_fasttext_model,
+                                                         get_transformer_pipeline, import_optional_property_dependency)
 from deepchecks.utils.function import run_available_kwargs
+from deepchecks.utils.logger import get_logger
 from deepchecks.utils.strings import SPECIAL_CHARACTERS, format_list
 
 __all__ = ['calculate_builtin_properties', 'get_builtin_properties_types']
@@ -663,6 +670,9 @@ def calculate_builtin_properties(
         batch_size: Optional[int] = 16,
         cache_models: bool = False,
         use_onnx_models: bool = True,
+        cache_properties: bool = False,
+        n_jobs: int = 1,
+        text_hashes: Optional[Sequence[int]] = None,
 ) -> Tuple[Dict[str, List[float]], Dict[str, str]]:
     """Calculate properties on provided text samples.
 
@@ -713,6 +723,17 @@ def calculate_builtin_properties(
     use_onnx_models : bool, default True
         If True, will use onnx gpu optimized models for the calculation. Requires the optimum[onnxruntime-gpu] library
         to be installed as well as the availability of GPU.
+    cache_properties : bool, default False
+        If True, will store the calculated properties values on disk under the models_storage directory, keyed by
+        the text, the property name and the property version. Only texts that are not in the cache are calculated,
+        and the cache hit rate of each property is logged.
+    n_jobs : int, default 1
+        Number of processes to calculate the properties which do not use a model on, by splitting the texts between
+        them. -1 uses all the available CPUs. The model based properties (Toxicity, Fluency and Formality) are
+        calculated in batches on the main process.
+    text_hashes : Optional[Sequence[int]], default None
+        The hashes of the texts (see hash_samples), used as the keys of the properties cache. If None, they are
+        calculated when cache_properties is True.
 
     Returns
     -------
@@ -721,6 +742,11 @@ def calculate_builtin_properties(
     Dict[str, str]
         A dictionary with the property name as key and the property's type as value.
     """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif not isinstance(n_jobs, int) or n_jobs < 1:
+        raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
+
     use_onnx_models = _validate_onnx_model_availability(use_onnx_models, device)
     text_properties = _select_properties(
         include_properties=include_properties,
@@ -728,6 +754,133 @@ def calculate_builtin_properties(
         include_long_calculation_properties=include_long_calculation_properties
     )
 
+    properties_types = {
+        it['name']: it['output_type']
+        for it in text_properties
+    }
+
+    if not cache_properties:
+        calculated_properties, _ = _calculate_properties(
+            raw_text, text_properties, ignore_non_english_samples_for_english_properties, device, models_storage,
+            batch_size, cache_models, use_onnx_models, n_jobs
+        )
+    else:
+        calculated_properties = _calculate_properties_with_cache(
+            raw_text, text_properties, ignore_non_english_samples_for_english_properties, device, models_storage,
+            batch_size, cache_models, use_onnx_models, n_jobs, text_hashes
+        )
+
+    if not calculated_properties:
+        raise RuntimeError('Failed to calculate any of the properties.')
+
+    properties_types = {
+        k: v
+        for k, v in properties_types.items()
+        if k in calculated_properties
+    }
+
+    return calculated_properties, properties_types
+
+
+def _calculate_properties_with_cache(
+        raw_text: Sequence[str],
+        text_properties: Sequence[TextProperty],
+        ignore_non_english_samples_for_english_properties: bool,
+        device: Optional[str],
+        models_storage: Union[pathlib.Path, str, None],
+        batch_size: Optional[int],
+        cache_models: bool,
+        use_onnx_models: bool,
+        n_jobs: int,
+        text_hashes: Optional[Sequence[int]]
+) -> Dict[str, List[Any]]:
+    """Calculate the properties values of the texts which are not in the properties cache, and update the cache."""
+    properties_cache = PropertiesCache(models_storage)
+    # Texts that are not strings are not cached, and their properties values are nan
+    text_indices = [i for i, text in enumerate(raw_text) if isinstance(text, str)]
+    # The texts are hashed once, their hashes are the cache keys of all the properties
+    if text_hashes is None:
+        text_hashes = np.zeros(len(raw_text), dtype=np.uint64)
+        text_hashes[text_indices] = hash_samples([raw_text[i] for i in text_indices])
+    else:
+        text_hashes = np.asarray(text_hashes, dtype=np.uint64)
+    versions = {
+        prop['name']: _get_property_version(prop['name'], use_onnx_models,
+                                            ignore_non_english_samples_for_english_properties)
+        for prop in text_properties
+    }
+    cached_values = {
+        prop['name']: properties_cache.get(prop['name'], versions[prop['name']], raw_text, text_hashes)
+        for prop in text_properties
+    }
+
+    properties_to_calculate = [
+        prop for prop in text_properties
+        if any(cached_values[prop['name']][i] is MISSING for i in text_indices)
+    ]
+    indices_to_calculate = [
+        i for i in text_indices
+        if any(cached_values[prop['name']][i] is MISSING for prop in properties_to_calculate)
+    ]
+    get_logger().info('Text properties cache hit rates: %s', {
+        name: f'{rate:.1%}' for name, rate in properties_cache.hit_rates().items()
+    })
+
+    calculated_properties = {name: [np.nan if value is MISSING else value for value in values]
+                             for name, values in cached_values.items()}
+    if not properties_to_calculate:
+        return calculated_properties
+
+    texts_to_calculate = [raw_text[i] for i in indices_to_calculate]
+    new_properties, failed_properties = _calculate_properties(
+        texts_to_calculate, properties_to_calculate, ignore_non_english_samples_for_english_properties, device,
+        models_storage, batch_size, cache_models, use_onnx_models, n_jobs
+    )
+    for prop in properties_to_calculate:
+        name = prop['name']
+        if name not in new_properties:
+            continue
+        for i, value in zip(indices_to_calculate, new_properties[name]):
+            calculated_properties[name][i] = value
+        if name not in failed_properties:
+            properties_cache.update(name, versions[name], texts_to_calculate, new_properties[name],
+                                    categorical=prop['output_type'] == 'categorical',
+                                    text_hashes=text_hashes[indices_to_calculate])
+    return calculated_properties
+
+
+def _get_property_version(property_name: str, use_onnx_models: bool,
+                          ignore_non_english_samples_for_english_properties: bool) -> str:
+    """Return the version of a property, which changes whenever its values may change."""
+    models = {
+        'Toxicity': TOXICITY_MODEL_NAME_ONNX if use_onnx_models else TOXICITY_MODEL_NAME,
+        'Fluency': FLUENCY_MODEL_NAME_ONNX if use_onnx_models else FLUENCY_MODEL_NAME,
+        'Formality': FORMALITY_MODEL_NAME_ONNX if use_onnx_models else FORMALITY_MODEL_NAME,
+    }
+    version = models.get(property_name, deepchecks.__version__)
+    if property_name in ENGLISH_ONLY_PROPERTIES and ignore_non_english_samples_for_english_properties:
+        version += '-english-only'
+    return version
+
+
+def _calculate_properties(
+        raw_text: Sequence[str],
+        text_properties: Sequence[TextProperty],
+        ignore_non_english_samples_for_english_properties: bool,
+        device: Optional[str],
+        models_storage: Union[pathlib.Path, str, None],
+        batch_size: Optional[int],
+        cache_models: bool,
+        use_onnx_models: bool,
+        n_jobs: int = 1
+) -> Tuple[Dict[str, List[Any]], Set[str]]:
+    """Calculate the properties values of the texts, and return them with the names of properties that failed."""
+    if n_jobs > 1 and len(raw_text) > 1:
+        return _calculate_properties_in_processes(
+            raw_text, text_properties, ignore_non_english_samples_for_english_properties, device, models_storage,
+            batch_size, cache_models, use_onnx_models, n_jobs
+        )
+
     properties_types = {
         it['name']: it['output_type']
         for it in text_properties
@@ -736,6 +889,7 @@ def calculate_builtin_properties(
 
     kwargs = dict(device=device, models_storage=models_storage)
     calculated_properties = {k: [] for k in properties_types.keys()}
+    failed_properties = set()
 
     # Prepare kwargs for properties that require outside resources:
     kwargs['fasttext_model'] = get_fasttext_model(models_storage=models_storage, use_cache=cache_models)
@@ -746,6 +900,7 @@ def calculate_builtin_properties(
             _warn_if_missing_nltk_dependencies('cmudict', format_list(properties_requiring_cmudict))
             for prop in properties_requiring_cmudict:
                 calculated_properties[prop] = [np.nan] * len(raw_text)
+                failed_properties.add(prop)
         kwargs['cmudict_dict'] = get_cmudict_dict(use_cache=cache_models)
 
     if 'Toxicity' in properties_types and 'toxicity_classifier' not in kwargs:
@@ -833,16 +988,61 @@ def calculate_builtin_properties(
         words_cache.clear()
         sentences_cache.clear()
 
-    if not calculated_properties:
-        raise RuntimeError('Failed to calculate any of the properties.')
+    return calculated_properties, failed_properties | import_warnings
 
-    properties_types = {
-        k: v
-        for k, v in properties_types.items()
-        if k in calculated_properties
-    }
 
-    return calculated_properties, properties_types
+def _calculate_properties_in_processes(
+        raw_text: Sequence[str],
+        text_properties: Sequence[TextProperty],
+        ignore_non_english_samples_for_english_properties: bool,
+        device: Optional[str],
+        models_storage: Union[pathlib.Path, str, None],
+        batch_size: Optional[int],
+        cache_models: bool,
+        use_onnx_models: bool,
+        n_jobs: int
+) -> Tuple[Dict[str, List[Any]], Set[str]]:
+    """Calculate the properties which do not use a model on shards of the texts in a process pool.
+
+    The model based properties are calculated in batches on the main process. Each shard is calculated exactly like
+    the whole texts would have been, so concatenating the shards results in the same values order.
+    """
+    cpu_properties = [prop for prop in text_properties if prop['name'] not in BATCH_PROPERTIES]
+    model_properties = [prop for prop in text_properties if prop['name'] in BATCH_PROPERTIES]
+    calculated_properties, failed_properties = {}, set()
+
+    if cpu_properties:
+        # the resources are downloaded once before starting the workers, so that they don't download them concurrently
+        import_optional_property_dependency(module='fasttext', property_name='language')
+        download_fasttext_model(models_storage)
+        if set(CMUDICT_PROPERTIES) & {prop['name'] for prop in cpu_properties}:
+            nltk_download('cmudict', quiet=True)
+        shard_size = -(-len(raw_text) // n_jobs)
+        shards = [raw_text[i:i + shard_size] for i in range(0, len(raw_text), shard_size)]
+        calculate_shard = partial(
+            _calculate_properties, text_properties=cpu_properties,
+            ignore_non_english_samples_for_english_properties=ignore_non_english_samples_for_english_properties,
+            device=device, models_storage=models_storage, batch_size=batch_size,
+            cache_models=True, use_onnx_models=use_onnx_models
+        )
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            for shard_properties, shard_failed_properties in pool.map(calculate_shard, shards):
+                for name, values in shard_properties.items():
+                    calculated_properties.setdefault(name, []).extend(values)
+                failed_properties |= shard_failed_properties
+
+    if model_properties:
+        model_calculated_properties, model_failed_properties = _calculate_properties(
+            raw_text, model_properties, ignore_non_english_samples_for_english_properties, device, models_storage,
+            batch_size, cache_models, use_onnx_models
+        )
+        calculated_properties.update(model_calculated_properties)
+        failed_properties |= model_failed_properties
+
+    # keep the properties order as in a sequential calculation
+    calculated_properties = {prop['name']: calculated_properties[prop['name']] for prop in text_properties
+                             if prop['name'] in calculated_properties}
+    return calculated_properties, failed_properties
 
 
 def _warn_long_compute(device, properties_types, n_samples, use_onnx_models):
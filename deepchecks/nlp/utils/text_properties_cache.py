@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing a persistent cache of the text properties values."""
+import os
+import pathlib
+import re
+import tempfile
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.nlp.utils.text import hash_samples
+from deepchecks.nlp.utils.text_properties_models import get_create_model_storage
+
+__all__ = ['PropertiesCache', 'MISSING']
+
+PROPERTIES_CACHE_DIRECTORY = 'properties-cache'
+
+
+class _Missing:
+    """Marker of a value that does not exist in the cache."""
+
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
+class PropertiesCache:
+    """Persistent store of text properties values, keyed by the text hash, the property name and its version.
+
+    The values of each property version are kept in a single compact columnar file (.npz) of sorted text keys
+    and their values, so that only texts that were not seen before have to be calculated.
+
+    Parameters
+    ----------
+    models_storage : Union[str, pathlib.Path, None], default None
+        The models storage directory, the cache is stored in its 'properties-cache' sub directory.
+    """
+
+    def __init__(self, models_storage: Union[pathlib.Path, str, None] = None):
+        self.directory = get_create_model_storage(models_storage) / PROPERTIES_CACHE_DIRECTORY
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+    def _get_path(self, property_name: str, version: str) -> pathlib.Path:
+        file_name = re.sub(r'[^\w.-]+', '_', f'{property_name}-{version}')
+        return self.directory / f'{file_name}.npz'
+
+    def _load(self, property_name: str, version: str) -> Tuple[np.ndarray, List[Any]]:
+        """Load the sorted keys and their values of a property version."""
+        path = self._get_path(property_name, version)
+        if not path.exists():
+            return np.array([], dtype=np.uint64), []
+        with np.load(path, allow_pickle=False) as stored:
+            if 'categories' in stored:
+                categories = stored['categories'].tolist()
+                values = [categories[code] if code >= 0 else None for code in stored['codes'].tolist()]
+            else:
+                values = stored['values'].tolist()
+            return stored['keys'], values
+
+    def get(self, property_name: str, version: str, texts: Sequence[str],
+            text_hashes: Optional[Sequence[int]] = None) -> List[Any]:
+        """Return the cached values of the property for the given texts, or MISSING for texts that are not cached.
+
+        Values of texts which are not strings are returned as MISSING and are not counted as hits or misses.
+        The texts are looked up by their hashes (see hash_samples), which are calculated if not given.
+        """
+        result = [MISSING] * len(texts)
+        indices = [i for i, text in enumerate(texts) if isinstance(text, str)]
+        if not indices:
+            return result
+        stored_keys, stored_values = self._load(property_name, version)
+        keys = _get_keys(texts, indices, text_hashes)
+        positions = np.searchsorted(stored_keys, keys)
+        found = positions < len(stored_keys)
+        found[found] = stored_keys[positions[found]] == keys[found]
+        for index, position, is_found in zip(indices, positions.tolist(), found.tolist()):
+            if is_found:
+                result[index] = stored_values[position]
+        self.hits[property_name] += int(found.sum())
+        self.misses[property_name] += int((~found).sum())
+        return result
+
+    def update(self, property_name: str, version: str, texts: Sequence[str], values: Sequence[Any],
+               categorical: bool = False, text_hashes: Optional[Sequence[int]] = None):
+        """Add the values of the property for the given texts to the cache."""
+        indices = [i for i, text in enumerate(texts) if isinstance(text, str)]
+        new_values = dict(zip(_get_keys(texts, indices, text_hashes).tolist(), [values[i] for i in indices]))
+        if not new_values:
+            return
+        stored_keys, stored_values = self._load(property_name, version)
+        all_values = dict(zip(stored_keys.tolist(), stored_values))
+        all_values.update(new_values)
+        keys = np.array(sorted(all_values), dtype=np.uint64)
+        values = [all_values[key] for key in keys.tolist()]
+
+        if categorical:
+            codes, categories = pd.factorize(pd.Series(values, dtype=object))
+            categories = np.asarray(categories.tolist())
+            if categories.dtype == object:  # only values of simple types are stored, to avoid pickling
+                return
+            arrays = {'keys': keys, 'codes': codes.astype(np.int32), 'categories': categories}
+        else:
+            values = np.asarray(values)
+            if values.dtype == object:
+                values = values.astype(np.float64)
+            arrays = {'keys': keys, 'values': values}
+
+        # write to a temporary file and replace, so that readers never see a partially written file
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, self._get_path(property_name, version))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def hit_rates(self) -> Dict[str, float]:
+        """Return the hit rate of the cache lookups of each property."""
+        return {
+            name: self.hits[name] / (self.hits[name] + self.misses[name])
+            for name in self.hits
+            if self.hits[name] + self.misses[name] > 0
+        }
+
+
+def _get_keys(texts: Sequence[str], indices: List[int], text_hashes: Optional[Sequence[int]]) -> np.ndarray:
+    """Return the cache keys of the texts of the given indices, which are their hashes."""
+    if text_hashes is None:
+        return hash_samples([texts[i] for i in indices])
+    return np.asarray(text_hashes, dtype=np.uint64)[indices]
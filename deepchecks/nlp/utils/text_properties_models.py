@@ -10,7 +10,9 @@
 #
 """Module containing the text properties models for the NLP module."""
 import logging
+import os
 import pathlib
+import tempfile
 import warnings
 from contextlib import contextmanager
 from functools import lru_cache
@@ -35,8 +37,7 @@ def get_create_model_storage(models_storage: Union[pathlib.Path, str, None] = No
             raise ValueError(
                 f'Unexpected type of the "models_storage" parameter - {type(models_storage)}'
             )
-        if not models_storage.exists():
-            models_storage.mkdir(parents=True)
+        models_storage.mkdir(parents=True, exist_ok=True)
         if not models_storage.is_dir():
             raise ValueError('"model_storage" expected to be a directory')
 
@@ -180,26 +181,35 @@ def get_fasttext_model(models_storage: Union[pathlib.Path, str, None] = None, us
     return _get_fasttext_model.__wrapped__(models_storage)
 
 
-@lru_cache(maxsize=1)
-def _get_fasttext_model(models_storage: Union[pathlib.Path, str, None] = None):
-    """Return fasttext model."""
-    fasttext = import_optional_property_dependency(module='fasttext', property_name='language')
-
+def download_fasttext_model(models_storage: Union[pathlib.Path, str, None] = None) -> pathlib.Path:
+    """Download the fasttext model to the models storage if it is not there, and return its path."""
     model_name = FASTTEXT_LANG_MODEL.rsplit('/', maxsplit=1)[-1]
-    model_path = get_create_model_storage(models_storage)
-    model_path = model_path / 'fasttext'
-
-    if not model_path.exists():
-        model_path.mkdir(parents=True)
-
-    model_path = model_path / model_name
+    model_directory = get_create_model_storage(models_storage) / 'fasttext'
+    model_directory.mkdir(parents=True, exist_ok=True)
+    model_path = model_directory / model_name
 
     # Save the model to a file
     if not model_path.exists():
         response = requests.get(FASTTEXT_LANG_MODEL, timeout=240)
         if response.status_code != 200:
             raise RuntimeError('Failed to donwload fasttext model')
-        model_path.write_bytes(response.content)
+        # write to a temporary file and replace, so that concurrent readers never see a partially written model
+        file_descriptor, temp_path = tempfile.mkstemp(dir=model_directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                f.write(response.content)
+            os.replace(temp_path, model_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    return model_path
+
+
+@lru_cache(maxsize=1)
+def _get_fasttext_model(models_storage: Union[pathlib.Path, str, None] = None):
+    """Return fasttext model."""
+    fasttext = import_optional_property_dependency(module='fasttext', property_name='language')
+    model_path = download_fasttext_model(models_storage)
 
     # This weird code is to suppress a warning from fasttext about a deprecated function
     try:
@@ -30,7 +30,10 @@
 # 8080labs/ppscore: zenodo release (1.2.0). Zenodo. https://doi.org/10.5281/zenodo.4091345
 
 # pylint: skip-file
+import hashlib
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 warnings.filterwarnings('ignore', message='The least populated class in y has only')
 
@@ -40,8 +43,10 @@ from pandas.api.types import (is_bool_dtype, is_categorical_dtype, is_datetime64
                               is_object_dtype, is_string_dtype, is_timedelta64_dtype)
 from sklearn import preprocessing, tree
 from sklearn.metrics import f1_score, mean_absolute_error
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import check_cv, cross_val_score
 
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.utils.row_hashing import hash_column
 from deepchecks.utils.typing import Hashable
 
 NOT_SUPPORTED_ANYMORE = "NOT_SUPPORTED_ANYMORE"
@@ -73,18 +78,7 @@ def _calculate_model_cv_score_(
     else:
         target_series = df[target]
 
-    # preprocess feature
-    if _dtype_represents_categories(df[feature]):
-        one_hot_encoder = preprocessing.OneHotEncoder()
-        array = df[feature].__array__()
-        sparse_matrix = one_hot_encoder.fit_transform(array.reshape(-1, 1))
-        feature_input = sparse_matrix
-    else:
-        # reshaping needed because there is only 1 feature
-        array = df[feature].values
-        if not isinstance(array, np.ndarray):  # e.g Int64 IntegerArray
-            array = array.to_numpy()
-        feature_input = array.reshape(-1, 1)
+    feature_input = _preprocess_feature(df[feature])
 
     # Cross-validation is stratifiedKFold for classification, KFold for regression
     # CV on one core (n_job=1; default) has shown to be fastest
@@ -95,6 +89,20 @@ def _calculate_model_cv_score_(
     return scores.mean()
 
 
+def _preprocess_feature(series):
+    """Return the model input of a single feature, categories are one-hot encoded."""
+    if _dtype_represents_categories(series):
+        one_hot_encoder = preprocessing.OneHotEncoder()
+        array = series.__array__()
+        sparse_matrix = one_hot_encoder.fit_transform(array.reshape(-1, 1))
+        return sparse_matrix
+    # reshaping needed because there is only 1 feature
+    array = series.values
+    if not isinstance(array, np.ndarray):  # e.g Int64 IntegerArray
+        array = array.to_numpy()
+    return array.reshape(-1, 1)
+
+
 def _normalized_mae_score(model_mae, naive_mae):
     """Normalize the model MAE score, given the baseline score."""
     # # Value range of MAE is [0, infinity), 0 is best
@@ -534,7 +542,7 @@ def _format_list_of_dicts(scores, output, sorted):
     return scores
 
 
-def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
+def predictors(df, y: Hashable, output="df", sorted=True, n_jobs=1, cache=None, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) of all the features in the dataframe.
 
@@ -550,6 +558,12 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
         Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
     sorted: bool
         Whether or not to sort the output dataframe/list by the ppscore
+    n_jobs: int, default: 1
+        Number of processes to score the features in, -1 means all the CPUs. The features are split into contiguous
+        shards, so the scores are the same as when calculated in a single process.
+    cache: MutableMapping or `None`
+        Mapping to store the score dicts in and to read them from, so features which were already scored on the same
+        values (of the feature and of y) with the same parameters are not scored again.
     kwargs:
         Other key-word arguments that shall be forwarded to the pps.score method,
         e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
@@ -564,6 +578,10 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
         raise TypeError(
             f"The 'df' argument should be a pandas.DataFrame but you passed a {type(df)}\nPlease convert your input to a pandas.DataFrame"
         )
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif not isinstance(n_jobs, int) or n_jobs < 1:
+        raise DeepchecksValueError(f"n_jobs must be a positive integer or -1, but got: {n_jobs}")
     if not _is_column_in_df(y, df):
         raise ValueError(
             f"The 'y' argument should be the name of a dataframe column but the variable that you passed is not a column in the given dataframe.\nPlease review the column name or your dataframe"
@@ -581,11 +599,167 @@ def predictors(df, y: Hashable, output="df", sorted=True, **kwargs):
             f"""The 'sorted' argument should be one of [True, False] but you passed: {sorted}\nPlease adjust your input to one of the valid values"""
         )
 
-    scores = [score(df, column, y, **kwargs) for column in df if column != y]
+    scores = _score_predictors(df, [column for column in df if column != y], y, n_jobs, cache, **kwargs)
 
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
 
 
+def _score_predictors(df, xs, y, n_jobs, cache, **kwargs):
+    """Calculate the PPS of the features xs for the target y, reading and storing the scores in the cache."""
+    if kwargs.get("random_seed", 123) is None:
+        from random import random
+
+        # a single random seed for all the features, so that they share the sample of the rows
+        kwargs["random_seed"] = int(random() * 1000)
+
+    if cache is not None:
+        y_key = _column_cache_key(df[y])
+        params_key = repr(sorted(kwargs.items()))
+        cache_keys = [(x, y, _column_cache_key(df[x]), y_key, params_key) for x in xs]
+    else:
+        cache_keys = [None] * len(xs)
+    scores = {x: cache[key] for x, key in zip(xs, cache_keys) if key is not None and key in cache}
+    missing = [x for x in xs if x not in scores]
+
+    if n_jobs > 1 and len(missing) > 1:
+        shard_size = -(-len(missing) // n_jobs)
+        shards = [missing[i:i + shard_size] for i in range(0, len(missing), shard_size)]
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [pool.submit(_score_features, df[shard + [y]], shard, y, **kwargs) for shard in shards]
+            for shard, future in zip(shards, futures):
+                scores.update(zip(shard, future.result()))
+    elif missing:
+        scores.update(zip(missing, _score_features(df, missing, y, **kwargs)))
+
+    if cache is not None:
+        for x, key in zip(xs, cache_keys):
+            cache[key] = scores[x]
+    return [scores[x] for x in xs]
+
+
+def _column_cache_key(series):
+    """Return the key of the values (in order) and of the dtype of a column, for the scores cache."""
+    return str(series.dtype), hashlib.blake2b(hash_column(series).tobytes(), digest_size=16).hexdigest()
+
+
+def _score_features(
+        df,
+        xs,
+        y,
+        task=NOT_SUPPORTED_ANYMORE,
+        sample=5_000,
+        cross_validation=4,
+        random_seed=123,
+        invalid_score=0,
+        catch_errors=True,
+):
+    """Calculate the PPS of each of the features xs for the target y.
+
+    The features without missing values (where y is not missing) have the same rows after dropping the missing values,
+    so the sampled and shuffled rows, the encoded target, the cross-validation splits and the baseline score are
+    calculated once for all of them. Other features are scored one by one with `score`.
+    """
+    params = dict(task=task, sample=sample, cross_validation=cross_validation, random_seed=random_seed,
+                  invalid_score=invalid_score, catch_errors=catch_errors)
+    if task is not NOT_SUPPORTED_ANYMORE:
+        return [score(df, x, y, **params) for x in xs]
+    y_notna = df[y].notna().to_numpy()
+    shared_target = None
+    scores = []
+    for x in xs:
+        if x == y or len(df[[x]].columns) >= 2 or df[x].isna().to_numpy()[y_notna].any():
+            scores.append(score(df, x, y, **params))
+            continue
+        try:
+            if shared_target is None:
+                shared_target = _prepare_shared_target(df, y, y_notna, sample, cross_validation, random_seed)
+            scores.append(_score_with_shared_target(df, x, y, shared_target, invalid_score))
+        except Exception as exception:
+            if not catch_errors:
+                raise exception
+            scores.append(score(df, x, y, **params))
+    return scores
+
+
+def _prepare_shared_target(df, y, y_notna, sample, cross_validation, random_seed):
+    """Sample the rows where y is not missing and prepare the target, exactly as `score` does for each feature."""
+    positions = np.flatnonzero(y_notna)
+    if len(positions) == 0:
+        return {"case": "empty_dataframe_after_dropping_na"}
+    # sampling and shuffling depend only on the number of rows, so they are done on the positions of the rows
+    positions = _maybe_sample(pd.Series(positions), sample, random_seed=random_seed).to_numpy()
+    target = df[y].iloc[positions]
+    shared_target = {"positions": positions}
+
+    category_count = target.value_counts().count()
+    if category_count == 1:
+        shared_target["case"] = "target_is_constant"
+    elif _dtype_represents_categories(target) and (category_count == len(target)):
+        shared_target["case"] = "target_is_id"
+    elif _dtype_represents_categories(target):
+        shared_target["case"] = "classification"
+    elif is_numeric_dtype(target):
+        shared_target["case"] = "regression"
+    elif is_datetime64_any_dtype(target) or is_timedelta64_dtype(target):
+        shared_target["case"] = "target_is_datetime"
+    else:
+        shared_target["case"] = "target_data_type_not_supported"
+
+    if shared_target["case"] in ["classification", "regression"]:
+        task = VALID_CALCULATIONS[shared_target["case"]]
+        shuffle = pd.Series(np.arange(len(positions))).sample(frac=1, random_state=random_seed, replace=False)
+        shuffle = shuffle.to_numpy()
+        target_df = target.to_frame(y).reset_index(drop=True)
+        if task["type"] == "classification":
+            shuffled_target = pd.Series(preprocessing.LabelEncoder().fit_transform(target.iloc[shuffle]))
+        else:
+            shuffled_target = target.iloc[shuffle]
+        shared_target["shuffle"] = shuffle
+        shared_target["target"] = shuffled_target
+        shared_target["cv"] = list(check_cv(cross_validation, shuffled_target,
+                                            classifier=task["type"] == "classification").split(
+            np.zeros((len(shuffled_target), 1)), shuffled_target))
+        _, shared_target["baseline_score"] = task["score_normalizer"](target_df, y, 0, random_seed=random_seed)
+    return shared_target
+
+
+def _score_with_shared_target(df, x, y, shared_target, invalid_score):
+    """Calculate the PPS of x for y on the shared sampled rows and target."""
+    case_type = shared_target["case"]
+    if case_type != "empty_dataframe_after_dropping_na":
+        feature = df[x].iloc[shared_target["positions"]]
+        if _feature_is_id(feature.to_frame(x), x):
+            case_type = "feature_is_id"
+    task = _get_task(case_type, invalid_score)
+
+    if case_type in ["classification", "regression"]:
+        feature_input = _preprocess_feature(feature.iloc[shared_target["shuffle"]])
+        model_score = cross_val_score(
+            task["model"], feature_input, shared_target["target"], cv=shared_target["cv"], scoring=task["metric_key"]
+        ).mean()
+        baseline_score = shared_target["baseline_score"]
+        if case_type == "classification":
+            ppscore = _normalized_f1_score(model_score, baseline_score)
+        else:
+            ppscore = _normalized_mae_score(abs(model_score), baseline_score)
+    else:
+        model_score = task["model_score"]
+        baseline_score = task["baseline_score"]
+        ppscore = task["ppscore"]
+
+    return {
+        "x": x,
+        "y": y,
+        "ppscore": ppscore,
+        "case": case_type,
+        "is_valid_score": task["is_valid_score"],
+        "metric": task["metric_name"],
+        "baseline_score": baseline_score,
+        "model_score": abs(model_score),  # sklearn returns negative mae
+        "model": task["model"],
+    }
+
+
 def matrix(df, output="df", sorted=False, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) matrix for all columns in the dataframe.
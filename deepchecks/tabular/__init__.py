@@ -13,10 +13,12 @@ from .base_checks import ModelComparisonCheck, ModelOnlyCheck, SingleDatasetChec
 from .context import Context
 from .dataset import Dataset
 from .model_base import ModelComparisonContext, ModelComparisonSuite
+from .parquet_dataset import ParquetDataset
 from .suite import Suite
 
 __all__ = [
     "Dataset",
+    "ParquetDataset",
     "Context",
     "SingleDatasetCheck",
     "TrainTestCheck",
@@ -19,7 +19,8 @@ feature_importance: pd.Series , default: None
 feature_importance_force_permutation : bool , default: False
     force calculation of permutation features importance
 feature_importance_timeout : int , default: 120
-    timeout in second for the permutation features importance calculation
+    timeout in second for the permutation features importance calculation. Once reached, the importance
+    calculated so far is used.
 y_pred_train: Optional[np.ndarray] , default: None
     Array of the model prediction over the train dataset.
 y_pred_test: Optional[np.ndarray] , default: None
@@ -11,13 +11,14 @@
 """module contains Data Duplicates check."""
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 from typing_extensions import TypedDict
 
 from deepchecks.core import CheckResult
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.abstracts.conflicting_labels import ConflictingLabelsAbstract
-from deepchecks.utils.dataframes import cast_categorical_to_object_dtype
+from deepchecks.utils.row_hashing import hash_column
 from deepchecks.utils.strings import format_list
 from deepchecks.utils.typing import Hashable
 
@@ -82,42 +83,35 @@ class ConflictingLabels(SingleDatasetCheck, ConflictingLabelsAbstract):
         features = dataset.features
         label_name = dataset.label_name
 
-        # HACK:
-        # pandas have bug with groupby on category dtypes,
-        # so until it fixed, change dtypes manually
-        df = cast_categorical_to_object_dtype(dataset.data.copy())
-
-        # Get index in order to use in the display
-        index_col_name = '_dc_index'
-        df[index_col_name] = df.index
-        # Group by features
-        group_unique_data = df.groupby(features, dropna=False).agg(list)
-        # Calculate count per feature-group
-        group_unique_data['count'] = group_unique_data[index_col_name].apply(len)
-        # Sort by count
-        group_unique_data = group_unique_data.sort_values(by='count', ascending=False)
-
-        num_ambiguous = 0
+        df = dataset.data
+        # rows are grouped by the hashes of their features, group ids are ordered by the first appearance of the group
+        group_ids, _ = pd.factorize(dataset.row_hashes(features))
+        group_counts = np.bincount(group_ids)
+        label_ids, label_hashes = pd.factorize(hash_column(df[label_name]))
+        # a group is ambiguous if it has more than one unique label
+        unique_group_labels = pd.unique(group_ids.astype(np.int64) * len(label_hashes) + label_ids)
+        n_labels_per_group = np.bincount(unique_group_labels // len(label_hashes), minlength=len(group_counts))
+        ambiguous_groups = np.flatnonzero(n_labels_per_group > 1)
+        ambiguous_groups = ambiguous_groups[np.argsort(-group_counts[ambiguous_groups], kind='stable')]
+        positions_by_group = np.argsort(group_ids, kind='stable')
+        groups_starts = np.cumsum(group_counts) - group_counts
+
+        num_ambiguous = int(group_counts[ambiguous_groups].sum())
         ambiguous_label_name = 'Observed Labels'
         indices_name = 'Instances'
         samples = []
         display_samples = []
 
-        for group_index, group_data in group_unique_data.iterrows():
-            ambiguous_labels = set(group_data[label_name])
-            if len(ambiguous_labels) == 1:
-                continue
-            num_ambiguous += group_data['count']
-            samples.append(group_data[index_col_name])
+        for group in ambiguous_groups:
+            group_positions = positions_by_group[groups_starts[group]:groups_starts[group] + group_counts[group]]
+            group_indices = df.index[group_positions].to_list()
+            samples.append(group_indices)
 
             if context.with_display is True:
-                index_names = group_unique_data.index.names
-                # In case of single feature the group_index is not a list so convert it
-                group_index = group_index if isinstance(group_index, list) else [group_index]
-                display_sample = dict(zip(index_names, group_index))
+                display_sample = df.iloc[group_positions[0]][features].to_dict()
                 # Using tuple since it's hashable
-                display_sample[ambiguous_label_name] = tuple(ambiguous_labels)
-                display_sample[indices_name] = format_list(group_data[index_col_name])
+                display_sample[ambiguous_label_name] = tuple(pd.unique(df[label_name].iloc[group_positions]))
+                display_sample[indices_name] = format_list(group_indices)
                 display_samples.append(display_sample)
 
         if len(display_samples) == 0:
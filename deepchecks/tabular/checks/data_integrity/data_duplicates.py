@@ -12,6 +12,7 @@
 from typing import List, Union
 
 import numpy as np
+import pandas as pd
 
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DatasetValidationError
@@ -67,8 +68,8 @@ class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
         CheckResult
             percentage of duplicates and display of the top n_to_show most duplicated.
         """
-        df = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state).data
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
+        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
+        df = select_from_dataframe(dataset.data, self.columns, self.ignore_columns)
 
         data_columns = list(df.columns)
         n_samples = df.shape[0]
@@ -76,38 +77,25 @@ class DataDuplicates(SingleDatasetCheck, DataDuplicatesAbstract):
         if n_samples == 0:
             raise DatasetValidationError('Dataset does not contain any data')
 
-        # HACK: pandas have bug with groupby on category dtypes, so until it fixed, change dtypes manually
-        category_columns = df.dtypes[df.dtypes == 'category'].index.tolist()
-        if category_columns:
-            df = df.astype({c: 'object' for c in category_columns})
-
-        group_unique_data = df[data_columns].groupby(data_columns, dropna=False).size()
-        n_unique = len(group_unique_data)
+        # rows are grouped by their hashes, group ids are ordered by the first appearance of the group
+        group_ids, _ = pd.factorize(dataset.row_hashes(data_columns))
+        group_counts = np.bincount(group_ids)
+        n_unique = len(group_counts)
 
         percent_duplicate = 1 - (1.0 * int(n_unique)) / (1.0 * int(n_samples))
 
         if context.with_display and percent_duplicate > 0:
-            # patched for anonymous_series
-            # TODO: reset_index(name=...) can be used instead of this confusing hack
-            is_anonymous_series = 0 in group_unique_data.keys().names
-            if is_anonymous_series:
-                new_name = str(group_unique_data.keys().names)
-                new_index = group_unique_data.keys()
-                new_index.names = [new_name if name == 0 else name for name in new_index.names]
-                group_unique_data = group_unique_data.reindex(new_index)
-            duplicates_counted = group_unique_data.reset_index().rename(columns={0: 'Number of Duplicates'})
-            if is_anonymous_series:
-                duplicates_counted.rename(columns={new_name: 0}, inplace=True)
-
-            most_duplicates = duplicates_counted[duplicates_counted['Number of Duplicates'] > 1]. \
-                nlargest(self.n_to_show, ['Number of Duplicates'])
-
-            indexes = []
-            for row in most_duplicates.iloc():
-                indexes.append(format_list(df.index[np.all(df == row[data_columns], axis=1)].to_list()))
-
-            most_duplicates['Instances'] = indexes
-
+            duplicated_groups = np.flatnonzero(group_counts > 1)
+            top_groups = duplicated_groups[np.argsort(-group_counts[duplicated_groups], kind='stable')][:self.n_to_show]
+            positions_by_group = np.argsort(group_ids, kind='stable')
+            groups_starts = np.cumsum(group_counts) - group_counts
+
+            most_duplicates = df.iloc[positions_by_group[groups_starts[top_groups]]].reset_index(drop=True)
+            most_duplicates['Number of Duplicates'] = group_counts[top_groups]
+            most_duplicates['Instances'] = [
+                format_list(df.index[positions_by_group[start:start + count]].to_list())
+                for start, count in zip(groups_starts[top_groups], group_counts[top_groups])
+            ]
             most_duplicates = most_duplicates.set_index(['Instances', 'Number of Duplicates'])
 
             text = f'{format_percent(percent_duplicate)} of data samples are duplicates. '
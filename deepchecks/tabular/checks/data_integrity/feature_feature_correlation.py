@@ -17,9 +17,10 @@ import pandas as pd
 import plotly.express as px
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, SingleDatasetCheck
-from deepchecks.utils.correlation_methods import correlation_ratio, symmetric_theil_u_correlation
-from deepchecks.utils.dataframes import generalized_corrwith, select_from_dataframe
+from deepchecks.utils.correlation_methods import correlation_ratio_matrix, symmetric_theil_u_correlation_matrix
+from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['FeatureFeatureCorrelation']
@@ -45,6 +46,8 @@ class FeatureFeatureCorrelation(SingleDatasetCheck):
         number of samples to use for this check.
     random_state : int, default: 42
         random seed for all check internals.
+    n_jobs : int , default: 1
+        Number of processes to calculate the correlations of the categorical features in, -1 means all the CPUs.
     """
 
     def __init__(
@@ -54,14 +57,18 @@ class FeatureFeatureCorrelation(SingleDatasetCheck):
         show_n_top_columns: int = 10,
         n_samples: int = 10_000,
         random_state: int = 42,
+        n_jobs: int = 1,
         **kwargs
     ):
         super().__init__(**kwargs)
+        if n_jobs != -1 and (not isinstance(n_jobs, int) or n_jobs < 1):
+            raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
         self.columns = columns
         self.ignore_columns = ignore_columns
         self.n_top_columns = show_n_top_columns
         self.n_samples = n_samples
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """
@@ -81,9 +88,9 @@ class FeatureFeatureCorrelation(SingleDatasetCheck):
         # must use list comprehension for deterministic order of columns
         num_features = [f for f in dataset.numerical_features if f in df.columns]
         cat_features = [f for f in dataset.cat_features if f in df.columns]
-        encoded_cat_data = df.loc[:, cat_features].apply(lambda x: pd.factorize(x)[0])
-        # NaNs are encoded as -1, replace back to NaN
-        encoded_cat_data.replace(-1, np.NaN, inplace=True)
+        # NaNs are encoded as -1
+        encoded_cat_data = np.array([pd.factorize(df[f])[0] for f in cat_features], dtype=np.int64).reshape(
+            len(cat_features), len(df)).T
 
         all_features = num_features + cat_features
         full_df = pd.DataFrame(index=all_features, columns=all_features)
@@ -94,12 +101,13 @@ class FeatureFeatureCorrelation(SingleDatasetCheck):
 
         # Categorical-categorical correlations
         if cat_features:
-            full_df.loc[cat_features, cat_features] = encoded_cat_data.corr(method=symmetric_theil_u_correlation)
+            full_df.loc[cat_features, cat_features] = symmetric_theil_u_correlation_matrix(encoded_cat_data,
+                                                                                           n_jobs=self.n_jobs)
 
         # Numerical-categorical correlations
         if num_features and cat_features:
-            num_cat_corr = generalized_corrwith(df.loc[:, num_features], encoded_cat_data,
-                                                method=correlation_ratio)
+            numerical_data = df.loc[:, num_features].to_numpy(dtype=np.float64, na_value=np.nan)
+            num_cat_corr = correlation_ratio_matrix(encoded_cat_data, numerical_data, n_jobs=self.n_jobs)
             full_df.loc[num_features, cat_features] = num_cat_corr
             full_df.loc[cat_features, num_features] = num_cat_corr.transpose()
 
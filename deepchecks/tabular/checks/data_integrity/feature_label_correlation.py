@@ -14,6 +14,7 @@ import typing as t
 import deepchecks.ppscore as pps
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.core.check_utils.feature_label_correlation_utils import get_pps_figure, pd_series_to_trace
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
 from deepchecks.tabular.utils.task_type import TaskType
@@ -50,6 +51,8 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         number of samples to use for this check.
     random_state : int , default: None
         Random state for the ppscore.predictors function
+    n_jobs : int , default: 1
+        Number of processes to calculate the PPS of the features in, -1 means all the CPUs.
     """
 
     def __init__(
@@ -58,13 +61,17 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
         n_top_features: int = 5,
         n_samples: int = 100_000,
         random_state: t.Optional[int] = None,
+        n_jobs: int = 1,
         **kwargs
     ):
         super().__init__(**kwargs)
+        if n_jobs != -1 and (not isinstance(n_jobs, int) or n_jobs < 1):
+            raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
         self.ppscore_params = ppscore_params or {}
         self.n_top_features = n_top_features
         self.n_samples = n_samples
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context, dataset_kind) -> CheckResult:
         """Run check.
@@ -90,7 +97,7 @@ class FeatureLabelCorrelation(SingleDatasetCheck):
             data_df[dataset.label_name] = data_df[dataset.label_name].astype(object)
 
         df_pps = pps.predictors(df=data_df, y=dataset.label_name, random_seed=self.random_state,
-                                **self.ppscore_params)
+                                **{'n_jobs': self.n_jobs, **self.ppscore_params})
         s_ppscore = df_pps.set_index('x', drop=True)['ppscore']
 
         if context.with_display:
@@ -11,12 +11,12 @@
 """Module contains is_single_value check."""
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['IsSingleValue']
@@ -39,6 +39,11 @@ class IsSingleValue(SingleDatasetCheck):
         number of samples to use for this check.
     random_state : int, default: 42
         random seed for all check internals.
+
+    Notes
+    -----
+    For streaming datasets, which are read in chunks, the number of unique values of a column is capped at 2, meaning
+    2 or more unique values, as counting all of them exactly would require keeping them in memory.
     """
 
     def __init__(
@@ -64,13 +69,34 @@ class IsSingleValue(SingleDatasetCheck):
         -------
         CheckResult
             value of result is a dict of all columns with number of unique values in format {column: number_of_uniques}
+            (capped at 2 for streaming datasets)
             display is a series with columns that have only one unique
         """
-        # Validate parameters
-        df = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state).data
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
+        dataset = context.get_data_by_kind(dataset_kind)
+        # Only up to 2 non-null unique values of each column are kept over the chunks of the data, which is enough to
+        # tell whether the column has a single value, so the memory is bounded also for high cardinality columns.
+        # An in-memory dataset is a single chunk, so its number of unique values is exact.
+        kept_uniques, n_uniques, has_nulls = {}, {}, {}
+        for chunk in dataset.iter_chunks(self.columns, self.ignore_columns, self.n_samples, self.random_state):
+            for column_name, column in chunk.items():
+                non_null_uniques = column.dropna().drop_duplicates()
+                has_nulls[column_name] = has_nulls.get(column_name, False) or bool(column.isna().any())
+                if column_name in kept_uniques:
+                    if len(kept_uniques[column_name]) > 1:
+                        continue
+                    non_null_uniques = pd.concat([kept_uniques[column_name], non_null_uniques],
+                                                 ignore_index=True).drop_duplicates()
+                kept_uniques[column_name] = non_null_uniques.iloc[:2]
+                n_uniques[column_name] = len(non_null_uniques)
+            if all(len(uniques) > 1 for uniques in kept_uniques.values()):
+                break
 
-        num_unique_per_col = df.nunique(dropna=self.ignore_nan)
+        num_unique_per_col = pd.Series({
+            column_name: n_unique + int(not self.ignore_nan and has_nulls[column_name])
+            for column_name, n_unique in n_uniques.items()
+        }, dtype=int)
+        if dataset.is_streaming:
+            num_unique_per_col = num_unique_per_col.clip(upper=2)
         is_single_unique_value = (num_unique_per_col == 1)
 
         if context.with_display and is_single_unique_value.any():
@@ -78,8 +104,8 @@ class IsSingleValue(SingleDatasetCheck):
             # pylint: disable=unsubscriptable-object
             cols_with_single = is_single_unique_value[is_single_unique_value].index.to_list()
             uniques = pd.DataFrame({
-                column_name: [column.sort_values(kind='mergesort').values[0]]
-                for column_name, column in df.loc[:, cols_with_single].items()
+                column_name: [kept_uniques[column_name].values[0] if len(kept_uniques[column_name]) > 0 else np.nan]
+                for column_name in cols_with_single
             })
             uniques.index = ['Single unique value']
             display = ['The following columns have only one unique value', uniques]
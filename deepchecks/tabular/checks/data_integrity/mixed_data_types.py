@@ -17,7 +17,6 @@ import pandas as pd
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular.utils.feature_importance import N_TOP_MESSAGE, column_importance_sorter_df
-from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.strings import format_list, format_number, format_percent, is_string_column, truncate_string
 from deepchecks.utils.typing import Hashable
 
@@ -69,18 +68,22 @@ class MixedDataTypes(SingleDatasetCheck):
             for any column with mixed data types.
             numbers will also include hidden numbers in string representation.
         """
-        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
+        dataset = context.get_data_by_kind(dataset_kind)
         feature_importance = context.feature_importance
 
-        df = select_from_dataframe(dataset.data, self.columns, self.ignore_columns)
+        # The types counts of each column are accumulated over the chunks of the data
+        columns_counts = {}
+        for chunk in dataset.iter_chunks(self.columns, self.ignore_columns, self.n_samples, self.random_state):
+            for column_name in chunk.columns:
+                counts = columns_counts.setdefault(column_name, _TypesCounts())
+                counts.update(chunk[column_name].dropna())
 
         # Result value: { Column Name: {string: pct, numbers: pct}}
         display_dict = {}
         result_dict = {}
 
-        for column_name in df.columns:
-            column_data = df[column_name].dropna()
-            mix = self._get_data_mix(column_data)
+        for column_name, counts in columns_counts.items():
+            mix = counts.get_data_mix()
             result_dict[column_name] = mix
             if context.with_display and mix:
                 # Format percents for display
@@ -102,39 +105,6 @@ class MixedDataTypes(SingleDatasetCheck):
 
         return CheckResult(result_dict, display=display)
 
-    def _get_data_mix(self, column_data: pd.Series) -> dict:
-        if is_string_column(column_data):
-            return self._check_mixed_percentage(column_data)
-        return {}
-
-    def _check_mixed_percentage(self, column_data: pd.Series) -> dict:
-        total_rows = column_data.count()
-
-        numbers_in_col = set()
-        strings_in_col = set()
-
-        def is_float(x) -> bool:
-            try:
-                float(x)
-                if len(numbers_in_col) < 3:
-                    numbers_in_col.add(x)
-                return True
-            except ValueError:
-                if len(strings_in_col) < 3:
-                    strings_in_col.add(x)
-                return False
-
-        nums = sum(column_data.apply(is_float))
-        if nums in (total_rows, 0):
-            return {}
-
-        # Then we've got a mix
-        nums_pct = nums / total_rows
-        strs_pct = (np.abs(nums - total_rows)) / total_rows
-
-        return {'strings': strs_pct, 'numbers': nums_pct,
-                'strings_examples': strings_in_col, 'numbers_examples': numbers_in_col}
-
     def add_condition_rare_type_ratio_not_in_range(self, ratio_range: Tuple[float, float] = (0.01, 0.1)):
         """Add condition - Whether the ratio of rarer data type (strings or numbers) is not in the "danger zone".
 
@@ -172,3 +142,49 @@ class MixedDataTypes(SingleDatasetCheck):
         name = f'Rare data types in column are either more than {format_percent(ratio_range[1])} or less ' \
                f'than {format_percent(ratio_range[0])} of the data'
         return self.add_condition(name, condition)
+
+
+class _TypesCounts:
+    """Counts of the numbers and strings values of a column, accumulated over chunks of the column."""
+
+    def __init__(self):
+        self.total_rows = 0
+        self.nums = 0
+        self.is_string_column = False
+        self.numbers_in_col = set()
+        self.strings_in_col = set()
+
+    def update(self, column_data: pd.Series):
+        """Add the counts of the given (non null) values of the column."""
+        self.total_rows += column_data.count()
+        if not is_string_column(column_data):
+            # All the values of the chunk are numbers (or non string objects, which are not counted as strings)
+            self.nums += column_data.count()
+            self.numbers_in_col.update(column_data.iloc[:max(3 - len(self.numbers_in_col), 0)])
+            return
+        self.is_string_column = True
+
+        def is_float(x) -> bool:
+            try:
+                float(x)
+                if len(self.numbers_in_col) < 3:
+                    self.numbers_in_col.add(x)
+                return True
+            except ValueError:
+                if len(self.strings_in_col) < 3:
+                    self.strings_in_col.add(x)
+                return False
+
+        self.nums += sum(column_data.apply(is_float))
+
+    def get_data_mix(self) -> dict:
+        """Return the ratios of strings and numbers in the column, or an empty dict if there is no mix."""
+        if not self.is_string_column or self.nums in (self.total_rows, 0):
+            return {}
+
+        # Then we've got a mix
+        nums_pct = self.nums / self.total_rows
+        strs_pct = (np.abs(self.nums - self.total_rows)) / self.total_rows
+
+        return {'strings': strs_pct, 'numbers': nums_pct,
+                'strings_examples': self.strings_in_col, 'numbers_examples': self.numbers_in_col}
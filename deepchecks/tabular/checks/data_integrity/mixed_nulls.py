@@ -23,7 +23,6 @@ from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular._shared_docs import docstrings
 from deepchecks.tabular.utils.feature_importance import N_TOP_MESSAGE
 from deepchecks.tabular.utils.messages import get_condition_passed_message
-from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.strings import format_percent, string_baseform
 from deepchecks.utils.typing import Hashable
 
@@ -90,52 +89,31 @@ class MixedNulls(SingleDatasetCheck, ReduceFeatureMixin):
             display is DataFrame with columns ('Column Name', 'Value', 'Count', 'Percentage') for any column that
             has more than 1 null values.
         """
-        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
-        df = dataset.data
-
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
+        dataset = context.get_data_by_kind(dataset_kind)
         null_string_list = self._validate_null_string_list(self.null_string_list)
 
+        # The nulls counts of each column are accumulated over the chunks of the data
+        n_samples = 0
+        columns_null_counts = {}
+        for chunk in dataset.iter_chunks(self.columns, self.ignore_columns, self.n_samples, self.random_state):
+            n_samples += len(chunk)
+            for column_name in list(chunk.columns):
+                column_null_counts = columns_null_counts.setdefault(column_name, {})
+                for null_value, count in self._get_null_counts(chunk[column_name], null_string_list).items():
+                    column_null_counts[null_value] = column_null_counts.get(null_value, 0) + count
+
         feature_importance = context.feature_importance if context.feature_importance is not None \
-            else pd.Series(index=list(df.columns), dtype=object)
+            else pd.Series(index=list(columns_null_counts), dtype=object)
 
         # Result value
         display_array = []
-        result_dict = {'n_samples': len(df), 'columns': {}, 'feature_importance': feature_importance}
-
-        for column_name in list(df.columns):
-            column_data = df[column_name]
-            if is_categorical_dtype(column_data) is True:
-                # NOTE:
-                # 'pandas.Series.value_counts' and 'pandas.Series.apply'
-                # work in an unusual way with categorical data types
-                # - 'value_counts' returns all categorical values even if they are not in series
-                # - 'apply' applies function to each category, not to values
-                # therefore we processing categorical dtypes differently
-                # NOTE:
-                # 'Series.value_counts' method transforms null values like 'None', 'pd.Na', 'pd.NaT'
-                # into 'np.nan' therefore it cannot be used for usual dtypes, because we will lose info
-                # about all different null types in the column
-                null_counts = {}
-                for value, count in column_data.value_counts(dropna=False).to_dict().items():
-                    if count > 0:
-                        if pd.isna(value):
-                            null_counts[nan_type(value)] = count
-                        elif string_baseform(value) in null_string_list:
-                            null_counts[repr(value).replace('\'', '"')] = count
-            else:
-                string_null_counts = {
-                    repr(value).replace('\'', '"'): count
-                    for value, count in column_data.value_counts(dropna=True).items()
-                    if string_baseform(value) in null_string_list
-                }
-                nan_data_counts = column_data[column_data.isna()].apply(nan_type).value_counts().to_dict()
-                null_counts = {**string_null_counts, **nan_data_counts}
+        result_dict = {'n_samples': n_samples, 'columns': {}, 'feature_importance': feature_importance}
 
+        for column_name, null_counts in columns_null_counts.items():
             result_dict['columns'][column_name] = {}
             # Save the column nulls info
             for null_value, count in null_counts.items():
-                percent = count / len(column_data)
+                percent = count / n_samples
                 display_array.append([column_name, null_value, count, format_percent(percent)])
                 result_dict['columns'][column_name][null_value] = {'count': count, 'percent': percent}
 
@@ -151,6 +129,37 @@ class MixedNulls(SingleDatasetCheck, ReduceFeatureMixin):
 
         return CheckResult(result_dict, display=display)
 
+    @staticmethod
+    def _get_null_counts(column_data: pd.Series, null_string_list: set) -> Dict[str, int]:
+        """Return the counts of the different null values in the column."""
+        if is_categorical_dtype(column_data) is True:
+            # NOTE:
+            # 'pandas.Series.value_counts' and 'pandas.Series.apply'
+            # work in an unusual way with categorical data types
+            # - 'value_counts' returns all categorical values even if they are not in series
+            # - 'apply' applies function to each category, not to values
+            # therefore we processing categorical dtypes differently
+            # NOTE:
+            # 'Series.value_counts' method transforms null values like 'None', 'pd.Na', 'pd.NaT'
+            # into 'np.nan' therefore it cannot be used for usual dtypes, because we will lose info
+            # about all different null types in the column
+            null_counts = {}
+            for value, count in column_data.value_counts(dropna=False).to_dict().items():
+                if count > 0:
+                    if pd.isna(value):
+                        null_counts[nan_type(value)] = count
+                    elif string_baseform(value) in null_string_list:
+                        null_counts[repr(value).replace('\'', '"')] = count
+            return null_counts
+
+        string_null_counts = {
+            repr(value).replace('\'', '"'): count
+            for value, count in column_data.value_counts(dropna=True).items()
+            if string_baseform(value) in null_string_list
+        }
+        nan_data_counts = column_data[column_data.isna()].apply(nan_type).value_counts().to_dict()
+        return {**string_null_counts, **nan_data_counts}
+
     def reduce_output(self, check_result: CheckResult) -> Dict[str, float]:
         """Return an aggregated drift score based on aggregation method defined."""
         feature_importance = check_result.value['feature_importance']
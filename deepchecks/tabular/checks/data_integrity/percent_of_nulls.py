@@ -17,6 +17,7 @@ import plotly.express as px
 from deepchecks.core.check_result import CheckResult
 from deepchecks.core.checks import DatasetKind
 from deepchecks.core.condition import ConditionCategory, ConditionResult
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
 from deepchecks.core.reduce_classes import ReduceFeatureMixin
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.tabular._shared_docs import docstrings
@@ -71,26 +72,37 @@ class PercentOfNulls(SingleDatasetCheck, ReduceFeatureMixin):
 
     def run_logic(self, context: Context, dataset_kind: DatasetKind) -> CheckResult:
         """Run check logic."""
-        dataset = context.get_data_by_kind(dataset_kind).sample(self.n_samples, random_state=self.random_state)
-        dataset = dataset.select(self.columns, self.ignore_columns, keep_label=False)
-        data = dataset.features_columns
+        dataset = context.get_data_by_kind(dataset_kind)
+
+        # The nulls counts are accumulated over the chunks of the data
+        n_samples = 0
+        nulls_counts = None
+        for chunk in dataset.iter_chunks(self.columns, self.ignore_columns, self.n_samples, self.random_state):
+            chunk = chunk[[col for col in dataset.features if col in chunk.columns]]
+            n_samples += len(chunk)
+            nulls_counts = chunk.isna().sum() if nulls_counts is None else nulls_counts + chunk.isna().sum()
+        if nulls_counts is None:
+            raise DeepchecksValueError('Dataset does not contain any samples')
+        columns = list(nulls_counts.index)
+        if not columns:
+            raise DeepchecksNotSupportedError('Dataset does not contain any feature columns')
 
         feature_importance = context.feature_importance if context.feature_importance is not None \
-            else pd.Series(index=list(data.columns), dtype=object)
+            else pd.Series(index=columns, dtype=object)
 
-        result_data = [[col, data[col].isna().sum(), feature_importance[col]] for col in data.columns]
+        result_data = [[col, nulls_counts[col], feature_importance[col]] for col in columns]
         result_data = pd.DataFrame(data=result_data,
                                    columns=['Column',
                                             'Percent of nulls in sample',
                                             'Feature importance']).set_index(['Column'])
-        result_data['Percent of nulls in sample'] = result_data['Percent of nulls in sample'] / dataset.n_samples
+        result_data['Percent of nulls in sample'] = result_data['Percent of nulls in sample'] / n_samples
         result_data.sort_values(by='Percent of nulls in sample')
         if all(feature_importance.isna()):
             result_data.drop('Feature importance', axis=1, inplace=True)
 
         if context.with_display and max(result_data['Percent of nulls in sample']) > 0:
             display = (
-                [px.bar(x=data.columns, y=result_data['Percent of nulls in sample'],
+                [px.bar(x=columns, y=result_data['Percent of nulls in sample'],
                         title='Percent Of Nulls', range_y=(0, 1))
                  .update_layout(yaxis_title=None, xaxis_title=None)])
         else:
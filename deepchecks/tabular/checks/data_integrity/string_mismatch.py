@@ -91,7 +91,7 @@ class StringMismatch(SingleDatasetCheck, ReduceFeatureMixin):
                 continue
 
             result_dict['columns'][column_name] = {}
-            value_counts = column.value_counts()
+            value_counts = column.value_counts().to_dict()
             uniques = column.unique()
             base_form_to_variants = get_base_form_to_variants_dict(uniques)
             for base_form, variants in base_form_to_variants.items():
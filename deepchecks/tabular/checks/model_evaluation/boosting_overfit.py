@@ -186,7 +186,7 @@ class BoostingOverfit(TrainTestCheck):
         """
         train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
         test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
-        model = context.model
+        model = context.raw_model
 
         # Get default scorer
         scorer = context.get_single_scorer(self.alternative_scorer)
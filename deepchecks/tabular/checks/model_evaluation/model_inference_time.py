@@ -57,7 +57,7 @@ class ModelInferenceTime(SingleDatasetCheck):
             if 'model' is not a scikit-learn-compatible fitted estimator instance.
         """
         dataset = context.get_data_by_kind(dataset_kind)
-        model = context.model
+        model = context.raw_model
         df = dataset.features_columns
 
         prediction_method = model.predict  # type: ignore
@@ -32,7 +32,7 @@ class ModelInfo(ModelOnlyCheck):
         CheckResult
             value is dictionary in format {type: <model_type>, params: <model_params_dict>}
         """
-        model = context.model
+        model = context.raw_model
         estimator = get_model_of_pipeline(model)
         model_type = type(estimator).__name__
         try:
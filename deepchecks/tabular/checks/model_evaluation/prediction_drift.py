@@ -21,6 +21,7 @@ from deepchecks.core.reduce_classes import ReduceMixin
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.abstracts.prediction_drift import PredictionDriftAbstract
+from deepchecks.utils.distribution.sketches import DriftProfile
 
 __all__ = ['PredictionDrift']
 
@@ -115,6 +116,10 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
         number of samples to use for this check.
     random_state : int, default: 42
         random seed for all check internals.
+    train_profile : t.Optional[DriftProfile] , default: None
+        Drift profile of the train data, created with the model
+        (see ``deepchecks.tabular.utils.drift_profile.create_drift_profile``). If given, the distribution of the train
+        predictions is taken from the profile instead of predicting on the train dataset.
     """
 
     def __init__(
@@ -134,6 +139,7 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
             min_samples: t.Optional[int] = 10,
             n_samples: int = 100_000,
             random_state: int = 42,
+            train_profile: t.Optional[DriftProfile] = None,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -159,6 +165,7 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
         self.min_samples = min_samples
         self.n_samples = n_samples
         self.random_state = random_state
+        self.train_profile = train_profile
         if self.aggregation_method not in ('weighted', 'mean', 'none', None, 'max'):
             raise DeepchecksValueError('aggregation_method must be one of "weighted", "mean", "max", None')
 
@@ -174,7 +181,6 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
         if (self.drift_mode == 'proba') and (context.task_type == TaskType.REGRESSION):
             raise DeepchecksValueError('probability_drift="proba" is not supported for regression tasks')
 
-        train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
         test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
         model = context.model
 
@@ -184,15 +190,21 @@ class PredictionDrift(PredictionDriftAbstract, TrainTestCheck, ReduceMixin):
              or (self.drift_mode == 'proba')) \
             and not (self.balance_classes is True and self.drift_mode == 'auto')
 
+        if self.train_profile is not None:
+            train_features = None
+        else:
+            train_features = context.train.sample(self.n_samples, random_state=self.random_state).features_columns
+
         if proba_drift:
-            train_pred = np.array(model.predict_proba(train_dataset.features_columns))
+            train_pred = None if train_features is None else np.array(model.predict_proba(train_features))
             test_pred = np.array(model.predict_proba(test_dataset.features_columns))
         else:
-            train_pred = np.array(model.predict(train_dataset.features_columns)).reshape((-1, 1))
+            train_pred = None if train_features is None else np.array(model.predict(train_features)).reshape((-1, 1))
             test_pred = np.array(model.predict(test_dataset.features_columns)).reshape((-1, 1))
 
         return self._prediction_drift(train_pred, test_pred, context.model_classes, context.with_display, proba_drift,
-                                      (context.task_type != TaskType.REGRESSION) and (not proba_drift))
+                                      (context.task_type != TaskType.REGRESSION) and (not proba_drift),
+                                      self.train_profile)
 
     def reduce_output(self, check_result: CheckResult) -> t.Dict[str, float]:
         """Return prediction drift score."""
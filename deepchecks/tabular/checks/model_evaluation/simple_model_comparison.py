@@ -168,7 +168,7 @@ class SimpleModelComparison(TrainTestCheck):
         simple_model = self._create_simple_model(train_dataset, task_type)
 
         models = [
-            (f'{type(model).__name__} model', 'Origin', model),
+            (f'{context.model_name} model', 'Origin', model),
             (f'Simple model - {self.strategy}', 'Simple', simple_model)
         ]
         classes_display_array = []
@@ -19,6 +19,7 @@ from deepchecks.core.reduce_classes import ReduceFeatureMixin
 from deepchecks.tabular import Context, Dataset, TrainTestCheck
 from deepchecks.tabular._shared_docs import docstrings
 from deepchecks.utils.abstracts.feature_drift import FeatureDriftAbstract
+from deepchecks.utils.distribution.sketches import DriftProfile, NumericSketch
 from deepchecks.utils.typing import Hashable
 
 __all__ = ['FeatureDrift']
@@ -99,6 +100,11 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         Number of samples to use for drift computation and plot.
     random_state : int , default: 42
         Random seed for sampling.
+    train_profile : Optional[DriftProfile] , default: None
+        Drift profile of the train data (see ``deepchecks.tabular.utils.drift_profile.create_drift_profile``).
+        If given, the train distributions are taken from the profile instead of the train dataset, which is used only
+        for validation and is not read. Drift scores of numerical features are approximated if the profile was
+        created from more values than its sketches keep.
     """
 
     def __init__(
@@ -119,6 +125,7 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
             min_samples: int = 10,
             n_samples: int = 100_000,
             random_state: int = 42,
+            train_profile: Optional[DriftProfile] = None,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -143,6 +150,7 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         self.min_samples = min_samples
         self.n_samples = n_samples
         self.random_state = random_state
+        self.train_profile = train_profile
 
     def run_logic(self, context: Context) -> CheckResult:
         """
@@ -170,9 +178,9 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         train_dataset.assert_features()
         test_dataset.assert_features()
 
-        train_dataset = train_dataset.select(
-            self.columns, self.ignore_columns
-        ).sample(self.n_samples, random_state=self.random_state)
+        train_dataset = train_dataset.select(self.columns, self.ignore_columns)
+        if self.train_profile is None:
+            train_dataset = train_dataset.sample(self.n_samples, random_state=self.random_state)
         test_dataset = test_dataset.select(
             self.columns, self.ignore_columns
         ).sample(self.n_samples, random_state=self.random_state)
@@ -189,7 +197,12 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
         common_columns = {}
 
         for column in train_dataset.features:
-            if column in train_dataset.numerical_features:
+            if self.train_profile is not None:
+                # the column types are the types of the sketches in the profile
+                if column in self.train_profile.columns:
+                    is_numerical = isinstance(self.train_profile.columns[column], NumericSketch)
+                    common_columns[column] = 'numerical' if is_numerical else 'categorical'
+            elif column in train_dataset.numerical_features:
                 common_columns[column] = 'numerical'
             elif column in train_dataset.cat_features:
                 common_columns[column] = 'categorical'
@@ -199,7 +212,7 @@ class FeatureDrift(TrainTestCheck, FeatureDriftAbstract, ReduceFeatureMixin):
 
         results, displays = self._calculate_feature_drift(
             drift_kind='tabular-features',
-            train=train_dataset.data,
+            train=train_dataset.data if self.train_profile is None else self.train_profile.columns,
             test=test_dataset.data,
             train_dataframe_name=train_dataset.name,
             test_dataframe_name=test_dataset.name,
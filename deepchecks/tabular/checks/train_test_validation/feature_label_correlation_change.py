@@ -10,6 +10,7 @@
 #
 """The feature label correlation change check module."""
 import typing as t
+from collections import OrderedDict
 from copy import copy
 
 import numpy as np
@@ -17,6 +18,7 @@ import numpy as np
 from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.core.check_utils.feature_label_correlation_utils import get_feature_label_correlation
 from deepchecks.core.condition import ConditionCategory
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.tabular.utils.messages import get_condition_passed_message
 from deepchecks.tabular.utils.task_type import TaskType
@@ -31,6 +33,27 @@ pps_url = 'https://docs.deepchecks.com/stable/tabular/auto_checks/' \
           'train_test_validation/plot_feature_label_correlation_change.html'
 pps_html = f'<a href={pps_url} target="_blank">Predictive Power Score</a>'
 
+PPS_CACHE_MAX_SIZE = 10_000
+
+
+class _LRUCache(OrderedDict):
+    """Mapping which keeps only the most recently used max_size items."""
+
+    def __init__(self, max_size: int = PPS_CACHE_MAX_SIZE):
+        super().__init__()
+        self.max_size = max_size
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_size:
+            self.popitem(last=False)
+
 
 class FeatureLabelCorrelationChange(TrainTestCheck):
     """
@@ -59,6 +82,8 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
         Random state for the ppscore.predictors function
     min_pps_to_show: float, default 0.05
         Minimum PPS to show a class in the graph
+    n_jobs : int , default: 1
+        Number of processes to calculate the PPS of the features in, -1 means all the CPUs.
     """
 
     def __init__(self, ppscore_params=None,
@@ -66,13 +91,19 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
                  n_samples: int = 100_000,
                  random_state: int = None,
                  min_pps_to_show: float = 0.05,
+                 n_jobs: int = 1,
                  **kwargs):
         super().__init__(**kwargs)
+        if n_jobs != -1 and (not isinstance(n_jobs, int) or n_jobs < 1):
+            raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
         self.ppscore_params = ppscore_params or {}
         self.n_top_features = n_top_features
         self.n_samples = n_samples
         self.random_state = random_state
         self.min_pps_to_show = min_pps_to_show
+        self.n_jobs = n_jobs
+        # scores of features which were already calculated on the same data, e.g. when only the test dataset changes
+        self._pps_cache = _LRUCache()
 
     def run_logic(self, context: Context) -> CheckResult:
         """Run check.
@@ -122,12 +153,14 @@ class FeatureLabelCorrelationChange(TrainTestCheck):
         ret_value, display = get_feature_label_correlation(train_df,
                                                            train_dataset.label_name,
                                                            test_df,
-                                                           test_dataset.label_name, self.ppscore_params,
+                                                           test_dataset.label_name,
+                                                           {'n_jobs': self.n_jobs, **self.ppscore_params},
                                                            self.n_top_features,
                                                            min_pps_to_show=self.min_pps_to_show,
                                                            random_state=self.random_state,
                                                            with_display=context.with_display,
-                                                           dataset_names=(train_dataset.name, test_dataset.name))
+                                                           dataset_names=(train_dataset.name, test_dataset.name),
+                                                           pps_cache=self._pps_cache)
 
         if display:
             display += text
@@ -11,13 +11,15 @@
 
 """Module contains Label Drift check."""
 
-from typing import Dict
+from typing import Dict, Optional
 
 from deepchecks.core import CheckResult
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.core.reduce_classes import ReduceLabelMixin
 from deepchecks.tabular import Context, TrainTestCheck
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.abstracts.label_drift import LabelDriftAbstract
+from deepchecks.utils.distribution.sketches import DriftProfile
 
 __all__ = ['LabelDrift']
 
@@ -87,6 +89,9 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
         Number of samples to use for drift computation and plot.
     random_state : int , default: 42
         Random seed for sampling.
+    train_profile : Optional[DriftProfile] , default: None
+        Drift profile of the train data (see ``deepchecks.tabular.utils.drift_profile.create_drift_profile``).
+        If given, the train label distribution is taken from the profile instead of the train dataset.
     """
 
     def __init__(
@@ -103,6 +108,7 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
             min_samples: int = 10,
             n_samples: int = 100_000,
             random_state: int = 42,
+            train_profile: Optional[DriftProfile] = None,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -118,6 +124,7 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
         self.min_samples = min_samples
         self.n_samples = n_samples
         self.random_state = random_state
+        self.train_profile = train_profile
 
     def run_logic(self, context: Context) -> CheckResult:
         """Calculate drift for all columns.
@@ -128,12 +135,19 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
             value: drift score.
             display: label distribution graph, comparing the train and test distributions.
         """
-        train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
+        if self.train_profile is not None:
+            if self.train_profile.label is None:
+                raise DeepchecksValueError('The train profile does not contain the label distribution')
+            train_dataset = context.train
+            train_label = self.train_profile.label
+        else:
+            train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
+            train_label = train_dataset.label_col
         test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
 
         column_type = 'categorical' if context.task_type != TaskType.REGRESSION else 'numerical'
 
-        return self._calculate_label_drift(train_dataset.label_col, test_dataset.label_col, train_dataset.label_name,
+        return self._calculate_label_drift(train_label, test_dataset.label_col, train_dataset.label_name,
                                            column_type, context.with_display, (train_dataset.name, test_dataset.name))
 
     def reduce_output(self, check_result: CheckResult) -> Dict[str, float]:
@@ -94,8 +94,8 @@ class StringMismatchComparison(TrainTestCheck):
                 continue
 
             result_dict[column_name] = {}
-            tested_counts = tested_column.value_counts()
-            baseline_counts = baseline_column.value_counts()
+            tested_counts = tested_column.value_counts().to_dict()
+            baseline_counts = baseline_column.value_counts().to_dict()
             tested_baseforms = get_base_form_to_variants_dict(tested_column.unique())
             baseline_baseforms = get_base_form_to_variants_dict(baseline_column.unique())
 
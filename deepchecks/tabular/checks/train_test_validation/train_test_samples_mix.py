@@ -9,13 +9,13 @@
 # ----------------------------------------------------------------------------
 #
 """The data_sample_leakage_report check module."""
-from typing import Any, List
+from typing import List
 
+import numpy as np
 import pandas as pd
-from pandas.core.dtypes.common import is_integer_dtype
 
 from deepchecks.core import CheckResult
-from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular import Context, Dataset, TrainTestCheck
 from deepchecks.utils.abstracts.train_test_samples_mix import TrainTestSamplesMixAbstract
 from deepchecks.utils.strings import format_percent
 from deepchecks.utils.typing import Hashable
@@ -72,17 +72,8 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
         test_dataset.assert_features()
         columns = test_dataset.features + ([test_dataset.label_name] if test_dataset.has_label() else [])
 
-        # For pandas.groupby in python 3.6, there is problem with comparing numpy nan, so replace with placeholder
-        train_df = _fillna(train_dataset.data)
-        test_df = _fillna(test_dataset.data)
+        duplicates_df, test_dup_count = _create_train_test_duplicates_frame(train_dataset, test_dataset, columns)
 
-        train_uniques = _create_unique_frame(train_df, columns, text_prefix='Train indices: ')
-        test_uniques = _create_unique_frame(test_df, columns, text_prefix='Test indices: ')
-
-        duplicates_df, test_dup_count = _create_train_test_joined_duplicate_frame(train_uniques, test_uniques, columns)
-
-        # Replace filler back to none
-        duplicates_df = duplicates_df.applymap(lambda x: None if x == NAN_REPLACEMENT else x)
         dup_ratio = test_dup_count / test_dataset.n_samples
         user_msg = f'{format_percent(dup_ratio)} ({test_dup_count} / {test_dataset.n_samples}) \
                      of test data samples appear in train data'
@@ -91,49 +82,40 @@ class TrainTestSamplesMix(TrainTestCheck, TrainTestSamplesMixAbstract):
         return CheckResult(result, header='Train Test Samples Mix', display=display)
 
 
-def _create_train_test_joined_duplicate_frame(first: pd.DataFrame, second: pd.DataFrame, columns: List[Hashable]):
-    """Create duplicate dataframe out of 2 uniques dataframes.
+def _create_train_test_duplicates_frame(train_dataset: Dataset, test_dataset: Dataset, columns: List[Hashable]):
+    """Create a dataframe of the test samples which appear in the train dataset, by comparing the rows hashes.
 
-    This function accept 2 dataframes resulted from `_create_unique_frame`. this means that each dataframe have
-    no duplicate in it. so if the concatenation between the 2 find duplicates, they are necessarily between each other.
+    Each row of the dataframe is a unique test sample which appears in train, indexed by the indices of its
+    occurrences in both datasets, and the rows are sorted by the number of occurrences in test.
     """
-    columns_data = []
-    index_text = []
-    total_test_count = 0
-    group_unique_data: dict = pd.concat([first, second]).groupby(columns, dropna=False).groups
-    # The group data is backward (the columns are the indexes, and the indexes are the values)
-    for duplicate_columns, indexes in group_unique_data.items():
-        # If length is 1, then no duplicate found between first and second
-        if len(indexes) == 1:
-            continue
-        # Indexes should have dict of train & test info from `_filter_duplicates`
-        text = indexes[0]['text'] + '\n' + indexes[1]['text']
-        # Take the count only of test
-        test_count = indexes[0]['count'] if indexes[0]['text'].startswith('Test') else indexes[1]['count']
-        total_test_count += test_count
-        # Save info of duplicated text and the columns info
-        columns_data.append([*duplicate_columns, test_count])
-        index_text.append(text)
-
-    count_column_name = '_value_to_sort_by_'
-    duplicates = pd.DataFrame(columns_data, index=index_text, columns=[*columns, count_column_name])
-    duplicates = duplicates.sort_values(by=count_column_name, ascending=False)
-    duplicates = duplicates.drop(count_column_name, axis=1)
-    return duplicates, total_test_count
+    train_hashes = pd.Series(train_dataset.row_hashes(columns))
+    test_group_ids, test_group_hashes = pd.factorize(test_dataset.row_hashes(columns))
+    test_group_counts = np.bincount(test_group_ids, minlength=len(test_group_hashes))
 
+    mixed_groups = np.flatnonzero(pd.Series(test_group_hashes).isin(train_hashes).to_numpy())
+    mixed_groups = mixed_groups[np.argsort(-test_group_counts[mixed_groups], kind='stable')]
+    total_test_count = int(test_group_counts[mixed_groups].sum())
 
-def _create_unique_frame(df: pd.DataFrame, columns: List[Hashable], text_prefix: str = '') -> pd.DataFrame:
-    """For given dataframe and columns create a dataframe with only unique combinations of the columns."""
-    columns_data = []
-    index_text = []
-    group_unique_data: dict = df.groupby(columns, dropna=False).groups
-    # The group data is backward (the columns are the indexes, and the indexes are the values)
-    for duplicate_columns, indexes in group_unique_data.items():
-        # Save info of duplicated text and the columns info
-        columns_data.append(duplicate_columns)
-        index_text.append(_get_dup_info(indexes, text_prefix))
+    train_group_ids = pd.Index(test_group_hashes).get_indexer(train_hashes)
+    train_group_counts = np.bincount(train_group_ids + 1, minlength=len(test_group_hashes) + 1)[1:]
+    train_positions_by_group = np.argsort(train_group_ids, kind='stable')[np.sum(train_group_ids == -1):]
+    train_groups_starts = np.cumsum(train_group_counts) - train_group_counts
+    test_positions_by_group = np.argsort(test_group_ids, kind='stable')
+    test_groups_starts = np.cumsum(test_group_counts) - test_group_counts
 
-    return pd.DataFrame(columns_data, index=index_text, columns=columns)
+    index_text = []
+    for group in mixed_groups:
+        train_start, test_start = train_groups_starts[group], test_groups_starts[group]
+        train_positions = train_positions_by_group[train_start:train_start + train_group_counts[group]]
+        test_positions = test_positions_by_group[test_start:test_start + test_group_counts[group]]
+        train_info = _get_dup_info(train_dataset.data.index[train_positions], text_prefix='Train indices: ')
+        test_info = _get_dup_info(test_dataset.data.index[test_positions], text_prefix='Test indices: ')
+        index_text.append(train_info['text'] + '\n' + test_info['text'])
+
+    duplicates = test_dataset.data.iloc[test_positions_by_group[test_groups_starts[mixed_groups]]][columns]
+    duplicates = duplicates.astype(object).where(duplicates.notna(), None)
+    duplicates.index = index_text
+    return duplicates, total_test_count
 
 
 def _get_dup_info(index_arr: list, text_prefix: str) -> dict:
@@ -142,26 +124,3 @@ def _get_dup_info(index_arr: list, text_prefix: str) -> dict:
         text = f'{text[:30]}.. Tot. {(len(index_arr))}'
 
     return {'text': f'{text_prefix}{text}', 'count': len(index_arr)}
-
-
-NAN_REPLACEMENT = '__deepchecks_na_filler__'
-
-
-def _fillna_col(column: pd.Series, value: Any):
-    if isinstance(column.dtype, pd.CategoricalDtype):
-        return column.cat.add_categories([value]).fillna(value=value)
-    if is_integer_dtype(column):
-        # nullable int series cannot be filled with a string
-        return column.astype(float).fillna(value=value)
-    return column.fillna(value=value)
-
-
-def _fillna(
-    df: pd.DataFrame,
-    value: Any = NAN_REPLACEMENT
-) -> pd.DataFrame:
-    """Fill nan values."""
-    return pd.DataFrame({
-        name: (_fillna_col(column, value))
-        for name, column in df.items()
-    })
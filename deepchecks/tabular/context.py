@@ -9,7 +9,9 @@
 # ----------------------------------------------------------------------------
 #
 """Module for base tabular context."""
+import threading
 import typing as t
+from collections import defaultdict
 
 import numpy as np
 import pandas as pd
@@ -34,7 +36,7 @@ from deepchecks.utils.plot import DEFAULT_DATASET_NAMES
 from deepchecks.utils.typing import BasicModel
 
 __all__ = [
-    'Context', '_DummyModel'
+    'Context', '_DummyModel', '_CachedModel'
 ]
 
 
@@ -157,6 +159,123 @@ class _DummyModel:
         """Just for python 3.6 (sklearn validates fit method)."""
 
 
+class _CachedModel:
+    """Model wrapper caching the predictions of the user model over the context datasets.
+
+    Predictions are stored per dataset and per row, so each row of the context datasets is inferred at most once
+    for ``predict`` and once for ``predict_proba``, and any row subset of a known dataset (like the samples used by
+    the checks) is served by an index lookup. Data which does not match any of the known datasets is passed
+    directly to the user model. All other attributes are delegated to the user model.
+
+    Parameters
+    ----------
+    user_model: BasicModel
+        The model to cache the predictions of.
+    datasets: t.List[Dataset]
+        Datasets to cache the predictions on. Datasets with a non-unique index and streaming datasets are ignored.
+    """
+
+    def __init__(self, user_model: BasicModel, datasets: t.List[Dataset]):
+        self.user_model = user_model
+        self.datasets = [dataset for dataset in datasets
+                         if dataset is not None and not dataset.is_streaming and dataset.data.index.is_unique]
+        self.hits = 0
+        self.misses = 0
+        self._misses_per_thread = defaultdict(int)
+        self._predictions = {}
+        self._computed = {}
+        # guards the counters and the cached arrays, since checks may run concurrently on threads
+        self._lock = threading.Lock()
+
+        if hasattr(user_model, 'predict_proba'):
+            self.predict_proba = self._predict_proba
+
+    def __getattr__(self, name):
+        """Delegate any other attribute to the user model."""
+        # Guard against recursion when the object is not fully initialized (e.g. while being copied)
+        if name == 'user_model':
+            raise AttributeError(name)
+        return getattr(self.user_model, name)
+
+    def __getstate__(self):
+        """Return the state to pickle, without the lock which can't be pickled."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the pickled state with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def cache_info(self) -> t.Dict[str, int]:
+        """Return the number of inference calls served from the cache (hits) and the ones calling the model."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def thread_misses(self) -> int:
+        """Return the number of cache misses (calls to the user model) of the current thread."""
+        return self._misses_per_thread[threading.get_ident()]
+
+    def _count_miss(self):
+        with self._lock:
+            self.misses += 1
+            self._misses_per_thread[threading.get_ident()] += 1
+
+    def _find_positions(self, data) -> t.Tuple[t.Optional[int], t.Optional[np.ndarray]]:
+        """Return the id of the known dataset the data is a subset of, and the positions of its rows in it."""
+        if not isinstance(data, pd.DataFrame):
+            return None, None
+        for df_id, dataset in enumerate(self.datasets):
+            if list(data.columns) != dataset.features:
+                continue
+            positions = dataset.data.index.get_indexer(data.index)
+            if (positions < 0).any():
+                continue
+            # Validates the values as well, since checks may pass a modified version of the data
+            if all(data[col].equals(dataset.data[col].iloc[positions]) for col in dataset.features):
+                return df_id, positions
+        return None, None
+
+    def _cached_inference(self, method_name: str, data, *args, **kwargs):
+        df_id, positions = (None, None) if args or kwargs else self._find_positions(data)
+        if df_id is None:
+            self._count_miss()
+            return getattr(self.user_model, method_name)(data, *args, **kwargs)
+
+        key = (df_id, method_name)
+        dataset = self.datasets[df_id]
+        with self._lock:
+            computed = self._computed.setdefault(key, np.zeros(len(dataset.data), dtype=bool))
+            missing_positions = np.unique(positions[~computed[positions]])
+            if len(missing_positions) == 0:
+                self.hits += 1
+                return self._predictions[key][positions]
+
+        # the model is called outside the lock, so other threads are not blocked by it. Rows which are calculated by
+        # several threads at once are calculated more than once, but the cached arrays are updated only under the lock
+        self._count_miss()
+        missing_data = dataset.data.iloc[missing_positions][dataset.features]
+        new_values = np.asarray(getattr(self.user_model, method_name)(missing_data))
+        with self._lock:
+            values = self._predictions.get(key)
+            if values is None:
+                values = np.empty((len(dataset.data),) + new_values.shape[1:], dtype=new_values.dtype)
+            elif values.dtype != new_values.dtype:
+                values = values.astype(np.result_type(values, new_values))
+            values[missing_positions] = new_values
+            self._predictions[key] = values
+            computed[missing_positions] = True
+            return values[positions]
+
+    def predict(self, data, *args, **kwargs):
+        """Predict on given data, using the cached predictions where possible."""
+        return self._cached_inference('predict', data, *args, **kwargs)
+
+    def _predict_proba(self, data, *args, **kwargs):
+        """Predict probabilities on given data, using the cached probabilities where possible."""
+        return self._cached_inference('predict_proba', data, *args, **kwargs)
+
+
 @docstrings
 class Context(BaseContext):
     """Contains all the data + properties the user has passed to a check/suite, and validates it seamlessly.
@@ -222,6 +341,9 @@ class Context(BaseContext):
         if model is not None:
             # Here validate only type of model, later validating it can predict on the data if needed
             model_type_validation(model)
+            cached_model = _CachedModel(model, [train, test])
+        else:
+            cached_model = None
         if feature_importance is not None:
             feature_importance = validate_feature_importance(feature_importance, train.features)
         if model_classes and len(model_classes) == 0:
@@ -240,7 +362,7 @@ class Context(BaseContext):
         elif model_classes:
             task_type = infer_task_type_by_class_number(len(model_classes))
         else:
-            labels = get_all_labels(model, train, test, y_pred_train, y_pred_test)
+            labels = get_all_labels(cached_model, train, test, y_pred_train, y_pred_test)
             task_type = infer_task_type_by_labels(labels)
 
         observed_classes = None
@@ -265,6 +387,7 @@ class Context(BaseContext):
         self._train = train
         self._test = test
         self._model = model
+        self._cached_model = cached_model
         self._feature_importance_force_permutation = feature_importance_force_permutation
         self._feature_importance = feature_importance
         self._feature_importance_timeout = feature_importance_timeout
@@ -277,7 +400,17 @@ class Context(BaseContext):
 
     @property
     def model(self) -> BasicModel:
-        """Return & validate model if model exists, otherwise raise error."""
+        """Return & validate model if model exists, otherwise raise error.
+
+        The returned model caches its predictions over the context datasets, use ``raw_model`` in order to access
+        the model as it was passed by the user.
+        """
+        raw_model = self.raw_model
+        return self._cached_model if self._cached_model is not None else raw_model
+
+    @property
+    def raw_model(self) -> BasicModel:
+        """Return & validate the model without the predictions cache if model exists, otherwise raise error."""
         if self._model is None:
             raise DeepchecksNotSupportedError('Check is irrelevant for Datasets without model')
         if not self._validated_model:
@@ -286,6 +419,13 @@ class Context(BaseContext):
             self._validated_model = True
         return self._model
 
+    @property
+    def prediction_cache_info(self) -> t.Optional[t.Dict[str, int]]:
+        """Return the hits and misses counts of the model predictions cache, or None if predictions are not cached."""
+        if self._cached_model is None:
+            return None
+        return self._cached_model.cache_info()
+
     @property
     def model_classes(self) -> t.List:
         """Return ordered list of possible label classes for classification tasks or None for regression."""
@@ -303,14 +443,16 @@ class Context(BaseContext):
         """Return the observed classes in both train and test. None for regression."""
         # If did not cache yet the observed classes than calculate them
         if self._observed_classes is None and self.task_type in (TaskType.BINARY, TaskType.MULTICLASS):
-            labels = get_all_labels(self._model, self._train, self._test)
+            # the dummy model of the given predictions is not cached, so the predicted classes are taken from it
+            model = self._cached_model if self._cached_model is not None else self._model
+            labels = get_all_labels(model, self._train, self._test)
             self._observed_classes = sorted(labels.dropna().unique().tolist())
         return self._observed_classes
 
     @property
     def model_name(self):
         """Return model name."""
-        return type(self.model).__name__
+        return type(self.raw_model).__name__
 
     @property
     def task_type(self) -> TaskType:
@@ -350,6 +492,32 @@ class Context(BaseContext):
             return self._importance_type
         return None
 
+    def count_prediction_cache_misses(self) -> t.Optional[int]:
+        """Return the number of model predictions cache misses of the current thread, or None if not tracked.
+
+        Each miss calls the user model, calls made by checks directly to ``raw_model`` are not counted.
+        """
+        if self._cached_model is None:
+            return None
+        return self._cached_model.thread_misses()
+
+    def prepare_shared_state(self):
+        """Compute the model predictions and the feature importance in advance, in order to share them between \
+        concurrently run checks."""
+        if self._model is None:
+            return
+        # Errors are ignored here, as they are raised again by each of the checks requiring the failing attribute
+        try:
+            model = self.model
+            for dataset in (self._train, self._test):
+                if dataset is not None:
+                    model.predict(dataset.features_columns)
+                    if hasattr(model, 'predict_proba') and self.task_type != TaskType.REGRESSION:
+                        model.predict_proba(dataset.features_columns)
+        except Exception:  # pylint: disable=broad-except
+            pass
+        _ = self.feature_importance
+
     def have_test(self):
         """Return whether there is test dataset defined."""
         return self._test is not None
@@ -10,6 +10,7 @@
 #
 """The dataset module containing the tabular Dataset class and its functions."""
 # pylint: disable=inconsistent-quotes,protected-access
+import copy
 import typing as t
 import warnings
 from collections import Counter
@@ -25,6 +26,7 @@ from deepchecks.core.errors import DatasetValidationError, DeepchecksNotSupporte
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.logger import get_logger
+from deepchecks.utils.row_hashing import hash_rows
 from deepchecks.utils.strings import get_docs_link
 from deepchecks.utils.type_inference import infer_categorical_features, infer_numerical_features
 from deepchecks.utils.typing import Hashable
@@ -105,6 +107,8 @@ class Dataset:
     _max_categorical_ratio: float
     _max_categories: int
     _label_type: t.Optional[TaskType]
+    _row_hashes: t.Dict[t.Tuple[Hashable, ...], np.ndarray]
+    _row_hashes_source: t.Optional[t.Tuple['Dataset', t.Optional[np.ndarray]]]
 
     def __init__(
             self,
@@ -297,6 +301,9 @@ class Dataset:
 
         unassigned_cols = [col for col in self._features if col not in self._cat_features]
         self._numerical_features = infer_numerical_features(self._data[unassigned_cols])
+        self._row_hashes = {}
+        # dataset (and positions of the rows in it) this dataset was sampled or selected from, to reuse its row hashes
+        self._row_hashes_source = None
 
     @classmethod
     def from_numpy(
@@ -423,22 +430,25 @@ class Dataset:
         Dataset
             new dataset instance
         """
+        cls = type(self)
+        return cls(new_data, **self._get_metadata_kwargs(new_data.columns))
+
+    def _get_metadata_kwargs(self, columns: t.Collection[Hashable]) -> t.Dict[str, t.Any]:
+        """Return the init arguments of a dataset with the metadata of this dataset, restricted to the given columns."""
         # Filter out if columns were dropped
-        features = [feat for feat in self._features if feat in new_data.columns]
-        cat_features = [feat for feat in self.cat_features if feat in new_data.columns]
-        label_name = self._label_name if self._label_name in new_data.columns else None
+        features = [feat for feat in self._features if feat in columns]
+        cat_features = [feat for feat in self.cat_features if feat in columns]
+        label_name = self._label_name if self._label_name in columns else None
         label_type = None if self._label_type is None else self._label_type.value
-        index = self._index_name if self._index_name in new_data.columns else None
-        date = self._datetime_name if self._datetime_name in new_data.columns else None
-
-        cls = type(self)
+        index = self._index_name if self._index_name in columns else None
+        date = self._datetime_name if self._datetime_name in columns else None
 
-        return cls(new_data, features=features, cat_features=cat_features, label=label_name,
-                   index_name=index, set_index_from_dataframe_index=self._set_index_from_dataframe_index,
-                   datetime_name=date, set_datetime_from_dataframe_index=self._set_datetime_from_dataframe_index,
-                   convert_datetime=self._convert_datetime, max_categorical_ratio=self._max_categorical_ratio,
-                   max_categories=self._max_categories, label_type=label_type,
-                   dataset_name=self.name)
+        return dict(features=features, cat_features=cat_features, label=label_name,
+                    index_name=index, set_index_from_dataframe_index=self._set_index_from_dataframe_index,
+                    datetime_name=date, set_datetime_from_dataframe_index=self._set_datetime_from_dataframe_index,
+                    convert_datetime=self._convert_datetime, max_categorical_ratio=self._max_categorical_ratio,
+                    max_categories=self._max_categories,
+                    label_type=label_type, dataset_name=self.name)
 
     def sample(self: TDataset, n_samples: t.Optional[int] = None, replace: bool = False,
                random_state: t.Optional[int] = None) -> TDataset:
@@ -462,7 +472,48 @@ class Dataset:
             return self
 
         n_samples = min(n_samples, len(self.data))
-        return self.copy(self.data.sample(n_samples, replace=replace, random_state=random_state))
+        # sampling the positions draws the same rows as sampling the dataframe itself
+        positions = pd.Series(np.arange(len(self.data))).sample(n_samples, replace=replace,
+                                                                random_state=random_state).to_numpy()
+        sampled = self.copy(self.data.iloc[positions])
+        sampled._row_hashes_source = (self, positions)
+        return sampled
+
+    @property
+    def is_streaming(self) -> bool:
+        """Return True if the data is read from its source in chunks, instead of being kept in memory."""
+        return False
+
+    def iter_chunks(
+            self,
+            columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            ignore_columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            n_samples: t.Optional[int] = None,
+            random_state: t.Optional[int] = None
+    ) -> t.Iterator[pd.DataFrame]:
+        """Iterate over the (sampled) data of the dataset in chunks of rows.
+
+        Checks which only need statistics that can be accumulated over the rows (for example nulls counts) should
+        consume the data through this method, so that they run in bounded memory over streaming datasets.
+        The data of an in-memory dataset is returned as a single chunk.
+
+        Parameters
+        ----------
+        columns : t.Union[Hashable, t.List[Hashable], None] , default: None
+            Column names to read, if none are given reads all columns except ignored ones.
+        ignore_columns : t.Union[Hashable, t.List[Hashable], None] , default: None
+            Column names not to read.
+        n_samples : t.Optional[int] , default: None
+            Number of samples to draw, if None iterates over all samples.
+        random_state : t.Optional[int] , default: None
+            Random state.
+
+        Returns
+        -------
+        t.Iterator[pd.DataFrame]
+            chunks of the (sampled) data
+        """
+        yield select_from_dataframe(self.sample(n_samples, random_state=random_state).data, columns, ignore_columns)
 
     def drop_na_labels(self) -> TDataset:
         """Create a copy of the dataset object without samples with missing labels."""
@@ -866,7 +917,39 @@ class Dataset:
         if new_data.equals(self.data):
             return self
         else:
-            return self.copy(new_data)
+            selected = self.copy(new_data)
+            selected._row_hashes_source = (self, None)
+            return selected
+
+    def row_hashes(self, columns: t.Optional[t.Sequence[Hashable]] = None) -> np.ndarray:
+        """Return a stable 64 bit hash of the values of each row in the given columns, see ``hash_rows``.
+
+        Equal rows have equal hashes, also between different datasets, so duplicate rows can be found by comparing
+        the hashes instead of the rows. The hashes are cached per columns, and samples and selections of the dataset
+        reuse the hashes of the dataset they were created from.
+
+        Parameters
+        ----------
+        columns : t.Optional[t.Sequence[Hashable]] , default: None
+            The columns to hash, if None all the columns of the data are hashed.
+
+        Returns
+        -------
+        np.ndarray
+            uint64 array of the hash of each row
+        """
+        columns = tuple(self._data.columns if columns is None else columns)
+        if columns not in self._row_hashes:
+            source, positions = self._row_hashes_source or (None, None)
+            if source is not None and set(columns).issubset(source._data.columns):
+                hashes = source.row_hashes(columns)
+                self._row_hashes[columns] = hashes if positions is None else hashes[positions]
+            else:
+                self._row_hashes[columns] = np.concatenate(
+                    [hash_rows(chunk, columns) for chunk in self.iter_chunks(columns=list(columns))]
+                    or [np.array([], dtype=np.uint64)]
+                )
+        return self._row_hashes[columns]
 
     @classmethod
     def cast_to_dataset(cls, obj: t.Any) -> 'Dataset':
@@ -898,6 +981,9 @@ class Dataset:
             raise DeepchecksValueError(
                 f'non-empty instance of Dataset or DataFrame was expected, instead got {type(obj).__name__}'
             )
+        if obj.is_streaming:
+            # The data of streaming datasets is not kept in memory so it is enough to copy the metadata
+            return copy.copy(obj)
         return obj.copy(obj.data)
 
     @classmethod
@@ -0,0 +1,314 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""The parquet dataset module containing a tabular Dataset which streams its data from Parquet files."""
+# pylint: disable=protected-access
+import pathlib
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
+from deepchecks.tabular.dataset import Dataset
+from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.utils.logger import get_logger
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['ParquetDataset']
+
+TParquetDataset = t.TypeVar('TParquetDataset', bound='ParquetDataset')
+
+
+class ParquetDataset(Dataset):
+    """Dataset which references a (chunked) Parquet source instead of keeping the data in memory.
+
+    Only the metadata and the first rows of the source are loaded when the dataset is created, and the columns of
+    the source are read lazily when they are needed. Checks which work on statistics that can be accumulated over
+    the rows (nulls, single value, mixed types) read the data in chunks with bounded memory, other checks
+    materialize their sample of the data (which is drawn while streaming over the source) as an in-memory Dataset.
+
+    Requires the pyarrow package.
+
+    Parameters
+    ----------
+    source : t.Union[str, pathlib.Path, t.List[str]]
+        Path of a Parquet file, a directory of Parquet files or a list of Parquet files paths.
+    label : t.Optional[Hashable] , default: None
+        Name of the label column.
+    columns : t.Optional[t.List[Hashable]] , default: None
+        Columns of the source to use, if None uses all columns.
+    chunk_size : int , default: 100_000
+        Maximal number of rows to read into memory at once.
+    n_inference_samples : int , default: 10_000
+        Number of rows, from the start of the source, used to infer the categorical and numerical features.
+    **kwargs
+        Additional arguments of :class:`Dataset`, except of the arguments to set the index and datetime
+        from the dataframe index which are not supported.
+    """
+
+    def __init__(
+            self,
+            source: t.Union[str, pathlib.Path, t.List[str]],
+            label: t.Optional[Hashable] = None,
+            columns: t.Optional[t.List[Hashable]] = None,
+            chunk_size: int = 100_000,
+            n_inference_samples: int = 10_000,
+            **kwargs
+    ):
+        try:
+            import pyarrow.dataset  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                'ParquetDataset requires the pyarrow python package. '
+                'To get it, run "pip install pyarrow".'
+            ) from e
+
+        if kwargs.get('set_index_from_dataframe_index') or kwargs.get('set_datetime_from_dataframe_index'):
+            raise DeepchecksNotSupportedError('ParquetDataset does not support setting the index or the datetime '
+                                              'from the dataframe index')
+        if label is not None and not isinstance(label, Hashable):
+            raise DeepchecksValueError('ParquetDataset label must be the name of a column in the source, '
+                                       f'but got: {type(label).__name__}')
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise DeepchecksValueError(f'chunk_size must be a positive integer, but got: {chunk_size}')
+
+        self._source = source
+        self._arrow_dataset = pyarrow.dataset.dataset(source, format='parquet')
+        pandas_metadata = self._arrow_dataset.schema.pandas_metadata or {}
+        index_columns = set(c for c in pandas_metadata.get('index_columns', []) if isinstance(c, str))
+        source_columns = [c for c in self._arrow_dataset.schema.names if c not in index_columns]
+        if columns is not None:
+            difference = set(columns) - set(source_columns)
+            if difference:
+                raise DeepchecksValueError(f'Columns {difference} have not been found in the source')
+            source_columns = [c for c in source_columns if c in set(columns)]
+        self._columns = source_columns
+        self._chunk_size = chunk_size
+        self._n_inference_samples = n_inference_samples
+        self._n_rows = self._arrow_dataset.count_rows()
+        self._datetime_conversion_args = kwargs.get('datetime_args') or {}
+        # The metadata of the dataset is inferred from the first rows of the source
+        head = self._arrow_dataset.head(n_inference_samples, columns=self._columns).to_pandas()
+        super().__init__(head, label=label, **kwargs)
+
+    @property
+    def is_streaming(self) -> bool:
+        """Return True as the data is read from the source in chunks."""
+        return True
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Read all the data of the dataset into memory.
+
+        Prefer ``sample`` or ``iter_chunks`` over it, as the source may be too large to fit in memory.
+        """
+        get_logger().warning('Reading all %d rows of the Parquet source into memory', self._n_rows)
+        return self._read()
+
+    @property
+    def features_columns(self) -> pd.DataFrame:
+        """Return DataFrame containing only the features defined in the dataset, if features are empty raise error.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        self.assert_features()
+        return self._read(self.features)
+
+    @property
+    def label_col(self) -> pd.Series:
+        """Return Series of the label defined in the dataset, if label is not defined raise error.
+
+        Returns
+        -------
+        pd.Series
+        """
+        return self._read([self.label_name])[self.label_name]
+
+    @property
+    def n_samples(self) -> int:
+        """Return number of samples in the source.
+
+        Returns
+        -------
+        int
+            Number of samples in the source
+        """
+        return self._n_rows
+
+    def copy(self, new_data: pd.DataFrame) -> Dataset:
+        """Create an in-memory Dataset with the metadata of this dataset and the given data.
+
+        Parameters
+        ----------
+        new_data (DataFrame): new data from which new dataset will be created
+
+        Returns
+        -------
+        Dataset
+            new in-memory dataset instance
+        """
+        return Dataset(new_data, **self._get_metadata_kwargs(new_data.columns))
+
+    def sample(self, n_samples: t.Optional[int] = None, replace: bool = False,
+               random_state: t.Optional[int] = None) -> Dataset:
+        """Create an in-memory Dataset of a sample of the source rows.
+
+        The sample is drawn while streaming over the source, so only the sampled rows are kept in memory.
+
+        Parameters
+        ----------
+        n_samples : t.Optional[int]
+            Number of samples to draw, if None returns the dataset itself.
+        replace : bool, default: False
+            Whether to sample with replacement.
+        random_state : t.Optional[int] , default None
+            Random state.
+
+        Returns
+        -------
+        Dataset
+            instance of the Dataset with the sampled data.
+        """
+        if n_samples is None:
+            return self
+        return self.copy(self._read(self._columns, self._sample_rows(n_samples, replace, random_state)))
+
+    def select(
+            self: TParquetDataset,
+            columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            ignore_columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            keep_label: bool = False
+    ) -> TParquetDataset:
+        """Filter dataset columns by given params, without reading the data of the source.
+
+        Parameters
+        ----------
+        columns : Union[Hashable, List[Hashable], None]
+            Column names to keep.
+        ignore_columns : Union[Hashable, List[Hashable], None]
+            Column names to drop.
+
+        Returns
+        -------
+        TParquetDataset
+            horizontally filtered dataset
+
+        Raises
+        ------
+        DeepchecksValueError
+            In case one of columns given don't exists raise error
+        """
+        if keep_label and isinstance(columns, list) and self.label_name not in columns:
+            columns = columns[:]
+            columns.append(self.label_name)
+
+        new_columns = list(select_from_dataframe(self._data, columns, ignore_columns).columns)
+        if new_columns == self._columns:
+            return self
+        metadata_kwargs = self._get_metadata_kwargs(new_columns)
+        del metadata_kwargs['set_index_from_dataframe_index'], metadata_kwargs['set_datetime_from_dataframe_index']
+        return type(self)(self._source, columns=new_columns, chunk_size=self._chunk_size,
+                          n_inference_samples=self._n_inference_samples, datetime_args=self._datetime_conversion_args,
+                          **metadata_kwargs)
+
+    def train_test_split(self, *args, **kwargs) -> t.Tuple[Dataset, Dataset]:
+        """Split the dataset into random train and test in-memory datasets, see ``Dataset.train_test_split``."""
+        return self.copy(self.data).train_test_split(*args, **kwargs)
+
+    def iter_chunks(
+            self,
+            columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            ignore_columns: t.Union[Hashable, t.List[Hashable], None] = None,
+            n_samples: t.Optional[int] = None,
+            random_state: t.Optional[int] = None
+    ) -> t.Iterator[pd.DataFrame]:
+        """Iterate over the (sampled) data of the source in chunks of at most ``chunk_size`` rows.
+
+        Only the requested columns are read from the source. The chunks are indexed by the position of
+        their rows in the source.
+
+        Parameters
+        ----------
+        columns : t.Union[Hashable, t.List[Hashable], None] , default: None
+            Column names to read, if none are given reads all columns except ignored ones.
+        ignore_columns : t.Union[Hashable, t.List[Hashable], None] , default: None
+            Column names not to read.
+        n_samples : t.Optional[int] , default: None
+            Number of samples to draw, if None iterates over all samples.
+        random_state : t.Optional[int] , default: None
+            Random state.
+
+        Returns
+        -------
+        t.Iterator[pd.DataFrame]
+            chunks of the (sampled) data
+        """
+        columns = list(select_from_dataframe(self._data, columns, ignore_columns).columns)
+        rows = None if n_samples is None else self._sample_rows(n_samples, False, random_state)
+        for batch, positions in self._iter_batches(columns, rows):
+            yield self._to_pandas(batch, positions)
+
+    def _sample_rows(self, n_samples: int, replace: bool, random_state: t.Optional[int]) -> t.Optional[np.ndarray]:
+        """Return the sorted positions of the sampled rows, or None if all the rows are sampled."""
+        if not replace and n_samples >= self._n_rows:
+            return None
+        generator = np.random.default_rng(random_state)
+        if replace:
+            rows = generator.integers(0, self._n_rows, n_samples)
+        else:
+            rows = generator.choice(self._n_rows, n_samples, replace=False)
+        return np.sort(rows)
+
+    def _iter_batches(self, columns: t.List[Hashable], rows: t.Optional[np.ndarray] = None):
+        """Iterate over the arrow record batches of the given columns and the positions of their rows in the source.
+
+        If rows are given, only these rows (sorted positions in the source) are taken from each batch.
+        """
+        if rows is not None and len(rows) == 0:
+            return
+        offset = 0
+        for batch in self._arrow_dataset.to_batches(columns=columns, batch_size=self._chunk_size):
+            batch_end = offset + batch.num_rows
+            if rows is None:
+                positions = np.arange(offset, batch_end)
+            else:
+                start, end = np.searchsorted(rows, [offset, batch_end])
+                positions = rows[start:end]
+                batch = batch.take(positions - offset)
+            if len(positions) > 0:
+                yield batch, positions
+            offset = batch_end
+            if rows is not None and offset > rows[-1]:
+                break
+
+    def _read(self, columns: t.Optional[t.List[Hashable]] = None, rows: t.Optional[np.ndarray] = None):
+        """Read the given columns (all columns by default) of the given rows (all rows by default) into memory."""
+        import pyarrow  # pylint: disable=import-outside-toplevel
+
+        columns = self._columns if columns is None else columns
+        batches, positions = [], []
+        for batch, batch_positions in self._iter_batches(columns, rows):
+            batches.append(batch)
+            positions.append(batch_positions)
+        if not batches:
+            return self._data.iloc[:0][columns]
+        # converting all batches together, so categorical columns are created with the same categories
+        table = pyarrow.Table.from_batches(batches)
+        return self._to_pandas(table, np.concatenate(positions))
+
+    def _to_pandas(self, arrow_data, positions: np.ndarray) -> pd.DataFrame:
+        df = arrow_data.to_pandas()
+        df.index = positions
+        if self._convert_datetime and self._datetime_name is not None and self._datetime_name in df.columns:
+            df[self._datetime_name] = pd.to_datetime(df[self._datetime_name], **self._datetime_conversion_args)
+        return df
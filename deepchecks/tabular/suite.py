@@ -10,20 +10,20 @@
 #
 """Module for base tabular abstractions."""
 # pylint: disable=broad-except
-import time
+from concurrent.futures import Executor
+from functools import partial
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from deepchecks.core import DatasetKind
-from deepchecks.core.check_result import CheckFailure
+from deepchecks.core.check_result import BaseCheckResult, CheckFailure
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.tabular._shared_docs import docstrings
 from deepchecks.tabular.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
 from deepchecks.tabular.context import Context
 from deepchecks.tabular.dataset import Dataset
-from deepchecks.utils.ipython import create_progress_bar
 from deepchecks.utils.typing import BasicModel
 
 __all__ = ['Suite']
@@ -52,7 +52,9 @@ class Suite(BaseSuite):
         y_proba_train: Optional[np.ndarray] = None,
         y_proba_test: Optional[np.ndarray] = None,
         run_single_dataset: Optional[str] = None,
-        model_classes: Optional[List] = None
+        model_classes: Optional[List] = None,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None
     ) -> SuiteResult:
         """Run all checks.
 
@@ -67,6 +69,12 @@ class Suite(BaseSuite):
         run_single_dataset: Optional[str], default None
             'Train', 'Test' , or None to run on both train and test.
         {additional_context_params:2*indent}
+        n_jobs : Optional[int] , default: None
+            Number of threads to run the checks on concurrently. None or 1 run the checks sequentially,
+            and -1 uses all the available CPUs.
+        executor : Optional[concurrent.futures.Executor] , default: None
+            Executor to run the checks on concurrently, overrides n_jobs if passed. A ProcessPoolExecutor requires
+            the model and the datasets to be picklable, and sends the context to the workers with each check.
 
         Returns
         -------
@@ -88,66 +96,80 @@ class Suite(BaseSuite):
             model_classes=model_classes
         )
 
-        progress_bar = create_progress_bar(
-            iterable=list(self.checks.values()),
-            name=self.name,
-            unit='Check'
+        run_check = partial(
+            self._run_check,
+            context=context,
+            run_single_dataset=run_single_dataset,
+            has_train=train_dataset is not None,
+            has_test=test_dataset is not None,
+            has_model=model is not None
         )
+        results = self._run_checks(run_check, context, n_jobs=n_jobs, executor=executor)
 
-        # Run all checks
-        results = []
-        for check in progress_bar:
-            start = time.time()
-
-            try:
-                progress_bar.set_postfix({'Check': check.name()}, refresh=False)
-                if isinstance(check, TrainTestCheck):
-                    if train_dataset is not None and test_dataset is not None:
-                        check_result = check.run_logic(context)
-                        context.finalize_check_result(check_result, check)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if not supplied with both train and test datasets'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, SingleDatasetCheck):
-                    if train_dataset is not None and (run_single_dataset in [DatasetKind.TRAIN.value, None]):
-                        # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
-                        # wrap it in try/except
-                        try:
-                            check_result = check.run_logic(context, dataset_kind=DatasetKind.TRAIN)
-                            context.finalize_check_result(check_result, check, DatasetKind.TRAIN)
-                            # In case of single dataset not need to edit the header
-                            if test_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Train Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Train Dataset')
-                        results.append(check_result)
-                    if test_dataset is not None and (run_single_dataset in [DatasetKind.TEST.value, None]):
-                        try:
-                            check_result = check.run_logic(context, dataset_kind=DatasetKind.TEST)
-                            context.finalize_check_result(check_result, check, DatasetKind.TEST)
-                            # In case of single dataset not need to edit the header
-                            if train_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Test Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Test Dataset')
-                        results.append(check_result)
-                    if train_dataset is None and test_dataset is None:
-                        msg = 'Check is irrelevant if dataset is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, ModelOnlyCheck):
-                    if model is not None:
-                        check_result = check.run_logic(context)
-                        context.finalize_check_result(check_result, check)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if model is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                else:
-                    raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
-            except Exception as exp:
-                results.append(CheckFailure(check, exp))
+        extra_info = []
+        cache_info = context.prediction_cache_info
+        if cache_info is not None:
+            extra_info.append(f'Model predictions cache: {cache_info["hits"]} hits, {cache_info["misses"]} misses')
 
-            results[-1].run_time = int(round(time.time() - start, 0))
+        return SuiteResult(self.name, results, extra_info=extra_info)
 
-        return SuiteResult(self.name, results)
+    @classmethod
+    def _run_check(
+        cls,
+        check,
+        context: Context,
+        run_single_dataset: Optional[str],
+        has_train: bool,
+        has_test: bool,
+        has_model: bool
+    ) -> List[BaseCheckResult]:
+        """Run a single check of the suite and return its results."""
+        results = []
+        try:
+            if isinstance(check, TrainTestCheck):
+                if has_train and has_test:
+                    check_result = check.run_logic(context)
+                    context.finalize_check_result(check_result, check)
+                    results.append(check_result)
+                else:
+                    msg = 'Check is irrelevant if not supplied with both train and test datasets'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            elif isinstance(check, SingleDatasetCheck):
+                if has_train and (run_single_dataset in [DatasetKind.TRAIN.value, None]):
+                    # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
+                    # wrap it in try/except
+                    try:
+                        check_result = check.run_logic(context, dataset_kind=DatasetKind.TRAIN)
+                        context.finalize_check_result(check_result, check, DatasetKind.TRAIN)
+                        # In case of single dataset not need to edit the header
+                        if has_test:
+                            check_result.header = f'{check_result.get_header()} - Train Dataset'
+                    except Exception as exp:
+                        check_result = CheckFailure(check, exp, ' - Train Dataset')
+                    results.append(check_result)
+                if has_test and (run_single_dataset in [DatasetKind.TEST.value, None]):
+                    try:
+                        check_result = check.run_logic(context, dataset_kind=DatasetKind.TEST)
+                        context.finalize_check_result(check_result, check, DatasetKind.TEST)
+                        # In case of single dataset not need to edit the header
+                        if has_train:
+                            check_result.header = f'{check_result.get_header()} - Test Dataset'
+                    except Exception as exp:
+                        check_result = CheckFailure(check, exp, ' - Test Dataset')
+                    results.append(check_result)
+                if not has_train and not has_test:
+                    msg = 'Check is irrelevant if dataset is not supplied'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            elif isinstance(check, ModelOnlyCheck):
+                if has_model:
+                    check_result = check.run_logic(context)
+                    context.finalize_check_result(check_result, check)
+                    results.append(check_result)
+                else:
+                    msg = 'Check is irrelevant if model is not supplied'
+                    results.append(cls._get_unsupported_failure(check, msg))
+            else:
+                raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
+        except Exception as exp:
+            results.append(CheckFailure(check, exp))
+        return results
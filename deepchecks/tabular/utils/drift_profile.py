@@ -0,0 +1,97 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module for creating drift profiles of tabular datasets."""
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.tabular.context import Context
+from deepchecks.tabular.dataset import Dataset
+from deepchecks.tabular.utils.task_type import TaskType
+from deepchecks.utils.distribution.sketches import DEFAULT_MAX_CATEGORIES, DEFAULT_MAX_SIZE, DriftProfile, create_sketch
+from deepchecks.utils.typing import BasicModel
+
+__all__ = ['create_drift_profile']
+
+
+def create_drift_profile(
+        dataset: t.Union[Dataset, pd.DataFrame],
+        model: t.Optional[BasicModel] = None,
+        n_samples: t.Optional[int] = None,
+        random_state: int = 42,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_categories: int = DEFAULT_MAX_CATEGORIES
+) -> DriftProfile:
+    """Create a drift profile of the dataset, to be used as the train distribution of the drift checks.
+
+    The dataset is read in chunks (see ``Dataset.iter_chunks``), so profiles can be created for datasets which
+    do not fit in memory. Profiles of different partitions of the data can be combined with ``DriftProfile.merge``.
+
+    Parameters
+    ----------
+    dataset : t.Union[Dataset, pd.DataFrame]
+        Dataset to create the profile of.
+    model : t.Optional[BasicModel] , default: None
+        If given, the profile also contains the distribution of the model predictions (and predicted probabilities
+        for classification tasks).
+    n_samples : t.Optional[int] , default: None
+        Number of samples to profile, if None profiles all the samples of the dataset.
+    random_state : int , default: 42
+        Random seed for sampling.
+    max_size : int , default: 2048
+        Max number of values kept by the sketches of numerical columns.
+    max_categories : int , default: 10_000
+        Max number of categories kept by the sketches of categorical columns.
+
+    Returns
+    -------
+    DriftProfile
+        The drift profile of the dataset.
+    """
+    context = Context(dataset, model=model)
+    dataset = context.train
+    is_regression = context.task_type == TaskType.REGRESSION
+    label_type = 'numerical' if is_regression else 'categorical'
+    with_proba = model is not None and not is_regression and hasattr(context.model, 'predict_proba')
+
+    columns = {
+        name: create_sketch('numerical' if name in dataset.numerical_features else 'categorical',
+                            max_size=max_size, max_categories=max_categories)
+        for name in dataset.features
+    }
+    profile = DriftProfile(
+        columns=columns,
+        label=create_sketch(label_type, max_size=max_size, max_categories=max_categories)
+        if dataset.has_label() else None,
+        predictions=create_sketch(label_type, max_size=max_size, max_categories=max_categories)
+        if model is not None else None,
+        predicted_classes=create_sketch('categorical', max_categories=max_categories) if with_proba else None
+    )
+
+    for chunk in dataset.iter_chunks(n_samples=n_samples, random_state=random_state):
+        for name, sketch in columns.items():
+            sketch.update(chunk[name])
+        if profile.label is not None:
+            profile.label.update(chunk[dataset.label_name])
+        if model is not None:
+            features = chunk[dataset.features]
+            profile.predictions.update(np.asarray(context.model.predict(features)).reshape(-1))
+            if with_proba:
+                proba = np.asarray(context.model.predict_proba(features))
+                if profile.probabilities is None:
+                    profile.probabilities = [create_sketch('numerical', max_size=max_size)
+                                             for _ in range(proba.shape[1])]
+                for sketch, class_proba in zip(profile.probabilities, proba.T):
+                    sketch.update(class_proba)
+                profile.predicted_classes.update(proba.argmax(axis=1))
+
+    return profile
@@ -10,14 +10,17 @@
 #
 
 """Utils module containing feature importance calculations."""
+import os
+import threading
 import time
 import typing as t
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
-from sklearn.inspection import permutation_importance
 from sklearn.pipeline import Pipeline
+from sklearn.utils import check_random_state
 
 from deepchecks import tabular
 from deepchecks.core import errors
@@ -245,9 +248,15 @@ def _calc_permutation_importance(
         alternative_scorer: t.Optional[DeepcheckScorer] = None,
         skip_messages: bool = False,
         timeout: int = None,
+        min_repeats: int = 5,
+        tolerance: float = 0.05,
+        n_jobs: int = -1,
 ) -> pd.Series:
     """Calculate permutation feature importance. Return nonzero value only when std doesn't mask signal.
 
+    Each feature is permuted up to n_repeats times, but stops being permuted after min_repeats once the 95% confidence
+    interval of its importance is narrower than tolerance times the largest importance.
+
     Parameters
     ----------
     model: t.Any
@@ -261,7 +270,7 @@ def _calc_permutation_importance(
     task_type
         The task type of the model.
     n_repeats: int, default: 30
-        Number of times to permute a feature
+        Maximal number of times to permute a feature
     mask_high_variance_features : bool , default: False
         If true, features for which calculated permutation importance values
         varied greatly would be returned has having 0 feature importance
@@ -276,10 +285,16 @@ def _calc_permutation_importance(
     skip_messages: bool, default: False
         If True will not print any message related to timeout or calculation.
     timeout: int, default: None
-        Allowed runtime of permutation_importance, in seconds. As we can't limit the actual runtime of the function,
-        the timeout parameter is used for estimation of the runtime, done be measuring the inference time of the model
-        and multiplying it by number of repeats and features. If the expected runtime is bigger than timeout, the
-        calculation is skipped.
+        Allowed runtime of the calculation, in seconds. Features are permuted in rounds, and once the timeout is
+        reached the importance calculated so far is returned. Features which were not permuted even once by then get
+        an importance of 0. If 0, the calculation is skipped.
+    min_repeats: int, default: 5
+        Minimal number of times to permute a feature before checking if its importance has converged.
+    tolerance: float, default: 0.05
+        Width of the importance confidence interval, relative to the largest importance, under which a feature is
+        not permuted anymore. If 0, all features are permuted n_repeats times.
+    n_jobs: int, default: -1
+        Number of threads to permute the features on. -1 uses all the available CPUs.
 
     Returns
     -------
@@ -309,38 +324,49 @@ def _calc_permutation_importance(
 
     predicted_time_to_run = int(np.ceil(calc_time * n_repeats * len(dataset.features))) or 1
 
-    if timeout is not None:
-        if predicted_time_to_run > timeout:
-            raise errors.DeepchecksTimeoutError(
-                f'Skipping permutation importance calculation: calculation was projected to finish in '
-                f'{predicted_time_to_run} seconds, but timeout was configured to {timeout} seconds')
+    if timeout == 0:
+        raise errors.DeepchecksTimeoutError(
+            'Skipping permutation importance calculation: timeout was configured to 0 seconds')
+    elif timeout is not None:
+        if not skip_messages and predicted_time_to_run > timeout:
+            get_logger().info('Calculating permutation feature importance. Calculation was projected to finish in %s '
+                              'seconds, partial results will be returned after the timeout of %s seconds',
+                              predicted_time_to_run, timeout)
         elif not skip_messages:
             get_logger().info('Calculating permutation feature importance. Expected to finish in %s seconds',
                               predicted_time_to_run)
-    elif timeout == 0 and not skip_messages:
-        raise errors.DeepchecksSkippedFeatureImportance(
-            'feature_importance_timeout set to 0. Skipping any feature importance calculation.')
     elif not skip_messages:
         get_logger().warning('Calculating permutation feature importance without time limit. Expected to finish in '
                              '%s seconds', predicted_time_to_run)
 
-    r = permutation_importance(
+    importances = _adaptive_permutation_importance(
         model,
         dataset_sample.features_columns,
         dataset_sample.label_col,
+        scorer=scorer.scorer,
         n_repeats=n_repeats,
+        min_repeats=min_repeats,
+        tolerance=tolerance,
         random_state=random_state,
-        n_jobs=-1,
-        scoring=scorer.scorer
+        n_jobs=n_jobs,
+        deadline=None if timeout is None else start_time + timeout
     )
 
+    not_calculated = [name for name, values in zip(dataset.features, importances) if len(values) == 0]
+    if not_calculated and not skip_messages:
+        get_logger().warning('Permutation feature importance reached the timeout of %s seconds, the importance of %s '
+                             'out of %s features was not calculated and is set to 0', timeout, len(not_calculated),
+                             len(dataset.features))
+    importances_mean = np.array([np.mean(values) if values else 0 for values in importances])
+    importances_std = np.array([np.std(values) if values else 0 for values in importances])
+
     significance_mask = (
-        r.importances_mean - r.importances_std > 0
+        importances_mean - importances_std > 0
         if mask_high_variance_features
-        else r.importances_mean > 0
+        else importances_mean > 0
     )
 
-    feature_importance = r.importances_mean * significance_mask
+    feature_importance = importances_mean * significance_mask
     total = feature_importance.sum()
 
     if total != 0:
@@ -349,6 +375,79 @@ def _calc_permutation_importance(
     return pd.Series(feature_importance, index=dataset.features)
 
 
+def _adaptive_permutation_importance(
+        model: t.Any,
+        features: pd.DataFrame,
+        label: pd.Series,
+        scorer: t.Callable,
+        n_repeats: int,
+        min_repeats: int,
+        tolerance: float,
+        random_state: int,
+        n_jobs: int,
+        deadline: t.Optional[float] = None
+) -> t.List[t.List[float]]:
+    """Calculate the importance of each permutation of each feature, stopping features whose importance converged.
+
+    The features are permuted the same way as in sklearn's permutation_importance, so when no feature converges
+    the importances are identical to it.
+
+    Returns
+    -------
+    t.List[t.List[float]]
+        The importance calculated in each repeat, for each feature.
+    """
+    baseline_score = scorer(model, features, label)
+    random_seed = check_random_state(random_state).randint(np.iinfo(np.int32).max + 1)
+    n_features = features.shape[1]
+    generators = [np.random.RandomState(random_seed) for _ in range(n_features)]
+    shuffling_indexes = [np.arange(features.shape[0]) for _ in range(n_features)]
+    permuted_columns = [features.iloc[:, col_idx] for col_idx in range(n_features)]
+    importances = [[] for _ in range(n_features)]
+    thread_data = threading.local()
+
+    def permute_and_score(col_idx):
+        if deadline is not None and time.time() > deadline:
+            return
+        # Each thread permutes a single column at a time on its own copy of the features
+        if not hasattr(thread_data, 'features'):
+            thread_data.features = features.copy()
+        features_permuted = thread_data.features
+        column_name = features.columns[col_idx]
+        generators[col_idx].shuffle(shuffling_indexes[col_idx])
+        col = permuted_columns[col_idx].iloc[shuffling_indexes[col_idx]]
+        col.index = features.index
+        permuted_columns[col_idx] = col
+        features_permuted[column_name] = col
+        try:
+            importances[col_idx].append(baseline_score - scorer(model, features_permuted, label))
+        finally:
+            features_permuted[column_name] = features[column_name]
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    active_features = list(range(n_features))
+    with ThreadPoolExecutor(max_workers=min(n_jobs, n_features)) as pool:
+        for repeat in range(n_repeats):
+            if n_jobs == 1:
+                for col_idx in active_features:
+                    permute_and_score(col_idx)
+            else:
+                list(pool.map(permute_and_score, active_features))
+            if deadline is not None and time.time() > deadline:
+                break
+            if repeat + 1 >= max(min_repeats, 2):
+                threshold = tolerance * max(abs(np.mean(values)) for values in importances)
+                active_features = [
+                    col_idx for col_idx in active_features
+                    if 1.96 * np.std(importances[col_idx], ddof=1) / np.sqrt(len(importances[col_idx])) > threshold
+                ]
+            if not active_features:
+                break
+
+    return importances
+
+
 def get_importance(name: str, feature_importances: pd.Series, ds: 'tabular.Dataset') -> int:
     """Return importance based on feature importance or label/date/index first."""
     if name in feature_importances.keys():
@@ -69,7 +69,9 @@ def validate_model(
     )
 
     if isinstance(data, tabular.Dataset):
-        features = data.data[data.features]
+        # only the first non-empty chunk is read, so streaming datasets are not loaded into memory
+        features = next((chunk for chunk in data.iter_chunks(columns=data.features) if len(chunk) > 0),
+                        pd.DataFrame(columns=data.features))
     else:
         features = data
 
@@ -17,6 +17,7 @@ from typing_extensions import Self
 
 from deepchecks import CheckResult, ConditionCategory, ConditionResult
 from deepchecks.utils.distribution.drift import calc_drift_and_plot, get_drift_plot_sidenote
+from deepchecks.utils.distribution.sketches import CategoricalSketch, NumericSketch
 from deepchecks.utils.strings import format_number
 
 __all__ = ['LabelDriftAbstract']
@@ -43,8 +44,8 @@ class LabelDriftAbstract(abc.ABC):
                                dataset_names: t.Optional[t.Tuple[str, str]]) -> CheckResult:
 
         drift_score, method, display = calc_drift_and_plot(
-            train_column=pd.Series(train_column),
-            test_column=pd.Series(test_column),
+            train_column=_to_series(train_column),
+            test_column=_to_series(test_column),
             value_name=label_name,
             column_type=column_type,
             margin_quantile_filter=self.margin_quantile_filter,
@@ -103,3 +104,8 @@ class LabelDriftAbstract(abc.ABC):
             return ConditionResult(category, details)
 
         return self.add_condition(f'Label drift score < {max_allowed_drift_score}', condition)
+
+
+def _to_series(column):
+    """Convert the label values to a series, sketches of the label distribution are used as is."""
+    return column if isinstance(column, (NumericSketch, CategoricalSketch)) else pd.Series(column)
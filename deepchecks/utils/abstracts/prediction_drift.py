@@ -16,7 +16,9 @@ import numpy as np
 import pandas as pd
 
 from deepchecks import CheckResult, ConditionCategory, ConditionResult
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.distribution.drift import calc_drift_and_plot, get_drift_plot_sidenote
+from deepchecks.utils.distribution.sketches import CategoricalSketch, DriftProfile
 from deepchecks.utils.strings import format_number
 
 __all__ = ['PredictionDriftAbstract']
@@ -43,12 +45,12 @@ class PredictionDriftAbstract(abc.ABC):
     add_condition: t.Callable[..., t.Any]
 
     def _prediction_drift(self, train_prediction, test_prediction, model_classes, with_display,
-                          proba_drift, cat_plot) -> CheckResult:
+                          proba_drift, cat_plot, train_profile: t.Optional[DriftProfile] = None) -> CheckResult:
         """Calculate prediction drift.
 
         Args:
-            train_prediction : np.ndarray
-                train prediction or probabilities
+            train_prediction : t.Optional[np.ndarray]
+                train prediction or probabilities, ignored if train_profile is given
             test_prediction : np.ndarray
                 test prediction or probabilities
             model_classes : List[str]
@@ -59,6 +61,8 @@ class PredictionDriftAbstract(abc.ABC):
                 flag for computing drift on the probabilities rather than the predicted labels
             cat_plot : bool
                 flag for plotting the distribution of the predictions as a categorical plot
+            train_profile : t.Optional[DriftProfile]
+                drift profile of the train data, containing the distribution of the train predictions
 
         CheckResult
             value: drift score.
@@ -67,16 +71,30 @@ class PredictionDriftAbstract(abc.ABC):
         drift_score_dict, drift_display_dict = {}, {}
         method = None
 
+        if train_profile is not None:
+            train_columns, train_counts = _get_profile_predictions(train_profile, proba_drift)
+        else:
+            train_columns = [pd.Series(train_prediction[:, i].flatten()) for i in range(train_prediction.shape[1])]
+
         if proba_drift:
             if test_prediction.shape[1] == 2:
-                train_prediction = train_prediction[:, [1]]
+                train_columns = train_columns[1:]
                 test_prediction = test_prediction[:, [1]]
+                if train_profile is None:
+                    train_prediction = train_prediction[:, [1]]
+                else:
+                    # argmax of the single positive class column, as done below for the test predictions
+                    train_counts = pd.Series({0: train_columns[0].count})
 
             # Get the classes in the same order as the model's predictions
-            train_converted_from_proba = train_prediction.argmax(axis=1)
             test_converted_from_proba = test_prediction.argmax(axis=1)
-            samples_per_class = pd.Series(np.concatenate([train_converted_from_proba, test_converted_from_proba], axis=0
-                                                         ).squeeze()).value_counts().sort_index()
+            if train_profile is None:
+                train_converted_from_proba = train_prediction.argmax(axis=1)
+                samples_per_class = pd.Series(np.concatenate([train_converted_from_proba, test_converted_from_proba],
+                                                             axis=0).squeeze()).value_counts().sort_index()
+            else:
+                samples_per_class = train_counts.add(pd.Series(test_converted_from_proba).value_counts(),
+                                                     fill_value=0).astype(int).sort_index()
 
             # If label exists, get classes from it and map the samples_per_class index to these classes
             if model_classes is not None:
@@ -88,8 +106,12 @@ class PredictionDriftAbstract(abc.ABC):
             samples_per_class = samples_per_class.to_dict()
         else:
             # Get the classes in the same order as the model's predictions
-            samples_per_class = pd.Series(np.concatenate([train_prediction, test_prediction], axis=0
-                                                         ).squeeze()).value_counts().to_dict()
+            if train_profile is None:
+                samples_per_class = pd.Series(np.concatenate([train_prediction, test_prediction], axis=0
+                                                             ).squeeze()).value_counts().to_dict()
+            else:
+                samples_per_class = train_counts.add(pd.Series(test_prediction.squeeze(axis=1)).value_counts(),
+                                                     fill_value=0).astype(int).sort_values(ascending=False).to_dict()
             classes = list(sorted(samples_per_class.keys()))
 
         has_min_samples = hasattr(self, 'min_samples')
@@ -97,10 +119,10 @@ class PredictionDriftAbstract(abc.ABC):
         if has_min_samples:
             additional_kwargs['min_samples'] = self.min_samples
 
-        for class_idx in range(train_prediction.shape[1]):
+        for class_idx in range(test_prediction.shape[1]):
             class_name = classes[class_idx]
             drift_score_dict[class_name], method, drift_display_dict[class_name] = calc_drift_and_plot(
-                train_column=pd.Series(train_prediction[:, class_idx].flatten()),
+                train_column=train_columns[class_idx],
                 test_column=pd.Series(test_prediction[:, class_idx].flatten()),
                 value_name='model predictions' if not proba_drift else
                 f'predicted probabilities for class {class_name}',
@@ -179,3 +201,19 @@ class PredictionDriftAbstract(abc.ABC):
             return ConditionResult(category, details)
 
         return self.add_condition(f'Prediction drift score < {max_allowed_drift_score}', condition)
+
+
+def _get_profile_predictions(train_profile: DriftProfile, proba_drift: bool):
+    """Return the sketches of the train predictions and the number of train samples predicted as each class."""
+    if proba_drift:
+        if train_profile.probabilities is None or train_profile.predicted_classes is None:
+            raise DeepchecksValueError('The train profile does not contain the predicted probabilities')
+        return train_profile.probabilities, pd.Series(train_profile.predicted_classes.get_counter(), dtype=int)
+    if train_profile.predictions is None:
+        raise DeepchecksValueError('The train profile does not contain the model predictions')
+    sketch = train_profile.predictions
+    if isinstance(sketch, CategoricalSketch):
+        counts = sketch.get_counter()
+    else:
+        counts = pd.Series(sketch.weights, index=sketch.values).groupby(level=0).sum()
+    return [sketch], pd.Series(counts, dtype=int)
@@ -11,15 +11,26 @@
 """Module containing methods for calculating correlation between variables."""
 
 import math
+import os
 from collections import Counter
-from typing import List, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from scipy.stats import entropy
 
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.distribution.preprocessing import value_frequency
 
+__all__ = ['conditional_entropy', 'theil_u_correlation', 'symmetric_theil_u_correlation', 'correlation_ratio',
+           'symmetric_theil_u_correlation_matrix', 'correlation_ratio_matrix']
+
+# maximal number of elements of the temporary arrays of a batch of column pairs
+_MAX_BATCH_ELEMENTS = 2 ** 22
+# contingency tables with more cells than this multiple of the rows are re-encoded to their existing combinations
+_MAX_TABLE_ROWS = 16
+
 
 def conditional_entropy(x: Union[List, np.ndarray, pd.Series], y: Union[List, np.ndarray, pd.Series]) -> float:
     """
@@ -146,3 +157,213 @@ def correlation_ratio(categorical_data: Union[List, np.ndarray, pd.Series],
     else:
         eta = np.sqrt(numerator / denominator)
     return eta
+
+
+def symmetric_theil_u_correlation_matrix(categorical_codes: np.ndarray, n_jobs: int = 1) -> np.ndarray:
+    """
+    Calculate the symmetric Theil's U correlation between every pair of categorical columns.
+
+    The contingency table of each pair is counted from the integer codes with np.bincount, for a batch of pairs at a
+    time, instead of a python function call per pair. The values are the same as symmetric_theil_u_correlation of
+    each pair, calculated on the rows where both columns are not null (as in pd.DataFrame.corr).
+
+    Parameters
+    ----------
+    categorical_codes: np.ndarray
+        2D array of the integer codes of the values of each column (e.g. from pd.factorize), nulls are encoded as -1
+    n_jobs: int, default: 1
+        Number of processes to calculate the pairs in, -1 means all the CPUs.
+
+    Returns
+    -------
+    np.ndarray
+        Symmetric matrix of the correlations, NaN for pairs without any rows where both columns are not null.
+    """
+    codes = _validate_codes(categorical_codes)
+    num_columns = codes.shape[1]
+    pairs = np.stack(np.triu_indices(num_columns, k=1), axis=1)
+    values = _map_shards(_symmetric_theil_u_of_pairs, codes, pairs, n_jobs)
+
+    result = np.empty((num_columns, num_columns))
+    result[pairs[:, 0], pairs[:, 1]] = values
+    result[pairs[:, 1], pairs[:, 0]] = values
+    np.fill_diagonal(result, np.where((codes >= 0).any(axis=0), 1.0, np.nan))
+    return result
+
+
+def correlation_ratio_matrix(categorical_codes: np.ndarray, numerical_data: np.ndarray, n_jobs: int = 1) -> np.ndarray:
+    """
+    Calculate the correlation ratio of every numerical column to every categorical column.
+
+    The sizes and means of the categories are summed from the integer codes with np.bincount, for all the numerical
+    columns at once. The values are the same as correlation_ratio of each pair, calculated on the rows where both
+    columns are not null, except that categories without such rows are ignored (instead of resulting in NaN).
+
+    Parameters
+    ----------
+    categorical_codes: np.ndarray
+        2D array of the integer codes of the values of each categorical column, nulls are encoded as -1
+    numerical_data: np.ndarray
+        2D array of the values of each numerical column, nulls are NaN
+    n_jobs: int, default: 1
+        Number of processes to calculate the categorical columns in, -1 means all the CPUs.
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of the correlation ratios, of shape (numerical columns, categorical columns). NaN for pairs without any
+        rows where both columns are not null.
+    """
+    codes = _validate_codes(categorical_codes)
+    numerical_data = np.asarray(numerical_data, dtype=np.float64)
+    if numerical_data.ndim != 2 or numerical_data.shape[0] != codes.shape[0]:
+        raise DeepchecksValueError('numerical_data must be a 2D array with the same number of rows as the codes')
+    columns = np.arange(codes.shape[1])
+    values = _map_shards(_correlation_ratio_of_columns, codes, columns, n_jobs, numerical_data)
+    return np.reshape(values, (codes.shape[1], numerical_data.shape[1])).T
+
+
+def _validate_codes(categorical_codes: np.ndarray) -> np.ndarray:
+    codes = np.asarray(categorical_codes)
+    if codes.ndim != 2 or not np.issubdtype(codes.dtype, np.integer):
+        raise DeepchecksValueError('categorical_codes must be a 2D array of integer codes')
+    return codes.astype(np.int64, copy=False)
+
+
+def _map_shards(function: Callable, codes: np.ndarray, items: np.ndarray, n_jobs: int, *args) -> np.ndarray:
+    """Apply the function on contiguous shards of the items in a process pool, and concatenate the results."""
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif not isinstance(n_jobs, int) or n_jobs < 1:
+        raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
+    if n_jobs == 1 or len(items) <= 1:
+        return function(codes, items, *args)
+
+    shard_size = -(-len(items) // n_jobs)
+    shards = [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        futures = [pool.submit(function, codes, shard, *args) for shard in shards]
+        return np.concatenate([future.result() for future in futures])
+
+
+def _count_cells(codes: np.ndarray, sizes: np.ndarray, weights: Optional[np.ndarray] = None) -> \
+        Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count the codes of segments, where the codes of segment i are offset by the sum of the previous sizes.
+
+    Returns the segment, the code within the segment and the count of each non-empty cell.
+    """
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    counts = np.bincount(codes, weights=weights, minlength=offsets[-1])
+    cells = np.flatnonzero(counts)
+    segments = np.searchsorted(offsets, cells, side='right') - 1
+    return segments, cells - offsets[segments], counts[cells]
+
+
+def _entropies(segments: np.ndarray, counts: np.ndarray, num_segments: int) -> np.ndarray:
+    """Calculate the entropy of the counts of the cells of each segment."""
+    totals = np.bincount(segments, weights=counts, minlength=num_segments)
+    probabilities = counts / totals[segments]
+    return np.bincount(segments, weights=-probabilities * np.log(probabilities), minlength=num_segments)
+
+
+def _symmetric_theil_u_of_pairs(codes: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """Calculate the symmetric Theil's U of the given pairs of columns, in batches of pairs with the same first column.
+
+    The entropies of columns without nulls are calculated once, pairs with nulls need the entropies of their columns
+    on the rows where both are not null.
+    """
+    num_rows, num_columns = codes.shape
+    # each column is contiguous, so that taking the columns of a batch is a fast copy
+    columns = np.ascontiguousarray(codes.T)
+    cardinalities = columns.max(axis=1, initial=-1) + 1
+    not_null = columns >= 0
+    has_nulls = ~not_null.all(axis=1)
+    column_offsets = np.concatenate([[0], np.cumsum(cardinalities)[:-1]])
+    column_entropies = _entropies(*_count_cells((columns + column_offsets[:, None])[not_null], cardinalities)[::2],
+                                  num_columns)
+
+    result = np.empty(len(pairs))
+    for first in np.unique(pairs[:, 0]):
+        positions = np.flatnonzero(pairs[:, 0] == first)
+        for with_nulls in (False, True):
+            group = positions[(has_nulls[first] | has_nulls[pairs[positions, 1]]) == with_nulls]
+            table_sizes = np.minimum((cardinalities[first] + 1) * (cardinalities[pairs[group, 1]] + 1),
+                                     _MAX_TABLE_ROWS * num_rows)
+            batch_ids = (np.cumsum(table_sizes + num_rows) - 1) // _MAX_BATCH_ELEMENTS
+            for batch_id in np.unique(batch_ids):
+                batch = group[batch_ids == batch_id]
+                second = pairs[batch, 1]
+                entropies = None if with_nulls else (column_entropies[first], column_entropies[second])
+                result[batch] = _symmetric_theil_u_with_column(columns[first], cardinalities[first], columns[second],
+                                                               cardinalities[second], entropies)
+    return result
+
+
+def _symmetric_theil_u_with_column(x: np.ndarray, x_size: int, ys: np.ndarray, y_sizes: np.ndarray,
+                                   entropies: Optional[Tuple[float, np.ndarray]]) -> np.ndarray:
+    """Calculate the symmetric Theil's U of the column x with each of the columns ys (given as rows).
+
+    The entropies of x and of ys are given when there are no nulls, otherwise they are calculated from the contingency
+    tables, on the rows where both are not null.
+    """
+    num_pairs, num_rows = ys.shape
+    # the code of each pair of values in the contingency table is (y + 1) * x_base + (x + 1), so the nulls (-1) have
+    # cells of their own which are dropped after counting, instead of masking the rows
+    x_base = x_size + 1
+    joint = np.multiply(ys, x_base)
+    joint += x + x_base + 1
+    joint_sizes = x_base * (y_sizes + 1)
+    # pairs with much more possible combinations than rows are re-encoded, so their tables are not too large
+    decoders = {}
+    for pair in np.flatnonzero(joint_sizes > _MAX_TABLE_ROWS * num_rows):
+        decoders[pair], joint[pair] = np.unique(joint[pair], return_inverse=True)
+        joint_sizes[pair] = len(decoders[pair])
+    joint += np.concatenate([[0], np.cumsum(joint_sizes)[:-1]])[:, None]
+
+    segments, values, counts = _count_cells(joint.ravel(), joint_sizes)
+    if entropies is None:
+        for pair, uniques in decoders.items():
+            in_pair = segments == pair
+            values[in_pair] = uniques[values[in_pair]]
+        x_values, y_values = values % x_base, values // x_base
+        not_null = (x_values > 0) & (y_values > 0)
+        segments, x_values, y_values, counts = segments[not_null], x_values[not_null], y_values[not_null], \
+            counts[not_null]
+        h_x = _entropies(*_count_cells(segments * x_base + x_values, np.full(num_pairs, x_base), counts)[::2],
+                         num_pairs)
+        y_offsets = np.concatenate([[0], np.cumsum(y_sizes + 1)[:-1]])
+        h_y = _entropies(*_count_cells(y_offsets[segments] + y_values, y_sizes + 1, counts)[::2], num_pairs)
+    else:
+        h_x, h_y = entropies
+    h_xy = _entropies(segments, counts, num_pairs)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # equals (H(x) * U(x|y) + H(y) * U(y|x)) / (H(x) + H(y)), as the mutual information is symmetric
+        values = np.clip(2 * (h_x + h_y - h_xy) / (h_x + h_y), 0, 1)
+    values[np.bincount(segments, minlength=num_pairs) == 0] = np.nan
+    return values
+
+
+def _correlation_ratio_of_columns(codes: np.ndarray, columns: np.ndarray, numerical_data: np.ndarray) -> np.ndarray:
+    """Calculate the correlation ratio of all the numerical columns to each of the given categorical columns."""
+    num_numerical = numerical_data.shape[1]
+    not_null = ~np.isnan(numerical_data)
+    result = np.empty((len(columns), num_numerical))
+    for index, column in enumerate(columns):
+        categories = codes[:, [column]]
+        size = max(int(categories.max(initial=-1)) + 1, 1)
+        valid = (categories >= 0) & not_null
+
+        flat_codes = (categories + np.arange(num_numerical) * size)[valid]
+        counts = np.bincount(flat_codes, minlength=num_numerical * size).reshape(num_numerical, size)
+        sums = np.bincount(flat_codes, weights=numerical_data[valid], minlength=num_numerical * size)
+        sums = sums.reshape(num_numerical, size)
+        totals = counts.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total_means = sums.sum(axis=1) / totals
+            category_means = np.where(counts > 0, sums / np.maximum(counts, 1), 0)
+            numerator = (counts * (category_means - total_means[:, None]) ** 2).sum(axis=1)
+            denominator = (np.where(valid, numerical_data - total_means, 0) ** 2).sum(axis=0)
+            eta = np.where(denominator == 0, 0, np.sqrt(numerator / denominator))
+        result[index] = np.where(totals == 0, np.nan, eta)
+    return result.reshape(-1)
@@ -25,6 +25,9 @@ from deepchecks.utils.dict_funcs import get_dict_entry_by_value
 from deepchecks.utils.distribution.plot import (CategoriesSortingKind, drift_score_bar_traces,
                                                 feature_distribution_traces)
 from deepchecks.utils.distribution.preprocessing import preprocess_2_cat_cols_to_same_bins
+from deepchecks.utils.distribution.sketches import (CategoricalSketch, ColumnSketch, NumericSketch, create_sketch,
+                                                    earth_movers_distance_from_sketches,
+                                                    kolmogorov_smirnov_from_sketches)
 from deepchecks.utils.plot import DEFAULT_DATASET_NAMES
 from deepchecks.utils.strings import format_number
 
@@ -370,8 +373,8 @@ def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.n
     return wasserstein_distance(dist1, dist2)
 
 
-def calc_drift_and_plot(train_column: pd.Series,
-                        test_column: pd.Series,
+def calc_drift_and_plot(train_column: Union[pd.Series, ColumnSketch],
+                        test_column: Union[pd.Series, ColumnSketch],
                         value_name: str,
                         column_type: str,
                         plot_title: Optional[str] = None,
@@ -394,10 +397,10 @@ def calc_drift_and_plot(train_column: pd.Series,
 
     Parameters
     ----------
-    train_column: pd.Series
-        column from train dataset
-    test_column: pd.Series
-        same column from test dataset
+    train_column: Union[pd.Series, ColumnSketch]
+        column from train dataset, or a sketch of its distribution (see ``DriftProfile``)
+    test_column: Union[pd.Series, ColumnSketch]
+        same column from test dataset, or a sketch of its distribution
     value_name: str
         title of the x axis, if plot_title is None then also the title of the whole plot.
     column_type: str
@@ -456,14 +459,23 @@ def calc_drift_and_plot(train_column: pd.Series,
         raise DeepchecksValueError(
             f'min_category_size_ratio expected a value in range [0, 1], instead got {min_category_size_ratio}.')
 
-    if column_type == 'categorical' and ignore_na is False:
-        train_dist = np.array(train_column.values).reshape(-1)
-        test_dist = np.array(test_column.values).reshape(-1)
+    use_sketches = isinstance(train_column, (NumericSketch, CategoricalSketch)) or \
+        isinstance(test_column, (NumericSketch, CategoricalSketch))
+    if use_sketches:
+        # Drift is calculated on the sketches of both distributions
+        train_dist = _get_sketch(train_column, column_type)
+        test_dist = _get_sketch(test_column, column_type)
+        train_size, test_size = _get_sketch_size(train_dist, ignore_na), _get_sketch_size(test_dist, ignore_na)
     else:
-        train_dist = np.array(train_column.dropna().values).reshape(-1)
-        test_dist = np.array(test_column.dropna().values).reshape(-1)
+        if column_type == 'categorical' and ignore_na is False:
+            train_dist = np.array(train_column.values).reshape(-1)
+            test_dist = np.array(test_column.values).reshape(-1)
+        else:
+            train_dist = np.array(train_column.dropna().values).reshape(-1)
+            test_dist = np.array(test_column.dropna().values).reshape(-1)
+        train_size, test_size = len(train_dist), len(test_dist)
 
-    if len(train_dist) < min_samples or len(test_dist) < min_samples:
+    if train_size < min_samples or test_size < min_samples:
         if raise_min_samples_error is True:
             raise NotEnoughSamplesError(
                 f'Not enough samples to calculate drift score. Minimum {min_samples} samples required. '
@@ -474,16 +486,18 @@ def calc_drift_and_plot(train_column: pd.Series,
             return 'not_enough_samples', None, None
 
     if column_type == 'numerical':
-        train_dist = train_dist.astype('float')
-        test_dist = test_dist.astype('float')
+        if not use_sketches:
+            train_dist = train_dist.astype('float')
+            test_dist = test_dist.astype('float')
 
         if numerical_drift_method.lower() == 'emd':
             scorer_name = 'Earth Mover\'s Distance'
-            score = earth_movers_distance(dist1=train_dist, dist2=test_dist,
-                                          margin_quantile_filter=margin_quantile_filter)
+            emd_function = earth_movers_distance_from_sketches if use_sketches else earth_movers_distance
+            score = emd_function(train_dist, test_dist, margin_quantile_filter=margin_quantile_filter)
         elif numerical_drift_method.lower() in ['ks', 'kolmogorov-smirnov']:
             scorer_name = 'Kolmogorov-Smirnov'
-            score = kolmogorov_smirnov(dist1=train_dist, dist2=test_dist)
+            ks_function = kolmogorov_smirnov_from_sketches if use_sketches else kolmogorov_smirnov
+            score = ks_function(train_dist, test_dist)
         else:
             raise DeepchecksValueError('Expected numerical_drift_method to be one '
                                        f'of ["EMD", "KS"], received: {numerical_drift_method}')
@@ -491,6 +505,8 @@ def calc_drift_and_plot(train_column: pd.Series,
         if not with_display:
             return score, scorer_name, None
 
+        if use_sketches:
+            train_dist, test_dist = train_dist.representative_values(), test_dist.representative_values()
         bar_traces, bar_x_axis, bar_y_axis = drift_score_bar_traces(score)
         dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(train_dist, test_dist, value_name,
                                                                             dataset_names=dataset_names)
@@ -503,6 +519,10 @@ def calc_drift_and_plot(train_column: pd.Series,
 
         sort_by = 'difference' if show_categories_by == 'largest_difference' else \
             ('dist1' if show_categories_by == 'train_largest' else 'dist2')
+        if use_sketches:
+            # The drift scores support the values counts as well as the values themselves
+            train_sketch, test_sketch = train_dist, test_dist
+            train_dist, test_dist = train_sketch.get_counter(ignore_na), test_sketch.get_counter(ignore_na)
         if categorical_drift_method.lower() in ['cramer_v', 'cramers_v']:
             scorer_name = 'Cramer\'s V'
             score = cramers_v(dist1=train_dist, dist2=test_dist, balance_classes=balance_classes,
@@ -519,6 +539,9 @@ def calc_drift_and_plot(train_column: pd.Series,
         if not with_display:
             return score, scorer_name, None
 
+        if use_sketches:
+            train_dist = train_sketch.representative_values(ignore_na)
+            test_dist = test_sketch.representative_values(ignore_na)
         bar_traces, bar_x_axis, bar_y_axis = drift_score_bar_traces(score, bar_max=1)
         dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(
             train_dist, test_dist, value_name, is_categorical=True,
@@ -556,6 +579,21 @@ def calc_drift_and_plot(train_column: pd.Series,
     return score, scorer_name, fig
 
 
+def _get_sketch(column: Union[pd.Series, ColumnSketch], column_type: str) -> ColumnSketch:
+    """Return the sketch of the column distribution, creating it if the column values are given."""
+    if isinstance(column, (NumericSketch, CategoricalSketch)):
+        expected_type = NumericSketch if column_type == 'numerical' else CategoricalSketch
+        if not isinstance(column, expected_type):
+            raise DeepchecksValueError(f'Expected a sketch of a {column_type} column, '
+                                       f'received: {type(column).__name__}')
+        return column
+    return create_sketch(column_type, column)
+
+
+def _get_sketch_size(sketch: ColumnSketch, ignore_na: bool) -> int:
+    return sketch.count if isinstance(sketch, NumericSketch) else sketch.count(ignore_na)
+
+
 def get_drift_plot_sidenote(max_num_categories_for_display: int, show_categories_by: str) -> str:
     """
     Return a sidenote for the drift score plots regarding the number of categories shown in discrete distributions.
@@ -114,7 +114,8 @@ class ScaledNumerics(TransformerMixin, BaseEstimator):
             return s
 
 
-def preprocess_2_cat_cols_to_same_bins(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series],
+def preprocess_2_cat_cols_to_same_bins(dist1: Union[np.ndarray, pd.Series, Counter],
+                                       dist2: Union[np.ndarray, pd.Series, Counter],
                                        min_category_size_ratio: float = 0., max_num_categories: int = None,
                                        sort_by: str = 'dist1'
                                        ) -> Tuple[np.ndarray, np.ndarray, List]:
@@ -128,10 +129,10 @@ def preprocess_2_cat_cols_to_same_bins(dist1: Union[np.ndarray, pd.Series], dist
 
     Parameters
     ----------
-    dist1: Union[np.ndarray, pd.Series]
-        list of values from the first distribution.
-    dist2: Union[np.ndarray, pd.Series]
-        list of values from the second distribution.
+    dist1: Union[np.ndarray, pd.Series, Counter]
+        list of values from the first distribution, or the counts of its values.
+    dist2: Union[np.ndarray, pd.Series, Counter]
+        list of values from the second distribution, or the counts of its values.
     min_category_size_ratio: float, default 0
         minimum size ratio for categories. Categories with size ratio lower than this number are binned
         into an "Other" category.
@@ -160,9 +161,11 @@ def preprocess_2_cat_cols_to_same_bins(dist1: Union[np.ndarray, pd.Series], dist
         list of all categories that the percentages represent.
 
     """
+    # Counter of a Counter copies its counts, so both input types are handled the same
     dist1_counter, dist2_counter = Counter(dist1), Counter(dist2)
-    size_dist1, size_dist2 = len(dist1), len(dist2)
-    categories_list = list(set(dist1_counter.keys()) | (set(dist2_counter.keys())))
+    size_dist1, size_dist2 = sum(dist1_counter.values()), sum(dist2_counter.values())
+    # The counts may already include an "Other" category (e.g. of values truncated from a sketch)
+    categories_list = list((set(dist1_counter.keys()) | set(dist2_counter.keys())) - {OTHER_CATEGORY_NAME})
 
     if max_num_categories is not None and len(categories_list) > max_num_categories:
         if sort_by == 'dist1':
@@ -176,8 +179,8 @@ def preprocess_2_cat_cols_to_same_bins(dist1: Union[np.ndarray, pd.Series], dist
             raise DeepchecksValueError(f'sort_by got unexpected value: {sort_by}')
 
         # Not using most_common func of Counter as it's not deterministic for equal values
-        categories_list = [x[0] for x in sorted(sort_by_counter.items(), key=lambda x: (-x[1], x[0]))][
-                          :max_num_categories]
+        categories_list = [x[0] for x in sorted(sort_by_counter.items(), key=lambda x: (-x[1], x[0]))
+                           if x[0] != OTHER_CATEGORY_NAME][:max_num_categories]
         dist1_counter = Counter({k: dist1_counter[k] for k in categories_list})
         dist1_counter[OTHER_CATEGORY_NAME] = size_dist1 - sum(dist1_counter.values())
         dist2_counter = Counter({k: dist2_counter[k] for k in categories_list})
@@ -0,0 +1,396 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Mergeable sketches of distributions, used to calculate drift without keeping the data in memory."""
+# pylint: disable=protected-access
+import json
+import pathlib
+from collections import Counter
+from numbers import Number
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy.stats import wasserstein_distance
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.utils.distribution.preprocessing import OTHER_CATEGORY_NAME
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['NumericSketch', 'CategoricalSketch', 'ColumnSketch', 'DriftProfile', 'create_sketch']
+
+DEFAULT_MAX_SIZE = 2048
+DEFAULT_MAX_CATEGORIES = 10_000
+MAX_REPRESENTATIVE_VALUES = 10_000
+
+
+class NumericSketch:
+    """Mergeable quantile sketch of a numeric distribution.
+
+    The sketch keeps the distinct values and their counts, and is exact as long as there are at most ``max_size``
+    distinct values. Beyond that, the values are compressed into ``max_size`` weighted centroids of (nearly) equal
+    weight, so the error of the estimated CDF is bounded by about ``1 / max_size``.
+
+    Parameters
+    ----------
+    max_size : int , default: 2048
+        Maximal number of values (or centroids) kept by the sketch.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if not isinstance(max_size, int) or max_size < 2:
+            raise DeepchecksValueError(f'max_size must be an integer greater than 1, but got: {max_size}')
+        self.max_size = max_size
+        self.values = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.min = np.nan
+        self.max = np.nan
+        self.is_exact = True
+
+    @property
+    def count(self) -> int:
+        """Return the number of values added to the sketch."""
+        return int(round(self.weights.sum()))
+
+    def update(self, values: Union[np.ndarray, pd.Series]) -> 'NumericSketch':
+        """Add the given values to the sketch, null values are ignored."""
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        values = values[~np.isnan(values)]
+        if len(values) > 0:
+            uniques, counts = np.unique(values, return_counts=True)
+            self._add(uniques, counts.astype(np.float64), values.min(), values.max(), True)
+        return self
+
+    def merge(self, other: 'NumericSketch') -> 'NumericSketch':
+        """Return a new sketch of the values of both sketches."""
+        merged = NumericSketch(max(self.max_size, other.max_size))
+        merged._add(self.values, self.weights, self.min, self.max, self.is_exact)
+        merged._add(other.values, other.weights, other.min, other.max, other.is_exact)
+        return merged
+
+    def _add(self, values: np.ndarray, weights: np.ndarray, min_value: float, max_value: float, is_exact: bool):
+        if len(values) == 0:
+            return
+        uniques, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+        self.weights = np.bincount(inverse, weights=np.concatenate([self.weights, weights]))
+        self.values = uniques
+        self.min = np.nanmin([self.min, min_value])
+        self.max = np.nanmax([self.max, max_value])
+        self.is_exact = self.is_exact and is_exact
+        if len(self.values) > self.max_size:
+            self._compress()
+
+    def _compress(self):
+        """Compress the values into max_size centroids, each holding about the same weight."""
+        cumulative_weights = np.cumsum(self.weights)
+        # Assign each value to a bucket by the rank of its middle
+        buckets = np.minimum(((cumulative_weights - self.weights / 2) / cumulative_weights[-1] * self.max_size)
+                             .astype(np.int64), self.max_size - 1)
+        weights = np.bincount(buckets, weights=self.weights)
+        values = np.bincount(buckets, weights=self.values * self.weights)
+        non_empty = weights > 0
+        self.weights = weights[non_empty]
+        self.values = values[non_empty] / self.weights
+        self.is_exact = False
+
+    def quantile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Return the quantiles of the values, using linear interpolation like ``np.quantile``."""
+        positions = (self.weights.sum() - 1) * np.asarray(q, dtype=np.float64)
+        lower = np.floor(positions)
+        cumulative_weights = np.cumsum(self.weights)
+        last = len(self.values) - 1
+        lower_values = self.values[np.minimum(np.searchsorted(cumulative_weights, lower, side='right'), last)]
+        upper_values = self.values[np.minimum(np.searchsorted(cumulative_weights, lower + 1, side='right'), last)]
+        return lower_values + (positions - lower) * (upper_values - lower_values)
+
+    def cdf(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Return the ratio of values which are lower or equal to x."""
+        cumulative_weights = np.concatenate([[0], np.cumsum(self.weights)])
+        return cumulative_weights[np.searchsorted(self.values, x, side='right')] / cumulative_weights[-1]
+
+    def filter_margins(self, margin_quantile_filter: float) -> 'NumericSketch':
+        """Return a sketch without the values outside the given quantiles margins."""
+        qt_min, qt_max = self.quantile([margin_quantile_filter, 1 - margin_quantile_filter])
+        in_range = (qt_max >= self.values) & (self.values >= qt_min)
+        filtered = NumericSketch(self.max_size)
+        filtered._add(self.values[in_range], self.weights[in_range],
+                      self.values[in_range].min(), self.values[in_range].max(), self.is_exact)
+        return filtered
+
+    def representative_values(self, max_values: int = MAX_REPRESENTATIVE_VALUES) -> np.ndarray:
+        """Return values which are distributed like the sketch, to be used for display."""
+        if self.is_exact and self.count <= max_values:
+            return np.repeat(self.values, self.weights.astype(np.int64))
+        return self.quantile(np.linspace(0, 1, min(self.count, max_values)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a json serializable representation of the sketch."""
+        return {'type': 'numerical', 'max_size': self.max_size, 'values': self.values.tolist(),
+                'weights': self.weights.tolist(), 'min': _none_if_nan(self.min), 'max': _none_if_nan(self.max),
+                'is_exact': self.is_exact}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NumericSketch':
+        """Create a sketch from its representation returned by ``to_dict``."""
+        sketch = cls(data['max_size'])
+        sketch.values = np.asarray(data['values'], dtype=np.float64)
+        sketch.weights = np.asarray(data['weights'], dtype=np.float64)
+        sketch.min = np.nan if data['min'] is None else data['min']
+        sketch.max = np.nan if data['max'] is None else data['max']
+        sketch.is_exact = data['is_exact']
+        return sketch
+
+
+class CategoricalSketch:
+    """Mergeable counts of the values of a categorical distribution.
+
+    The counts of the ``max_categories`` most frequent values are kept, the counts of rarer values are only
+    accumulated as a total, which is treated as the "Other" category when the drift is calculated.
+
+    Parameters
+    ----------
+    max_categories : int , default: 10_000
+        Maximal number of values to keep the counts of.
+    """
+
+    def __init__(self, max_categories: int = DEFAULT_MAX_CATEGORIES):
+        if not isinstance(max_categories, int) or max_categories < 1:
+            raise DeepchecksValueError(f'max_categories must be a positive integer, but got: {max_categories}')
+        self.max_categories = max_categories
+        self.counts = Counter()
+        self.nan_count = 0
+        self.truncated_count = 0
+
+    def count(self, ignore_na: bool = True) -> int:
+        """Return the number of values added to the sketch."""
+        return sum(self.counts.values()) + self.truncated_count + (0 if ignore_na else self.nan_count)
+
+    def update(self, values: Union[np.ndarray, pd.Series]) -> 'CategoricalSketch':
+        """Add the given values to the sketch."""
+        values = pd.Series(np.asarray(values, dtype=object).reshape(-1))
+        nulls = values.isna()
+        self.nan_count += int(nulls.sum())
+        self.counts.update({_to_builtin(value): count for value, count in Counter(values[~nulls]).items()})
+        self._truncate()
+        return self
+
+    def merge(self, other: 'CategoricalSketch') -> 'CategoricalSketch':
+        """Return a new sketch of the values of both sketches."""
+        merged = CategoricalSketch(max(self.max_categories, other.max_categories))
+        merged.counts = self.counts + other.counts
+        merged.nan_count = self.nan_count + other.nan_count
+        merged.truncated_count = self.truncated_count + other.truncated_count
+        merged._truncate()
+        return merged
+
+    def _truncate(self):
+        if len(self.counts) > self.max_categories:
+            # Sorting by the value as well, as most_common is not deterministic for equal counts
+            kept = sorted(self.counts.items(), key=lambda x: (-x[1], str(x[0])))[:self.max_categories]
+            self.truncated_count += sum(self.counts.values()) - sum(count for _, count in kept)
+            self.counts = Counter(dict(kept))
+
+    def get_counter(self, ignore_na: bool = True) -> Counter:
+        """Return the counts of the values, including the counts of the truncated values as the "Other" category."""
+        counter = Counter(self.counts)
+        if self.truncated_count > 0:
+            counter[OTHER_CATEGORY_NAME] += self.truncated_count
+        if not ignore_na and self.nan_count > 0:
+            counter[np.nan] = self.nan_count
+        return counter
+
+    def representative_values(self, ignore_na: bool = True,
+                              max_values: int = MAX_REPRESENTATIVE_VALUES) -> np.ndarray:
+        """Return values which are distributed like the sketch, to be used for display."""
+        counter = self.get_counter(ignore_na)
+        ratio = min(1, max_values / max(sum(counter.values()), 1))
+        values = np.empty(len(counter), dtype=object)
+        values[:] = list(counter.keys())
+        return np.repeat(values, [int(round(count * ratio)) for count in counter.values()])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a json serializable representation of the sketch."""
+        return {'type': 'categorical', 'max_categories': self.max_categories,
+                'values': [_to_json_value(value) for value in self.counts.keys()],
+                'counts': list(self.counts.values()), 'nan_count': self.nan_count,
+                'truncated_count': self.truncated_count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CategoricalSketch':
+        """Create a sketch from its representation returned by ``to_dict``."""
+        sketch = cls(data['max_categories'])
+        sketch.counts = Counter(dict(zip(data['values'], data['counts'])))
+        sketch.nan_count = data['nan_count']
+        sketch.truncated_count = data['truncated_count']
+        return sketch
+
+
+ColumnSketch = Union[NumericSketch, CategoricalSketch]
+
+
+def create_sketch(column_type: str, values: Union[np.ndarray, pd.Series, None] = None,
+                  max_size: int = DEFAULT_MAX_SIZE, max_categories: int = DEFAULT_MAX_CATEGORIES) -> ColumnSketch:
+    """Create a sketch of the given column type ("numerical" or "categorical") and add the given values to it."""
+    if column_type == 'numerical':
+        sketch = NumericSketch(max_size)
+    elif column_type == 'categorical':
+        sketch = CategoricalSketch(max_categories)
+    else:
+        raise DeepchecksValueError(f'Unsupported column type for sketch: {column_type}')
+    if values is not None:
+        sketch.update(values)
+    return sketch
+
+
+def sketch_from_dict(data: Dict[str, Any]) -> ColumnSketch:
+    """Create a sketch from its representation returned by ``to_dict``."""
+    return NumericSketch.from_dict(data) if data['type'] == 'numerical' else CategoricalSketch.from_dict(data)
+
+
+def kolmogorov_smirnov_from_sketches(sketch1: NumericSketch, sketch2: NumericSketch) -> float:
+    """Calculate the two-sample Kolmogorov-Smirnov statistic of the distributions of the two sketches."""
+    if min(sketch1.count, sketch2.count) == 0:
+        raise ValueError('Data must not be empty')
+    data_all = np.concatenate([sketch1.values, sketch2.values])
+    return np.max(np.abs(sketch1.cdf(data_all) - sketch2.cdf(data_all)))
+
+
+def earth_movers_distance_from_sketches(sketch1: NumericSketch, sketch2: NumericSketch,
+                                        margin_quantile_filter: float) -> float:
+    """Calculate the Earth Movers Distance of the distributions of the two sketches, see ``earth_movers_distance``."""
+    if not isinstance(margin_quantile_filter, Number) or margin_quantile_filter < 0 or margin_quantile_filter >= 0.5:
+        raise DeepchecksValueError(
+            f'margin_quantile_filter expected a value in range [0, 0.5), instead got {margin_quantile_filter}')
+
+    if margin_quantile_filter != 0:
+        sketch1 = sketch1.filter_margins(margin_quantile_filter)
+        sketch2 = sketch2.filter_margins(margin_quantile_filter)
+
+    val_max = max(sketch1.values.max(), sketch2.values.max())
+    val_min = min(sketch1.values.min(), sketch2.values.min())
+
+    if val_max == val_min:
+        return 0
+
+    # Scale the distribution between 0 and 1:
+    return wasserstein_distance((sketch1.values - val_min) / (val_max - val_min),
+                                (sketch2.values - val_min) / (val_max - val_min),
+                                sketch1.weights, sketch2.weights)
+
+
+class DriftProfile:
+    """Sketches of the distributions of a dataset, used as the reference distributions for drift calculation.
+
+    Profiles are created per chunk or partition of the data, merged, and persisted, so a new batch of data can be
+    compared to them without reloading the reference data.
+
+    Parameters
+    ----------
+    columns : Optional[Dict[Hashable, ColumnSketch]] , default: None
+        Sketches of the columns (features) distributions.
+    label : Optional[ColumnSketch] , default: None
+        Sketch of the label distribution.
+    predictions : Optional[ColumnSketch] , default: None
+        Sketch of the values predicted by the model.
+    probabilities : Optional[List[NumericSketch]] , default: None
+        Sketches of the predicted probabilities of each class, in the order of the model classes.
+    predicted_classes : Optional[CategoricalSketch] , default: None
+        Sketch of the index of the class with the highest predicted probability.
+    """
+
+    def __init__(
+            self,
+            columns: Optional[Dict[Hashable, ColumnSketch]] = None,
+            label: Optional[ColumnSketch] = None,
+            predictions: Optional[ColumnSketch] = None,
+            probabilities: Optional[List[NumericSketch]] = None,
+            predicted_classes: Optional[CategoricalSketch] = None
+    ):
+        self.columns = dict(columns or {})
+        self.label = label
+        self.predictions = predictions
+        self.probabilities = probabilities
+        self.predicted_classes = predicted_classes
+
+    def merge(self, other: 'DriftProfile') -> 'DriftProfile':
+        """Return a new profile of the data of both profiles."""
+        if set(self.columns) != set(other.columns):
+            raise DeepchecksValueError('Can not merge drift profiles of different columns')
+        probabilities = None
+        if self.probabilities is not None and other.probabilities is not None:
+            probabilities = [s1.merge(s2) for s1, s2 in zip(self.probabilities, other.probabilities)]
+        return DriftProfile(
+            columns={name: sketch.merge(other.columns[name]) for name, sketch in self.columns.items()},
+            label=_merge_optional(self.label, other.label),
+            predictions=_merge_optional(self.predictions, other.predictions),
+            probabilities=probabilities,
+            predicted_classes=_merge_optional(self.predicted_classes, other.predicted_classes)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a json serializable representation of the profile."""
+        return {
+            'columns': [[_to_json_value(name), sketch.to_dict()] for name, sketch in self.columns.items()],
+            'label': _optional_to_dict(self.label),
+            'predictions': _optional_to_dict(self.predictions),
+            'probabilities': None if self.probabilities is None else [s.to_dict() for s in self.probabilities],
+            'predicted_classes': _optional_to_dict(self.predicted_classes)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DriftProfile':
+        """Create a profile from its representation returned by ``to_dict``."""
+        return cls(
+            columns={name: sketch_from_dict(sketch) for name, sketch in data['columns']},
+            label=_optional_from_dict(data['label']),
+            predictions=_optional_from_dict(data['predictions']),
+            probabilities=None if data['probabilities'] is None else [
+                sketch_from_dict(sketch) for sketch in data['probabilities']],
+            predicted_classes=_optional_from_dict(data['predicted_classes'])
+        )
+
+    def save(self, path: Union[str, pathlib.Path]):
+        """Save the profile to a json file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: Union[str, pathlib.Path]) -> 'DriftProfile':
+        """Load a profile saved by ``save``."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def _merge_optional(sketch1: Optional[ColumnSketch], sketch2: Optional[ColumnSketch]) -> Optional[ColumnSketch]:
+    if sketch1 is None or sketch2 is None:
+        return sketch1 if sketch2 is None else sketch2
+    return sketch1.merge(sketch2)
+
+
+def _optional_to_dict(sketch: Optional[ColumnSketch]) -> Optional[Dict[str, Any]]:
+    return None if sketch is None else sketch.to_dict()
+
+
+def _optional_from_dict(data: Optional[Dict[str, Any]]) -> Optional[ColumnSketch]:
+    return None if data is None else sketch_from_dict(data)
+
+
+def _to_builtin(value):
+    """Convert numpy scalars to python builtins, so equal values of different types are counted together."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _to_json_value(value):
+    value = _to_builtin(value)
+    return value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+
+
+def _none_if_nan(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
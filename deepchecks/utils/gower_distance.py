@@ -9,13 +9,22 @@
 # ----------------------------------------------------------------------------
 #
 """Module for calculating distance matrix via Gower method."""
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Hashable, List
 
 import numpy as np
 import pandas as pd
 
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.array_math import fast_sum_by_row
 
+# Maximal number of (sample, neighbor candidate, feature) cells calculated at once when searching for nearest neighbors
+MAX_TILE_SIZE = 2 ** 18
+# Minimal number of samples whose neighbors are calculated in a single tile, the neighbor candidates of the tile are
+# reduced in order to fit it in the maximal tile size
+MIN_QUERY_TILE_SIZE = 128
+
 
 def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
     """
@@ -57,7 +66,8 @@ def gower_matrix(data: np.ndarray, cat_features: np.array) -> np.ndarray:
 
 
 def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Hashable], numeric_cols: List[Hashable],
-                                          num_neighbors: int, samples_to_calc_neighbors_for: pd.DataFrame = None):
+                                          num_neighbors: int, samples_to_calc_neighbors_for: pd.DataFrame = None,
+                                          n_jobs: int = 1, max_tile_size: int = MAX_TILE_SIZE):
     """
     Calculate distance matrix for a dataset using Gower's method.
 
@@ -66,6 +76,8 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     categorical features it is an indicator whether the values are the same.
     See https://www.jstor.org/stable/2528823 for further details.
     This method minimizes memory usage by saving in memory and returning only the closest neighbors of each sample.
+    The distances are calculated in tiles of (samples, neighbor candidates, features) cells, which bounds the memory
+    used at any moment, while the closest neighbors found so far are kept per sample.
     In addition, it can deal with missing values.
 
     Parameters
@@ -82,6 +94,11 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     samples_to_calc_neighbors_for: pd.DataFrame, default None
         Samples for which to calculate nearest neighbors. If None, calculates for all given samples in data.
         These samples do not have to exist in data, but must share all relevant features.
+    n_jobs: int, default 1
+        Number of threads to calculate the tiles on concurrently. -1 uses all the available CPUs.
+    max_tile_size: int, default MAX_TILE_SIZE
+        Maximal number of cells (samples * neighbor candidates * features) calculated at once. It may be exceeded
+        only by tiles of the minimal size - MIN_QUERY_TILE_SIZE samples and num_neighbors neighbor candidates.
 
     Returns
     -------
@@ -90,6 +107,11 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     numpy.ndarray
         representing the indexes of the nearest neighbors.
     """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif not isinstance(n_jobs, int) or n_jobs < 1:
+        raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
+
     num_samples = data.shape[0]
     if samples_to_calc_neighbors_for is not None:
         data = pd.concat([data, samples_to_calc_neighbors_for])
@@ -110,10 +132,6 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
     numeric_feature_ranges = np.where(numeric_feature_ranges == 0, 1, numeric_feature_ranges)
     numeric_data = np.nan_to_num(numeric_data, nan=np.inf)
 
-    # do not warn on operations that include usage of math involving inf
-    original_error_state = np.geterr()['invalid']
-    np.seterr(invalid='ignore')
-
     if samples_to_calc_neighbors_for is not None:
         numeric_samples_to_calc_neighbors_for = numeric_data[num_samples:]
         cat_samples_to_calc_neighbors_for = cat_data[num_samples:]
@@ -124,34 +142,87 @@ def calculate_nearest_neighbors_distances(data: pd.DataFrame, cat_cols: List[Has
         numeric_samples_to_calc_neighbors_for = numeric_data
         cat_samples_to_calc_neighbors_for = cat_data
 
-    for i in range(num_indices_to_calc):  # TODO: parallelize this loop
-        numeric_sample_i = numeric_samples_to_calc_neighbors_for[i, :]
-        cat_sample_i = cat_samples_to_calc_neighbors_for[i, :]
-        dist_to_sample_i = _calculate_distances_to_sample(
-            categorical_sample=cat_sample_i, numeric_sample=numeric_sample_i, cat_data=cat_data,
-            numeric_data=numeric_data, numeric_feature_ranges=numeric_feature_ranges, num_features=num_features
+    # split the calculation into tiles of query samples X reference samples, so that each tile has at most
+    # max_tile_size cells. The query tile gets at least MIN_QUERY_TILE_SIZE samples (so the calculation is vectorized
+    # over many samples) and the reference tile is reduced to fit, or grows to all the samples if they fit.
+    cells_per_pair = max(num_features, 1)
+    query_tile_size = max(1, min(num_indices_to_calc, MIN_QUERY_TILE_SIZE))
+    reference_tile_size = min(num_samples, max(num_neighbors, max_tile_size // (cells_per_pair * query_tile_size)))
+    query_tile_size = max(query_tile_size, max_tile_size // (cells_per_pair * max(reference_tile_size, 1)))
+
+    def calc_query_tile(start):
+        end = min(start + query_tile_size, num_indices_to_calc)
+        tile_distances, tile_indexes = _calculate_nearest_neighbors_of_tile(
+            categorical_samples=cat_samples_to_calc_neighbors_for[start:end],
+            numeric_samples=numeric_samples_to_calc_neighbors_for[start:end],
+            cat_data=cat_data, numeric_data=numeric_data, numeric_feature_ranges=numeric_feature_ranges,
+            num_features=num_features, num_neighbors=num_neighbors, reference_tile_size=reference_tile_size
         )
-        # sort to find the closest samples (including self)
-        min_dist_indexes = np.argpartition(dist_to_sample_i, num_neighbors)[:num_neighbors]
-        min_dist_indexes_ordered = sorted(min_dist_indexes, key=lambda x, arr=dist_to_sample_i: arr[x], reverse=False)
-        indexes[i, :] = min_dist_indexes_ordered
-        distances[i, :] = dist_to_sample_i[min_dist_indexes_ordered]
+        distances[start:end] = tile_distances
+        indexes[start:end] = tile_indexes
+
+    tile_starts = range(0, num_indices_to_calc, query_tile_size)
+    if n_jobs == 1 or len(tile_starts) == 1:
+        for start in tile_starts:
+            calc_query_tile(start)
+    else:
+        # numpy releases the GIL for the heavy array operations, so threads calculate the tiles concurrently
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(calc_query_tile, tile_starts))
 
-    np.seterr(invalid=original_error_state)
     return np.nan_to_num(distances, nan=np.nan, posinf=np.nan, neginf=np.nan), indexes
 
 
-def _calculate_distances_to_sample(categorical_sample: np.ndarray, numeric_sample: np.ndarray, cat_data: np.ndarray,
-                                   numeric_data: np.ndarray, numeric_feature_ranges: np.ndarray, num_features: int):
+def _calculate_nearest_neighbors_of_tile(categorical_samples: np.ndarray, numeric_samples: np.ndarray,
+                                         cat_data: np.ndarray, numeric_data: np.ndarray,
+                                         numeric_feature_ranges: np.ndarray, num_features: int, num_neighbors: int,
+                                         reference_tile_size: int):
     """
-    Calculate Gower's distance between a single sample to the rest of the samples in the dataset.
+    Find the nearest neighbors of a tile of samples, going over the dataset in tiles of reference_tile_size samples.
+
+    Returns
+    -------
+    numpy.ndarray
+        The distances to the nearest neighbors of each sample, ordered from the closest.
+    numpy.ndarray
+        The indexes of the nearest neighbors of each sample.
+    """
+    best_distances, best_indexes = None, None
+    for start in range(0, numeric_data.shape[0], reference_tile_size):
+        end = min(start + reference_tile_size, numeric_data.shape[0])
+        tile_distances = _calculate_distances_to_samples(
+            categorical_samples=categorical_samples, numeric_samples=numeric_samples, cat_data=cat_data[start:end],
+            numeric_data=numeric_data[start:end], numeric_feature_ranges=numeric_feature_ranges,
+            num_features=num_features
+        )
+        tile_indexes = np.broadcast_to(np.arange(start, end), tile_distances.shape)
+        if best_distances is not None:
+            tile_distances = np.concatenate([best_distances, tile_distances], axis=1)
+            tile_indexes = np.concatenate([best_indexes, tile_indexes], axis=1)
+        # keep only the closest samples found so far (nan distances are considered the farthest)
+        if tile_distances.shape[1] > num_neighbors:
+            min_dist_indexes = np.argpartition(tile_distances, num_neighbors - 1, axis=1)[:, :num_neighbors]
+            tile_distances = np.take_along_axis(tile_distances, min_dist_indexes, axis=1)
+            tile_indexes = np.take_along_axis(tile_indexes, min_dist_indexes, axis=1)
+        best_distances, best_indexes = tile_distances, tile_indexes
+
+    # sort to find the closest samples (including self)
+    order = np.argsort(best_distances, axis=1, kind='stable')
+    return np.take_along_axis(best_distances, order, axis=1), np.take_along_axis(best_indexes, order, axis=1)
+
+
+def _calculate_distances_to_samples(categorical_samples: np.ndarray, numeric_samples: np.ndarray,
+                                    cat_data: np.ndarray, numeric_data: np.ndarray,
+                                    numeric_feature_ranges: np.ndarray, num_features: int):
+    """
+    Calculate Gower's distance between a tile of samples to the rest of the samples in the dataset.
 
     Parameters
     ----------
-    categorical_sample
-        The categorical features part of the sample to compare to the rest of the samples.
-    numeric_sample
-        The numeric features part of the sample to compare to the rest of the samples.
+    categorical_samples
+        The categorical features part of the samples to compare to the rest of the samples.
+    numeric_samples
+        The numeric features part of the samples to compare to the rest of the samples.
     cat_data
         The categorical features part of the dataset(after preprocessing).
     numeric_data
@@ -163,21 +234,30 @@ def _calculate_distances_to_sample(categorical_sample: np.ndarray, numeric_sampl
     Returns
     -------
     numpy.ndarray
-        The distances to the rest of the samples.
+        The distances of each sample (rows) to the rest of the samples (columns).
     """
-    numeric_feat_dist_to_sample = numeric_data - numeric_sample
-    np.abs(numeric_feat_dist_to_sample, out=numeric_feat_dist_to_sample)
-    # if a numeric feature value is null for one of the two samples, the distance over it is ignored
-    null_dist_locations = np.logical_or(numeric_feat_dist_to_sample == np.inf, numeric_feat_dist_to_sample == np.nan)
-    null_numeric_features_per_sample = fast_sum_by_row(null_dist_locations)
-    numeric_feat_dist_to_sample[null_dist_locations] = 0
-    numeric_feat_dist_to_sample = numeric_feat_dist_to_sample.astype('float64')
-    np.divide(numeric_feat_dist_to_sample, numeric_feature_ranges, out=numeric_feat_dist_to_sample)
-
-    cat_feature_dist_to_sample = (cat_data - categorical_sample) != 0
-
-    dist_to_sample = fast_sum_by_row(cat_feature_dist_to_sample) + fast_sum_by_row(numeric_feat_dist_to_sample)
-    return dist_to_sample / (-null_numeric_features_per_sample + num_features)  # can have inf values
+    # do not warn on operations that include usage of math involving inf
+    with np.errstate(invalid='ignore'):
+        numeric_feat_dist_to_sample = numeric_data[np.newaxis, :, :] - numeric_samples[:, np.newaxis, :]
+        np.abs(numeric_feat_dist_to_sample, out=numeric_feat_dist_to_sample)
+        # if a numeric feature value is null for one of the two samples, the distance over it is ignored
+        null_dist_locations = numeric_feat_dist_to_sample == np.inf
+        np.copyto(numeric_feat_dist_to_sample, 0, where=null_dist_locations)
+        np.divide(numeric_feat_dist_to_sample, numeric_feature_ranges, out=numeric_feat_dist_to_sample)
+        # the numeric distances are summed row by row like in a single sample calculation, to get identical results
+        tile_shape = numeric_feat_dist_to_sample.shape[:2]
+        dist_to_sample = fast_sum_by_row(
+            numeric_feat_dist_to_sample.reshape(tile_shape[0] * tile_shape[1], numeric_data.shape[1])
+        ).reshape(tile_shape)
+
+        # counts are integers, so they are summed feature by feature which is faster for a tile
+        null_numeric_features_per_sample = np.zeros(tile_shape, dtype=np.int64)
+        for i in range(null_dist_locations.shape[2]):
+            null_numeric_features_per_sample += null_dist_locations[:, :, i]
+        for i in range(cat_data.shape[1]):
+            dist_to_sample += cat_data[np.newaxis, :, i] != categorical_samples[:, i, np.newaxis]
+
+        return dist_to_sample / (-null_numeric_features_per_sample + num_features)  # can have inf values
 
 
 def calculate_distance(vec1: np.array, vec2: np.array, range_per_feature: np.array) -> float:
@@ -0,0 +1,166 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing a stable hashing of the rows of dataframes, used for finding duplicate rows."""
+import numbers
+import typing as t
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (infer_dtype, is_bool_dtype, is_complex_dtype, is_datetime64_any_dtype, is_integer_dtype,
+                              is_numeric_dtype, is_timedelta64_dtype, is_unsigned_integer_dtype)
+
+from deepchecks.utils.typing import Hashable
+
+__all__ = ['hash_rows', 'hash_column']
+
+# hash of all null values (NaN, None, NaT, pd.NA), so nulls are equal to each other as in groupby with dropna=False
+NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+# multiplier used to combine the hashes of the columns of a row, the combination depends on the columns order
+_COMBINE_MULTIPLIER = np.uint64(0x100000001B3)
+# tags mixed into the hashes of numbers which are not int64 values, so their bits don't collide with int64 values
+_FLOAT_TAG = np.uint64(0xC2B2AE3D27D4EB4F)
+_UINT_TAG = np.uint64(0x165667B19E3779F9)
+_NUMERIC_INFERRED_TYPES = frozenset(['floating', 'mixed-integer-float', 'decimal'])
+_INTEGER_INFERRED_TYPES = frozenset(['integer', 'boolean'])
+
+
+def hash_rows(df: pd.DataFrame, columns: t.Optional[t.Sequence[Hashable]] = None) -> np.ndarray:
+    """Return a stable 64 bit hash of the values of each row of the dataframe in the given columns.
+
+    Rows with equal values have equal hashes, regardless of the dtypes of the columns: all nulls are equal, numbers
+    are compared by their value (1, 1.0 and True are equal) and categorical columns are compared by their values.
+    The hashes don't depend on the process or on the other rows, so hashes of different dataframes can be compared.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to hash the rows of.
+    columns : t.Optional[t.Sequence[Hashable]] , default: None
+        The columns to hash, if None all the columns are hashed.
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of the hash of each row
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    row_hashes = np.zeros(len(df), dtype=np.uint64)
+    for column in columns:
+        row_hashes *= _COMBINE_MULTIPLIER
+        row_hashes ^= hash_column(df[column])
+    return row_hashes
+
+
+def hash_column(column: pd.Series) -> np.ndarray:
+    """Return a stable 64 bit hash of each value of the column, nulls and numbers are hashed by value."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        column = pd.Series(np.asarray(column), index=column.index)
+    null_mask = column.isna().to_numpy()
+
+    if is_bool_dtype(column.dtype) or is_integer_dtype(column.dtype):
+        dtype = 'uint64' if is_unsigned_integer_dtype(column.dtype) else 'int64'
+        hashes = _hash_numbers(column.to_numpy(dtype=dtype, na_value=0))
+    elif is_numeric_dtype(column.dtype) and not is_complex_dtype(column.dtype):
+        hashes = _hash_numbers(column.to_numpy(dtype='float64', na_value=np.nan), null_mask)
+    elif is_datetime64_any_dtype(column.dtype) or is_timedelta64_dtype(column.dtype):
+        hashes = pd.util.hash_pandas_object(column, index=False).to_numpy()
+    else:
+        hashes = _hash_objects(column.to_numpy(dtype=object), null_mask)
+
+    hashes[null_mask] = NULL_HASH
+    return hashes
+
+
+def _hash_numbers(values: np.ndarray, null_mask: t.Optional[np.ndarray] = None) -> np.ndarray:
+    """Hash numbers by their value, integers by their exact value and floats which are integers as these integers.
+
+    Integers are not converted to floats, so large integers (such as ids above 2 ** 53) don't collide.
+    """
+    if values.dtype.kind in 'bi':
+        return pd.util.hash_array(values.astype(np.int64), categorize=False)
+    if values.dtype.kind == 'u':
+        hashes = pd.util.hash_array(values.astype(np.uint64), categorize=False)
+        is_large = values > np.iinfo(np.int64).max
+        hashes[is_large] ^= _UINT_TAG
+        return hashes
+
+    if null_mask is not None:
+        values = np.where(null_mask, 0.0, values)
+    values = values + 0.0  # -0.0 equals 0.0
+    hashes = pd.util.hash_array(values, categorize=False) ^ _FLOAT_TAG
+    with np.errstate(invalid='ignore'):
+        is_integer = np.isfinite(values) & (np.floor(values) == values)
+    is_int64 = is_integer & (values >= -2.0 ** 63) & (values < 2.0 ** 63)
+    hashes[is_int64] = _hash_numbers(values[is_int64].astype(np.int64))
+    is_uint64 = is_integer & (values >= 2.0 ** 63) & (values < 2.0 ** 64)
+    hashes[is_uint64] = _hash_numbers(values[is_uint64].astype(np.uint64))
+    return hashes
+
+
+def _hash_number_objects(values: np.ndarray) -> np.ndarray:
+    """Hash an object array of real numbers, integers are hashed by their exact value when they fit 64 bits."""
+    is_integer = np.fromiter((isinstance(value, (numbers.Integral, np.bool_)) for value in values),
+                             dtype=bool, count=len(values))
+    hashes = np.empty(len(values), dtype=np.uint64)
+    if is_integer.any():
+        integers = values[is_integer].tolist()
+        for dtype in (np.int64, np.uint64, np.float64):
+            try:
+                hashes[is_integer] = _hash_numbers(np.array(integers, dtype=dtype))
+                break
+            except OverflowError:
+                continue
+    if not is_integer.all():
+        hashes[~is_integer] = _hash_numbers(values[~is_integer].astype('float64'))
+    return hashes
+
+
+def _hash_objects(values: np.ndarray, null_mask: np.ndarray) -> np.ndarray:
+    """Hash python objects, strings by their content, numbers by their value and others by their type and repr."""
+    codes, uniques = pd.factorize(values)
+    uniques = np.asarray(uniques, dtype=object)
+    # pandas factorization treats strings that differ only after a null character as equal, so hash all the values
+    if any(isinstance(value, str) and '\0' in value for value in uniques):
+        return _hash_unique_objects(np.where(null_mask, '', values))
+    hashes = np.full(len(values), NULL_HASH, dtype=np.uint64)
+    hashes[~null_mask] = _hash_unique_objects(uniques)[codes[~null_mask]]
+    return hashes
+
+
+def _hash_unique_objects(values: np.ndarray) -> np.ndarray:
+    """Hash non-null python objects, the values of each type are hashed together."""
+    inferred_type = infer_dtype(values, skipna=False)
+    if inferred_type in ('string', 'empty'):
+        return _hash_strings(values)
+    if inferred_type in _INTEGER_INFERRED_TYPES:
+        return _hash_number_objects(values)
+    if inferred_type in _NUMERIC_INFERRED_TYPES:
+        return _hash_numbers(values.astype('float64'))
+
+    is_number = np.fromiter(
+        (isinstance(value, numbers.Real) and not isinstance(value, (str, bytes)) for value in values),
+        dtype=bool, count=len(values)
+    )
+    hashes = np.empty(len(values), dtype=np.uint64)
+    if is_number.any():
+        hashes[is_number] = _hash_number_objects(values[is_number])
+    others = values[~is_number]
+    # strings are hashed by their content, other objects with their type so that for example 'a' and b'a' differ
+    hashes[~is_number] = _hash_strings(np.array(
+        [value if isinstance(value, str) else f'\x01{type(value).__qualname__}:{value!r}' for value in others],
+        dtype=object
+    ))
+    return hashes
+
+
+def _hash_strings(values: np.ndarray) -> np.ndarray:
+    """Hash an object array of strings."""
+    return pd.util.hash_array(values, categorize=False)
@@ -37,6 +37,7 @@ from deepchecks.utils.typing import Hashable
 
 __all__ = [
     'string_baseform',
+    'string_baseforms',
     'get_base_form_to_variants_dict',
     'split_camel_case',
     'split_and_keep',
@@ -62,6 +63,8 @@ __all__ = [
 SPECIAL_CHARACTERS = tuple(c for c in map(chr, range(sys.maxunicode)) if not c.isalnum())
 DEL_CHARS = ''.join(SPECIAL_CHARACTERS)
 DEL_MAP = str.maketrans('', '', DEL_CHARS)
+# the special characters of ascii strings are deleted much faster from their bytes
+ASCII_DEL_BYTES = bytes(c for c in range(128) if not chr(c).isalnum())
 
 
 def truncate_string(long_string: str, max_length: int):
@@ -303,6 +306,35 @@ def string_baseform(string: str, allow_empty_result: bool = False) -> str:
         return string
 
 
+def string_baseforms(values: t.Iterable, allow_empty_result: bool = False) -> t.List:
+    """Normalize a sequence of values to their uniform forms, the same as string_baseform of each value.
+
+    The values are translated without a function call per value, and ascii strings are translated as bytes.
+
+    Parameters
+    ----------
+    values : t.Iterable
+        values to normalize, values which are not strings are returned as is
+    allow_empty_result : bool , default : False
+        bool indicating whether to return empty result if no alphanumeric characters are present or the original input
+
+    Returns
+    -------
+    t.List
+        the base form of each of the values
+    """
+    values = list(values)
+    baseforms = [
+        (value.encode('ascii').translate(None, ASCII_DEL_BYTES).lower().decode('ascii') if value.isascii()
+         else value.translate(DEL_MAP).lower()) if isinstance(value, str) else value
+        for value in values
+    ]
+    if allow_empty_result:
+        return baseforms
+    return [value if isinstance(value, str) and not baseform else baseform
+            for value, baseform in zip(values, baseforms)]
+
+
 def is_string_column(column: pd.Series) -> bool:
     """Determine whether a pandas series is string type."""
     if is_numeric_dtype(column):
@@ -352,9 +384,10 @@ def get_base_form_to_variants_dict(uniques: t.Iterable[str]) -> t.Dict[str, t.Se
     and the value being a set of all existing original values.
     This is done using the StringCategory class.
     """
+    uniques = list(uniques)
     base_form_to_variants = defaultdict(set)
-    for item in uniques:
-        base_form_to_variants[string_baseform(item)].add(item)
+    for base_form, item in zip(string_baseforms(uniques), uniques):
+        base_form_to_variants[base_form].add(item)
     return base_form_to_variants
 
 
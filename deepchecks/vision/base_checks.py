@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module for vision base checks."""
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from deepchecks.core.check_result import CheckResult
 from deepchecks.core.checks import DatasetKind, ModelOnlyBaseCheck, SingleDatasetBaseCheck, TrainTestBaseCheck
@@ -17,6 +17,7 @@ from deepchecks.utils.ipython import ProgressBarGroup
 from deepchecks.vision import deprecation_warnings  # pylint: disable=unused-import # noqa: F401
 from deepchecks.vision._shared_docs import docstrings
 from deepchecks.vision.context import Context
+from deepchecks.vision.utils.vision_properties import PropertiesInputType
 from deepchecks.vision.vision_data import VisionData
 from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 
@@ -48,7 +49,8 @@ class SingleDatasetCheck(SingleDatasetBaseCheck):
 
             with progressbar_factory.create_dummy(name='Processing Batches'):
                 for batch in context.train:
-                    batch = BatchWrapper(batch, context.train.task_type, context.train.number_of_images_cached)
+                    batch = BatchWrapper(batch, context.train.task_type, context.train.number_of_images_cached,
+                                         context.train.properties_cache)
                     context.train.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
                     self.update(context, batch, DatasetKind.TRAIN)
                     if self.n_samples is not None and context.train.number_of_images_cached >= self.n_samples:
@@ -63,6 +65,16 @@ class SingleDatasetCheck(SingleDatasetBaseCheck):
         """Initialize run before starting updating on batches. Optional."""
         pass
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch, as pairs of properties list and input type.
+
+        Used by the suite to calculate the properties of all its checks together once per batch. Called after
+        initialize_run. Optional.
+        """
+        # pylint: disable=unused-argument
+        return []
+
     def update(self, context: Context, batch: Any, dataset_kind: DatasetKind):
         """Update internal check state with given batch."""
         raise NotImplementedError()
@@ -100,7 +112,8 @@ class TrainTestCheck(TrainTestBaseCheck):
 
             with progressbar_factory.create_dummy(name='Processing Train Batches'):
                 for batch in context.train:
-                    batch = BatchWrapper(batch, context.train.task_type, context.train.number_of_images_cached)
+                    batch = BatchWrapper(batch, context.train.task_type, context.train.number_of_images_cached,
+                                         context.train.properties_cache)
                     context.train.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
                     self.update(context, batch, DatasetKind.TRAIN)
                     if self.n_samples is not None and context.train.number_of_images_cached >= self.n_samples:
@@ -108,7 +121,8 @@ class TrainTestCheck(TrainTestBaseCheck):
 
             with progressbar_factory.create_dummy(name='Processing Test Batches'):
                 for batch in context.test:
-                    batch = BatchWrapper(batch, context.test.task_type, context.test.number_of_images_cached)
+                    batch = BatchWrapper(batch, context.test.task_type, context.test.number_of_images_cached,
+                                         context.test.properties_cache)
                     context.test.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
                     self.update(context, batch, DatasetKind.TEST)
                     if self.n_samples is not None and context.test.number_of_images_cached >= self.n_samples:
@@ -123,6 +137,16 @@ class TrainTestCheck(TrainTestBaseCheck):
         """Initialize run before starting updating on batches. Optional."""
         pass
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch, as pairs of properties list and input type.
+
+        Used by the suite to calculate the properties of all its checks together once per batch. Called after
+        initialize_run. Optional.
+        """
+        # pylint: disable=unused-argument
+        return []
+
     def update(self, context: Context, batch: Any, dataset_kind: DatasetKind):
         """Update internal check state with given batch for either train or test."""
         raise NotImplementedError()
@@ -9,6 +9,8 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains AbstractPropertyOutliers check."""
+import heapq
+import itertools
 import string
 import typing as t
 import warnings
@@ -34,6 +36,9 @@ from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 
 __all__ = ['AbstractPropertyOutliers']
 
+# images kept for the display are downsampled to fit this size, which is twice the size of the displayed thumbnails
+MAX_KEPT_IMAGE_SIZE = 400
+
 
 class AbstractPropertyOutliers(SingleDatasetCheck):
     """Find outliers samples with respect to the given properties.
@@ -97,9 +102,8 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
         """Initialize the properties state."""
         data = context.get_data_by_kind(dataset_kind)
         self._properties_results = defaultdict(list)
-        # Dict of properties names to a dict of containing keys of property values, images
-        self._lowest_property_value_images = defaultdict(list)
-        self._highest_property_value_images = defaultdict(list)
+        # Dict of properties names to the samples of their lowest and highest values
+        self._extreme_samples = {}
         self._images_uuid = []
 
         self.properties_list = self.properties_list if self.properties_list else self.get_default_properties(data)
@@ -107,20 +111,26 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
             warnings.warn('Properties that have class_id as output_type will be skipped.')
             self.properties_list = [p for p in self.properties_list if p['output_type'] != 'class_id']
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> t.List[t.Tuple[t.Optional[t.List[t.Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        return [(self.properties_list, self.property_input_type)]
+
     def update(self, context: Context, batch: BatchWrapper, dataset_kind: DatasetKind):
         """Aggregate image properties from batch."""
         batch_properties = batch.vision_properties(self.properties_list, self.property_input_type)
         data = context.get_data_by_kind(dataset_kind)
+        # If the label is single value per image, wrap them in order to work on a fixed structure
+        if batch.numpy_labels is not None and data.task_type == TaskType.CLASSIFICATION:
+            labels = [[label_per_image] for label_per_image in batch.numpy_labels]
+        else:
+            labels = batch.numpy_labels
+        image_identifiers = batch.numpy_image_identifiers
+        self._images_uuid += image_identifiers
         for prop_name, property_values in batch_properties.items():
             _ensure_property_shape(property_values, len(batch), prop_name)
-            # If the property or label is single value per image, wrap them in order to work on a fixed structure
-            if batch.numpy_labels is not None and data.task_type == TaskType.CLASSIFICATION:
-                labels = [[label_per_image] for label_per_image in batch.numpy_labels]
-            else:
-                labels = batch.numpy_labels
-
-            self._images_uuid += batch.numpy_image_identifiers
-            self._cache_property_values_and_images(batch.numpy_images, labels, list(property_values), prop_name)
+            self._cache_property_values_and_images(batch.numpy_images, labels, list(property_values), prop_name,
+                                                   image_identifiers, data.task_type)
 
     def compute(self, context: Context, dataset_kind: DatasetKind) -> CheckResult:
         """Compute final result."""
@@ -134,23 +144,23 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
         for name, values in self._properties_results.items():
             values_lengths_cumsum = np.cumsum(np.array([len(v) for v in values]))
 
-            values_arr = np.hstack(values).astype(float).squeeze()
-            values_arr = np.array([x for x in values_arr if pd.notnull(x)])
+            values_arr = np.hstack(values).astype(float).reshape(-1)
+            not_null_values_arr = values_arr[~np.isnan(values_arr)]
 
-            if len(values_arr) < self.min_samples:
+            if len(not_null_values_arr) < self.min_samples:
                 check_result[name] = 'Not enough non-null samples to calculate outliers.'
                 continue
 
-            lower_limit, upper_limit = iqr_outliers_range(values_arr, self.iqr_percentiles, self.iqr_scale)
+            lower_limit, upper_limit = iqr_outliers_range(not_null_values_arr, self.iqr_percentiles, self.iqr_scale)
 
-            outlier_values_idx = np.argwhere((values_arr < lower_limit) | (values_arr > upper_limit)).squeeze(axis=1)
-            outlier_img_idx = np.unique([_sample_index_from_flatten_index(values_lengths_cumsum, outlier_index)
-                                         for outlier_index in outlier_values_idx])
+            # null values are not outliers, as comparisons with nan are always false
+            outlier_values_idx = np.flatnonzero((values_arr < lower_limit) | (values_arr > upper_limit))
+            outlier_img_idx = np.unique(_sample_index_from_flatten_index(values_lengths_cumsum, outlier_values_idx))
             outlier_img_identifiers = self._images_uuid[outlier_img_idx] if len(outlier_img_idx) > 0 else []
             check_result[name] = {
                 'outliers_identifiers': outlier_img_identifiers,
-                'lower_limit': max(lower_limit, min(values_arr)),
-                'upper_limit': min(upper_limit, max(values_arr)),
+                'lower_limit': max(lower_limit, not_null_values_arr.min()),
+                'upper_limit': min(upper_limit, not_null_values_arr.max()),
             }
 
         # Create display
@@ -204,86 +214,108 @@ class AbstractPropertyOutliers(SingleDatasetCheck):
     def _get_property_outlier_images(self, prop_name: str, lower_limit: float, upper_limit: float,
                                      vision_data) -> t.List[t.Tuple[float, str]]:
         """Get outlier images and their values for provided property."""
-        result = []
-        for idx, value in enumerate(self._lowest_property_value_images[prop_name]['property_values']):
-            value = value[0] if isinstance(value, t.Sequence) else value  # for property per bbox, value is a list
-            if value < lower_limit:
-                image_thumbnail = draw_image(image=self._lowest_property_value_images[prop_name]['images'][idx],
-                                             label=self._lowest_property_value_images[prop_name]['labels'][idx],
-                                             task_type=vision_data.task_type, draw_label=self._draw_label_on_image,
-                                             label_map=vision_data.label_map)
-                result.append((value, image_thumbnail))
-        for idx, value in enumerate(self._highest_property_value_images[prop_name]['property_values']):
-            value = value[0] if isinstance(value, t.Sequence) else value  # for property per bbox, value is a list
-            if value > upper_limit:
-                image_thumbnail = draw_image(
-                    image=self._highest_property_value_images[prop_name]['images'][idx],
-                    label=self._highest_property_value_images[prop_name]['labels'][idx],
-                    task_type=vision_data.task_type, draw_label=self._draw_label_on_image,
-                    label_map=vision_data.label_map)
-                result.append((value, image_thumbnail))
-        return result
+        tracker = self._extreme_samples[prop_name]
+        samples = [x for x in tracker.lowest() if x[0] < lower_limit] + \
+                  [x for x in tracker.highest() if x[0] > upper_limit]
+        return [(value, draw_image(image=image, label=label, task_type=vision_data.task_type,
+                                   draw_label=self._draw_label_on_image, label_map=vision_data.label_map))
+                for value, (_, image, label) in samples]
 
     @abstractmethod
     def get_default_properties(self, data: VisionData):
         """Return default properties to run in the check."""
         pass
 
-    def _cache_property_values_and_images(self, images: t.List, labels: t.List, property_values: t.List,
-                                          property_name: str):
-        """Update the _lowest_property_value_images, _lowest_property_value_images dicts based on new batch."""
+    def _cache_property_values_and_images(self, images: t.Optional[t.List], labels: t.Optional[t.List],
+                                          property_values: t.List, property_name: str,
+                                          image_identifiers: t.List[str], task_type: TaskType):
+        """Update the property values and the samples of the lowest and highest property values based on new batch."""
         is_property_per_label = isinstance(property_values[0], (np.ndarray, t.Sequence))
         # Update full property values cache for outlier calculation
         if is_property_per_label:
             self._properties_results[property_name].extend(property_values)
+            lengths = [len(v) for v in property_values]
+            flat_values = [x for v in property_values for x in v]
         else:
             self._properties_results[property_name].extend([[x] for x in property_values])
-        # In case there are no images or no labels put none instead and do not display images / labels
-        images = [None] * len(property_values) if images is None else images
-        if labels is None:
-            labels = [[None]] * len(property_values) if is_property_per_label else [None] * len(property_values)
-
-        # adds the current lowest and highest property value images/labels/values to the batch before sorting
-        if property_name in self._lowest_property_value_images:
-            for stored_values_dict in (self._lowest_property_value_images[property_name],
-                                       self._highest_property_value_images[property_name]):
-                labels = stored_values_dict['labels'] + labels
-                images = stored_values_dict['images'] + images
-                property_values = stored_values_dict['property_values'] + property_values
-
-        if is_property_per_label:  # if property is per label flatten the list of lists to find lowest and highest
-            values_lengths_cumsum = np.cumsum(np.array([len(v) for v in property_values]))
-            property_values = np.hstack(property_values).astype(float)
-            labels = np.asarray([item for sublist in labels for item in sublist], dtype='object')
-
-        # calculate lowest and highest property values
-        not_null_indices = [idx for idx, value in enumerate(property_values) if value is not None]
-        if len(not_null_indices) <= self.n_show_top:
-            lowest_values_idx = not_null_indices
-            highest_values_idx = not_null_indices
-        else:
-            lowest_values_idx = np.argpartition([np.inf if v is None else v for v in property_values],
-                                                self.n_show_top)[:self.n_show_top]
-            highest_values_idx = np.argpartition([np.NINF if v is None else v for v in property_values],
-                                                 -self.n_show_top)[-self.n_show_top:]
+            lengths = [1] * len(property_values)
+            flat_values = property_values
+        values_arr = np.array([np.nan if x is None else x for x in flat_values], dtype=float)
+        # the image of each value, and the index of the value within the values of its image
+        image_indices = np.repeat(np.arange(len(lengths)), lengths)
+        label_indices = np.arange(len(values_arr)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+        def get_sample(value_index):
+            image_index = image_indices[value_index]
+            image = images[image_index] if images is not None else None
+            label = labels[image_index] if labels is not None else None
+            if label is not None and is_property_per_label and task_type == TaskType.OBJECT_DETECTION:
+                label = np.asarray(label).reshape((-1, 5))[[label_indices[value_index]]]
+            image, label = _downsample_image_and_label(image, label, task_type)
+            return image_identifiers[image_index], image, label
+
+        if property_name not in self._extreme_samples:
+            self._extreme_samples[property_name] = _ExtremeValuesTracker(self.n_show_top)
+        self._extreme_samples[property_name].update(values_arr, get_sample)
+
+
+class _ExtremeValuesTracker:
+    """Track the samples of the n lowest and n highest values of a property, with a bounded heap per direction.
+
+    Only the identifier and a downsampled copy of the image and the label are kept per sample, so the memory does not
+    grow with the size of the dataset.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self._lowest_heap = []  # the values are negated, so the root is the highest of the lowest values
+        self._highest_heap = []
+        self._counter = itertools.count()  # breaks ties between equal values by insertion order
+
+    def update(self, values: np.ndarray, get_sample: t.Callable[[int], t.Tuple]):
+        """Push the values of a batch, with get_sample called only for values that enter one of the heaps."""
+        not_null_indices = np.flatnonzero(~np.isnan(values))
+        if self.n <= 0 or len(not_null_indices) == 0:
+            return
+        samples = {}
+        for heap, keys in ((self._lowest_heap, -values), (self._highest_heap, values)):
+            candidates = not_null_indices
+            if len(candidates) > self.n:
+                candidates = candidates[np.argpartition(keys[candidates], -self.n)[-self.n:]]
+            for index in candidates:
+                if len(heap) == self.n and keys[index] <= heap[0][0]:
+                    continue
+                if index not in samples:
+                    samples[index] = get_sample(index)
+                item = (keys[index], next(self._counter), values[index], samples[index])
+                if len(heap) < self.n:
+                    heapq.heappush(heap, item)
+                else:
+                    heapq.heapreplace(heap, item)
+
+    def lowest(self) -> t.List[t.Tuple[float, t.Tuple]]:
+        """Return the lowest values and their samples, sorted by value."""
+        return [(item[2], item[3]) for item in sorted(self._lowest_heap, reverse=True)]
+
+    def highest(self) -> t.List[t.Tuple[float, t.Tuple]]:
+        """Return the highest values and their samples, sorted by value."""
+        return [(item[2], item[3]) for item in sorted(self._highest_heap)]
 
-        if is_property_per_label:
-            lowest_img_idx = [_sample_index_from_flatten_index(values_lengths_cumsum, x) for x in lowest_values_idx]
-            highest_img_idx = [_sample_index_from_flatten_index(values_lengths_cumsum, x) for x in highest_values_idx]
-        else:
-            lowest_img_idx = lowest_values_idx
-            highest_img_idx = highest_values_idx
 
-        self._lowest_property_value_images[property_name] = \
-            {'images': [images[x] for x in lowest_img_idx],
-             'property_values': [[property_values[x]] if is_property_per_label else property_values[x]
-                                 for x in lowest_values_idx],
-             'labels': [[labels[x]] if is_property_per_label else labels[x] for x in lowest_values_idx]}
-        self._highest_property_value_images[property_name] = \
-            {'images': [images[x] for x in highest_img_idx],
-             'property_values': [[property_values[x]] if is_property_per_label else property_values[x]
-                                 for x in highest_values_idx],
-             'labels': [[labels[x]] if is_property_per_label else labels[x] for x in highest_values_idx]}
+def _downsample_image_and_label(image: t.Optional[np.ndarray], label, task_type: TaskType):
+    """Return a copy of the image downsampled to fit MAX_KEPT_IMAGE_SIZE, and the label scaled accordingly."""
+    if image is None:
+        return None, label
+    step = int(np.ceil(max(image.shape[:2]) / MAX_KEPT_IMAGE_SIZE))
+    # copying the image, so that the whole batch it was taken from is not kept in memory
+    image = np.array(image[::step, ::step])
+    if label is not None and step > 1:
+        if task_type == TaskType.OBJECT_DETECTION:
+            label = np.asarray(label, dtype=float).reshape((-1, 5)).copy()
+            label[:, 1:] /= step
+        elif task_type == TaskType.SEMANTIC_SEGMENTATION:
+            label = np.array(np.asarray(label)[::step, ::step])
+    return image, label
 
 
 def _ensure_property_shape(property_values, data_len, prop_name):
@@ -311,12 +343,12 @@ def _is_list_of_numbers(l):
     return not any(i is not None and not isinstance(i, Number) for i in l)
 
 
-def _sample_index_from_flatten_index(cumsum_lengths, flatten_index) -> int:
+def _sample_index_from_flatten_index(cumsum_lengths, flatten_index):
     # The cumulative sum lengths is holding the cumulative sum of properties per image, so the first index which value
     # is greater than the flatten index, is the image index.
     # for example if the sums lengths is [1, 6, 11, 13, 16, 20] and the flatten index = 6, it means this property
-    # belong to the third image which is index = 2.
-    return np.argwhere(cumsum_lengths > flatten_index)[0][0]
+    # belong to the third image which is index = 2. Works on a single index or on an array of indices.
+    return np.searchsorted(cumsum_lengths, flatten_index, side='right')
 
 
 NO_IMAGES_TEMPLATE = """
@@ -11,7 +11,7 @@
 """Module contains the property label correlation check."""
 
 from collections import defaultdict
-from typing import Any, Dict, Hashable, List, Optional, TypeVar
+from typing import Any, Dict, Hashable, List, Optional, Tuple, TypeVar
 
 import pandas as pd
 
@@ -22,7 +22,9 @@ from deepchecks.utils.strings import format_number
 from deepchecks.vision._shared_docs import docstrings
 from deepchecks.vision.base_checks import SingleDatasetCheck
 from deepchecks.vision.context import Context
-from deepchecks.vision.utils.property_label_correlation_utils import calc_properties_for_property_label_correlation
+from deepchecks.vision.utils.property_label_correlation_utils import (
+    calc_properties_for_property_label_correlation, get_properties_input_type_for_property_label_correlation)
+from deepchecks.vision.utils.vision_properties import PropertiesInputType
 from deepchecks.vision.vision_data import TaskType
 from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 
@@ -98,6 +100,12 @@ class PropertyLabelCorrelation(SingleDatasetCheck):
         """Initialize run."""
         context.assert_task_type(TaskType.CLASSIFICATION, TaskType.OBJECT_DETECTION)
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        task_type = context.get_data_by_kind(dataset_kind).task_type
+        return [(self.image_properties, get_properties_input_type_for_property_label_correlation(task_type))]
+
     def update(self, context: Context, batch: BatchWrapper, dataset_kind: DatasetKind):
         """Calculate image properties for train or test batches."""
         vision_data = context.get_data_by_kind(dataset_kind)
@@ -10,7 +10,7 @@
 #
 """Module contains the Prediction Drift check."""
 from collections import OrderedDict, defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -184,6 +184,11 @@ class PredictionDrift(TrainTestCheck, ReducePropertyMixin):
         self._train_prediction_properties = defaultdict(list)
         self._test_prediction_properties = defaultdict(list)
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        return [(self.prediction_properties, PropertiesInputType.PREDICTIONS)]
+
     def update(self, context: Context, batch: BatchWrapper, dataset_kind):
         """Perform update on batch for train or test properties."""
         # For all transformers, calculate histograms by batch:
@@ -10,7 +10,7 @@
 #
 """Module of weak segments performance check."""
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -110,6 +110,11 @@ class WeakSegmentsPerformance(SingleDatasetCheck, WeakSegmentAbstract):
         self._properties_results = defaultdict(list)
         self._sample_scores = []
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        return [(self.image_properties, PropertiesInputType.IMAGES)]
+
     def update(self, context: Context, batch: BatchWrapper, dataset_kind: DatasetKind):
         """Calculate the image properties and scores per image."""
         properties_results = batch.vision_properties(self.image_properties, PropertiesInputType.IMAGES)
@@ -9,8 +9,10 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains label Drift check."""
+import os
 from collections import defaultdict
-from typing import Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -18,6 +20,7 @@ import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 
 from deepchecks.core import CheckResult, DatasetKind
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.vision._shared_docs import docstrings
 from deepchecks.vision.base_checks import TrainTestCheck
 from deepchecks.vision.context import Context
@@ -27,6 +30,9 @@ from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 
 __all__ = ['HeatmapComparison']
 
+# max number of images summed as uint16 before being added to the int64 heatmap, so that the sum can't overflow
+MAX_IMAGES_PER_ACCUMULATOR = np.iinfo(np.uint16).max // 255
+
 
 @docstrings
 class HeatmapComparison(TrainTestCheck):
@@ -38,11 +44,30 @@ class HeatmapComparison(TrainTestCheck):
 
     Parameters
     ----------
+    heatmap_size : Optional[Tuple[int, int]] , default: None
+        The (height, width) of the heatmaps, to which all images are resized before being averaged. If None, the shape
+        of the first image is used. A small fixed size (e.g. (256, 256)) is much faster for high resolution images,
+        as images which are at least twice that size are first downscaled by integer factors, cropping the pixels
+        which remain after the division. This approximates a single resize of the whole image.
+    n_jobs : int , default: 1
+        Number of threads to resize and sum the images of each batch on concurrently. -1 uses all the available CPUs.
     {additional_check_init_params:2*indent}
     """
 
-    def __init__(self, n_samples: Optional[int] = 10000, **kwargs):  # pylint: disable=useless-super-delegation
+    def __init__(self,
+                 n_samples: Optional[int] = 10000,
+                 heatmap_size: Optional[Tuple[int, int]] = None,
+                 n_jobs: int = 1,
+                 **kwargs):
         super().__init__(**kwargs)
+        if heatmap_size is not None and (len(heatmap_size) != 2 or
+                                         any(not isinstance(x, int) or x < 1 for x in heatmap_size)):
+            raise DeepchecksValueError(f'heatmap_size must be a tuple of two positive integers, but got: '
+                                       f'{heatmap_size}')
+        if n_jobs != -1 and (not isinstance(n_jobs, int) or n_jobs < 1):
+            raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
+        self.heatmap_size = heatmap_size
+        self.n_jobs = n_jobs
         self.n_samples = n_samples
 
     def initialize_run(self, context: Context):
@@ -51,7 +76,8 @@ class HeatmapComparison(TrainTestCheck):
 
         # State members to store the average grayscale image throughout update steps
         self._grayscale_heatmap = defaultdict(lambda: 0)
-        self._shape = None
+        # cv2 shapes are (width, height)
+        self._shape = tuple(self.heatmap_size[::-1]) if self.heatmap_size is not None else None
         self._counter = {}
         self._counter[DatasetKind.TRAIN] = 0
         self._counter[DatasetKind.TEST] = 0
@@ -73,10 +99,9 @@ class HeatmapComparison(TrainTestCheck):
             # The difference from the above code for the average grayscale image is
             # that the averaged images are images of
             # the places where the bounding boxes are located. These bounding box images are computed by
-            # _label_to_image_batch
+            # _label_to_image
             if self._task_type == TaskType.OBJECT_DETECTION:
-                label_image_batch = self._label_to_image_batch(valid_labels, valid_images)
-                summed_bbox_image = self._grayscale_sum_image(label_image_batch)
+                summed_bbox_image = self._bbox_sum_image(valid_labels, valid_images)
                 self._bbox_heatmap[dataset_kind] += summed_bbox_image
 
     def compute(self, context: Context) -> CheckResult:
@@ -150,31 +175,39 @@ class HeatmapComparison(TrainTestCheck):
 
     def _label_to_image(self, label: np.ndarray, original_shape: Tuple[int]) -> np.ndarray:
         """Convert label array to an image where pixels inside the bboxes are white and the rest are black."""
-        # Create a black image
-        image = np.zeros(original_shape, dtype=np.uint8)
+        height, width = original_shape[:2]
         label = label.reshape((-1, 5))
-        x_min = (label[:, 1]).astype(np.int32)
-        y_min = (label[:, 2]).astype(np.int32)
-        x_max = (label[:, 1] + label[:, 3]).astype(np.int32)
-        y_max = (label[:, 2] + label[:, 4]).astype(np.int32)
-        for i in range(len(label)):
-            # For each bounding box, set the pixels inside the bounding box to white
-            image[y_min[i]:y_max[i], x_min[i]:x_max[i]] = 255
+        # the bboxes are clipped to the image, as their pixels would be when slicing the image
+        x_min = np.clip(label[:, 1].astype(np.int32), 0, width)
+        y_min = np.clip(label[:, 2].astype(np.int32), 0, height)
+        x_max = np.clip((label[:, 1] + label[:, 3]).astype(np.int32), 0, width)
+        y_max = np.clip((label[:, 2] + label[:, 4]).astype(np.int32), 0, height)
+        is_empty = (x_max <= x_min) | (y_max <= y_min)
+        x_min, y_min, x_max, y_max = x_min[~is_empty], y_min[~is_empty], x_max[~is_empty], y_max[~is_empty]
+        # Rasterize all the bboxes together: mark the corners of each bbox in a 2D difference array, whose cumulative
+        # sum over both axes is the number of bboxes covering each pixel
+        corners_diff = np.zeros((height + 1, width + 1), dtype=np.int32)
+        np.add.at(corners_diff, (y_min, x_min), 1)
+        np.add.at(corners_diff, (y_min, x_max), -1)
+        np.add.at(corners_diff, (y_max, x_min), -1)
+        np.add.at(corners_diff, (y_max, x_max), 1)
+        coverage = corners_diff.cumsum(axis=0).cumsum(axis=1)[:height, :width]
+        image = np.where(coverage > 0, 255, 0).astype(np.uint8)
         return np.expand_dims(image, axis=2)
 
-    def _label_to_image_batch(self, label_batch: List[np.ndarray], image_batch: List[np.ndarray]) -> List[np.ndarray]:
-        """Convert label batch to batch of images where pixels inside the bboxes are white and the rest are black."""
-        return_bbox_image_batch = []
-        for image, label in zip(image_batch, label_batch):
-            return_bbox_image_batch.append(self._label_to_image(label, image.shape[:2]))
-        return return_bbox_image_batch
+    def _bbox_sum_image(self, label_batch: List[np.ndarray], image_batch: List[np.ndarray]) -> np.ndarray:
+        """Sum the images of the bboxes locations in batch, where pixels inside the bboxes are white, to one image."""
+        return self._sum_heatmaps(
+            [(label, image.shape[:2]) for label, image in zip(label_batch, image_batch)],
+            lambda label_and_shape: self._to_heatmap_shape(self._label_to_image(*label_and_shape))
+        )
 
-    def _grayscale_sum_image(self, batch: Iterable[np.ndarray]) -> np.ndarray:
-        """Sum all images in batch to one grayscale image of shape target_shape.
+    def _grayscale_sum_image(self, batch: Sequence[np.ndarray]) -> np.ndarray:
+        """Sum all images in batch to one grayscale image of the heatmap shape.
 
         Parameters
         ----------
-        batch: np.ndarray
+        batch: Sequence[np.ndarray]
             batch of images.
 
         Returns
@@ -182,29 +215,60 @@ class HeatmapComparison(TrainTestCheck):
         np.ndarray
             summed image.
         """
-        summed_image = None
-
-        # Iterate over all images in batch, using the first image as the target shape if target_shape is None.
-        # All subsequent images will be resized to the target shape and their gray values will be added to the
-        # summed image.
-        for img in batch:
-            # Cast to grayscale
-            if img.shape[2] == 1:
-                resized_img = img
-            elif img.shape[2] == 3:
-                resized_img = cv2.cvtColor(img.astype('uint8'), cv2.COLOR_RGB2GRAY)
-            else:
-                raise NotImplementedError('Images must be RGB or grayscale')
-
-            # reshape to one shape
-            if self._shape is None:
-                self._shape = resized_img.shape[:2][::-1]
-            resized_img = cv2.resize(resized_img.astype('uint8'), self._shape, interpolation=cv2.INTER_AREA)
-
-            # sum images
-            if summed_image is None:
-                summed_image = resized_img.squeeze().astype(np.int64)
-            else:
-                summed_image += resized_img.squeeze().astype(np.int64)
+        return self._sum_heatmaps(batch, self._to_grayscale_heatmap)
+
+    def _to_grayscale_heatmap(self, img: np.ndarray) -> np.ndarray:
+        """Cast the image to grayscale and resize it to the heatmap shape."""
+        if img.shape[2] == 1:
+            grayscale_img = img
+        elif img.shape[2] == 3:
+            grayscale_img = cv2.cvtColor(np.ascontiguousarray(img, dtype=np.uint8), cv2.COLOR_RGB2GRAY)
+        else:
+            raise NotImplementedError('Images must be RGB or grayscale')
+        return self._to_heatmap_shape(grayscale_img)
+
+    def _to_heatmap_shape(self, img: np.ndarray) -> np.ndarray:
+        """Resize a single channel image to the heatmap shape, which is the shape of the first image by default."""
+        img = np.ascontiguousarray(img, dtype=np.uint8)
+        if self._shape is None:
+            self._shape = img.shape[:2][::-1]
+        if img.shape[:2] != self._shape[::-1]:
+            # Downscaling by integer factors is much faster than by arbitrary ones, so when the heatmap size is given,
+            # images which are at least twice its size are first downscaled by the largest integer factors that keep
+            # them larger. The default heatmap size keeps the exact single resize of the previous results.
+            factor_x, factor_y = img.shape[1] // self._shape[0], img.shape[0] // self._shape[1]
+            if self.heatmap_size is not None and factor_x > 1 and factor_y > 1:
+                height, width = img.shape[0] // factor_y, img.shape[1] // factor_x
+                img = cv2.resize(img[:height * factor_y, :width * factor_x], (width, height),
+                                 interpolation=cv2.INTER_AREA)
+            img = cv2.resize(img, self._shape, interpolation=cv2.INTER_AREA)
+        return img.reshape(self._shape[::-1])
+
+    def _sum_heatmaps(self, items: Sequence, to_heatmap: Callable[[Any], np.ndarray]) -> np.ndarray:
+        """Sum the heatmaps of the items, calculated by worker threads if n_jobs is not 1."""
+        items = list(items)
+        if self._shape is None and len(items) > 0:
+            # the heatmap shape is determined by the first image, so it can't be calculated concurrently
+            first_heatmap = to_heatmap(items[0])
+            return first_heatmap.astype(np.int64) + self._sum_heatmaps(items[1:], to_heatmap)
+
+        n_jobs = (os.cpu_count() or 1) if self.n_jobs == -1 else self.n_jobs
+        n_jobs = min(n_jobs, len(items))
+        if n_jobs <= 1:
+            return self._sum_heatmaps_sequentially(items, to_heatmap)
+        # OpenCV and numpy release the GIL while resizing and summing the images, so threads run in parallel
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return sum(executor.map(lambda chunk: self._sum_heatmaps_sequentially(chunk, to_heatmap),
+                                    [items[i::n_jobs] for i in range(n_jobs)]))
 
+    def _sum_heatmaps_sequentially(self, items: Sequence, to_heatmap: Callable[[Any], np.ndarray]) -> np.ndarray:
+        """Sum the heatmaps of the items, accumulating them as uint16 which is much faster than int64."""
+        summed_image = np.zeros(self._shape[::-1], dtype=np.int64)
+        accumulator = np.zeros(self._shape[::-1], dtype=np.uint16)
+        for index, item in enumerate(items, start=1):
+            np.add(accumulator, to_heatmap(item), out=accumulator)
+            if index % MAX_IMAGES_PER_ACCUMULATOR == 0:
+                summed_image += accumulator
+                accumulator[:] = 0
+        summed_image += accumulator
         return summed_image
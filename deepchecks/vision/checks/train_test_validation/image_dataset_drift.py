@@ -9,13 +9,14 @@
 # ----------------------------------------------------------------------------
 #
 """Module contains the image dataset drift check."""
-from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.core.check_utils.multivariate_drift_utils import run_multivariable_drift
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.strings import format_number
 from deepchecks.vision._shared_docs import docstrings
 from deepchecks.vision.base_checks import TrainTestCheck
@@ -26,6 +27,35 @@ from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 
 __all__ = ['ImageDatasetDrift']
 
+EMBEDDING_COLUMN_PREFIX = 'Embedding'
+
+
+class _Reservoir:
+    """Uniform random sample of a fixed size from a stream of samples (reservoir sampling, algorithm R)."""
+
+    def __init__(self, size: int, random_state: int):
+        self.size = size
+        self.samples = []
+        self._n_seen = 0
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, samples: Sequence[Any]):
+        """Add the samples of a batch to the reservoir, each replacing a random kept sample with the right probability.
+
+        Samples are appended until the reservoir is full, so the reservoir holds all the samples, in their order, as
+        long as no more than its size were seen.
+        """
+        n_free = min(max(self.size - self._n_seen, 0), len(samples))
+        self.samples.extend(samples[:n_free])
+        if n_free < len(samples):
+            # the i-th sample of the stream replaces a random kept sample with probability size / (i + 1)
+            stream_positions = self._n_seen + np.arange(n_free, len(samples))
+            replaced = self._rng.integers(0, stream_positions + 1)
+            for sample_index, kept_index in zip(range(n_free, len(samples)), replaced.tolist()):
+                if kept_index < self.size:
+                    self.samples[kept_index] = samples[sample_index]
+        self._n_seen += len(samples)
+
 
 @docstrings
 class ImageDatasetDrift(TrainTestCheck):
@@ -75,6 +105,14 @@ class ImageDatasetDrift(TrainTestCheck):
         Fraction of the combined datasets to use for the evaluation of the domain classifier.
     min_meaningful_drift_score : float , default 0.05
         Minimum drift score for displaying drift in check. Under that score, check will display "nothing found".
+    reservoir_size : int , default: 10000
+        Maximal number of images per dataset to keep the features of for the domain classifier. When more images are
+        processed, a uniform random sample of them is kept (reservoir sampling), so the memory and the training time
+        of the domain classifier don't grow with the size of the datasets.
+    use_embeddings : bool , default: False
+        Whether to add the embeddings of the images to the features of the domain classifier, if both datasets supply
+        them. The embedding dimensions are named "Embedding i", and are shown like the image properties when they are
+        among the most important features.
     {additional_check_init_params:2*indent}
     """
 
@@ -88,36 +126,57 @@ class ImageDatasetDrift(TrainTestCheck):
             max_num_categories_for_display: int = 10,
             show_categories_by: str = 'largest_difference',
             n_samples: Optional[int] = 10000,
+            reservoir_size: int = 10000,
+            use_embeddings: bool = False,
             **kwargs
     ):
         super().__init__(**kwargs)
+        if not isinstance(reservoir_size, int) or reservoir_size < 1:
+            raise DeepchecksValueError(f'reservoir_size must be a positive integer, but got: {reservoir_size}')
         self.n_samples = n_samples
         self.image_properties = image_properties
         self.n_top_properties = n_top_properties
         self.min_feature_importance = min_feature_importance
         self.test_size = test_size
         self.min_meaningful_drift_score = min_meaningful_drift_score
-        self._train_properties = None
-        self._test_properties = None
+        self.reservoir_size = reservoir_size
+        self.use_embeddings = use_embeddings
+        self._property_names = None
+        self._reservoirs = None
         self.max_num_categories_for_display = max_num_categories_for_display
         self.show_categories_by = show_categories_by
 
     def initialize_run(self, context: Context):
         """Initialize self state, and validate the run context."""
-        self._train_properties = defaultdict(list)
-        self._test_properties = defaultdict(list)
+        self._property_names = [prop['name'] for prop in self.image_properties or default_image_properties]
+        self._reservoirs = {
+            DatasetKind.TRAIN: _Reservoir(self.reservoir_size, context.random_state),
+            DatasetKind.TEST: _Reservoir(self.reservoir_size, context.random_state + 1),
+        }
 
-    def update(self, context: Context, batch: BatchWrapper, dataset_kind: DatasetKind):
-        """Calculate image properties for train or test batches."""
-        if dataset_kind == DatasetKind.TRAIN:
-            properties_results = self._train_properties
-        else:
-            properties_results = self._test_properties
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        return [(self.image_properties, PropertiesInputType.IMAGES)]
 
+    def update(self, context: Context, batch: BatchWrapper, dataset_kind: DatasetKind):
+        """Calculate image properties for train or test batches, and keep a sample of them in the dataset reservoir."""
         data_for_properties = batch.vision_properties(self.image_properties, PropertiesInputType.IMAGES)
+        property_values = [data_for_properties[name] for name in self._property_names]
+        embeddings = batch.numpy_embeddings if self.use_embeddings else None
+        if embeddings is None:
+            embeddings = [None] * len(batch)
+        self._reservoirs[dataset_kind].update(list(zip(zip(*property_values), embeddings)))
 
-        for prop_name, prop_value in data_for_properties.items():
-            properties_results[prop_name].extend(prop_value)
+    def _features_dataframe(self, dataset_kind: DatasetKind, with_embeddings: bool) -> pd.DataFrame:
+        """Return the features of the sampled images of the dataset."""
+        samples = self._reservoirs[dataset_kind].samples
+        df = pd.DataFrame([properties for properties, _ in samples], columns=self._property_names)
+        if with_embeddings:
+            embeddings = np.stack([np.asarray(embedding).reshape(-1) for _, embedding in samples])
+            embedding_columns = [f'{EMBEDDING_COLUMN_PREFIX} {i}' for i in range(embeddings.shape[1])]
+            df = pd.concat([df, pd.DataFrame(embeddings, columns=embedding_columns)], axis=1)
+        return df
 
     def compute(self, context: Context) -> CheckResult:
         """Train a Domain Classifier on image property data that was collected during update() calls.
@@ -130,8 +189,9 @@ class ImageDatasetDrift(TrainTestCheck):
             display: distribution graph for each column for the columns most explaining the dataset difference,
             comparing the train and test distributions.
         """
-        df_train = pd.DataFrame(self._train_properties)
-        df_test = pd.DataFrame(self._test_properties)
+        with_embeddings = self.use_embeddings and self._embeddings_supplied()
+        df_train = self._features_dataframe(DatasetKind.TRAIN, with_embeddings)
+        df_test = self._features_dataframe(DatasetKind.TEST, with_embeddings)
 
         sample_size = min(df_train.shape[0], df_test.shape[0])
 
@@ -150,6 +210,8 @@ class ImageDatasetDrift(TrainTestCheck):
                 numeric_features.append(prop['name'])
             else:
                 categorical_features.append(prop['name'])
+        if with_embeddings:
+            numeric_features += [column for column in df_train.columns if column not in self._property_names]
 
         dataset_names = (context.train.name, context.test.name)
         values_dict, displays = run_multivariable_drift(
@@ -168,6 +230,15 @@ class ImageDatasetDrift(TrainTestCheck):
 
         return CheckResult(value=values_dict, display=displays, header='Image Dataset Drift')
 
+    def _embeddings_supplied(self) -> bool:
+        """Return whether all the sampled images of both datasets have embeddings of the same size."""
+        sizes = {
+            None if embedding is None else np.size(embedding)
+            for reservoir in self._reservoirs.values()
+            for _, embedding in reservoir.samples
+        }
+        return len(sizes) == 1 and None not in sizes
+
     def add_condition_drift_score_less_than(self, threshold: float = 0.1):
         """
         Add condition - require drift score to be less than the threshold.
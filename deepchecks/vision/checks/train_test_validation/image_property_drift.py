@@ -121,6 +121,11 @@ class ImagePropertyDrift(TrainTestCheck, ReducePropertyMixin):
         self._train_properties = defaultdict(list)
         self._test_properties = defaultdict(list)
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> t.List[t.Tuple[t.Optional[t.List[t.Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        return [(self.image_properties, PropertiesInputType.IMAGES)]
+
     def update(
             self,
             context: Context,
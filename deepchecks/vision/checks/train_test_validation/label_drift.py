@@ -10,7 +10,7 @@
 #
 """Module contains the label Drift check."""
 from collections import OrderedDict, defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -175,6 +175,11 @@ class LabelDrift(TrainTestCheck, ReducePropertyMixin, ReduceLabelMixin):
         self._train_label_properties = defaultdict(list)
         self._test_label_properties = defaultdict(list)
 
+    def requested_properties(self, context: Context, dataset_kind: DatasetKind) \
+            -> List[Tuple[Optional[List[Dict]], PropertiesInputType]]:
+        """Return the properties the check calculates on each batch."""
+        return [(self.label_properties, PropertiesInputType.LABELS)]
+
     def update(self, context: Context, batch: BatchWrapper, dataset_kind):
         """Perform update on batch for train or test properties."""
         # For all transformers, calculate histograms by batch:
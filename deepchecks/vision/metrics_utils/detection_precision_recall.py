@@ -18,6 +18,7 @@ from ignite.metrics import Metric
 from ignite.metrics.metric import reinit__is_reduced, sync_all_reduce
 
 from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.vision.metrics_utils.iou_utils import compute_best_matches
 from deepchecks.vision.metrics_utils.metric_mixin import MetricMixin, ObjectDetectionMetricMixin
 
 
@@ -186,75 +187,51 @@ class AveragePrecisionRecall(Metric, MetricMixin):
     def _evaluate_image(self, detections, ground_truths, ious):
         """Evaluate image."""
         # Sort detections by decreasing confidence
-        confidences = self.get_confidences(detections)
-        areas = self.get_detection_areas(detections)
+        confidences = np.asarray(self.get_confidences(detections))
+        areas = np.asarray(self.get_detection_areas(detections))
         sorted_confidence_ids = np.argsort(confidences, kind='stable')[::-1]
-        orig_ious = ious
-        orig_gt = ground_truths
-        ground_truth_area = np.array(self.get_labels_areas(ground_truths))
+        ground_truth_area = np.asarray(self.get_labels_areas(ground_truths))
+
+        # the detections are matched greedily in order of confidence, so the matches of the top n detections are
+        # the same for any max dets, and are calculated once for the largest one
+        top_detections_idx = sorted_confidence_ids[:max(self.max_detections_per_class)]
+        top_confidences = confidences[top_detections_idx]
+        top_ious = ious[top_detections_idx]
 
         scores = {}
         matched = {}
         n_gts = {}
-        for top_n_detections in self.max_detections_per_class:
-            for area_size in self.area_ranges_names:
-                # sort list of dts and chop by max dets
-                top_detections_idx = sorted_confidence_ids[:top_n_detections]
-                ious = orig_ious[top_detections_idx]
-                ground_truth_to_ignore = [self._is_ignore_area(gt_area, area_size) for gt_area in ground_truth_area]
-
-                # sort gts by ignore last
-                gt_sort = np.argsort(ground_truth_to_ignore, kind='stable')
-                ground_truths = [orig_gt[idx] for idx in gt_sort]
-                ground_truth_to_ignore = [ground_truth_to_ignore[idx] for idx in gt_sort]
-
-                ious = ious[:, gt_sort]
-                for min_iou in self.iou_thresholds:
-                    detection_matches = \
-                        self._get_best_matches(top_detections_idx, min_iou, ground_truths, ground_truth_to_ignore, ious)
-
-                    # generate ignore list for dts
-                    detections_to_ignore = [
-                        ground_truth_to_ignore[detection_matches[d_idx]] if d_idx in detection_matches
-                        else self._is_ignore_area(areas[real_index], area_size)
-                        for d_idx, real_index in enumerate(top_detections_idx)
-                    ]
+        for area_size in self.area_ranges_names:
+            ground_truth_to_ignore = self._is_ignore_area(ground_truth_area, area_size)
+
+            # sort gts by ignore last
+            gt_sort = np.argsort(ground_truth_to_ignore, kind='stable')
+            ground_truth_to_ignore = ground_truth_to_ignore[gt_sort]
+
+            # matches of all the iou thresholds, in the shape of (iou thresholds, detections)
+            detection_matches = self._get_best_matches(top_ious[:, gt_sort], ground_truth_to_ignore)
+            is_matched = detection_matches > -1
+
+            # generate ignore list for dts
+            detections_to_ignore = np.tile(self._is_ignore_area(areas[top_detections_idx], area_size),
+                                           (len(self.iou_thresholds), 1))
+            detections_to_ignore[is_matched] = ground_truth_to_ignore[detection_matches[is_matched]]
+            n_not_ignored_gts = int(np.sum(~ground_truth_to_ignore))
 
+            for top_n_detections in self.max_detections_per_class:
+                for iou_i, min_iou in enumerate(self.iou_thresholds):
                     # get score for non-ignored dts
+                    not_ignored = ~detections_to_ignore[iou_i, :top_n_detections]
                     scores[(area_size, top_n_detections, min_iou)] = \
-                        [confidences[real_index] for d_idx, real_index in enumerate(top_detections_idx)
-                         if not detections_to_ignore[d_idx]]
+                        top_confidences[:top_n_detections][not_ignored].tolist()
                     matched[(area_size, top_n_detections, min_iou)] = \
-                        [d_idx in detection_matches for d_idx, real_index in enumerate(top_detections_idx)
-                         if not detections_to_ignore[d_idx]]
-                    n_gts[(area_size, top_n_detections, min_iou)] = \
-                        len([g_idx for g_idx in range(len(ground_truths)) if not ground_truth_to_ignore[g_idx]])
+                        is_matched[iou_i, :top_n_detections][not_ignored].tolist()
+                    n_gts[(area_size, top_n_detections, min_iou)] = n_not_ignored_gts
         return {'scores': scores, 'matched': matched, 'NP': n_gts}
 
-    def _get_best_matches(self, dt, min_iou, ground_truths, ground_truth_to_ignore, ious):
-        ground_truth_matched = {}
-        detection_matches = {}
-
-        for d_idx in range(len(dt)):
-            # information about best match so far (best_match=-1 -> unmatched)
-            best_iou = min(min_iou, 1 - 1e-10)
-            best_match = -1
-            for g_idx in range(len(ground_truths)):
-                # if this gt already matched, continue
-                if g_idx in ground_truth_matched:
-                    continue
-                # if dt matched and currently on ignore gt, stop
-                # this exists to allow for matching ignored ground truth, so that we ignore this detection
-                if best_match > -1 and ground_truth_to_ignore[g_idx]:
-                    break
-
-                if ious[d_idx, g_idx] >= best_iou:
-                    best_iou = ious[d_idx, g_idx]
-                    best_match = g_idx
-            if best_match != -1:
-                detection_matches[d_idx] = best_match
-                ground_truth_matched[best_match] = d_idx
-        return detection_matches
+    def _get_best_matches(self, ious, ground_truth_to_ignore):
+        """Match the detections to the ground truths for all the iou thresholds, in the shape of (thresholds, dts)."""
+        return compute_best_matches(ious, self.iou_thresholds, ground_truth_to_ignore)
 
     def _compute_ap_recall(self, scores, matched, n_positives, recall_thresholds=None):
         if n_positives == 0:
@@ -292,13 +269,14 @@ class AveragePrecisionRecall(Metric, MetricMixin):
 
     def _is_ignore_area(self, area_bb, area_size):
         """Generate ignored gt list by area_range."""
+        area_bb = np.asarray(area_bb)
         if area_size == 'small':
-            return not area_bb < self.area_range[0]
+            return ~(area_bb < self.area_range[0])
         if area_size == 'medium':
-            return not self.area_range[0] <= area_bb <= self.area_range[1]
+            return ~((self.area_range[0] <= area_bb) & (area_bb <= self.area_range[1]))
         if area_size == 'large':
-            return not area_bb > self.area_range[1]
-        return False
+            return ~(area_bb > self.area_range[1])
+        return np.zeros(area_bb.shape, dtype=bool)
 
     def filter_res(self, res: np.ndarray, iou: float = None, area: str = None, max_dets: int = None):
         """Get the value of a result by the filtering values.
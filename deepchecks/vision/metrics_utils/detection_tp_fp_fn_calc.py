@@ -18,6 +18,7 @@ from ignite.metrics.metric import reinit__is_reduced, sync_all_reduce
 
 from deepchecks.utils.metrics import averaging_mechanism
 from deepchecks.vision.metrics_utils.confusion_matrix_counts_metrics import AVAILABLE_EVALUATING_FUNCTIONS
+from deepchecks.vision.metrics_utils.iou_utils import compute_best_matches
 from deepchecks.vision.metrics_utils.metric_mixin import MetricMixin, ObjectDetectionMetricMixin
 from deepchecks.vision.vision_data.utils import is_torch_object
 
@@ -128,8 +129,7 @@ class TpFpFn(Metric, MetricMixin):
         # sort list of dts and chop by max dets
         ious = orig_ious[sorted_confidence_ids]
 
-        detection_matches = self._get_best_matches(ground_truths, ious)
-        matched = np.array([d_idx in detection_matches for d_idx in range(len(ious))])
+        matched = self._get_best_matches(ious) > -1
         if len(matched) == 0:
             tp, fp = 0, 0
         else:
@@ -137,26 +137,9 @@ class TpFpFn(Metric, MetricMixin):
             fp = len(matched) - tp
         return tp, fp, len(ground_truths) - tp
 
-    def _get_best_matches(self, ground_truths: t.List, ious: np.ndarray) -> t.Dict[int, int]:
-        ground_truth_matched = {}
-        detection_matches = {}
-
-        for d_idx in range(len(ious)):
-            # information about best match so far (best_match=-1 -> unmatched)
-            best_iou = min(self.iou_thres, 1 - 1e-10)
-            best_match = -1
-            for g_idx in range(len(ground_truths)):
-                # if this gt already matched, continue
-                if g_idx in ground_truth_matched:
-                    continue
-
-                if ious[d_idx, g_idx] >= best_iou:
-                    best_iou = ious[d_idx, g_idx]
-                    best_match = g_idx
-            if best_match != -1:
-                detection_matches[d_idx] = best_match
-                ground_truth_matched[best_match] = d_idx
-        return detection_matches
+    def _get_best_matches(self, ious: np.ndarray) -> np.ndarray:
+        """Match the detections to the ground truths, returns the matched ground truth of each detection or -1."""
+        return compute_best_matches(ious, [self.iou_thres])[0]
 
 
 class ObjectDetectionTpFpFn(TpFpFn, ObjectDetectionMetricMixin):
@@ -10,7 +10,7 @@
 #
 """Module for computing Intersection over Unions."""
 from collections import defaultdict
-from typing import List
+from typing import List, Optional, Sequence
 
 import numpy as np
 
@@ -50,8 +50,55 @@ def jaccard_iou(dt: np.array, gt: np.array):
     return intersection / (dt_area + gt_area - intersection)
 
 
-def compute_pairwise_ious(detected, ground_truth, iou_func):
+def _stack_boxes(boxes) -> np.ndarray:
+    """Stack a sequence of boxes (numpy arrays or tensors) to a 2D numpy array."""
+    return np.stack([np.asarray(box) for box in boxes])
+
+
+def pairwise_jaccard_iou(detected, ground_truth) -> np.ndarray:
+    """Calculate the jaccard IoU of every pair of detection and ground truth at once.
+
+    Gives the same values as calling ``jaccard_iou`` on every pair.
+
+    Parameters
+    ----------
+    detected: Sequence
+        Detections in the shape of [x, y, width, height, confidence, class]
+    ground_truth: Sequence
+        Ground truths in the shape of [class, x, y, width, height]
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of the IoUs in the shape of (len(detected), len(ground_truth))
+    """
+    if len(detected) == 0 or len(ground_truth) == 0:
+        return np.zeros((len(detected), len(ground_truth)))
+
+    detected = _stack_boxes(detected)
+    ground_truth = _stack_boxes(ground_truth)
+    x_dt, y_dt, w_dt, h_dt = (detected[:, i, np.newaxis] for i in range(4))
+    x_gt, y_gt, w_gt, h_gt = (ground_truth[np.newaxis, :, i] for i in range(1, 5))
+
+    # innermost left and right x, same for y
+    xi = np.maximum(x_dt, x_gt)
+    x2i = np.minimum(x_dt + w_dt, x_gt + w_gt)
+    yi = np.maximum(y_dt, y_gt)
+    y2i = np.minimum(y_dt + h_dt, y_gt + h_gt)
+
+    # calculate areas
+    dt_area = w_dt * h_dt
+    gt_area = w_gt * h_gt
+    intersection = np.maximum(x2i - xi, 0) * np.maximum(y2i - yi, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ious = intersection / (dt_area + gt_area - intersection)
+    return ious.astype(np.float64, copy=False)
+
+
+def compute_pairwise_ious(detected, ground_truth, iou_func=jaccard_iou):
     """Compute pairwise ious between detections and ground truth."""
+    if iou_func is jaccard_iou:
+        return pairwise_jaccard_iou(detected, ground_truth)
     ious = np.zeros((len(detected), len(ground_truth)))
     for g_idx, g in enumerate(ground_truth):
         for d_idx, d in enumerate(detected):
@@ -59,6 +106,56 @@ def compute_pairwise_ious(detected, ground_truth, iou_func):
     return ious
 
 
+def compute_best_matches(ious: np.ndarray, iou_thresholds: Sequence[float],
+                         ground_truth_to_ignore: Optional[np.ndarray] = None) -> np.ndarray:
+    """Greedily match detections to ground truths, COCO style, for all the IoU thresholds at once.
+
+    The detections are matched in their order (should be sorted by decreasing confidence), each to the unmatched
+    ground truth with the highest IoU above the threshold. A detection is matched to an ignored ground truth only if
+    there is no other ground truth it can be matched to.
+
+    Parameters
+    ----------
+    ious: np.ndarray
+        Matrix of the IoUs in the shape of (n_detections, n_ground_truths)
+    iou_thresholds: Sequence[float]
+        The minimal IoU of a match, for each of the matchings to calculate
+    ground_truth_to_ignore: Optional[np.ndarray], default: None
+        Boolean mask of the ignored ground truths, which must come last in the ious matrix. If None, no ground truth
+        is ignored.
+
+    Returns
+    -------
+    np.ndarray
+        The index of the ground truth matched to each detection, or -1 if it is unmatched, in the shape of
+        (len(iou_thresholds), n_detections)
+    """
+    n_detections, n_ground_truths = ious.shape
+    thresholds = np.minimum(np.asarray(iou_thresholds, dtype=np.float64), 1 - 1e-10)[:, np.newaxis]
+    matches = -np.ones((len(thresholds), n_detections), dtype=int)
+    if n_ground_truths == 0:
+        return matches
+    is_ignored = np.zeros(n_ground_truths, dtype=bool) if ground_truth_to_ignore is None \
+        else np.asarray(ground_truth_to_ignore, dtype=bool)
+
+    unmatched = np.ones((len(thresholds), n_ground_truths), dtype=bool)
+    # detections without any ground truth above the lowest threshold are never matched
+    for d_idx in np.flatnonzero((ious >= thresholds.min()).any(axis=1)):
+        candidates = unmatched & (ious[d_idx] >= thresholds)
+        # out of the ground truths with the highest iou, the last one is matched
+        regular = candidates & ~is_ignored
+        best_regular = n_ground_truths - 1 - np.argmax(np.where(regular, ious[d_idx], -np.inf)[:, ::-1], axis=1)
+        # out of the ignored ground truths, the first one is matched
+        ignored = candidates & is_ignored
+        best_ignored = np.argmax(ignored, axis=1)
+
+        best_match = np.where(regular.any(axis=1), best_regular, np.where(ignored.any(axis=1), best_ignored, -1))
+        matched_thresholds = np.flatnonzero(best_match > -1)
+        matches[:, d_idx] = best_match
+        unmatched[matched_thresholds, best_match[matched_thresholds]] = False
+    return matches
+
+
 def group_class_detection_label(detected: np.ndarray, ground_truth: np.ndarray):
     """Group bounding detection and labels by class."""
     class_bounding_boxes = defaultdict(lambda: {"detected": [], "ground_truth": []})
@@ -9,30 +9,45 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing utils for semantic segmentation metrics utils."""
-from typing import Tuple
+from typing import Sequence, Tuple
 
 import numpy as np
 
 
-def format_segmentation_masks(y_true: np.ndarray, y_pred: np.ndarray, threshold):
-    """Bring the ground truth and the prediction masks to the same format (C, W, H) with values 1.0 or 0.0."""
-    pred_onehot = np.where(y_pred > threshold, 1.0, 0.0)
-    label_onehot = np.zeros_like(pred_onehot)
-    for channel in range(pred_onehot.shape[0]):
-        label_onehot[channel] = y_true == channel
-    return label_onehot, pred_onehot
+def segmentation_counts_per_sample(y_true: Sequence[np.ndarray], y_pred: Sequence[np.ndarray],
+                                   threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the intersection, ground truth and predicted areas per sample and class for segmentation metrics.
 
+    The areas are counted with np.bincount over the class of each pixel, instead of comparing one-hot masks of all
+    the classes, so the memory and time don't grow with the number of classes times the mask size.
 
-def segmentation_counts_per_class(y_true_onehot: np.ndarray, y_pred_onehot: np.ndarray):
-    """Compute the ground truth, predicted and intersection areas per class for segmentation metrics."""
-    tp_onehot = np.logical_and(y_true_onehot, y_pred_onehot)
-    tp_count_per_class = np.asarray([np.sum(tp_onehot[channel]) for channel in range(tp_onehot.shape[0])])
-    y_true_count_per_class = np.asarray([np.sum(y_true_onehot[channel]) for channel in range(tp_onehot.shape[0])])
-    pred_count_per_class = np.asarray([np.sum(y_pred_onehot[channel]) for channel in range(tp_onehot.shape[0])])
-    return tp_count_per_class, y_true_count_per_class, pred_count_per_class
+    Parameters
+    ----------
+    y_true : Sequence[np.ndarray]
+        The ground truth masks, of shape (H, W) with the class id of each pixel.
+    y_pred : Sequence[np.ndarray]
+        The predictions, of shape (C, H, W) with the score of each class per pixel.
+    threshold : float
+        Prediction value per pixel above which the pixel is considered True.
 
-
-def segmentation_counts_micro(y_true_onehot: np.ndarray, y_pred_onehot: np.ndarray) -> Tuple[int, int, int]:
-    """Compute the micro averaged ground truth, predicted and intersection areas for segmentation metrics."""
-    tp_onehot = np.logical_and(y_true_onehot, y_pred_onehot)
-    return np.sum(tp_onehot), np.sum(y_true_onehot), np.sum(y_pred_onehot)
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The intersection, ground truth and predicted areas, each of shape (num_samples, C).
+    """
+    num_classes = y_pred[0].shape[0] if len(y_pred) > 0 else 0
+    tp_counts, y_true_counts, pred_counts = (np.zeros((len(y_pred), num_classes), dtype=np.int64) for _ in range(3))
+    for index, (label, pred) in enumerate(zip(y_true, y_pred)):
+        pred_mask = np.asarray(pred).reshape(num_classes, -1) > threshold
+        label = np.asarray(label).reshape(-1)
+        class_ids = label.astype(np.int64)
+        # pixels of classes which are not predicted are not counted, same as pixels of non integer classes
+        valid = (class_ids >= 0) & (class_ids < num_classes) & (class_ids == label)
+        class_ids = class_ids[valid]
+        # whether each pixel is predicted as its ground truth class
+        is_hit = pred_mask[class_ids, np.flatnonzero(valid)]
+        tp_counts[index] = np.bincount(class_ids[is_hit], minlength=num_classes)
+        y_true_counts[index] = np.bincount(class_ids, minlength=num_classes)
+        # counting each class separately is several times faster than np.count_nonzero with an axis
+        pred_counts[index] = [np.count_nonzero(class_mask) for class_mask in pred_mask]
+    return tp_counts, y_true_counts, pred_counts
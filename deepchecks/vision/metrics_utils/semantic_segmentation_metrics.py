@@ -17,9 +17,7 @@ import torch
 from ignite.metrics import Metric
 
 from deepchecks.core.errors import DeepchecksValueError
-from deepchecks.vision.metrics_utils.semantic_segmentation_metric_utils import (format_segmentation_masks,
-                                                                                segmentation_counts_micro,
-                                                                                segmentation_counts_per_class)
+from deepchecks.vision.metrics_utils.semantic_segmentation_metric_utils import segmentation_counts_per_sample
 
 
 class MeanDice(Metric):
@@ -54,20 +52,12 @@ class MeanDice(Metric):
 
     def update(self, output: Tuple[np.ndarray, np.ndarray]):
         """Update metric with batch of samples."""
-        for pred, label in zip(output[0], output[1]):
-            label_onehot, pred_onehot = format_segmentation_masks(label, pred, self.threshold)
-            if self.average == 'micro':
-                tp, label, pred = segmentation_counts_micro(label_onehot, pred_onehot)
-                tp_count, label_count, pred_count = np.asarray([tp]), np.asarray([label]), np.asarray([pred])
-            else:
-                tp_count, label_count, pred_count = segmentation_counts_per_class(label_onehot, pred_onehot)
-
-            dice = (2 * tp_count + self.smooth) / (label_count + pred_count + self.smooth)
-
-            classes_ids = [0] if self.average == 'micro' else np.unique(label)
-            for class_id in [int(x) for x in classes_ids]:
-                self._evals[class_id]['dice'] += dice[class_id]
-                self._evals[class_id]['count'] += 1
+        tp_count, label_count, pred_count = segmentation_counts_per_sample(output[1], output[0], self.threshold)
+        if self.average == 'micro':
+            tp_count, label_count, pred_count = (x.sum(axis=1, keepdims=True)
+                                                 for x in (tp_count, label_count, pred_count))
+        dice = (2 * tp_count + self.smooth) / (label_count + pred_count + self.smooth)
+        _update_per_class_evals(self._evals, 'dice', dice, label_count, self.average)
 
     def compute(self):
         """Compute metric value."""
@@ -117,18 +107,11 @@ class MeanIoU(Metric):
 
     def update(self, output: Tuple[torch.Tensor, torch.Tensor]):
         """Update metric with batch of samples."""
-        for pred, label in zip(output[0], output[1]):
-            gt_onehot, pred_onehot = format_segmentation_masks(label, pred, self.threshold)
-            tp_count_per_class, gt_count_per_class, pred_count_per_class = segmentation_counts_per_class(
-                gt_onehot, pred_onehot)
-
-            iou_per_class = (tp_count_per_class + self.smooth) / \
-                            (gt_count_per_class + pred_count_per_class - tp_count_per_class + self.smooth)
-
-            classes_ids = [0] if self.average == 'micro' else np.unique(label)
-            for class_id in [int(x) for x in classes_ids]:
-                self._evals[class_id]['iou'] += iou_per_class[class_id]
-                self._evals[class_id]['count'] += 1
+        tp_count_per_class, gt_count_per_class, pred_count_per_class = segmentation_counts_per_sample(
+            output[1], output[0], self.threshold)
+        iou_per_class = (tp_count_per_class + self.smooth) / \
+                        (gt_count_per_class + pred_count_per_class - tp_count_per_class + self.smooth)
+        _update_per_class_evals(self._evals, 'iou', iou_per_class, gt_count_per_class, self.average)
 
     def compute(self):
         """Compute metric value."""
@@ -147,9 +130,24 @@ class MeanIoU(Metric):
 
 def per_sample_dice(predictions, labels, threshold: float = 0.5, smooth: float = 1e-3):
     """Calculate Dice score per sample."""
-    score = np.empty(len(labels))
-    for i in range(len(labels)):
-        gt_onehot, pred_onehot = format_segmentation_masks(labels[i], predictions[i], threshold)
-        tp_count, gt_count, pred_count = segmentation_counts_micro(gt_onehot, pred_onehot)
-        score[i] = (2 * tp_count + smooth) / (gt_count + pred_count + smooth)
+    counts = segmentation_counts_per_sample(labels, predictions, threshold)
+    tp_count, gt_count, pred_count = (x.sum(axis=1) for x in counts)
+    score = (2 * tp_count + smooth) / (gt_count + pred_count + smooth)
     return score.tolist()
+
+
+def _update_per_class_evals(evals, score_name: str, scores: np.ndarray, label_count: np.ndarray, average: str):
+    """Add the scores of the samples to the sums of the classes which appear in their labels.
+
+    For micro average, all the scores are added to class 0.
+    """
+    if len(scores) == 0:
+        return
+    if average == 'micro':
+        evals[0][score_name] += scores[:, 0].sum()
+        evals[0]['count'] += len(scores)
+        return
+    is_in_label = label_count > 0
+    for class_id in np.flatnonzero(is_in_label.any(axis=0)):
+        evals[int(class_id)][score_name] += scores[is_in_label[:, class_id], class_id].sum()
+        evals[int(class_id)]['count'] += int(is_in_label[:, class_id].sum())
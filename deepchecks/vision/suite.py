@@ -10,15 +10,20 @@
 #
 """Module for base vision abstractions."""
 # pylint: disable=broad-except,not-callable
+import os
+import queue
+import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import copy
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 import numpy as np
 
 from deepchecks.core.check_result import BaseCheckResult, CheckFailure
 from deepchecks.core.checks import DatasetKind
-from deepchecks.core.errors import DeepchecksNotSupportedError
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksProcessError, DeepchecksValueError
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.utils.ipython import ProgressBarGroup
 from deepchecks.vision._shared_docs import docstrings
@@ -46,7 +51,9 @@ class Suite(BaseSuite):
             random_state: int = 42,
             with_display: bool = True,
             max_samples: Optional[int] = None,
-            run_single_dataset: Optional[str] = None
+            run_single_dataset: Optional[str] = None,
+            n_jobs: Optional[int] = None,
+            prefetch_batches: int = 2
     ) -> SuiteResult:
         """Run all checks.
 
@@ -63,6 +70,12 @@ class Suite(BaseSuite):
             determined by the n_samples argument.
         run_single_dataset: Optional[str], default None
             'Train', 'Test' , or None to run on both train and test.
+        n_jobs : Optional[int] , default: None
+            Number of threads to update the checks with each batch on concurrently. None or 1 update the checks
+            sequentially, and -1 uses all the available CPUs. When running concurrently, the batches are also loaded
+            and converted to numpy in a background thread, while the checks are updated with the previous batch.
+        prefetch_batches : int , default: 2
+            Max number of batches loaded in advance by the background thread, when running concurrently.
 
         Returns
         -------
@@ -78,7 +91,16 @@ class Suite(BaseSuite):
         results: Dict[Union[str, int], BaseCheckResult] = OrderedDict({})
         max_samples = max_samples or np.inf
 
-        with ProgressBarGroup() as progressbar_factory:
+        if not isinstance(prefetch_batches, int) or prefetch_batches < 1:
+            raise DeepchecksValueError(f'prefetch_batches must be a positive integer, but got: {prefetch_batches}')
+        if n_jobs in (None, 1):
+            executor = None
+        elif not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+            raise DeepchecksValueError(f'n_jobs must be a positive integer or -1, but got: {n_jobs}')
+        else:
+            executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) if n_jobs == -1 else n_jobs)
+
+        with executor or nullcontext(), ProgressBarGroup() as progressbar_factory:
             context = Context(train_dataset, test_dataset,
                               random_state=random_state, with_display=with_display)
             # Initialize train test checks
@@ -104,7 +126,7 @@ class Suite(BaseSuite):
                 self._update_loop(context=context, train_test_checks=train_test_checks,
                                   single_dataset_checks=single_dataset_checks_train, results=results,
                                   dataset_kind=DatasetKind.TRAIN, progressbar_factory=progressbar_factory,
-                                  max_samples=max_samples)
+                                  max_samples=max_samples, executor=executor, prefetch_batches=prefetch_batches)
 
             if test_dataset is not None:
                 for name, check in list(single_dataset_checks_test.items()):
@@ -116,7 +138,7 @@ class Suite(BaseSuite):
                 self._update_loop(context=context, train_test_checks=train_test_checks,
                                   single_dataset_checks=single_dataset_checks_test, results=results,
                                   dataset_kind=DatasetKind.TEST, progressbar_factory=progressbar_factory,
-                                  max_samples=max_samples)
+                                  max_samples=max_samples, executor=executor, prefetch_batches=prefetch_batches)
 
             # Need to compute only on not SingleDatasetCheck, since they computed inside the loop
             progress_bar = progressbar_factory.create(iterable=list(train_test_checks.items()), unit='Check',
@@ -135,29 +157,39 @@ class Suite(BaseSuite):
 
     @classmethod
     def _update_loop(cls, context: Context, dataset_kind: DatasetKind, results: Dict[Union[str, int], BaseCheckResult],
-                     progressbar_factory: ProgressBarGroup, train_test_checks, single_dataset_checks, max_samples):
+                     progressbar_factory: ProgressBarGroup, train_test_checks, single_dataset_checks, max_samples,
+                     executor: Optional[ThreadPoolExecutor] = None, prefetch_batches: int = 2):
         checks_to_update = {**train_test_checks, **single_dataset_checks}
         vision_data = context.get_data_by_kind(dataset_kind)
+        properties_requests = cls._get_properties_requests(context, dataset_kind, checks_to_update)
+        if executor is None:
+            batches = (BatchWrapper(batch, vision_data.task_type, vision_data.number_of_images_cached,
+                                    vision_data.properties_cache) for batch in vision_data)
+        else:
+            batches = _iter_prefetched_batches(vision_data, prefetch_batches)
 
         # Update loop over the batches
         with progressbar_factory.create_dummy(name='Processing Batches:' + vision_data.name):
-            for batch in vision_data:
-                batch = BatchWrapper(batch, vision_data.task_type, vision_data.number_of_images_cached)
-                vision_data.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
-                for name, check in list(checks_to_update.items()):
-                    try:
-                        check.update(context, batch, dataset_kind=dataset_kind)
-                        if vision_data.number_of_images_cached > np.min((max_samples, check.n_samples or np.inf)):
+            try:
+                for batch in batches:
+                    vision_data.update_cache(len(batch), batch.numpy_labels, batch.numpy_predictions)
+                    cls._precalculate_properties(batch, [request for name in checks_to_update
+                                                         for request in properties_requests[name]])
+                    errors = cls._update_checks(context, batch, dataset_kind, checks_to_update, executor)
+                    for name, check in list(checks_to_update.items()):
+                        if name in errors:
+                            results[name] = CheckFailure(check, errors[name], vision_data.name)
                             checks_to_update.pop(name)
-                    except Exception as exp:
-                        results[name] = CheckFailure(check, exp, vision_data.name)
-                        checks_to_update.pop(name)
-                        if name in single_dataset_checks:
-                            single_dataset_checks.pop(name)
-                        else:
-                            train_test_checks.pop(name)
-                if len(checks_to_update) == 0:
-                    break
+                            if name in single_dataset_checks:
+                                single_dataset_checks.pop(name)
+                            else:
+                                train_test_checks.pop(name)
+                        elif vision_data.number_of_images_cached > np.min((max_samples, check.n_samples or np.inf)):
+                            checks_to_update.pop(name)
+                    if len(checks_to_update) == 0:
+                        break
+            finally:
+                batches.close()
 
         # Compute for single dataset checks
         checks_pbar = progressbar_factory.create(iterable=list(single_dataset_checks.items()), unit='Check',
@@ -171,6 +203,103 @@ class Suite(BaseSuite):
             except Exception as exp:
                 results[name] = CheckFailure(check, exp, vision_data.name)
 
+    @classmethod
+    def _get_properties_requests(cls, context: Context, dataset_kind: DatasetKind, checks) -> Dict:
+        """Return the properties requested by each of the checks, see ``requested_properties``."""
+        properties_requests = {}
+        for name, check in checks.items():
+            try:
+                properties_requests[name] = check.requested_properties(context, dataset_kind)
+            except Exception:
+                # the check calculates its properties by itself, and reports the error if it fails
+                properties_requests[name] = []
+        return properties_requests
+
+    @classmethod
+    def _precalculate_properties(cls, batch: BatchWrapper, properties_requests):
+        """Calculate the properties of all the checks together once, before the checks are updated with the batch."""
+        if not properties_requests:
+            return
+        try:
+            batch.precalculate_vision_properties(properties_requests)
+        except Exception:
+            # errors are raised again when the checks calculate the properties, and are reported on these checks
+            pass
+
+    @classmethod
+    def _update_checks(cls, context: Context, batch: BatchWrapper, dataset_kind: DatasetKind, checks,
+                       executor: Optional[ThreadPoolExecutor] = None) -> Dict[Union[str, int], Exception]:
+        """Update the checks with the batch, concurrently if an executor is given, and return the raised errors."""
+        def update(check):
+            try:
+                check.update(context, batch, dataset_kind=dataset_kind)
+            except Exception as exp:
+                return exp
+            return None
+
+        if executor is None:
+            errors = {name: update(check) for name, check in checks.items()}
+        else:
+            futures = {name: executor.submit(update, check) for name, check in checks.items()}
+            errors = {name: future.result() for name, future in futures.items()}
+        return {name: error for name, error in errors.items() if error is not None}
+
     @classmethod
     def _get_unsupported_failure(cls, check, msg):
         return CheckFailure(check, DeepchecksNotSupportedError(msg))
+
+
+_END_OF_BATCHES = object()
+
+
+def _iter_prefetched_batches(vision_data: VisionData, prefetch_batches: int) -> Iterator[BatchWrapper]:
+    """Iterate over the batches of the vision data, which are loaded and converted to numpy in a background thread.
+
+    At most prefetch_batches batches are loaded ahead of the consumer. Errors raised while loading the batches are
+    raised by the iterator.
+    """
+    loaded_batches = queue.Queue(maxsize=prefetch_batches)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                loaded_batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def load():
+        images_seen_num = vision_data.number_of_images_cached
+        try:
+            for batch in vision_data:
+                batch = BatchWrapper(batch, vision_data.task_type, images_seen_num, vision_data.properties_cache)
+                batch.prefetch()
+                images_seen_num += len(batch)
+                if not put(batch):
+                    return
+        except BaseException as exp:  # pylint: disable=broad-except
+            put(exp)
+        finally:
+            put(_END_OF_BATCHES)
+
+    thread = threading.Thread(target=load, name='deepchecks-batch-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                item = loaded_batches.get(timeout=0.1)
+            except queue.Empty:
+                # the end marker is always put by the loader, unless putting it failed
+                if not thread.is_alive() and loaded_batches.empty():
+                    raise DeepchecksProcessError('The batches loading thread stopped unexpectedly') from None
+                continue
+            if item is _END_OF_BATCHES:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
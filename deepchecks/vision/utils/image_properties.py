@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the image formatter class for the vision module."""
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from cv2 import CV_64F, Laplacian
@@ -27,6 +27,11 @@ __all__ = ['default_image_properties',
            'get_size',
            'get_dimension']
 
+# max number of values (pixels times channels) of the images stacked to a single array by the batch kernels. Large
+# images are processed one by one, as the overhead per image is negligible for them while large stacked arrays are
+# slower to process.
+MAX_STACKED_PIXELS = 2 ** 18
+
 
 def aspect_ratio(batch: List[np.ndarray]) -> List[float]:
     """Return list of floats of image height to width ratio."""
@@ -40,14 +45,14 @@ def area(batch: List[np.ndarray]) -> List[int]:
 
 def brightness(batch: List[np.ndarray]) -> List[float]:
     """Calculate brightness on each image in the batch."""
-    return [img.mean() if _is_grayscale(img) else rgb2gray(img).mean()
-            for img in batch]
+    return _apply_on_batch(batch, lambda images: _flatten_images(_grayscale(images)).mean(axis=1),
+                           lambda img: img.mean() if _is_grayscale(img) else rgb2gray(img).mean())
 
 
 def rms_contrast(batch: List[np.array]) -> List[float]:
     """Return RMS contrast of image."""
-    return [img.std() if _is_grayscale(img) else rgb2gray(img).std()
-            for img in batch]
+    return _apply_on_batch(batch, lambda images: _flatten_images(_grayscale(images)).std(axis=1),
+                           lambda img: img.std() if _is_grayscale(img) else rgb2gray(img).std())
 
 
 def mean_red_relative_intensity(batch: List[np.ndarray]) -> List[float]:
@@ -67,8 +72,52 @@ def mean_blue_relative_intensity(batch: List[np.ndarray]) -> List[float]:
 
 def texture_level(batch: List[np.ndarray]) -> List[float]:
     """Calculate the sharpness of each image in the batch."""
-    return [Laplacian(img, CV_64F).var() if _is_grayscale(img) else Laplacian(rgb2gray(img), CV_64F).var()
-            for img in batch]
+    return _apply_on_batch(batch, lambda images: _flatten_images(_laplacian(_grayscale(images))).var(axis=1),
+                           lambda img: Laplacian(img if _is_grayscale(img) else rgb2gray(img), CV_64F).var())
+
+
+def _is_same_shape(batch: List[np.ndarray]) -> bool:
+    return len(batch) > 0 and all(img.shape == batch[0].shape and img.dtype == batch[0].dtype for img in batch)
+
+
+def _stack_same_shape(batch: List[np.ndarray]) -> Optional[List[np.ndarray]]:
+    """Stack the images to arrays of up to MAX_STACKED_PIXELS values.
+
+    Returns None if the images differ in shape, or are too large to stack more than one of them in an array.
+    """
+    if not _is_same_shape(batch):
+        return None
+    images_per_array = MAX_STACKED_PIXELS // max(1, batch[0].size)
+    if images_per_array < 2:
+        return None
+    return [np.stack(batch[i:i + images_per_array]) for i in range(0, len(batch), images_per_array)]
+
+
+def _apply_on_batch(batch: List[np.ndarray], stacked_function: Callable[[np.ndarray], np.ndarray],
+                    image_function: Callable[[np.ndarray], float]) -> list:
+    """Apply a function on the images stacked to arrays, or on each image if the images differ in shape."""
+    stacked = _stack_same_shape(batch)
+    if stacked is None:
+        return [image_function(img) for img in batch]
+    return [value for images in stacked for value in stacked_function(images)]
+
+
+def _flatten_images(images: np.ndarray) -> np.ndarray:
+    """Reshape an array of stacked images to an array of the pixels values of each image (N x pixels)."""
+    return images.reshape((images.shape[0], -1))
+
+
+def _grayscale(images: np.ndarray) -> np.ndarray:
+    """Convert an array of stacked images (N x H x W x C) to grayscale, if they are not grayscale already."""
+    return images[..., 0] if get_dimension(images[0]) == 1 else rgb2gray(images)
+
+
+def _laplacian(images: np.ndarray) -> np.ndarray:
+    """Calculate the laplacian of an array of stacked grayscale images (N x H x W) like cv2.Laplacian."""
+    # cv2 default border is reflect 101, which is the reflect mode of numpy
+    padded = np.pad(images.astype(np.float64, copy=False), ((0, 0), (1, 1), (1, 1)), mode='reflect')
+    return (padded[:, :-2, 1:-1] + padded[:, 2:, 1:-1] + padded[:, 1:-1, :-2] + padded[:, 1:-1, 2:]
+            - 4 * padded[:, 1:-1, 1:-1])
 
 
 def _sizes(batch: List[np.ndarray]):
@@ -99,8 +148,22 @@ def _rgb_relative_intensity_mean(batch: List[np.ndarray]) -> List[Tuple[float, f
         List of 3-dimensional arrays, each dimension is the normalized mean of the color channel. An array is
         returned for each image.
     """
-    return [_normalize_pixelwise(img).mean(axis=(1, 2)) if not _is_grayscale(img) else (None, None, None)
-            for img in batch]
+    stacked = _stack_same_shape(batch)
+    if stacked is None:
+        return [_normalize_pixelwise(img).mean(axis=(1, 2)) if not _is_grayscale(img) else (None, None, None)
+                for img in batch]
+    return [values for images in stacked for values in _rgb_relative_intensity_mean_stacked(images)]
+
+
+def _rgb_relative_intensity_mean_stacked(images: np.ndarray) -> List:
+    """Calculate the normalized mean of each channel for an array of stacked images (N x H x W x C)."""
+    if get_dimension(images[0]) == 1:
+        return [(None, None, None)] * len(images)
+    # the channels are moved before the pixels, to average the pixels of each channel like _normalize_pixelwise
+    channels = np.ascontiguousarray(np.moveaxis(images, 3, 1)).reshape((images.shape[0], 3, -1))
+    s = channels.sum(axis=1, keepdims=True)
+    normalized = np.divide(channels, s, out=np.zeros(channels.shape, dtype='float64'), where=s != 0)
+    return list(normalized.mean(axis=2))
 
 
 def _rgb_relative_intensity_mean_array(batch: List[np.ndarray]) -> np.ndarray:
@@ -151,6 +214,16 @@ def sample_pixels(image: np.ndarray, n_pixels: int):
     return sampled_image
 
 
+def _sample_pixels_stacked(batch: List[np.ndarray], n_pixels: int) -> np.ndarray:
+    """Sample the pixels of images of the same shape like sample_pixels, stacked to a single array (N x n x 1 x C)."""
+    n_image_pixels = batch[0].shape[0] * batch[0].shape[1]
+    if n_image_pixels <= n_pixels:
+        return np.stack(batch).reshape((len(batch), n_image_pixels, 1, -1))
+    # same random draws as sampling the images one by one
+    pixel_idxs = np.random.choice(n_image_pixels, (len(batch), n_pixels))
+    return np.stack([img.reshape((n_image_pixels, -1))[idxs] for img, idxs in zip(batch, pixel_idxs)])[:, :, np.newaxis]
+
+
 def calc_default_image_properties(batch: List[np.ndarray], sample_n_pixels: int = 10000) -> Dict[str, list]:
     """Speed up the calculation for the default image properties by sharing common actions."""
     if len(batch) == 0:
@@ -160,13 +233,22 @@ def calc_default_image_properties(batch: List[np.ndarray], sample_n_pixels: int
     results_dict['Aspect Ratio'] = list(sizes_array[:, 0] / sizes_array[:, 1])
     results_dict['Area'] = list(sizes_array[:, 0] * sizes_array[:, 1])
 
-    sampled_images = [sample_pixels(img, sample_n_pixels) for img in batch]
-
-    grayscale_images = [img if _is_grayscale(img) else rgb2gray(img)*255 for img in sampled_images]
-    results_dict['Brightness'] = [image.mean() for image in grayscale_images]
-    results_dict['RMS Contrast'] = [image.std() for image in grayscale_images]
+    if _is_same_shape(batch):
+        # all the images share a shape, so their sampled pixels are processed as a single stacked array
+        sampled_images = _sample_pixels_stacked(batch, sample_n_pixels)
+        grayscale_images = _flatten_images(_grayscale(sampled_images))
+        if get_dimension(batch[0]) != 1:
+            grayscale_images = grayscale_images * 255
+        results_dict['Brightness'] = list(grayscale_images.mean(axis=1))
+        results_dict['RMS Contrast'] = list(grayscale_images.std(axis=1))
+        rgb_intensities = np.array(_rgb_relative_intensity_mean_stacked(sampled_images))
+    else:
+        sampled_images = [sample_pixels(img, sample_n_pixels) for img in batch]
+        grayscale_images = [img if _is_grayscale(img) else rgb2gray(img)*255 for img in sampled_images]
+        results_dict['Brightness'] = [image.mean() for image in grayscale_images]
+        results_dict['RMS Contrast'] = [image.std() for image in grayscale_images]
+        rgb_intensities = _rgb_relative_intensity_mean_array(sampled_images)
 
-    rgb_intensities = _rgb_relative_intensity_mean_array(sampled_images)
     results_dict['Mean Red Relative Intensity'] = rgb_intensities[:, 0].tolist()
     results_dict['Mean Green Relative Intensity'] = rgb_intensities[:, 1].tolist()
     results_dict['Mean Blue Relative Intensity'] = rgb_intensities[:, 2].tolist()
@@ -17,23 +17,32 @@ from deepchecks.vision.vision_data import TaskType
 from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 
 
+def get_properties_input_type_for_property_label_correlation(task_type: TaskType) -> PropertiesInputType:
+    """Return the input type of the properties calculated for the given task type, images or objects in the images.
+
+    Intended for the checks PropertyLabelCorrelation and PropertyLabelCorrelationChange.
+    """
+    if task_type == TaskType.OBJECT_DETECTION:
+        return PropertiesInputType.PARTIAL_IMAGES
+    elif task_type == TaskType.CLASSIFICATION:
+        return PropertiesInputType.IMAGES
+    raise ModelValidationError(f'Check is irrelevant for task of type {task_type}')
+
+
 def calc_properties_for_property_label_correlation(task_type: TaskType, batch: BatchWrapper, image_properties: List):
     """
     Transform the data to the relevant format and calculate the properties on it.
 
     Intended for the checks PropertyLabelCorrelation and PropertyLabelCorrelationChange.
     """
+    property_type = get_properties_input_type_for_property_label_correlation(task_type)
     targets = []
     if task_type == TaskType.OBJECT_DETECTION:
         for bboxes_per_image in batch.numpy_labels:
             if bboxes_per_image is not None and len(bboxes_per_image.shape) == 2:
                 targets = targets + bboxes_per_image[:, 0].tolist()
-        property_type = PropertiesInputType.PARTIAL_IMAGES
-    elif task_type == TaskType.CLASSIFICATION:
-        targets = targets + batch.numpy_labels
-        property_type = PropertiesInputType.IMAGES
     else:
-        raise ModelValidationError(f'Check is irrelevant for task of type {task_type}')
+        targets = targets + batch.numpy_labels
 
     data_for_properties = batch.vision_properties(image_properties, property_type)
     return data_for_properties, targets
@@ -0,0 +1,252 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing a persistent cache of the vision properties values and embeddings."""
+import hashlib
+import os
+import pathlib
+import re
+import tempfile
+import threading
+import uuid
+from collections import defaultdict
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from deepchecks.vision.utils.vision_properties import PropertiesInputType
+
+__all__ = ['VisionPropertiesCache', 'MISSING']
+
+EMBEDDINGS_ENTRY = 'embeddings'
+# files of an entry are merged to a single file when loaded, once there are more than this number of them
+MAX_FILES_PER_ENTRY = 64
+
+
+class _Missing:
+    """Marker of a value that does not exist in the cache."""
+
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
+def _stable_hash(*parts: bytes, digest_size: int = 8) -> bytes:
+    """Return a hash of the parts which is stable between processes (unlike the builtin hash)."""
+    hasher = hashlib.blake2b(digest_size=digest_size)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+def _serialize_code(code: CodeType) -> bytes:
+    """Serialize the code object in a way that is stable between processes.
+
+    The repr of nested code objects (comprehensions, lambdas) contains their memory address and the repr of frozensets
+    depends on the hash seed, so the constants are serialized recursively instead.
+    """
+    def serialize_const(const) -> bytes:
+        if isinstance(const, CodeType):
+            return b'code(' + _serialize_code(const) + b')'
+        if isinstance(const, tuple):
+            return b'tuple(' + b','.join(serialize_const(x) for x in const) + b')'
+        if isinstance(const, frozenset):
+            return b'frozenset(' + b','.join(sorted(serialize_const(x) for x in const)) + b')'
+        return repr(const).encode('utf-8', 'surrogatepass')
+
+    return b'\0'.join([
+        code.co_code,
+        serialize_const(code.co_consts),
+        repr(code.co_names).encode(),
+    ])
+
+
+def _function_identity(function: Callable) -> str:
+    """Return the identity of a function, which changes when the function is renamed or its code is changed."""
+    name = f'{getattr(function, "__module__", "")}.{getattr(function, "__qualname__", type(function).__name__)}'
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return name
+    return f'{name}:{_stable_hash(_serialize_code(code)).hex()}'
+
+
+class VisionPropertiesCache:
+    """Persistent store of image, label and prediction properties and of embeddings, keyed by image identifiers.
+
+    The values of a property are stored per image identifier and property function identity (its qualified name and
+    code), so changing a property function invalidates its cached values. Properties of labels and predictions are
+    also keyed by the content of the label or prediction, so that only new or changed samples are calculated.
+    Properties of partial images (bounding boxes) are not cached.
+
+    Every update is written as a compact columnar file (.npz) of the keys and the values, so repeated runs append
+    only the new samples, and all the files of a property are read once per process.
+
+    Parameters
+    ----------
+    directory : Union[str, pathlib.Path]
+        The directory to store the cache in, created if it does not exist.
+    """
+
+    def __init__(self, directory: Union[str, pathlib.Path]):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._entries: Dict[str, Dict[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def property_entry(input_type: PropertiesInputType, single_property: Dict[str, Any],
+                       calc_function: Optional[Callable] = None) -> str:
+        """Return the name of the cache entry of a property.
+
+        Parameters
+        ----------
+        input_type : PropertiesInputType
+            The input type of the property.
+        single_property : Dict[str, Any]
+            The property, with its name, method and output type.
+        calc_function : Optional[Callable], default: None
+            The function calculating the property values when it is not the property method itself (for example the
+            batched calculation of the default image properties), whose values are then stored under its own identity.
+        """
+        function = single_property['method'] if calc_function is None else calc_function
+        identity = f'{single_property["output_type"]}-{_function_identity(function)}'
+        return f'{input_type.value}-{single_property["name"]}-{_stable_hash(identity.encode(), digest_size=4).hex()}'
+
+    @staticmethod
+    def sample_keys(image_identifiers: Sequence, data: Optional[Sequence] = None) -> List[int]:
+        """Return the cache keys of the samples, by their image identifiers and optionally their data content."""
+        keys = []
+        for index, identifier in enumerate(image_identifiers):
+            parts = [str(identifier).encode('utf-8', 'surrogatepass')]
+            if data is not None:
+                value = np.ascontiguousarray(data[index])
+                parts += [b'\0', str(value.dtype).encode(), repr(value.shape).encode(), value.tobytes()]
+            keys.append(int.from_bytes(_stable_hash(*parts), 'little'))
+        return keys
+
+    def _get_directory(self, entry: str) -> pathlib.Path:
+        return self.directory / re.sub(r'[^\w.-]+', '_', entry)
+
+    def _load(self, entry: str) -> Dict[int, Any]:
+        """Load the stored values of an entry, all its files are read once."""
+        if entry in self._entries:
+            return self._entries[entry]
+        values = {}
+        paths = sorted(self._get_directory(entry).glob('*.npz'))
+        for path in paths:
+            with np.load(path, allow_pickle=False) as stored:
+                values.update(zip(stored['keys'].tolist(), _from_arrays(stored)))
+        self._entries[entry] = values
+
+        if len(paths) > MAX_FILES_PER_ENTRY:
+            merged_arrays = _to_arrays(list(values.keys()), list(values.values()))
+            if merged_arrays is not None:
+                self._write(entry, merged_arrays)
+                for path in paths:
+                    path.unlink(missing_ok=True)
+        return values
+
+    def _write(self, entry: str, arrays: Dict[str, np.ndarray]):
+        """Write the arrays as a new file of the entry."""
+        directory = self._get_directory(entry)
+        directory.mkdir(exist_ok=True)
+        # write to a temporary file and rename, so that readers never see a partially written file
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, directory / f'{uuid.uuid4().hex}.npz')
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def get(self, entry: str, keys: Sequence[int]) -> List[Any]:
+        """Return the cached values of the entry for the given keys, or MISSING for keys that are not cached."""
+        with self._lock:
+            stored = self._load(entry)
+            result = [stored.get(key, MISSING) for key in keys]
+        n_missing = sum(value is MISSING for value in result)
+        self.hits[entry] += len(result) - n_missing
+        self.misses[entry] += n_missing
+        return result
+
+    def update(self, entry: str, keys: Sequence[int], values: Sequence[Any]):
+        """Add the values of the entry for the given keys to the cache.
+
+        Values which are not numbers, strings, None or sequences of them are not stored.
+        """
+        with self._lock:
+            stored = self._load(entry)
+            new_values = {key: value for key, value in zip(keys, values) if key not in stored}
+            if not new_values:
+                return
+            arrays = _to_arrays(list(new_values.keys()), list(new_values.values()))
+            if arrays is None:
+                return
+            self._write(entry, arrays)
+            stored.update(new_values)
+
+    def hit_rates(self) -> Dict[str, float]:
+        """Return the hit rate of the cache lookups of each entry."""
+        return {
+            entry: self.hits[entry] / (self.hits[entry] + self.misses[entry])
+            for entry in self.hits
+            if self.hits[entry] + self.misses[entry] > 0
+        }
+
+
+def _to_arrays(keys: List[int], values: List[Any]) -> Optional[Dict[str, np.ndarray]]:
+    """Convert the keys and values to arrays to store, returns None if the values can't be stored without pickling.
+
+    The values are either all scalars or all sequences of scalars, which are stored flattened with their lengths.
+    Null values and null sequences are stored as masks, and the other values keep their dtype.
+    """
+    arrays = {'keys': np.array(keys, dtype=np.uint64)}
+    is_sequence = [isinstance(value, (list, tuple, np.ndarray)) for value in values]
+    if any(is_sequence):
+        null_sequences = np.array([value is None for value in values], dtype=bool)
+        if not all(np.logical_or(is_sequence, null_sequences)):
+            return None
+        values = [np.asarray(value, dtype=object if any(x is None for x in value) else None).reshape(-1).tolist()
+                  for value in values if value is not None]
+        arrays['lengths'] = np.array([len(value) for value in values], dtype=np.int64)
+        if null_sequences.any():
+            arrays['null_sequences'] = null_sequences
+        values = [x for value in values for x in value]
+
+    nulls = np.array([value is None for value in values], dtype=bool)
+    stored_values = np.asarray([value for value in values if value is not None])
+    if stored_values.dtype == object or stored_values.ndim != 1:
+        return None
+    arrays['values'] = stored_values
+    if nulls.any():
+        arrays['nulls'] = nulls
+    return arrays
+
+
+def _from_arrays(stored: Dict[str, np.ndarray]) -> List[Any]:
+    """Convert the stored arrays of an entry back to its values, in the order of its keys."""
+    values = stored['values'].tolist()
+    if 'nulls' in stored:
+        non_null_values = iter(values)
+        values = [None if is_null else next(non_null_values) for is_null in stored['nulls'].tolist()]
+    if 'lengths' not in stored:
+        return values
+    offsets = np.concatenate([[0], np.cumsum(stored['lengths'])]).tolist()
+    values = [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+    if 'null_sequences' in stored:
+        sequences = iter(values)
+        values = [None if is_null else next(sequences) for is_null in stored['null_sequences'].tolist()]
+    return values
@@ -9,7 +9,8 @@
 # ----------------------------------------------------------------------------
 #
 """Package for vision data class and utilities."""
+from deepchecks.vision.vision_data.sampled_loader import IndexedDataset, SampledBatchLoader
 from deepchecks.vision.vision_data.utils import BatchOutputFormat, TaskType
 from deepchecks.vision.vision_data.vision_data import VisionData
 
-__all__ = ['VisionData', 'BatchOutputFormat', 'TaskType']
+__all__ = ['VisionData', 'BatchOutputFormat', 'TaskType', 'IndexedDataset', 'SampledBatchLoader']
@@ -9,7 +9,8 @@
 # ----------------------------------------------------------------------------
 #
 """Contains code for BatchWrapper."""
-from typing import Dict, List, Optional, Union
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -17,6 +18,7 @@ from deepchecks.core.errors import DeepchecksProcessError
 from deepchecks.vision.utils.image_functions import crop_image
 from deepchecks.vision.utils.image_properties import calc_default_image_properties, default_image_properties
 from deepchecks.vision.utils.vision_properties import PropertiesInputType, calc_vision_properties, validate_properties
+from deepchecks.vision.utils.vision_properties_cache import EMBEDDINGS_ENTRY, MISSING, VisionPropertiesCache
 from deepchecks.vision.vision_data.utils import BatchOutputFormat, TaskType, sequence_to_numpy
 
 __all__ = ['BatchWrapper']
@@ -25,17 +27,23 @@ __all__ = ['BatchWrapper']
 class BatchWrapper:
     """Represents dataset batch returned by the dataloader during iteration."""
 
-    def __init__(self, batch: BatchOutputFormat, task_type: TaskType, images_seen_num: int):
+    def __init__(self, batch: BatchOutputFormat, task_type: TaskType, images_seen_num: int,
+                 properties_cache: Optional[VisionPropertiesCache] = None):
         self._task_type = task_type
         self._batch = batch
         self._labels, self._predictions, self._images = None, None, None
         self._embeddings, self._additional_data, = None, None
+        self._numpy_cache = {}
         self._image_identifiers = batch.get('image_identifiers')
+        # the values in the disk cache are keyed by the image identifiers, so it can't be used without them
+        self._properties_cache = properties_cache if self._image_identifiers is not None else None
         # if there are no image identifiers, use the number of the image in loading process as identifier
         if self._image_identifiers is None:
             self._image_identifiers = np.asarray(range(images_seen_num, images_seen_num + len(self)), dtype='str')
 
         self._vision_properties_cache = dict.fromkeys(PropertiesInputType)
+        # the batch may be shared by checks updating concurrently, so properties are calculated once under a lock
+        self._vision_properties_lock = threading.Lock()
 
     def _get_relevant_data_for_properties(self, input_type: PropertiesInputType):
         result = []
@@ -67,6 +75,10 @@ class BatchWrapper:
         Dict[str, Any]
             Dictionary of the properties name to list of property values per data element.
         """
+        with self._vision_properties_lock:
+            return self._vision_properties(properties_list, input_type)
+
+    def _vision_properties(self, properties_list: Optional[List[Dict]], input_type: PropertiesInputType):
         if self._vision_properties_cache[input_type] is None:
             self._vision_properties_cache[input_type] = {}
         keys_in_cache = self._vision_properties_cache[input_type].keys()
@@ -76,20 +88,76 @@ class BatchWrapper:
             requested_properties_names = [prop['name'] for prop in properties_list]
             properties_to_calc = [p for p in properties_list if p['name'] not in keys_in_cache]
             if len(properties_to_calc) > 0:
-                data = self._get_relevant_data_for_properties(input_type)
-                self._vision_properties_cache[input_type].update(calc_vision_properties(data, properties_to_calc))
+                self._vision_properties_cache[input_type].update(self._calc_vision_properties(
+                    properties_to_calc, input_type, lambda data: calc_vision_properties(data, properties_to_calc)))
         else:
             if input_type not in [PropertiesInputType.PARTIAL_IMAGES, PropertiesInputType.IMAGES]:
                 # TODO: add support for quick default properties calculation for other input types
                 raise DeepchecksProcessError(f'None was passed to properties calculation for input type {input_type}.')
             requested_properties_names = [prop['name'] for prop in default_image_properties]
             if any(x not in keys_in_cache for x in requested_properties_names):
-                data = self._get_relevant_data_for_properties(input_type)
-                self._vision_properties_cache[input_type].update(calc_default_image_properties(data))
+                self._vision_properties_cache[input_type].update(self._calc_vision_properties(
+                    default_image_properties, input_type, calc_default_image_properties, cache_by_calc_function=True))
 
         return {key: value for key, value in self._vision_properties_cache[input_type].items() if
                 key in requested_properties_names}
 
+    def _calc_vision_properties(self, properties_list: List[Dict], input_type: PropertiesInputType,
+                                calc_function: Callable[[List], Dict[str, list]],
+                                cache_by_calc_function: bool = False) -> Dict[str, list]:
+        """Calculate the properties with the calc function, only for samples whose values are not in the disk cache.
+
+        If cache_by_calc_function is True, the values are cached under the identity of the calc function instead of
+        the properties methods, since the calc function calculates them differently (e.g. on sampled pixels).
+        """
+        if self._properties_cache is None or input_type == PropertiesInputType.PARTIAL_IMAGES:
+            return calc_function(self._get_relevant_data_for_properties(input_type))
+
+        sample_keys = self._properties_cache.sample_keys(
+            self.numpy_image_identifiers,
+            None if input_type == PropertiesInputType.IMAGES else self._get_relevant_data_for_properties(input_type)
+        )
+        entries = {
+            prop['name']: self._properties_cache.property_entry(
+                input_type, prop, calc_function if cache_by_calc_function else None)
+            for prop in properties_list
+        }
+        results = {name: self._properties_cache.get(entry, sample_keys) for name, entry in entries.items()}
+        missing_indices = sorted({index for values in results.values()
+                                  for index, value in enumerate(values) if value is MISSING})
+        if missing_indices:
+            data = self._get_relevant_data_for_properties(input_type)
+            calculated = calc_function([data[index] for index in missing_indices])
+            for name, entry in entries.items():
+                for index, value in zip(missing_indices, calculated[name]):
+                    results[name][index] = value
+                self._properties_cache.update(entry, [sample_keys[index] for index in missing_indices],
+                                              calculated[name])
+        return results
+
+    def precalculate_vision_properties(self, requests: Sequence[Tuple[Optional[List[Dict]], PropertiesInputType]]):
+        """Calculate the union of the properties requested by several checks in a single call per input type.
+
+        The properties are cached, so the checks updating with the batch read them instead of calculating them.
+
+        Parameters
+        ----------
+        requests: Sequence[Tuple[Optional[List[Dict]], PropertiesInputType]]
+            Pairs of a properties list (None for the default properties) and its input type.
+        """
+        properties_per_input_type = {}
+        for properties_list, input_type in requests:
+            requested = properties_per_input_type.setdefault(input_type, {})
+            if properties_list is None:
+                # the default properties are calculated by a dedicated function
+                self.vision_properties(None, input_type)
+            else:
+                for prop in validate_properties(properties_list):
+                    requested.setdefault(prop['name'], prop)
+        for input_type, requested in properties_per_input_type.items():
+            if requested:
+                self.vision_properties(list(requested.values()), input_type)
+
     @property
     def original_labels(self):
         """Return labels for the batch, formatted in deepchecks format."""
@@ -100,8 +168,10 @@ class BatchWrapper:
     @property
     def numpy_labels(self) -> List[Union[np.ndarray, int]]:
         """Return labels for the batch in numpy format."""
-        required_dim = 0 if self._task_type == TaskType.CLASSIFICATION else 2
-        return sequence_to_numpy(self.original_labels, expected_ndim_per_object=required_dim)
+        if 'labels' not in self._numpy_cache:
+            required_dim = 0 if self._task_type == TaskType.CLASSIFICATION else 2
+            self._numpy_cache['labels'] = sequence_to_numpy(self.original_labels, expected_ndim_per_object=required_dim)
+        return self._numpy_cache['labels']
 
     @property
     def original_predictions(self):
@@ -113,15 +183,18 @@ class BatchWrapper:
     @property
     def numpy_predictions(self) -> List[np.ndarray]:
         """Return predictions for the batch in numpy format."""
-        if self._task_type == TaskType.CLASSIFICATION:
-            required_dim = 1
-        elif self._task_type == TaskType.OBJECT_DETECTION:
-            required_dim = 2
-        elif self._task_type == TaskType.SEMANTIC_SEGMENTATION:
-            required_dim = 3
-        else:
-            required_dim = None
-        return sequence_to_numpy(self.original_predictions, expected_ndim_per_object=required_dim)
+        if 'predictions' not in self._numpy_cache:
+            if self._task_type == TaskType.CLASSIFICATION:
+                required_dim = 1
+            elif self._task_type == TaskType.OBJECT_DETECTION:
+                required_dim = 2
+            elif self._task_type == TaskType.SEMANTIC_SEGMENTATION:
+                required_dim = 3
+            else:
+                required_dim = None
+            self._numpy_cache['predictions'] = sequence_to_numpy(self.original_predictions,
+                                                                 expected_ndim_per_object=required_dim)
+        return self._numpy_cache['predictions']
 
     @property
     def original_images(self):
@@ -133,7 +206,9 @@ class BatchWrapper:
     @property
     def numpy_images(self) -> List[Union[np.ndarray]]:
         """Return images for the batch in numpy format."""
-        return sequence_to_numpy(self.original_images, 'uint8', 3)
+        if 'images' not in self._numpy_cache:
+            self._numpy_cache['images'] = sequence_to_numpy(self.original_images, 'uint8', 3)
+        return self._numpy_cache['images']
 
     @property
     def original_embeddings(self):
@@ -145,7 +220,19 @@ class BatchWrapper:
     @property
     def numpy_embeddings(self) -> List[Union[np.ndarray]]:
         """Return embedding for the batch in numpy format."""
-        return sequence_to_numpy(self.original_embeddings, 'float32')
+        if 'embeddings' not in self._numpy_cache:
+            embeddings = sequence_to_numpy(self.original_embeddings, 'float32')
+            if self._properties_cache is not None:
+                keys = self._properties_cache.sample_keys(self.numpy_image_identifiers)
+                if embeddings is not None:
+                    self._properties_cache.update(EMBEDDINGS_ENTRY, keys, embeddings)
+                else:
+                    # embeddings which are not supplied by the batch are taken from the cache, if all are cached
+                    cached = self._properties_cache.get(EMBEDDINGS_ENTRY, keys)
+                    if cached and all(value is not MISSING for value in cached):
+                        embeddings = [np.asarray(value, dtype='float32') for value in cached]
+            self._numpy_cache['embeddings'] = embeddings
+        return self._numpy_cache['embeddings']
 
     @property
     def original_additional_data(self):
@@ -157,7 +244,9 @@ class BatchWrapper:
     @property
     def numpy_additional_data(self):
         """Return additional data for the batch in numpy format."""
-        return sequence_to_numpy(self.original_additional_data)
+        if 'additional_data' not in self._numpy_cache:
+            self._numpy_cache['additional_data'] = sequence_to_numpy(self.original_additional_data)
+        return self._numpy_cache['additional_data']
 
     @property
     def original_image_identifiers(self):
@@ -167,7 +256,14 @@ class BatchWrapper:
     @property
     def numpy_image_identifiers(self) -> List[Union[str, int]]:
         """Return image identifiers for the batch in numpy format."""
-        return sequence_to_numpy(self.original_image_identifiers, 'str', 0)
+        if 'image_identifiers' not in self._numpy_cache:
+            self._numpy_cache['image_identifiers'] = sequence_to_numpy(self.original_image_identifiers, 'str', 0)
+        return self._numpy_cache['image_identifiers']
+
+    def prefetch(self):
+        """Convert all the data of the batch to numpy in advance, e.g. in a background thread loading the batches."""
+        _ = (self.numpy_images, self.numpy_labels, self.numpy_predictions, self.numpy_embeddings,
+             self.numpy_additional_data, self.numpy_image_identifiers)
 
     def __len__(self):
         """Return length of batch."""
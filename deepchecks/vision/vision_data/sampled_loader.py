@@ -0,0 +1,107 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing a batch loader which reads a random or stratified sample of a map-style dataset."""
+import typing as t
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Protocol, runtime_checkable
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.vision.vision_data.utils import BatchOutputFormat
+
+__all__ = ['IndexedDataset', 'SampledBatchLoader']
+
+
+@runtime_checkable
+class IndexedDataset(Protocol):
+    """Protocol of a map-style dataset, which can read the samples of any given indices.
+
+    Implementing it allows deepchecks to read only the sampled images of the dataset, in a reproducible random (or
+    class-stratified) order, instead of iterating over a batch loader that must be shuffled beforehand.
+    """
+
+    def __len__(self) -> int:
+        """Return the number of samples in the dataset."""
+
+    def get_batch(self, indices: t.Sequence[int]) -> BatchOutputFormat:
+        """Return the batch of the samples of the given indices, in deepchecks BatchOutputFormat."""
+
+
+class SampledBatchLoader:
+    """Batch loader reading the samples of an indexed dataset in a random or class-stratified order.
+
+    Every prefix of the order is a random (or stratified) sample of the dataset, so checks which stop after n_samples
+    images read only these images. The order depends only on the random state, so runs are reproducible.
+
+    Parameters
+    ----------
+    dataset : IndexedDataset
+        The dataset to read the batches from.
+    batch_size : int , default: 64
+        Number of samples in each batch.
+    shuffle : bool , default: True
+        Whether to read the samples in a random order, or in the order of their indices.
+    stratify_by : Optional[Sequence] , default: None
+        The class of each sample of the dataset. If given, the samples are read in an order in which every prefix
+        contains the classes in the same proportions as the whole dataset.
+    random_state : int , default: 42
+        The seed of the random order.
+    """
+
+    def __init__(self,
+                 dataset: IndexedDataset,
+                 batch_size: int = 64,
+                 shuffle: bool = True,
+                 stratify_by: t.Optional[t.Sequence] = None,
+                 random_state: int = 42):
+        if not isinstance(dataset, IndexedDataset):
+            raise DeepchecksValueError('dataset must implement __len__ and get_batch(indices)')
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise DeepchecksValueError(f'batch_size must be a positive integer, but got: {batch_size}')
+        if stratify_by is not None and len(stratify_by) != len(dataset):
+            raise DeepchecksValueError(f'stratify_by must contain the class of each of the {len(dataset)} samples, '
+                                       f'but got {len(stratify_by)} values')
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.stratify_by = stratify_by
+        self.random_state = random_state
+        self.indices = self._sample_order()
+
+    def _sample_order(self) -> np.ndarray:
+        """Return the order of the indices to read."""
+        num_samples = len(self.dataset)
+        rng = np.random.default_rng(self.random_state)
+        order = rng.permutation(num_samples) if self.shuffle else np.arange(num_samples)
+        if self.stratify_by is None:
+            return order
+
+        classes, _ = pd.factorize(pd.Series(self.stratify_by).iloc[order])
+        classes[classes == -1] = classes.max() + 1  # null classes are a separate class
+        counts = np.bincount(classes)
+        # rank of each sample among the samples of its class, in the current order
+        by_class = np.argsort(classes, kind='stable')
+        ranks = np.empty(num_samples)
+        ranks[by_class] = np.arange(num_samples) - np.repeat(np.cumsum(counts) - counts, counts)
+        # the samples of each class are spread evenly over the order, so every prefix is stratified
+        positions = (ranks + 0.5) / counts[classes]
+        tie_breaker = rng.random(num_samples) if self.shuffle else np.arange(num_samples)
+        return order[np.lexsort((tie_breaker, positions))]
+
+    def __len__(self) -> int:
+        """Return the number of batches."""
+        return int(np.ceil(len(self.indices) / self.batch_size))
+
+    def __iter__(self) -> t.Iterator[BatchOutputFormat]:
+        """Read the batches of the dataset, one at a time."""
+        for start in range(0, len(self.indices), self.batch_size):
+            yield self.dataset.get_batch(self.indices[start:start + self.batch_size].tolist())
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the VisionData class and its functions."""
+import pathlib
 import sys
 import typing as t
 from collections import defaultdict
@@ -20,12 +21,14 @@ from deepchecks.core.serialization.html_display import HtmlDisplayableResult
 from deepchecks.utils.ipython import is_notebook, is_sphinx
 from deepchecks.vision.utils.detection_formatters import DEFAULT_PREDICTION_FORMAT
 from deepchecks.vision.utils.image_functions import draw_bboxes, draw_masks, prepare_thumbnail, random_color_dict
+from deepchecks.vision.utils.vision_properties_cache import VisionPropertiesCache
 from deepchecks.vision.vision_data import TaskType
 from deepchecks.vision.vision_data.batch_wrapper import BatchWrapper
 from deepchecks.vision.vision_data.format_validators import (validate_additional_data_format,
                                                              validate_embeddings_format,
                                                              validate_image_identifiers_format, validate_images_format,
                                                              validate_labels_format, validate_predictions_format)
+from deepchecks.vision.vision_data.sampled_loader import IndexedDataset, SampledBatchLoader
 from deepchecks.vision.vision_data.utils import (BatchOutputFormat, LabelMap, get_class_ids_from_numpy_labels,
                                                  get_class_ids_from_numpy_preds, shuffle_loader)
 
@@ -40,6 +43,9 @@ class VisionData:
     batch_loader :
         A batch_loader which load a batch of data in an iterative manner. Batch loader batch output must be a
         dictionary in BatchOutputFormat format. The batch loader must provide SHUFFLED batches.
+        Alternatively, a map-style dataset implementing the IndexedDataset protocol (``__len__`` and
+        ``get_batch(indices)``), which is read in a reproducible random order so that only the sampled images are
+        read. Use a SampledBatchLoader for a class-stratified order or a different batch size.
     task_type : str
         The task type of the data. can be one of the following: 'classification', 'semantic_segmentation',
         'object_detection', 'other'. For 'other', only image related checks (such as ImagePropertyOutliers) will be run.
@@ -49,6 +55,11 @@ class VisionData:
         Name of the dataset to use in the displays instead of "Train" or "Test".
     reshuffle_data: bool, default=True
         If True we will attempt to shuffle the batch loader. Only set this to False if the data is already shuffled.
+        A SampledBatchLoader is never reshuffled, as it already reads the samples in its own order.
+    properties_cache_dir: Union[str, pathlib.Path], optional
+        Directory of a persistent cache of the image, label and prediction properties and of the embeddings, keyed by
+        the image identifiers (which the batches must then contain). Repeated runs on the same images read the
+        properties from the cache instead of calculating them, so only new or changed samples are processed.
     """
 
     def __init__(
@@ -57,13 +68,18 @@ class VisionData:
             task_type: Literal['classification', 'object_detection', 'semantic_segmentation', 'other'],
             label_map: t.Optional[t.Dict[int, str]] = None,
             dataset_name: t.Optional[str] = None,
-            reshuffle_data: bool = True
+            reshuffle_data: bool = True,
+            properties_cache_dir: t.Optional[t.Union[str, pathlib.Path]] = None
     ):
+        if isinstance(batch_loader, IndexedDataset):
+            batch_loader = SampledBatchLoader(batch_loader, shuffle=reshuffle_data)
         if not hasattr(batch_loader, '__iter__'):
             # TODO: add link to documentation
             raise DeepchecksValueError(r'Batch loader must be an iterable which loads batches of data in deepcheck\'s'
                                        'required format, see link for additional information ')
-        self._batch_loader = shuffle_loader(batch_loader) if reshuffle_data else batch_loader
+        if reshuffle_data and not isinstance(batch_loader, SampledBatchLoader):
+            batch_loader = shuffle_loader(batch_loader)
+        self._batch_loader = batch_loader
 
         if task_type not in TaskType.values():
             raise ValueError(f'Invalid task type: {task_type}, must be one of the following: {TaskType.values()}')
@@ -80,6 +96,13 @@ class VisionData:
         self.validate()
         self.init_cache()
 
+        if properties_cache_dir is not None and not self._has_image_identifiers:
+            raise DeepchecksValueError('properties_cache_dir requires the batches to contain image_identifiers, '
+                                       'which the cached values are keyed by')
+        self.properties_cache_dir = properties_cache_dir
+        self.properties_cache = VisionPropertiesCache(properties_cache_dir) if properties_cache_dir is not None \
+            else None
+
     def init_cache(self):
         """Initialize the cache."""
         self._num_images_cached = 0
@@ -255,7 +278,8 @@ class VisionData:
         cls = type(self)
         batch_loader = batch_loader if batch_loader is not None else self._batch_loader
         return cls(batch_loader=batch_loader, task_type=self._task_type.value, label_map=self.label_map,
-                   dataset_name=self.name, reshuffle_data=reshuffle_data)
+                   dataset_name=self.name, reshuffle_data=reshuffle_data,
+                   properties_cache_dir=self.properties_cache_dir)
 
     def __iter__(self):
         """Return an iterator over the batch loader."""
@@ -290,7 +314,8 @@ class VisionData:
         headers_row = []
         rows = [[] for _ in range(num_images_to_display)]
         color_dict = None
-        batch = BatchWrapper(next(iter(self._batch_loader)), self.task_type, self.number_of_images_cached)
+        batch = BatchWrapper(next(iter(self._batch_loader)), self.task_type, self.number_of_images_cached,
+                             self.properties_cache)
 
         if self.task_type == TaskType.SEMANTIC_SEGMENTATION:
             # Creating a colors dict to be shared for all images
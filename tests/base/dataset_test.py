@@ -20,6 +20,7 @@ from sklearn.datasets import load_iris, make_classification
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.tabular.utils.validation import ensure_dataframe_type
+from deepchecks.utils.row_hashing import hash_rows
 
 
 def assert_dataset(dataset: Dataset, args):
@@ -1073,3 +1074,17 @@ def test_dataset_duplicate_column_names_validation(iris: pd.DataFrame):
         calling(Dataset).with_args(**args),
         raises(DeepchecksValueError, matching=has_string(validation_exception_message))
     )
+
+
+def test_row_hashes_of_sample_reuse_dataset_hashes(iris: pd.DataFrame):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    columns = dataset.features
+
+    # Act
+    sampled = dataset.sample(50, random_state=0).select(columns[:2])
+    sampled_hashes = sampled.row_hashes(columns[:2])
+
+    # Assert
+    assert_that(list(dataset._row_hashes), equal_to([tuple(columns[:2])]))
+    assert_that(sampled_hashes.tolist(), equal_to(hash_rows(sampled.data, columns[:2]).tolist()))
@@ -9,18 +9,24 @@
 # ----------------------------------------------------------------------------
 #
 """Test feature importance utils"""
+import time
+
+import numpy as np
 import pandas as pd
 import pytest
-from hamcrest import (any_of, assert_that, calling, close_to, contains_exactly, contains_string, equal_to, has_length,
-                      is_, none, not_none, raises)
+from hamcrest import (any_of, assert_that, calling, close_to, contains_exactly, contains_string, equal_to,
+                      greater_than_or_equal_to, has_length, is_, less_than, none, not_none, only_contains, raises)
 from sklearn.ensemble import AdaBoostClassifier
+from sklearn.inspection import permutation_importance
 from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.neural_network import MLPClassifier, MLPRegressor
 from sklearn.pipeline import Pipeline
 
 from deepchecks.core.errors import DeepchecksTimeoutError, DeepchecksValueError, ModelValidationError
 from deepchecks.tabular.dataset import Dataset
-from deepchecks.tabular.utils.feature_importance import (_calculate_feature_importance,
+from deepchecks.tabular.metric_utils.scorers import init_validate_scorers
+from deepchecks.tabular.utils.feature_importance import (_adaptive_permutation_importance,
+                                                         _calculate_feature_importance,
                                                          calculate_feature_importance_or_none,
                                                          column_importance_sorter_df, column_importance_sorter_dict,
                                                          validate_feature_importance)
@@ -291,4 +297,56 @@ def test_feature_importance_validation():
     with pytest.warns(UserWarning, match='feature_importance does not sum to 1. Normalizing to 1.'):
         normalized_feature_importance = validate_feature_importance(feature_importance * 2, features)
 
-    assert_that(normalized_feature_importance.sum(), close_to(1, 0.0001))
\ No newline at end of file
+    assert_that(normalized_feature_importance.sum(), close_to(1, 0.0001))
+
+
+def test_calculate_importance_without_early_stopping_same_as_sklearn(iris_labeled_dataset):
+    # Arrange
+    clf = MLPClassifier(hidden_layer_sizes=(10,), random_state=42)
+    clf.fit(iris_labeled_dataset.data[iris_labeled_dataset.features],
+            iris_labeled_dataset.data[iris_labeled_dataset.label_name])
+    scorer = init_validate_scorers({'Accuracy': 'accuracy'}, clf, iris_labeled_dataset, [0, 1, 2], [0, 1, 2])[0]
+
+    # Act
+    importances = _adaptive_permutation_importance(clf, iris_labeled_dataset.features_columns,
+                                                   iris_labeled_dataset.label_col, scorer.scorer, n_repeats=10,
+                                                   min_repeats=5, tolerance=0, random_state=42, n_jobs=2)
+    sklearn_result = permutation_importance(clf, iris_labeled_dataset.features_columns, iris_labeled_dataset.label_col,
+                                            n_repeats=10, random_state=42, scoring=scorer.scorer)
+
+    # Assert
+    assert_that(np.array_equal(np.array(importances), sklearn_result.importances), equal_to(True))
+
+
+def test_calculate_importance_stops_converged_features(iris_labeled_dataset):
+    # Arrange
+    clf = MLPClassifier(hidden_layer_sizes=(10,), random_state=42)
+    clf.fit(iris_labeled_dataset.data[iris_labeled_dataset.features],
+            iris_labeled_dataset.data[iris_labeled_dataset.label_name])
+    scorer = init_validate_scorers({'Accuracy': 'accuracy'}, clf, iris_labeled_dataset, [0, 1, 2], [0, 1, 2])[0]
+
+    # Act
+    importances = _adaptive_permutation_importance(clf, iris_labeled_dataset.features_columns,
+                                                   iris_labeled_dataset.label_col, scorer.scorer, n_repeats=30,
+                                                   min_repeats=5, tolerance=0.05, random_state=42, n_jobs=1)
+
+    # Assert
+    assert_that([len(values) for values in importances], only_contains(greater_than_or_equal_to(5)))
+    assert_that(min(len(values) for values in importances), less_than(30))
+
+
+def test_calculate_importance_returns_partial_results_on_timeout(iris_labeled_dataset):
+    # Arrange
+    clf = MLPClassifier(hidden_layer_sizes=(10,), random_state=42)
+    clf.fit(iris_labeled_dataset.data[iris_labeled_dataset.features],
+            iris_labeled_dataset.data[iris_labeled_dataset.label_name])
+    scorer = init_validate_scorers({'Accuracy': 'accuracy'}, clf, iris_labeled_dataset, [0, 1, 2], [0, 1, 2])[0]
+
+    # Act
+    importances = _adaptive_permutation_importance(clf, iris_labeled_dataset.features_columns,
+                                                   iris_labeled_dataset.label_col, scorer.scorer, n_repeats=30,
+                                                   min_repeats=5, tolerance=0, random_state=42, n_jobs=1,
+                                                   deadline=time.time())
+
+    # Assert
+    assert_that(importances, only_contains(has_length(0)))
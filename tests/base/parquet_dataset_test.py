@@ -0,0 +1,178 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Contains unit tests for the ParquetDataset class."""
+import numpy as np
+import pandas as pd
+import pytest
+from hamcrest import assert_that, calling, equal_to, has_length, instance_of, is_, raises
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular import Context, Dataset
+from deepchecks.tabular.checks import IsSingleValue, MixedDataTypes, MixedNulls, PercentOfNulls
+from deepchecks.tabular.parquet_dataset import ParquetDataset
+from deepchecks.tabular.utils.validation import validate_model
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def parquet_df():
+    rng = np.random.default_rng(0)
+    n_rows = 1000
+    return pd.DataFrame({
+        'numeric': rng.normal(size=n_rows),
+        'with_nulls': np.where(rng.random(n_rows) < 0.1, np.nan, rng.random(n_rows)),
+        'mixed_nulls': rng.choice(['a', 'b', 'null', None], n_rows),
+        'mixed_types': rng.choice(['1', '2.5', 'x', 'y'], n_rows, p=[0.45, 0.45, 0.05, 0.05]),
+        'single': 'value',
+        'category': rng.choice(['u', 'v', 'w'], n_rows),
+        'label': rng.integers(0, 2, n_rows),
+    })
+
+
+@pytest.fixture
+def parquet_path(parquet_df, tmp_path):
+    path = tmp_path / 'data.parquet'
+    parquet_df.to_parquet(path, row_group_size=300)
+    return path
+
+
+def test_metadata_is_inferred_from_source(parquet_df, parquet_path):
+    # Act
+    dataset = ParquetDataset(parquet_path, label='label', cat_features=['category', 'single'], chunk_size=128)
+    # Assert
+    assert_that(dataset.is_streaming, is_(True))
+    assert_that(len(dataset), equal_to(len(parquet_df)))
+    assert_that(dataset.label_name, equal_to('label'))
+    assert_that(dataset.features, equal_to(list(parquet_df.columns[:-1])))
+    assert_that(dataset.cat_features, equal_to(['category', 'single']))
+    assert_that(dataset.label_col.tolist(), equal_to(parquet_df['label'].tolist()))
+    assert_that(dataset.data.equals(parquet_df), is_(True))
+
+
+def test_iter_chunks_reads_requested_columns_in_chunks(parquet_df, parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label', chunk_size=128)
+    # Act
+    chunks = list(dataset.iter_chunks(['numeric', 'single']))
+    # Assert
+    assert_that(max(len(chunk) for chunk in chunks), equal_to(128))
+    assert_that(pd.concat(chunks).equals(parquet_df[['numeric', 'single']]), is_(True))
+
+
+def test_iter_chunks_sampled_rows_same_as_sample(parquet_df, parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label', chunk_size=128)
+    # Act
+    chunks = list(dataset.iter_chunks(n_samples=100, random_state=42))
+    sample = dataset.sample(100, random_state=42)
+    # Assert
+    assert_that(sample, instance_of(Dataset))
+    assert_that(sample.is_streaming, is_(False))
+    assert_that(sample.data, has_length(100))
+    assert_that(pd.concat(chunks).equals(sample.data), is_(True))
+    assert_that(sample.data.equals(parquet_df.loc[sample.data.index]), is_(True))
+
+
+def test_select_does_not_materialize(parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label')
+    # Act
+    selected = dataset.select(['numeric', 'category'], keep_label=True)
+    # Assert
+    assert_that(selected, instance_of(ParquetDataset))
+    assert_that(selected.features, equal_to(['numeric', 'category']))
+    assert_that(selected.label_name, equal_to('label'))
+    assert_that(list(next(selected.iter_chunks()).columns), equal_to(['numeric', 'category', 'label']))
+
+
+def test_context_does_not_materialize(parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label')
+    # Act
+    context = Context(dataset)
+    # Assert
+    assert_that(context.train, instance_of(ParquetDataset))
+    assert_that(context.train is dataset, is_(False))
+
+
+def test_validate_model_does_not_materialize(parquet_path, monkeypatch):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label', chunk_size=128)
+    predicted_columns = []
+
+    class Model:
+        def predict(self, data):
+            predicted_columns.append(list(data.columns))
+            return np.zeros(len(data))
+
+    def read_all(self):
+        raise AssertionError('the whole source was read')
+
+    monkeypatch.setattr(ParquetDataset, 'data', property(read_all))
+    # Act
+    validate_model(dataset, Model())
+    # Assert
+    assert_that(predicted_columns, equal_to([dataset.features]))
+
+
+def test_invalid_chunk_size(parquet_path):
+    assert_that(calling(ParquetDataset).with_args(parquet_path, chunk_size=0),
+                raises(DeepchecksValueError, 'chunk_size must be a positive integer, but got: 0'))
+
+
+@pytest.mark.parametrize('check', [
+    MixedNulls(n_samples=None),
+    MixedDataTypes(n_samples=None),
+    PercentOfNulls(n_samples=None),
+])
+def test_streaming_check_same_as_in_memory(check, parquet_df, parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label', chunk_size=128)
+    in_memory_dataset = Dataset(parquet_df, label='label', cat_features=dataset.cat_features)
+    # Act
+    streamed_result = check.run(dataset, with_display=False)
+    in_memory_result = check.run(in_memory_dataset, with_display=False)
+    # Assert
+    if isinstance(in_memory_result.value, pd.DataFrame):
+        assert_that(streamed_result.value.equals(in_memory_result.value), is_(True))
+    elif isinstance(in_memory_result.value.get('feature_importance'), pd.Series):
+        assert_that(streamed_result.value['columns'], equal_to(in_memory_result.value['columns']))
+        assert_that(streamed_result.value['n_samples'], equal_to(in_memory_result.value['n_samples']))
+    else:
+        assert_that(streamed_result.value, equal_to(in_memory_result.value))
+
+
+def test_streaming_single_value_same_as_in_memory(parquet_df, parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label', chunk_size=128)
+    in_memory_dataset = Dataset(parquet_df, label='label', cat_features=dataset.cat_features)
+    check = IsSingleValue(n_samples=None, ignore_nan=False)
+    # Act
+    streamed_result = check.run(dataset)
+    in_memory_result = check.run(in_memory_dataset)
+    # Assert
+    single_columns = [column for column, n_unique in in_memory_result.value.items() if n_unique == 1]
+    assert_that(single_columns, equal_to(['single']))
+    assert_that([column for column, n_unique in streamed_result.value.items() if n_unique == 1],
+                equal_to(single_columns))
+    assert_that(streamed_result.value, equal_to({column: min(n_unique, 2)
+                                                 for column, n_unique in in_memory_result.value.items()}))
+    assert_that(streamed_result.display[1].equals(in_memory_result.display[1]), is_(True))
+
+
+def test_empty_sample(parquet_path):
+    # Arrange
+    dataset = ParquetDataset(parquet_path, label='label', chunk_size=128)
+    # Act & Assert
+    assert_that(list(dataset.iter_chunks(n_samples=0)), equal_to([]))
+    assert_that(calling(PercentOfNulls(n_samples=0).run).with_args(dataset),
+                raises(DeepchecksValueError, 'Dataset does not contain any samples'))
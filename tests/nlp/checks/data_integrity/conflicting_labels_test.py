@@ -15,8 +15,11 @@ import pandas as pd
 import pytest
 from hamcrest import *
 
-from deepchecks.nlp.checks import ConflictingLabels
+from deepchecks.core import CheckResult
+from deepchecks.nlp import Suite, text_data
+from deepchecks.nlp.checks import ConflictingLabels, TextDuplicates
 from deepchecks.nlp.text_data import TextData
+from deepchecks.nlp.utils import text as text_utils
 from deepchecks.utils.strings import format_percent
 from tests.base.utils import equal_condition_result
 
@@ -299,3 +302,59 @@ def test_inspect_long_samples():
         "percent_of_conflicting_samples": close_to(0.66, 0.01),
         "conflicting_samples": instance_of(pd.DataFrame),
     }))
+
+
+def test_calculated_text_hashes_are_reused(dataset_without_conflicts, monkeypatch):
+    # Arrange
+    dataset_without_conflicts.get_normalized_text_hashes()
+
+    def fail_normalize(*args, **kwargs):
+        raise AssertionError('the texts were normalized again')
+
+    monkeypatch.setattr(text_data, 'normalize_samples', fail_normalize)
+    monkeypatch.setattr(text_utils, 'normalize_samples', fail_normalize)
+
+    # Act
+    result = ConflictingLabels().run(dataset=dataset_without_conflicts)
+
+    # Assert
+    assert_that(result.value['percent_of_conflicting_samples'], equal_to(0))
+
+
+@pytest.mark.parametrize('check', [ConflictingLabels(n_samples=4), TextDuplicates(n_samples=4)])
+def test_only_sampled_texts_are_normalized(check, dataset_without_conflicts, monkeypatch):
+    # Arrange
+    normalized_texts_counts = []
+
+    def count_normalize(texts, *args):
+        normalized_texts_counts.append(len(texts))
+        return normalize_texts(texts, *args)
+
+    normalize_texts = text_utils._normalize_texts
+    monkeypatch.setattr(text_utils, '_normalize_texts', count_normalize)
+
+    # Act
+    check.run(dataset=dataset_without_conflicts)
+
+    # Assert
+    assert_that(max(normalized_texts_counts), less_than_or_equal_to(4))
+
+
+def test_texts_are_normalized_once_in_suite(dataset_without_conflicts, monkeypatch):
+    # Arrange
+    normalized_texts_counts = []
+
+    def count_normalize(texts, *args):
+        normalized_texts_counts.append(len(texts))
+        return normalize_texts(texts, *args)
+
+    normalize_texts = text_utils._normalize_texts
+    monkeypatch.setattr(text_utils, '_normalize_texts', count_normalize)
+    suite = Suite('test suite', TextDuplicates(), ConflictingLabels())
+
+    # Act
+    result = suite.run(train_dataset=dataset_without_conflicts)
+
+    # Assert
+    assert_that([r for r in result.results if isinstance(r, CheckResult)], has_length(2))
+    assert_that(normalized_texts_counts, has_length(1))
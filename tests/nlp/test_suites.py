@@ -9,6 +9,10 @@
 # ----------------------------------------------------------------------------
 #
 """Test for the default suites"""
+from hamcrest import assert_that, contains_exactly
+
+from deepchecks.nlp import Suite
+from deepchecks.nlp.checks import ConflictingLabels, SpecialCharacters, TextDuplicates
 from deepchecks.nlp.suites import full_suite, model_evaluation
 from tests.common import get_expected_results_length, validate_suite_result
 
@@ -51,3 +55,18 @@ def test_model_eval_suite_with_model_classes_argument(tweet_emotion_train_test_t
     # Assert
     length = get_expected_results_length(suite, kwargs)
     validate_suite_result(result, length)
+
+
+def test_suite_concurrent_run(text_classification_dataset_mock):
+    # Arrange
+    kwargs = dict(train_dataset=text_classification_dataset_mock)
+    suite = Suite('Test Suite', TextDuplicates(), ConflictingLabels(), SpecialCharacters())
+
+    # Act
+    sequential_result = suite.run(**kwargs)
+    concurrent_result = suite.run(**kwargs, n_jobs=2)
+
+    # Assert
+    validate_suite_result(concurrent_result, get_expected_results_length(suite, kwargs))
+    assert_that([r.get_header() for r in concurrent_result.results],
+                contains_exactly(*[r.get_header() for r in sequential_result.results]))
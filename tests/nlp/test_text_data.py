@@ -167,6 +167,22 @@ def test_head_functionality():
     assert_that(list(result.index), contains_exactly(0, 1))
 
 
+def test_text_hashes():
+    dataset = TextData(['Hello, World!', 'hello world', 'Hello, World!', 'other'])
+
+    hashes = dataset.text_hashes
+    normalized_hashes = dataset.get_normalized_text_hashes(remove_stops=False)
+    copied = dataset.copy(rows_to_use=[3, 1])
+
+    assert_that(hashes[0], equal_to(hashes[2]))
+    assert_that(hashes[0] == hashes[1], equal_to(False))
+    assert_that(len(set(normalized_hashes[:3])), equal_to(1))
+    assert_that(dataset.text_hashes is hashes, equal_to(True))
+    assert_that(copied.text_hashes.tolist(), equal_to(hashes[[1, 3]].tolist()))
+    assert_that(copied.get_normalized_text_hashes(remove_stops=False).tolist(),
+                equal_to(normalized_hashes[[1, 3]].tolist()))
+
+
 def test_label_for_display():
     # Arrange
     text = ['a', 'b b b', 'c c c c']
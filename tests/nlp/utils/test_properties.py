@@ -19,9 +19,12 @@ import pytest
 from hamcrest import *
 
 from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.nlp.utils import text_properties_models
 from deepchecks.nlp.utils.text_properties import (TOXICITY_MODEL_NAME_ONNX, _sample_for_property,
                                                   calculate_builtin_properties, english_text)
-from deepchecks.nlp.utils.text_properties_models import MODELS_STORAGE, _get_transformer_model_and_tokenizer
+from deepchecks.nlp.utils.text_properties_cache import MISSING, PropertiesCache
+from deepchecks.nlp.utils.text_properties_models import (MODELS_STORAGE, _get_transformer_model_and_tokenizer,
+                                                         download_fasttext_model)
 
 
 def mock_fn(*args, **kwargs):  # pylint: disable=unused-argument
@@ -570,3 +573,88 @@ def test_sample_for_property():
 
     assert_that(sample_words, equal_to('hands put'))
     assert_that(sample_sentences, equal_to('all the single ladies. all the single ladies?'))
+
+
+def test_properties_cache(tmp_path):
+    # Arrange
+    cache = PropertiesCache(models_storage=tmp_path)
+    # Act
+    cache.update('Text Length', 'v1', ['a', 'bb', 'ccc'], [1, 2, 3])
+    cache.update('Language', 'v1', ['a', 'bb', 'ccc'], ['en', None, 'uk'], categorical=True)
+    cached_length = cache.get('Text Length', 'v1', ['bb', 'dddd', None, 'a'])
+    cached_language = PropertiesCache(models_storage=tmp_path).get('Language', 'v1', ['ccc', 'bb', 'a'])
+    other_version_length = cache.get('Text Length', 'v2', ['a'])
+    # Assert
+    assert_that(cached_length, contains_exactly(2, MISSING, MISSING, 1))
+    assert_that(cached_language, contains_exactly('uk', None, 'en'))
+    assert_that(other_version_length, contains_exactly(MISSING))
+    assert_that(cache.hit_rates(), has_entries({'Text Length': close_to(2 / 4, 0.001)}))
+
+
+def test_calculate_properties_with_cache(tmp_path):
+    # Arrange
+    text = ['This is simple sentence.', 'Another sentence here!', None]
+    include_properties = ['Text Length', '% Punctuation', 'Language']
+
+    # Act
+    properties = calculate_builtin_properties(text, include_properties=include_properties,
+                                              models_storage=tmp_path, cache_properties=True)[0]
+    cached_properties = calculate_builtin_properties(text + ['New text'], include_properties=include_properties,
+                                                     models_storage=tmp_path, cache_properties=True)[0]
+
+    # Assert
+    assert_that(properties['Text Length'][:2], contains_exactly(24, 22))
+    assert_that(properties['Language'][:2], contains_exactly('en', 'en'))
+    assert_that(cached_properties['Text Length'][:2], contains_exactly(24, 22))
+    assert_that(cached_properties['Text Length'][3], equal_to(8))
+    assert_that(cached_properties['% Punctuation'][:2], equal_to(properties['% Punctuation'][:2]))
+    assert_that(np.isnan(cached_properties['Text Length'][2]), equal_to(True))
+
+
+def test_calculate_properties_with_n_jobs():
+    # Arrange
+    text = ['This is simple sentence.', 'Another sentence here!', 'Сьогодні чудова погода', 'Short'] * 5
+    include_properties = ['Text Length', '% Punctuation', 'Language', 'Sentiment']
+
+    # Act
+    properties, properties_types = calculate_builtin_properties(text, include_properties=include_properties)
+    parallel_properties, parallel_properties_types = calculate_builtin_properties(
+        text, include_properties=include_properties, n_jobs=2)
+
+    # Assert
+    assert_that(list(parallel_properties.keys()), equal_to(list(properties.keys())))
+    assert_that(parallel_properties['Text Length'], equal_to(properties['Text Length']))
+    assert_that(parallel_properties['Language'], equal_to(properties['Language']))
+    assert_that(np.array_equal(parallel_properties['Sentiment'], properties['Sentiment'], equal_nan=True),
+                equal_to(True))
+    assert_that(parallel_properties_types, equal_to(properties_types))
+
+
+def test_calculate_properties_with_invalid_n_jobs():
+    assert_that(calling(calculate_builtin_properties).with_args(['text'], n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: 0'))
+
+
+def test_download_fasttext_model_once(tmp_path, monkeypatch):
+    # Arrange
+    requests_count = []
+
+    class Response:
+        status_code = 200
+        content = b'model'
+
+    def get(*args, **kwargs):  # pylint: disable=unused-argument
+        requests_count.append(1)
+        return Response()
+
+    monkeypatch.setattr(text_properties_models.requests, 'get', get)
+    (tmp_path / 'storage' / 'fasttext').mkdir(parents=True)
+
+    # Act
+    paths = [download_fasttext_model(tmp_path / 'storage') for _ in range(2)]
+
+    # Assert
+    assert_that(paths[0], equal_to(paths[1]))
+    assert_that(paths[0].read_bytes(), equal_to(b'model'))
+    assert_that(len(requests_count), equal_to(1))
+    assert_that(os.listdir(paths[0].parent), equal_to([paths[0].name]))
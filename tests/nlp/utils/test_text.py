@@ -0,0 +1,37 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test for the text utils module"""
+import numpy as np
+from hamcrest import assert_that, equal_to
+
+from deepchecks.nlp.utils.text import hash_samples, hash_text, normalize_samples, normalize_text
+
+
+def test_normalize_samples_same_as_normalize_text():
+    samples = ['Hello, World!', 'hello world', 'Ｃａｆｅ  ﬁne', 'Hello, World!', '']
+    for kwargs in [{'remove_stops': False}, {'remove_stops': False, 'ignore_whitespace': True},
+                   {'ignore_case': False, 'remove_punct': False, 'normalize_uni': False, 'remove_stops': False}]:
+        assert_that(normalize_samples(samples, **kwargs),
+                    equal_to([normalize_text(sample, **kwargs) for sample in samples]))
+
+    assert_that(normalize_samples(samples, remove_stops=False),
+                equal_to(['hello world', 'hello world', 'cafe  fine', 'hello world', '']))
+
+
+def test_hash_samples_are_stable():
+    samples = ['hello world', 'Hello world', 'hello world', '\ud800']
+    hashes = hash_samples(samples)
+    assert_that(hashes.dtype, equal_to(np.uint64))
+    assert_that(hashes.tolist(), equal_to([hash_text(text) for text in samples]))
+    assert_that(hashes[0], equal_to(hashes[2]))
+    assert_that(hashes[0] == hashes[1], equal_to(False))
+    # the hashes don't depend on the process, unlike the builtin hash
+    assert_that(hash_text('hello world'), equal_to(5814608031911216775))
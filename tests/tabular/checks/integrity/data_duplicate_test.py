@@ -41,6 +41,13 @@ def test_data_duplicates_categorical_dtypes():
     assert_that(check_obj.run(duplicate_data).value, close_to(0.0, 0.001))
 
 
+def test_data_duplicates_large_integer_ids():
+    # ids above 2 ** 53 are not exactly representable as floats, but are all different
+    data = pd.DataFrame({'id': [2 ** 53, 2 ** 53 + 1, 2 ** 53 + 2, 2 ** 53 + 3], 'x': 1})
+    check_obj = DataDuplicates()
+    assert_that(check_obj.run(data).value, equal_to(0))
+
+
 def test_data_duplicates_columns():
     duplicate_data = pd.DataFrame({'col1': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
                                    'col2': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
@@ -146,3 +153,12 @@ def test_condition():
         equal_condition_result(is_pass=True,
                                details='Found 0% duplicate data',
                                name='Duplicate data ratio is less or equal to 0%')))
+
+
+def test_data_duplicates_instances_of_rows_with_nulls():
+    duplicate_data = pd.DataFrame({'col1': [1, None, 1, None, 2],
+                                   'col2': ['a', None, 'a', None, 'a']})
+    result = DataDuplicates().run(duplicate_data)
+    assert_that(result.value, close_to(0.4, 0.01))
+    instances = result.display[2].index.get_level_values('Instances')
+    assert_that(sorted(sorted(text.split(', ')) for text in instances), equal_to([['0', '2'], ['1', '3']]))
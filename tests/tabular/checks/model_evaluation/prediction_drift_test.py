@@ -15,6 +15,7 @@ from hamcrest import assert_that, calling, close_to, equal_to, greater_than, has
 from deepchecks.core.errors import DeepchecksValueError, NotEnoughSamplesError
 from deepchecks.tabular import Dataset
 from deepchecks.tabular.checks import PredictionDrift
+from deepchecks.tabular.utils.drift_profile import create_drift_profile
 from tests.base.utils import equal_condition_result
 
 
@@ -318,3 +319,20 @@ def test_multiclass_proba_reduce_aggregations(iris_split_dataset_and_model_rf):
         details='Found 2 classes with model predicted probability Earth Mover\'s '
                 'Distance drift score above threshold: 0.05.'
     ))
+
+
+def test_drift_with_train_profile_same_as_with_train_dataset(drifted_data_and_model, diabetes, diabetes_model):
+    diabetes_train, diabetes_test = diabetes
+    drifted_train, drifted_test, drifted_model = drifted_data_and_model
+    for train, test, model, drift_mode in ((drifted_train, drifted_test, drifted_model, 'proba'),
+                                           (drifted_train, drifted_test, drifted_model, 'prediction'),
+                                           (diabetes_train, diabetes_test, diabetes_model, 'auto')):
+        # Arrange
+        profile = create_drift_profile(train, model)
+        # Act
+        result = PredictionDrift(drift_mode=drift_mode).run(train, test, model)
+        profile_result = PredictionDrift(drift_mode=drift_mode, train_profile=profile).run(train, test, model)
+        # Assert
+        assert_that(profile_result.value['Drift score'], close_to(result.value['Drift score'], 0.01))
+        assert_that(profile_result.value['Method'], equal_to(result.value['Method']))
+        assert_that(profile_result.value['Samples per class'], equal_to(result.value['Samples per class']))
@@ -16,6 +16,7 @@ from hamcrest import (assert_that, calling, close_to, equal_to, greater_than, ha
 
 from deepchecks.core.errors import NotEnoughSamplesError
 from deepchecks.tabular.checks import FeatureDrift
+from deepchecks.tabular.utils.drift_profile import create_drift_profile
 from tests.base.utils import equal_condition_result
 
 
@@ -490,3 +491,22 @@ def test_drift_max_drift_score_multi_columns_drift_pass(drifted_data_and_model):
                 'Found column "numeric_with_drift" has the highest numerical drift score: 0.34',
         name='categorical drift score < 0.2 and numerical drift score < 0.2'
     ))
+
+
+def test_drift_with_train_profile_same_as_with_train_dataset(drifted_data_and_model):
+    # Arrange
+    train, test, model = drifted_data_and_model
+    profile = create_drift_profile(train)
+    check = FeatureDrift(categorical_drift_method='PSI', numerical_drift_method='EMD')
+    profile_check = FeatureDrift(categorical_drift_method='PSI', numerical_drift_method='EMD', train_profile=profile)
+
+    # Act
+    result = check.run(train, test, model)
+    profile_result = profile_check.run(train, test, model)
+
+    # Assert
+    assert_that(profile_result.value.keys(), equal_to(result.value.keys()))
+    for column, info in result.value.items():
+        assert_that(profile_result.value[column]['Drift score'], close_to(info['Drift score'], 0.01))
+        assert_that(profile_result.value[column]['Method'], equal_to(info['Method']))
+    assert_that(profile_result.display, has_length(len(result.display)))
@@ -351,3 +351,51 @@ def test_dataset_name(drifted_data_and_model):
 
     assert_that(result.display[0].data[0].name, 'First')
     assert_that(result.display[0].data[1].name, 'Second')
+
+
+def test_feature_label_correlation_in_parallel():
+    df, expected = util_generate_dataframe_and_expected()
+    dataset = Dataset(df, label='label')
+
+    result = FeatureLabelCorrelation(n_samples=None, random_state=42).run(dataset)
+    parallel_result = FeatureLabelCorrelation(n_samples=None, random_state=42, n_jobs=2).run(dataset)
+
+    assert_that(parallel_result.value, equal_to(result.value))
+    assert_that(parallel_result.value, has_entries(expected))
+
+
+def test_invalid_n_jobs():
+    assert_that(calling(FeatureLabelCorrelation).with_args(n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: 0'))
+    assert_that(calling(FeatureLabelCorrelationChange).with_args(n_jobs='all'),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: all'))
+
+
+def test_trainval_train_pps_cached_when_only_test_changes():
+    df, df2, expected = util_generate_second_similar_dataframe_and_expected()
+    check = FeatureLabelCorrelationChange(n_samples=None, random_state=42)
+
+    check.run(train_dataset=Dataset(df, label='label'), test_dataset=Dataset(df, label='label'))
+    # the scores of the train dataset were calculated (and cached) once, for the two identical datasets
+    assert_that(check._pps_cache, has_length(5))
+
+    result = check.run(train_dataset=Dataset(df, label='label'), test_dataset=Dataset(df2, label='label'))
+    # x2 of the new test dataset has the same values as x4, so only x2 and x3 were calculated
+    assert_that(check._pps_cache, has_length(7))
+    assert_that(result.value['train-test difference'], has_entries(expected))
+
+
+def test_trainval_pps_cache_is_bounded():
+    df, df2, _ = util_generate_second_similar_dataframe_and_expected()
+    check = FeatureLabelCorrelationChange(n_samples=None, random_state=42)
+    check._pps_cache.max_size = 6
+
+    check.run(train_dataset=Dataset(df, label='label'), test_dataset=Dataset(df, label='label'))
+    check.run(train_dataset=Dataset(df, label='label'), test_dataset=Dataset(df2, label='label'))
+    cached_result = check.run(train_dataset=Dataset(df, label='label'), test_dataset=Dataset(df2, label='label'))
+
+    # the cache keeps only the most recently used scores
+    assert_that(check._pps_cache, has_length(6))
+    result = FeatureLabelCorrelationChange(n_samples=None, random_state=42).run(
+        train_dataset=Dataset(df, label='label'), test_dataset=Dataset(df2, label='label'))
+    assert_that(cached_result.value, equal_to(result.value))
@@ -14,9 +14,10 @@ import pandas as pd
 from hamcrest import assert_that, calling, close_to, equal_to, greater_than, has_entries, has_length, raises
 
 from deepchecks.core.condition import ConditionCategory
-from deepchecks.core.errors import NotEnoughSamplesError
+from deepchecks.core.errors import DeepchecksValueError, NotEnoughSamplesError
 from deepchecks.tabular import Dataset
 from deepchecks.tabular.checks import LabelDrift
+from deepchecks.tabular.utils.drift_profile import create_drift_profile
 from tests.base.utils import equal_condition_result
 
 
@@ -205,3 +206,24 @@ def test_drift_max_drift_score_condition_pass_threshold(non_drifted_classificati
         details='Label\'s drift score PSI is 3.37E-3',
         name='Label drift score < 1'
     ))
+
+
+def test_drift_with_train_profile_same_as_with_train_dataset(drifted_classification_label, drifted_regression_label):
+    for train, test in (drifted_classification_label, drifted_regression_label):
+        # Arrange
+        profile = create_drift_profile(train)
+        # Act
+        result = LabelDrift().run(train, test)
+        profile_result = LabelDrift(train_profile=profile).run(train, test)
+        # Assert
+        assert_that(profile_result.value['Drift score'], close_to(result.value['Drift score'], 0.01))
+        assert_that(profile_result.value['Method'], equal_to(result.value['Method']))
+
+
+def test_train_profile_without_label(drifted_classification_label):
+    # Arrange
+    train, test = drifted_classification_label
+    profile = create_drift_profile(Dataset(train.data.drop(columns=train.label_name), cat_features=train.cat_features))
+    # Act & Assert
+    assert_that(calling(LabelDrift(train_profile=profile).run).with_args(train, test),
+                raises(DeepchecksValueError, 'The train profile does not contain the label distribution'))
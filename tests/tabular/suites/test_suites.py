@@ -11,19 +11,23 @@
 """builtin suites tests"""
 
 # pylint: disable=redefined-outer-name
+import json
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 import pandas as pd
 import pytest
 from catboost import CatBoostClassifier, CatBoostRegressor
-from hamcrest import assert_that, contains_exactly, has_length
+from hamcrest import assert_that, calling, contains_exactly, equal_to, has_entries, has_length, instance_of, raises
 from lightgbm import LGBMClassifier, LGBMRegressor
 from sklearn.ensemble import AdaBoostClassifier
 from sklearn.model_selection import train_test_split
 from xgboost import XGBClassifier, XGBRegressor
 
-from deepchecks.tabular import Dataset, suites
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.tabular import Dataset, Suite, suites
+from deepchecks.tabular.checks import ConfusionMatrixReport, IsSingleValue, RocReport
 from tests.common import get_expected_results_length, validate_suite_result
 
 
@@ -229,3 +233,46 @@ def test_production_suite(iris):
     train, test, model = iris
     result = suite.run(train, test, model)
     assert_that(result.results, has_length(16))
+
+
+def test_suite_concurrent_run_same_as_sequential(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    suite = suites.model_evaluation()
+    sequential_result = suite.run(train, test, model, with_display=False)
+    concurrent_result = suite.run(train, test, model, with_display=False, n_jobs=2)
+    # the results are sorted by their conditions, which may depend on timing (e.g. Model Inference Time)
+    assert_that({r.get_header(): type(r) for r in concurrent_result.results},
+                equal_to({r.get_header(): type(r) for r in sequential_result.results}))
+    assert_that(concurrent_result.results, has_length(len(sequential_result.results)))
+
+
+def test_suite_run_with_process_pool_executor(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    suite = suites.data_integrity()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = suite.run(train, test, model, executor=executor)
+    length = get_expected_results_length(suite, dict(train_dataset=train, test_dataset=test, model=model))
+    validate_suite_result(result, length)
+
+
+def test_suite_run_with_invalid_n_jobs(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    assert_that(calling(suites.data_integrity().run).with_args(train, test, model, n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: 0'))
+
+
+def test_suite_run_profile(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    suite = Suite('Test Suite', ConfusionMatrixReport(), RocReport(), IsSingleValue())
+    result = suite.run(train, test, model)
+
+    profile = result.get_run_profile()
+    assert_that(profile.columns, contains_exactly('Check', 'Wall Time', 'CPU Time', 'Prediction Cache Misses'))
+    assert_that(sorted(profile['Check']), contains_exactly('Confusion Matrix Report', 'Is Single Value',
+                                                           'Roc Report'))
+    assert_that(profile.set_index('Check')['Prediction Cache Misses'].to_dict(),
+                has_entries({'Is Single Value': 0, 'Roc Report': 2}))
+    json_profile = json.loads(result.run_profile_to_json())
+    assert_that(json_profile, has_length(3))
+    assert_that(json_profile[0], has_entries({'prediction_cache_misses': instance_of(int),
+                                              'process_peak_rss_mb': instance_of(float)}))
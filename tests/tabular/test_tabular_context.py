@@ -8,6 +8,10 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from hamcrest import assert_that, equal_to, has_entries, none
 
 from deepchecks.tabular import Context
 
@@ -20,3 +24,85 @@ def test_task_type_same_with_model_or_y_pred(diabetes_split_dataset_and_model):
     ctx2 = Context(train, y_pred_train=model.predict(train.features_columns))
     # Assert
     assert ctx1.task_type == ctx2.task_type
+
+
+def test_model_predictions_are_cached(iris_split_dataset_and_model):
+    # Arrange
+    _, test, model = iris_split_dataset_and_model
+    ctx = Context(test, model=model)
+    sampled_test = test.sample(20, random_state=0)
+    # Act
+    full_pred = ctx.model.predict(test.features_columns)
+    sample_pred = ctx.model.predict(sampled_test.features_columns)
+    sample_proba = ctx.model.predict_proba(sampled_test.features_columns)
+    # Assert
+    assert_that(full_pred.tolist(), equal_to(model.predict(test.features_columns).tolist()))
+    assert_that(sample_pred.tolist(), equal_to(model.predict(sampled_test.features_columns).tolist()))
+    assert_that(sample_proba.tolist(), equal_to(model.predict_proba(sampled_test.features_columns).tolist()))
+    assert_that(ctx.prediction_cache_info, has_entries({'hits': 1, 'misses': 2}))
+    assert_that(ctx.raw_model, equal_to(model))
+
+
+def test_model_predictions_cache_skips_modified_data(iris_split_dataset_and_model):
+    # Arrange
+    _, test, model = iris_split_dataset_and_model
+    ctx = Context(test, model=model)
+    modified_features = test.features_columns.copy()
+    modified_features.iloc[:, 0] = 0
+    # Act
+    ctx.model.predict(test.features_columns)
+    modified_pred = ctx.model.predict(modified_features)
+    # Assert
+    assert_that(modified_pred.tolist(), equal_to(model.predict(modified_features).tolist()))
+    assert_that(ctx.prediction_cache_info, has_entries({'hits': 0, 'misses': 2}))
+
+
+def test_no_prediction_cache_without_model(iris_split_dataset_and_model):
+    # Arrange
+    train, test, model = iris_split_dataset_and_model
+    # Act
+    ctx = Context(train, test, y_pred_train=model.predict(train.features_columns),
+                  y_pred_test=model.predict(test.features_columns))
+    # Assert
+    assert_that(ctx.prediction_cache_info, none())
+
+
+def test_observed_classes_include_given_predictions(iris_split_dataset_and_model):
+    # Arrange
+    train, _, model = iris_split_dataset_and_model
+    y_pred_train = model.predict(train.features_columns).copy()
+    y_pred_train[0] = 3
+    # Act
+    ctx = Context(train, y_pred_train=y_pred_train)
+    # Assert
+    assert_that(ctx.observed_classes, equal_to([0, 1, 2, 3]))
+
+
+def test_model_predictions_cache_is_thread_safe(iris_split_dataset_and_model):
+    # Arrange
+    _, test, model = iris_split_dataset_and_model
+    ctx = Context(test, model=model)
+    samples = [test.sample(20, random_state=i).features_columns for i in range(16)]
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        probas = list(executor.map(ctx.model.predict_proba, samples))
+    # Assert
+    for sample, proba in zip(samples, probas):
+        assert_that(proba.tolist(), equal_to(model.predict_proba(sample).tolist()))
+    assert_that(ctx.model.predict_proba(test.features_columns).tolist(),
+                equal_to(model.predict_proba(test.features_columns).tolist()))
+    info = ctx.prediction_cache_info
+    assert_that(info['hits'] + info['misses'], equal_to(len(samples) + 1))
+
+
+def test_cached_model_is_picklable(iris_split_dataset_and_model):
+    # Arrange
+    _, test, model = iris_split_dataset_and_model
+    ctx = Context(test, model=model)
+    ctx.model.predict(test.features_columns)
+    # Act
+    cached_model = pickle.loads(pickle.dumps(ctx.model))
+    # Assert
+    assert_that(cached_model.predict(test.features_columns).tolist(),
+                equal_to(model.predict(test.features_columns).tolist()))
+    assert_that(cached_model.cache_info(), has_entries({'hits': 1, 'misses': 1}))
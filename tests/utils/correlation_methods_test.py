@@ -9,8 +9,9 @@
 # ----------------------------------------------------------------------------
 #
 
+import numpy as np
 import pandas as pd
-from hamcrest import assert_that, close_to
+from hamcrest import assert_that, close_to, equal_to
 
 from deepchecks.utils import correlation_methods
 
@@ -68,3 +69,35 @@ def test_correlation_ratio():
     c_sname_size = correlation_methods.correlation_ratio(df['sName'], df['Size'])
     assert_that(c_sname_age, close_to(0, 0.00001))  # sName groups all age values to a single group
     assert_that(c_sname_size, close_to(0, 0.00001))  # sName groups all size values to a single group
+
+
+def test_symmetric_theil_u_matrix_same_as_pairwise():
+    data = pd.DataFrame({'fName': ['Noam', 'Nir', 'Nadav', 'Sol', 'Noam', None],
+                         'lName': ['Shir', 'Matan', 'Matan', None, 'Shir', 'Shir'],
+                         'sName': ['JKL', 'JKL', 'JKL', 'JKL', 'JKL', 'JKL']})
+    codes = np.stack([pd.factorize(data[column])[0] for column in data], axis=1)
+
+    result = correlation_methods.symmetric_theil_u_correlation_matrix(codes)
+
+    for i, j in [(0, 1), (0, 2), (1, 2)]:
+        valid = (codes[:, i] >= 0) & (codes[:, j] >= 0)
+        expected = correlation_methods.symmetric_theil_u_correlation(codes[valid, i], codes[valid, j])
+        assert_that(result[i, j], close_to(expected, 1e-10))
+        assert_that(result[j, i], close_to(expected, 1e-10))
+    assert_that(np.diag(result).tolist(), equal_to([1, 1, 1]))
+    assert_that(correlation_methods.symmetric_theil_u_correlation_matrix(codes, n_jobs=2).tolist(),
+                equal_to(result.tolist()))
+
+
+def test_correlation_ratio_matrix_same_as_pairwise():
+    codes = np.array([[0, 0], [1, 0], [1, -1], [0, 1], [2, 1], [-1, 1]])
+    numerical_data = np.array([[1, 310], [5, 900], [2, np.nan], [3, 300], [4, 290], [np.nan, 1000]])
+
+    result = correlation_methods.correlation_ratio_matrix(codes, numerical_data)
+
+    assert_that(result.shape, equal_to((2, 2)))
+    for i in range(2):
+        for j in range(2):
+            valid = (codes[:, j] >= 0) & ~np.isnan(numerical_data[:, i])
+            expected = correlation_methods.correlation_ratio(codes[valid, j], numerical_data[valid, i])
+            assert_that(result[i, j], close_to(expected, 1e-10))
@@ -0,0 +1,61 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test the hashing of dataframe rows"""
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, equal_to
+
+from deepchecks.utils.row_hashing import hash_column, hash_rows
+
+
+def test_hash_column_by_value_and_nulls():
+    # Arrange
+    numbers = pd.Series([1, 2, None], dtype='Int64')
+    floats = pd.Series([1.0, 2.0, np.nan])
+    objects = pd.Series([True, 2, pd.NA], dtype=object)
+    categories = pd.Series(['a', 'b', None], dtype='category')
+    strings = pd.Series(['a', 'b', np.nan])
+
+    # Act & Assert
+    assert_that(hash_column(numbers).tolist(), equal_to(hash_column(floats).tolist()))
+    assert_that(hash_column(objects).tolist(), equal_to(hash_column(floats).tolist()))
+    assert_that(hash_column(categories).tolist(), equal_to(hash_column(strings).tolist()))
+    assert_that(len(set(hash_column(pd.Series(['1', 1, b'1', 'a\0b', 'a\0c'])).tolist())), equal_to(5))
+
+
+def test_hash_rows_same_as_groupby():
+    # Arrange
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'a': rng.integers(0, 3, 1000), 'b': rng.choice(['x', 'y', None], 1000),
+                       'c': rng.choice([0.5, np.nan], 1000)})
+
+    # Act
+    hashes = hash_rows(df)
+
+    # Assert
+    groups = df.groupby(list(df.columns), dropna=False).ngroup().to_numpy()
+    assert_that(pd.factorize(hashes)[0].tolist(), equal_to(pd.factorize(groups)[0].tolist()))
+    assert_that(hash_rows(df.iloc[::-1]).tolist(), equal_to(hashes[::-1].tolist()))
+
+
+def test_hash_column_of_large_integers():
+    # Arrange
+    ids = [2 ** 53, 2 ** 53 + 1, 2 ** 63 - 1, -2 ** 63]
+    unsigned_ids = [2 ** 63, 2 ** 63 + 1, 2 ** 64 - 1]
+
+    # Act & Assert
+    assert_that(len(set(hash_column(pd.Series(ids)).tolist())), equal_to(4))
+    assert_that(hash_column(pd.Series(ids, dtype=object)).tolist(), equal_to(hash_column(pd.Series(ids)).tolist()))
+    assert_that(len(set(hash_column(pd.Series(unsigned_ids, dtype='uint64')).tolist())), equal_to(3))
+    assert_that(hash_column(pd.Series(unsigned_ids, dtype='uint64')).tolist(),
+                equal_to(hash_column(pd.Series(unsigned_ids, dtype=object)).tolist()))
+    assert_that(hash_column(pd.Series([2 ** 53, 3], dtype='Int64')).tolist(),
+                equal_to(hash_column(pd.Series([2.0 ** 53, 3.0])).tolist()))
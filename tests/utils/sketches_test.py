@@ -0,0 +1,118 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2023 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test drift sketches"""
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, close_to, equal_to, has_length, instance_of, less_than_or_equal_to
+
+from deepchecks.utils.distribution.drift import calc_drift_and_plot
+from deepchecks.utils.distribution.sketches import CategoricalSketch, DriftProfile, NumericSketch, create_sketch
+
+
+def _sketch_of_chunks(column_type, values, n_chunks, **kwargs):
+    sketch = create_sketch(column_type, **kwargs)
+    for chunk in np.array_split(values, n_chunks):
+        sketch = sketch.merge(create_sketch(column_type, chunk, **kwargs))
+    return sketch
+
+
+def _drift_score(train, test, column_type, **kwargs):
+    score, _, _ = calc_drift_and_plot(train, test, 'value', column_type, with_display=False, **kwargs)
+    return score
+
+
+def test_numeric_sketch_is_exact_below_max_size():
+    # Arrange
+    values = np.random.default_rng(0).integers(0, 50, 5000).astype(float)
+    # Act
+    sketch = _sketch_of_chunks('numerical', values, 10, max_size=100)
+    # Assert
+    assert_that(sketch.is_exact, equal_to(True))
+    assert_that(sketch.count, equal_to(5000))
+    for q in (0, 0.1, 0.5, 0.9, 1):
+        assert_that(sketch.quantile(q), close_to(np.quantile(values, q), 1e-9))
+
+
+def test_numeric_sketch_size_is_bounded():
+    # Arrange
+    values = np.random.default_rng(0).normal(size=100_000)
+    # Act
+    sketch = _sketch_of_chunks('numerical', values, 20, max_size=512)
+    # Assert
+    assert_that(sketch.values, has_length(less_than_or_equal_to(512)))
+    assert_that(sketch.count, equal_to(100_000))
+    assert_that(sketch.min, equal_to(values.min()))
+    assert_that(sketch.max, equal_to(values.max()))
+    assert_that(sketch.quantile(0.5), close_to(np.quantile(values, 0.5), 0.02))
+
+
+def test_categorical_sketch_truncates_rare_categories():
+    # Arrange
+    values = pd.Series(['a'] * 50 + ['b'] * 30 + ['c'] * 2 + ['d'] + [None] * 3)
+    # Act
+    sketch = _sketch_of_chunks('categorical', values, 3, max_categories=2)
+    # Assert
+    assert_that(sketch.count(), equal_to(83))
+    assert_that(sketch.count(ignore_na=False), equal_to(86))
+    assert_that(dict(sketch.counts), equal_to({'a': 50, 'b': 30}))
+    assert_that(sketch.truncated_count, equal_to(3))
+
+
+def test_numeric_drift_from_sketches_same_as_from_values():
+    # Arrange
+    rng = np.random.default_rng(0)
+    train = pd.Series(rng.integers(0, 20, 3000).astype(float))
+    test = pd.Series(rng.integers(2, 22, 1000).astype(float))
+    train_sketch = _sketch_of_chunks('numerical', train, 5)
+    test_sketch = create_sketch('numerical', test)
+    # Act & Assert
+    for method in ('KS', 'EMD'):
+        expected = _drift_score(train, test, 'numerical', numerical_drift_method=method)
+        assert_that(_drift_score(train_sketch, test, 'numerical', numerical_drift_method=method),
+                    close_to(expected, 1e-9))
+        assert_that(_drift_score(train_sketch, test_sketch, 'numerical', numerical_drift_method=method),
+                    close_to(expected, 1e-9))
+
+
+def test_categorical_drift_from_sketches_same_as_from_values():
+    # Arrange
+    rng = np.random.default_rng(0)
+    train = pd.Series(rng.choice(['a', 'b', 'c', None], 3000, p=[0.5, 0.3, 0.1, 0.1]))
+    test = pd.Series(rng.choice(['a', 'b', 'c', None], 1000, p=[0.3, 0.3, 0.3, 0.1]))
+    train_sketch = _sketch_of_chunks('categorical', train, 5)
+    # Act & Assert
+    for method in ('cramers_v', 'PSI'):
+        for ignore_na in (True, False):
+            expected = _drift_score(train, test, 'categorical', categorical_drift_method=method, ignore_na=ignore_na)
+            assert_that(_drift_score(train_sketch, test, 'categorical', categorical_drift_method=method,
+                                     ignore_na=ignore_na),
+                        close_to(expected, 1e-9))
+
+
+def test_drift_profile_save_and_load(tmp_path):
+    # Arrange
+    rng = np.random.default_rng(0)
+    profile = DriftProfile(
+        columns={'numeric': create_sketch('numerical', rng.normal(size=100)),
+                 'category': create_sketch('categorical', rng.choice(['a', 'b'], 100))},
+        label=create_sketch('categorical', rng.integers(0, 3, 100))
+    )
+    path = tmp_path / 'profile.json'
+    # Act
+    profile.save(path)
+    loaded = DriftProfile.load(path)
+    # Assert
+    assert_that(loaded.columns['numeric'], instance_of(NumericSketch))
+    assert_that(loaded.columns['category'], instance_of(CategoricalSketch))
+    assert_that(loaded.columns['numeric'].values.tolist(), equal_to(profile.columns['numeric'].values.tolist()))
+    assert_that(dict(loaded.columns['category'].counts), equal_to(dict(profile.columns['category'].counts)))
+    assert_that(dict(loaded.label.counts), equal_to(dict(profile.label.counts)))
+    assert_that(loaded.predictions, equal_to(None))
@@ -8,11 +8,15 @@
 # along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
 # ----------------------------------------------------------------------------
 #
+from unittest.mock import patch
+
 import gower
 import numpy as np
 import pandas as pd
-from hamcrest import assert_that, contains_exactly, equal_to, greater_than, has_item, has_length, less_than_or_equal_to
+from hamcrest import (assert_that, calling, contains_exactly, equal_to, greater_than, has_item, has_length,
+                      less_than_or_equal_to, raises)
 
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils import gower_distance
 
 
@@ -106,3 +110,57 @@ def test_compare_other_package_iris(iris_dataset):
     for i in range(data.shape[0]):
         closest_to_i = gower.gower_topn(data.iloc[i:i + 1, :4], data.iloc[:, :4], n=3)
         assert (closest_to_i['values'].round(5) == dist[i, :]).all()
+
+
+def test_tiled_calculation_same_as_single_tile():
+    # Arrange
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'num1': rng.normal(size=300), 'num2': rng.integers(0, 5, 300).astype(float),
+                         'cat1': rng.choice(['a', 'b', 'c'], 300), 'cat2': rng.choice(['a', 'b', None], 300)})
+    data.loc[rng.random(300) < 0.1, 'num1'] = np.nan
+    # Act
+    dist, idx = gower_distance.calculate_nearest_neighbors_distances(data, ['cat1', 'cat2'], ['num1', 'num2'], 10)
+    tiled_dist, tiled_idx = gower_distance.calculate_nearest_neighbors_distances(
+        data, ['cat1', 'cat2'], ['num1', 'num2'], 10, n_jobs=3, max_tile_size=100)
+    # Assert
+    assert_that(np.array_equal(dist, tiled_dist, equal_nan=True), equal_to(True))
+    assert_that(tiled_idx.shape, equal_to(idx.shape))
+
+
+def test_nearest_neighbors_same_as_full_matrix():
+    # Arrange
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame({'num1': rng.normal(size=100), 'num2': rng.normal(size=100),
+                         'cat1': rng.choice(['a', 'b', 'c'], 100)})
+    # Act
+    dist, idx = gower_distance.calculate_nearest_neighbors_distances(data, ['cat1'], ['num1', 'num2'], 5,
+                                                                     max_tile_size=64)
+    full_matrix = gower_distance.gower_matrix(np.asarray(data[['cat1', 'num1', 'num2']], dtype=object),
+                                              np.array([True, False, False]))
+    # Assert
+    np.testing.assert_allclose(dist, np.sort(full_matrix, axis=1)[:, :5])
+    np.testing.assert_allclose(dist, np.take_along_axis(full_matrix, idx.astype(int), axis=1))
+
+
+def test_tiles_contain_multiple_query_samples():
+    # Arrange
+    rng = np.random.default_rng(2)
+    data = pd.DataFrame({f'num{i}': rng.normal(size=2000) for i in range(8)})
+    data['cat1'] = rng.choice(['a', 'b', 'c'], 2000)
+    data['cat2'] = rng.choice(['a', 'b'], 2000)
+    # Act
+    with patch.object(gower_distance, '_calculate_nearest_neighbors_of_tile',
+                      wraps=gower_distance._calculate_nearest_neighbors_of_tile) as calc_tile:
+        gower_distance.calculate_nearest_neighbors_distances(data, ['cat1', 'cat2'], [f'num{i}' for i in range(8)], 5)
+    # Assert
+    query_tile_sizes = [len(call.kwargs['numeric_samples']) for call in calc_tile.call_args_list]
+    assert_that(sum(query_tile_sizes), equal_to(2000))
+    assert_that(max(query_tile_sizes), greater_than(1))
+    assert_that(len(query_tile_sizes), less_than_or_equal_to(2000 // gower_distance.MIN_QUERY_TILE_SIZE + 1))
+
+
+def test_invalid_n_jobs():
+    data = pd.DataFrame({'col1': [1, 2, 3, 4]})
+    calc_distances = gower_distance.calculate_nearest_neighbors_distances
+    assert_that(calling(calc_distances).with_args(data, [], ['col1'], 2, n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: 0'))
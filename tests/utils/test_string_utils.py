@@ -12,7 +12,7 @@ from datetime import datetime
 
 from hamcrest import assert_that, calling, equal_to, instance_of, matches_regexp, raises
 
-from deepchecks.utils.strings import format_datetime, truncate_string
+from deepchecks.utils.strings import format_datetime, string_baseform, string_baseforms, truncate_string
 
 
 def test_get_ellipsis():
@@ -84,3 +84,11 @@ def test_format_datetime_with_unsupported_value_type():
         calling(format_datetime).with_args('hello'),
         raises(ValueError, r'Unsupported value type - str')
     )
+
+
+def test_string_baseforms_same_as_string_baseform():
+    values = ['Hello-World', 'HELLO world!', '!!', '', 'Café_Ünï', 'İstanbul', None, 3]
+    assert_that(string_baseforms(values), equal_to([string_baseform(value) for value in values]))
+    assert_that(string_baseforms(values, allow_empty_result=True),
+                equal_to([string_baseform(value, allow_empty_result=True) for value in values]))
+    assert_that(string_baseforms(values)[:3], equal_to(['helloworld', 'helloworld', '!!']))
@@ -10,16 +10,21 @@
 #
 #
 from collections import defaultdict
+from unittest.mock import patch
 
 from hamcrest import assert_that, calling, contains_inanyorder, has_length, instance_of, is_, raises
 
 from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.core.errors import DatasetValidationError, DeepchecksNotSupportedError, DeepchecksValueError
 from deepchecks.vision.base_checks import SingleDatasetCheck, TrainTestCheck
+from deepchecks.vision.checks import (ClassPerformance, HeatmapComparison, ImagePropertyDrift, ImagePropertyOutliers,
+                                      LabelDrift, MeanAveragePrecisionReport, PropertyLabelCorrelationChange)
 from deepchecks.vision.datasets.classification import mnist_tensorflow
 from deepchecks.vision.datasets.detection import coco_torch
 from deepchecks.vision.suite import Suite
 from deepchecks.vision.suites.default_suites import full_suite
+from deepchecks.vision.utils.image_properties import default_image_properties
+from deepchecks.vision.vision_data import batch_wrapper
 from tests.common import get_expected_results_length, validate_suite_result
 
 
@@ -281,3 +286,124 @@ def test_single_dataset(coco_visiondata_train, coco_visiondata_test):
     assert_that(res_names, contains_inanyorder(*expected_train_headers))
     assert_that(res_test.results, has_length(16))
     assert_that(res_full.results, has_length(23))
+
+
+def test_suite_execution_with_n_jobs():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+    executions = defaultdict(int)
+    images_seen = []
+
+    class DummyCheck(SingleDatasetCheck):
+        def initialize_run(self, context, dataset_kind: DatasetKind):
+            executions["initialize_run"] += 1
+
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            executions["update"] += 1
+            images_seen.extend(batch.numpy_image_identifiers)
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            executions["compute"] += 1
+            return CheckResult(0)
+
+    class FailingTrainTestCheck(TrainTestCheck):
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            raise DeepchecksValueError('bad update')
+
+        def compute(self, context) -> CheckResult:
+            return CheckResult(1)
+
+    suite = Suite("test", DummyCheck(), FailingTrainTestCheck())
+    args = {'train_dataset': coco_dataset, 'test_dataset': coco_dataset, 'n_jobs': 2, 'prefetch_batches': 1}
+    result = suite.run(**args)
+    length = get_expected_results_length(suite, args)
+    validate_suite_result(result, length)
+
+    assert_that(result.results[0].value, is_(0))
+    assert_that(result.results[2].exception, instance_of(DeepchecksValueError))
+    assert_that(executions, is_({'initialize_run': 2, 'update': 4, 'compute': 2}))
+    assert_that(images_seen, is_([str(i) for i in range(len(images_seen))]))
+
+
+def test_suite_execution_with_n_jobs_same_as_sequential(coco_visiondata_train, coco_visiondata_test):
+    suite = Suite("test", ClassPerformance(), HeatmapComparison(), ImagePropertyOutliers(), LabelDrift(),
+                  MeanAveragePrecisionReport())
+    args = {'train_dataset': coco_visiondata_train, 'test_dataset': coco_visiondata_test, 'with_display': False}
+
+    sequential_result = suite.run(**args)
+    concurrent_result = suite.run(**args, n_jobs=4)
+
+    validate_suite_result(concurrent_result, get_expected_results_length(suite, args))
+    for sequential, concurrent in zip(sequential_result.results, concurrent_result.results):
+        assert_that(concurrent.get_header(), is_(sequential.get_header()))
+        assert_that(concurrent, instance_of(type(sequential)))
+        if isinstance(sequential, CheckResult):
+            assert_that(str(concurrent.value), is_(str(sequential.value)))
+
+
+def test_suite_execution_with_n_jobs_raises_loading_errors():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+
+    class FailingLoader:
+        def __iter__(self):
+            yield next(iter(coco_dataset.batch_loader))
+            raise ValueError('bad batch')
+
+    failing_dataset = coco_dataset.copy(batch_loader=FailingLoader())
+
+    class DummyCheck(SingleDatasetCheck):
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            pass
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(0)
+
+    assert_that(calling(Suite("test", DummyCheck()).run).with_args(failing_dataset, n_jobs=2),
+                raises(ValueError, 'bad batch'))
+
+
+def test_suite_execution_with_n_jobs_raises_non_exception_loading_errors():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+
+    class LoaderInterrupt(BaseException):
+        pass
+
+    class InterruptedLoader:
+        def __iter__(self):
+            yield next(iter(coco_dataset.batch_loader))
+            raise LoaderInterrupt('interrupted')
+
+    interrupted_dataset = coco_dataset.copy(batch_loader=InterruptedLoader())
+
+    class DummyCheck(SingleDatasetCheck):
+        def update(self, context, batch, dataset_kind: DatasetKind):
+            pass
+
+        def compute(self, context, dataset_kind: DatasetKind) -> CheckResult:
+            return CheckResult(0)
+
+    assert_that(calling(Suite("test", DummyCheck()).run).with_args(interrupted_dataset, n_jobs=2),
+                raises(LoaderInterrupt, 'interrupted'))
+
+
+def test_suite_execution_with_invalid_n_jobs():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+    assert_that(calling(full_suite().run).with_args(coco_dataset, n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: 0'))
+
+
+def test_suite_calculates_properties_of_all_checks_once_per_batch():
+    coco_dataset = coco_torch.load_dataset(object_type='VisionData')
+    brightness, area = default_image_properties[:2]
+    suite = Suite("test",
+                  ImagePropertyDrift(image_properties=[brightness]),
+                  ImagePropertyOutliers(image_properties=[brightness, area]),
+                  PropertyLabelCorrelationChange(image_properties=[area]))
+    args = {'train_dataset': coco_dataset, 'test_dataset': coco_dataset, 'with_display': False}
+
+    with patch('deepchecks.vision.vision_data.batch_wrapper.calc_vision_properties',
+               wraps=batch_wrapper.calc_vision_properties) as calc_vision_properties:
+        result = suite.run(**args)
+
+    validate_suite_result(result, get_expected_results_length(suite, args))
+    # for each batch: the images properties and the properties of the objects in the images
+    assert_that(calc_vision_properties.call_count, is_(2 * 2 * len(coco_dataset)))
@@ -10,18 +10,26 @@
 #
 #
 
+import subprocess
+import sys
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 import torch
 from hamcrest import assert_that, calling, equal_to, has_length, is_not, raises
 from torch.utils.data import DataLoader
 
-from deepchecks.core.errors import DatasetValidationError, ValidationError
+from deepchecks.core.errors import DatasetValidationError, DeepchecksValueError, ValidationError
+from deepchecks.vision.checks import ImagePropertyOutliers, LabelDrift
 from deepchecks.vision.datasets.classification.mnist_torch import IterableTorchMnistDataset, collate_without_model
 from deepchecks.vision.datasets.detection import coco_torch
 from deepchecks.vision.datasets.segmentation import segmentation_coco
+from deepchecks.vision.utils.image_properties import calc_default_image_properties, default_image_properties
 from deepchecks.vision.utils.test_utils import replace_collate_fn_dataloader
-from deepchecks.vision.vision_data import TaskType, VisionData
+from deepchecks.vision.utils.vision_properties import PropertiesInputType
+from deepchecks.vision.utils.vision_properties_cache import VisionPropertiesCache
+from deepchecks.vision.vision_data import SampledBatchLoader, TaskType, VisionData
 from deepchecks.vision.vision_data.utils import validate_vision_data_compatibility
 from tests.vision.conftest import run_update_loop
 
@@ -296,3 +304,160 @@ def test_shuffling_tf_dataset(tf_coco_visiondata_train, caplog):
     assert_that(caplog.records[0].message, equal_to('Shuffling for tensorflow datasets is not supported. '
                                                     'Make sure that the data used to create the Dataset was shuffled '
                                                     'beforehand and set shuffle_batch_loader=False'))
+
+
+def _detection_batches_with_identifiers(n_batches, first_identifier=0, seed=0):
+    rng = np.random.default_rng(seed)
+    batches = []
+    for batch_index in range(n_batches):
+        identifiers = [f'image_{first_identifier + batch_index * 4 + i}' for i in range(4)]
+        images = [rng.integers(0, 255, (32, 32, 3)).astype(np.uint8) for _ in range(4)]
+        labels = [np.column_stack([rng.integers(0, 2, 2), rng.integers(0, 16, (2, 4))]).astype(float)
+                  for _ in range(4)]
+        batches.append({'images': images, 'labels': labels, 'image_identifiers': identifiers})
+    return batches
+
+
+def test_properties_cache_calculates_only_new_images(tmp_path):
+    # Arrange
+    batches = _detection_batches_with_identifiers(3)
+    new_batches = batches + _detection_batches_with_identifiers(1, first_identifier=12, seed=1)
+    create_data = lambda loader: VisionData(loader, 'object_detection', reshuffle_data=False,
+                                            properties_cache_dir=tmp_path)
+
+    # Act
+    with patch('deepchecks.vision.vision_data.batch_wrapper.calc_default_image_properties',
+               wraps=calc_default_image_properties) as calc_mock:
+        result = ImagePropertyOutliers().run(create_data(batches))
+        calls_first_run = calc_mock.call_count
+        cached_result = ImagePropertyOutliers().run(create_data(batches))
+        calls_second_run = calc_mock.call_count - calls_first_run
+        calc_mock.reset_mock()
+        ImagePropertyOutliers().run(create_data(new_batches))
+
+    # Assert
+    assert_that(calls_first_run, equal_to(3))
+    assert_that(calls_second_run, equal_to(0))
+    assert_that(sum(len(call.args[0]) for call in calc_mock.call_args_list), equal_to(4))
+    for property_name, value in result.value.items():
+        assert_that(cached_result.value[property_name]['lower_limit'], equal_to(value['lower_limit']))
+        assert_that(cached_result.value[property_name]['upper_limit'], equal_to(value['upper_limit']))
+
+
+def test_properties_cache_of_changed_labels(tmp_path):
+    # Arrange
+    train_batches = _detection_batches_with_identifiers(4)
+    changed_batches = _detection_batches_with_identifiers(4, seed=1)
+    create_data = lambda loader: VisionData(loader, 'object_detection', reshuffle_data=False,
+                                            properties_cache_dir=tmp_path)
+
+    # Act
+    result = LabelDrift().run(create_data(train_batches), create_data(changed_batches))
+    cached_result = LabelDrift().run(create_data(train_batches), create_data(changed_batches))
+    no_cache_result = LabelDrift().run(VisionData(train_batches, 'object_detection', reshuffle_data=False),
+                                       VisionData(changed_batches, 'object_detection', reshuffle_data=False))
+
+    # Assert
+    assert_that(cached_result.value, equal_to(result.value))
+    assert_that(no_cache_result.value, equal_to(result.value))
+
+
+def test_properties_cache_requires_image_identifiers(tmp_path):
+    batches = [{key: value for key, value in batch.items() if key != 'image_identifiers'}
+               for batch in _detection_batches_with_identifiers(1)]
+    assert_that(calling(VisionData).with_args(batches, 'object_detection', properties_cache_dir=tmp_path),
+                raises(DeepchecksValueError, 'properties_cache_dir requires the batches to contain image_identifiers'))
+
+
+@pytest.mark.parametrize('values', [
+    [1.5, None, float('nan'), 3.0],
+    [[1, 2], [], None, [0]],
+    [[1.5, None], [2.5], [], [0.5, 1.5]],
+    ['a', None, 'b', 'c'],
+])
+def test_properties_cache_hit_equals_miss(tmp_path, values):
+    # Arrange
+    keys = [1, 2, 3, 4]
+    VisionPropertiesCache(tmp_path).update('entry', keys, values)
+
+    # Act
+    cached_values = VisionPropertiesCache(tmp_path).get('entry', keys)
+
+    # Assert
+    assert_that(repr(cached_values), equal_to(repr(values)))
+
+
+def test_properties_cache_entries_are_stable_between_processes():
+    # Arrange
+    code = ('from deepchecks.vision.utils.image_properties import default_image_properties;'
+            'from deepchecks.vision.utils.vision_properties import PropertiesInputType;'
+            'from deepchecks.vision.utils.vision_properties_cache import VisionPropertiesCache;'
+            'print(",".join(VisionPropertiesCache.property_entry(PropertiesInputType.IMAGES, prop)'
+            ' for prop in default_image_properties))')
+
+    # Act
+    entries = [subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.strip()
+               for _ in range(2)]
+
+    # Assert
+    expected = ','.join(VisionPropertiesCache.property_entry(PropertiesInputType.IMAGES, prop)
+                        for prop in default_image_properties)
+    assert_that(entries, equal_to([expected, expected]))
+
+
+def test_properties_cache_entries_of_default_properties_calculation():
+    brightness = next(prop for prop in default_image_properties if prop['name'] == 'Brightness')
+    assert_that(VisionPropertiesCache.property_entry(PropertiesInputType.IMAGES, brightness,
+                                                     calc_default_image_properties),
+                is_not(equal_to(VisionPropertiesCache.property_entry(PropertiesInputType.IMAGES, brightness))))
+
+
+class _IndexedClassificationDataset:
+    def __init__(self, labels):
+        self.labels = np.asarray(labels)
+        self.read_indices = []
+
+    def __len__(self):
+        return len(self.labels)
+
+    def get_batch(self, indices):
+        self.read_indices += indices
+        return {'images': [np.full((8, 8, 3), index % 256, dtype=np.uint8) for index in indices],
+                'labels': self.labels[indices].tolist(),
+                'image_identifiers': [str(index) for index in indices]}
+
+
+def test_indexed_dataset_reads_only_sampled_images():
+    # Arrange
+    dataset = _IndexedClassificationDataset(np.arange(10_000) % 3)
+    data = VisionData(dataset, 'classification')
+    dataset.read_indices = []
+
+    # Act
+    ImagePropertyOutliers(n_samples=200).run(data)
+    first_run_indices = dataset.read_indices
+    dataset.read_indices = []
+    ImagePropertyOutliers(n_samples=200).run(data)
+
+    # Assert
+    assert_that(first_run_indices, has_length(256))
+    assert_that(dataset.read_indices, equal_to(first_run_indices))
+    assert_that(first_run_indices, is_not(equal_to(sorted(first_run_indices))))
+
+
+def test_sampled_batch_loader_stratified_order():
+    # Arrange
+    labels = np.random.default_rng(0).choice(['a', 'b', 'c'], 10_000, p=[0.7, 0.2, 0.1])
+    dataset = _IndexedClassificationDataset(labels)
+
+    # Act
+    loader = SampledBatchLoader(dataset, batch_size=10, stratify_by=labels, random_state=0)
+    first_batch = next(iter(loader))
+
+    # Assert
+    assert_that(sorted(loader.indices.tolist()), equal_to(list(range(10_000))))
+    assert_that(sorted(first_batch['labels']), equal_to(['a'] * 7 + ['b'] * 2 + ['c']))
+    for prefix_size in (100, 1000):
+        counts = np.unique(labels[loader.indices[:prefix_size]], return_counts=True)[1]
+        expected_counts = np.unique(labels, return_counts=True)[1] / len(labels) * prefix_size
+        assert_that(np.abs(counts - expected_counts).max() <= 1, equal_to(True))
@@ -10,12 +10,13 @@
 #
 
 import numpy as np
-from hamcrest import (all_of, any_of, assert_that, calling, close_to, has_entries, has_key, has_length, has_properties,
-                      instance_of, is_, raises)
+from hamcrest import (all_of, any_of, assert_that, calling, close_to, equal_to, has_entries, has_key, has_length,
+                      has_properties, instance_of, is_, raises)
 from hamcrest.core.matcher import Matcher
 
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DeepchecksProcessError, NotEnoughSamplesError
+from deepchecks.vision import VisionData
 from deepchecks.vision.checks import ImagePropertyOutliers
 from deepchecks.vision.utils.image_properties import default_image_properties
 
@@ -176,3 +177,22 @@ def test_property_with_nones(mnist_visiondata_train):
             'upper_limit': is_(1)
         })
     }))
+
+
+def test_outliers_of_multiple_batches():
+    # Arrange
+    rng = np.random.default_rng(0)
+    batches = []
+    for batch_index in range(4):
+        images = rng.integers(100, 150, (8, 500, 600, 3)).astype(np.uint8)
+        # a dark image in a different position of each batch
+        images[batch_index] //= 10
+        batches.append({'images': images})
+    data = VisionData(batches, task_type='other')
+    # Act
+    result = ImagePropertyOutliers(n_show_top=2).run(data)
+    # Assert
+    assert_that(sorted(result.value['Brightness']['outliers_identifiers']), equal_to(['0', '18', '27', '9']))
+    assert_that(result.value['Brightness']['lower_limit'], close_to(124.17, 0.01))
+    brightness_display = result.display[0].split('Property "Brightness"')[1].split('<h5><b>Property')[0]
+    assert_that(brightness_display.count('<img'), is_(2))
@@ -9,11 +9,26 @@
 # ----------------------------------------------------------------------------
 #
 """Test functions of the heatmap comparison check."""
-from hamcrest import assert_that, close_to, greater_than, has_length
+import cv2
+import numpy as np
+from hamcrest import assert_that, calling, close_to, equal_to, greater_than, has_length, raises
 
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.vision import VisionData
 from deepchecks.vision.checks import HeatmapComparison
 
 
+def _random_detection_data(seed):
+    rng = np.random.default_rng(seed)
+    batches = []
+    for shape in [(300, 400), (300, 400), (150, 100)]:
+        images = [rng.integers(0, 256, shape + (3,)).astype(np.uint8) for _ in range(5)]
+        labels = [np.column_stack([rng.integers(0, 3, 4), rng.integers(0, shape[1] // 2, (4, 2)),
+                                   rng.integers(5, shape[0] // 2, (4, 2))]).astype(float) for _ in range(5)]
+        batches.append({'images': images, 'labels': labels})
+    return VisionData(batches, task_type='object_detection')
+
+
 def test_object_detection(coco_visiondata_train, coco_visiondata_test):
     # Arrange
     check = HeatmapComparison()
@@ -122,3 +137,54 @@ def test_dataset_name(mnist_visiondata_train, mnist_visiondata_test):
 
     assert_that(result.display[0].layout.annotations[0].text, 'Ref')
     assert_that(result.display[0].layout.annotations[1].text, 'Win')
+
+
+def test_heatmap_size_and_n_jobs():
+    # Arrange
+    train, test = _random_detection_data(0), _random_detection_data(1)
+
+    # Act
+    default_result = HeatmapComparison().run(train, test, with_display=False)
+    parallel_result = HeatmapComparison(n_jobs=2).run(train, test, with_display=False)
+    small_result = HeatmapComparison(heatmap_size=(30, 40), n_jobs=2).run(train, test, with_display=False)
+
+    # Assert
+    assert_that(default_result.value['diff'].shape, equal_to((300, 400, 1)))
+    assert_that(parallel_result.value['diff'].tolist(), equal_to(default_result.value['diff'].tolist()))
+    assert_that(parallel_result.value['diff_bbox'].tolist(), equal_to(default_result.value['diff_bbox'].tolist()))
+    assert_that(small_result.value['diff'].shape, equal_to((30, 40, 1)))
+    assert_that(small_result.value['diff_bbox'].shape, equal_to((30, 40, 1)))
+
+
+def test_default_heatmap_size_resizes_images_at_once():
+    # Arrange
+    image = np.random.default_rng(0).integers(0, 256, (95, 130)).astype(np.uint8)
+    default_check, sized_check = HeatmapComparison(), HeatmapComparison(heatmap_size=(30, 40))
+    default_check._shape = sized_check._shape = (40, 30)  # pylint: disable=protected-access
+
+    # Act
+    default_heatmap = default_check._to_heatmap_shape(image)  # pylint: disable=protected-access
+    sized_heatmap = sized_check._to_heatmap_shape(image)  # pylint: disable=protected-access
+
+    # Assert
+    assert_that(default_heatmap.tolist(), equal_to(cv2.resize(image, (40, 30), interpolation=cv2.INTER_AREA).tolist()))
+    assert_that(sized_heatmap.shape, equal_to((30, 40)))
+
+
+def test_label_to_image_same_as_filling_each_bbox():
+    # Arrange
+    label = np.array([[0, 5, 5, 10, 20], [1, 10, 12, 30, 4], [2, -5, 40, 12.7, 30], [0, 70, 3, 5, 5], [1, 8, 8, 0, 5]])
+    expected_image = np.zeros((50, 60), dtype=np.uint8)
+    for _, x, y, width, height in label:
+        expected_image[max(int(y), 0):max(int(y + height), 0), max(int(x), 0):max(int(x + width), 0)] = 255
+
+    # Act
+    image = HeatmapComparison()._label_to_image(label, (50, 60))  # pylint: disable=protected-access
+
+    # Assert
+    assert_that(image[:, :, 0].tolist(), equal_to(expected_image.tolist()))
+
+
+def test_invalid_n_jobs():
+    assert_that(calling(HeatmapComparison).with_args(n_jobs=0),
+                raises(DeepchecksValueError, 'n_jobs must be a positive integer or -1, but got: 0'))
@@ -10,8 +10,11 @@
 #
 """Test functions of the VISION label drift."""
 import numpy as np
-from hamcrest import assert_that, close_to, equal_to, greater_than, has_entries, has_length
+from hamcrest import assert_that, calling, close_to, equal_to, greater_than, has_entries, has_length, raises
 
+from deepchecks.core import DatasetKind
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.vision import VisionData
 from deepchecks.vision.checks import ImageDatasetDrift
 from deepchecks.vision.datasets.detection.coco_torch import collate_without_model
 from deepchecks.vision.utils.test_utils import replace_collate_fn_visiondata
@@ -153,3 +156,31 @@ def test_with_drift_rgb(coco_visiondata_train, coco_visiondata_test):
         name=f'Drift score is less than 0.1',
         details=f'Drift score 0.955 is not less than 0.1',
     ))
+
+
+def _batches_with_embeddings(n_batches, embedding_shift, seed):
+    rng = np.random.default_rng(seed)
+    return [{'images': rng.integers(0, 256, (16, 8, 8, 3)).astype(np.uint8),
+             'embeddings': rng.normal(size=(16, 4)) + [embedding_shift, 0, 0, 0]}
+            for _ in range(n_batches)]
+
+
+def test_drift_of_embeddings_in_reservoir():
+    # Arrange
+    train = VisionData(_batches_with_embeddings(20, 0, seed=0), task_type='other', reshuffle_data=False)
+    test = VisionData(_batches_with_embeddings(20, 3, seed=1), task_type='other', reshuffle_data=False)
+    check = ImageDatasetDrift(reservoir_size=100, use_embeddings=True, n_samples=None)
+
+    # Act
+    result = check.run(train, test)
+
+    # Assert
+    assert_that(check._reservoirs[DatasetKind.TRAIN].samples, has_length(100))
+    assert_that(result.value['domain_classifier_drift_score'], greater_than(0.8))
+    feature_importance = result.value['domain_classifier_feature_importance']
+    assert_that(max(feature_importance, key=feature_importance.get), equal_to('Embedding 0'))
+
+
+def test_invalid_reservoir_size():
+    assert_that(calling(ImageDatasetDrift).with_args(reservoir_size=0),
+                raises(DeepchecksValueError, 'reservoir_size must be a positive integer, but got: 0'))
@@ -11,7 +11,7 @@
 from typing import Dict
 
 import numpy as np
-from hamcrest import assert_that, close_to, has_items, has_length
+from hamcrest import assert_that, close_to, equal_to, has_items, has_length
 from ignite.engine import Engine
 from ignite.metrics import Metric
 from numpy import nanmean
@@ -20,6 +20,8 @@ from sklearn.metrics import jaccard_score, make_scorer
 from deepchecks.vision import VisionData
 from deepchecks.vision.metrics_utils import get_scorers_dict
 from deepchecks.vision.metrics_utils.detection_precision_recall import ObjectDetectionAveragePrecision
+from deepchecks.vision.metrics_utils.iou_utils import compute_best_matches, compute_pairwise_ious, jaccard_iou
+from deepchecks.vision.metrics_utils.semantic_segmentation_metric_utils import segmentation_counts_per_sample
 from deepchecks.vision.metrics_utils.semantic_segmentation_metrics import MeanDice, MeanIoU, per_sample_dice
 from deepchecks.vision.vision_data.utils import sequence_to_numpy
 
@@ -135,6 +137,26 @@ def test_per_sample_dice(segmentation_coco_visiondata_train):
     assert_that(sum(res), close_to(9.513, 0.001))
 
 
+def test_segmentation_counts_same_as_onehot_masks():
+    # Arrange
+    rng = np.random.default_rng(0)
+    labels = [rng.integers(0, 5, (20, 30)) for _ in range(3)]
+    # class 5 is not predicted, so it is not counted
+    labels[0][:2] = 5
+    predictions = [rng.random((5, 20, 30)) for _ in range(3)]
+
+    # Act
+    tp_count, label_count, pred_count = segmentation_counts_per_sample(labels, predictions, threshold=0.5)
+
+    # Assert
+    for index, (label, prediction) in enumerate(zip(labels, predictions)):
+        label_onehot = np.stack([label == class_id for class_id in range(5)])
+        pred_onehot = prediction > 0.5
+        assert_that(tp_count[index].tolist(), equal_to((label_onehot & pred_onehot).sum(axis=(1, 2)).tolist()))
+        assert_that(label_count[index].tolist(), equal_to(label_onehot.sum(axis=(1, 2)).tolist()))
+        assert_that(pred_count[index].tolist(), equal_to(pred_onehot.sum(axis=(1, 2)).tolist()))
+
+
 def test_string_metric_classification(mnist_visiondata_test):
     metric_dict = get_scorers_dict(mnist_visiondata_test, {'acc': 'accuracy'})
     res = calculate_metrics(metric_dict, mnist_visiondata_test)
@@ -146,3 +168,60 @@ def test_scorer_metric_classification(mnist_visiondata_test):
     metric_dict = get_scorers_dict(mnist_visiondata_test, {'kappa': scorer})
     res = calculate_metrics(metric_dict, mnist_visiondata_test)
     assert_that(np.mean(list(res['kappa'].values())), close_to(0.976, 0.001))
+
+
+def _random_boxes(rng, n_boxes):
+    detected = np.column_stack([rng.integers(0, 100, (n_boxes, 2)), rng.integers(1, 60, (n_boxes, 2)),
+                                rng.random(n_boxes), np.zeros(n_boxes)])
+    ground_truth = np.column_stack([np.zeros(n_boxes), rng.integers(0, 100, (n_boxes, 2)),
+                                    rng.integers(1, 60, (n_boxes, 2))])
+    # detections which are exactly the ground truth, for ties of the ious
+    detected[:n_boxes // 4, :4] = ground_truth[:n_boxes // 4, 1:]
+    return detected, ground_truth
+
+
+def _sequential_best_matches(ious, min_iou, ground_truth_to_ignore):
+    detection_matches = -np.ones(len(ious), dtype=int)
+    for d_idx in range(len(ious)):
+        best_iou = min(min_iou, 1 - 1e-10)
+        best_match = -1
+        for g_idx in range(ious.shape[1]):
+            if g_idx in detection_matches:
+                continue
+            if best_match > -1 and ground_truth_to_ignore[g_idx]:
+                break
+            if ious[d_idx, g_idx] >= best_iou:
+                best_iou = ious[d_idx, g_idx]
+                best_match = g_idx
+        detection_matches[d_idx] = best_match
+    return detection_matches
+
+
+def test_pairwise_ious_same_as_jaccard_iou():
+    # Arrange
+    detected, ground_truth = _random_boxes(np.random.default_rng(0), 50)
+
+    # Act
+    ious = compute_pairwise_ious(detected, ground_truth, jaccard_iou)
+    sequential_ious = compute_pairwise_ious(detected, ground_truth, lambda dt, gt: jaccard_iou(dt, gt))
+
+    # Assert
+    assert_that(ious.tolist(), equal_to(sequential_ious.tolist()))
+    assert_that(compute_pairwise_ious([], ground_truth, jaccard_iou).shape, equal_to((0, 50)))
+
+
+def test_best_matches_same_as_sequential_matching():
+    # Arrange
+    rng = np.random.default_rng(0)
+    detected, ground_truth = _random_boxes(rng, 50)
+    ious = compute_pairwise_ious(detected, ground_truth, jaccard_iou)
+    ground_truth_to_ignore = np.arange(50) >= 40
+    iou_thresholds = np.linspace(0.5, 0.95, 10)
+
+    # Act
+    matches = compute_best_matches(ious, iou_thresholds, ground_truth_to_ignore)
+
+    # Assert
+    for iou_i, min_iou in enumerate(iou_thresholds):
+        assert_that(matches[iou_i].tolist(),
+                    equal_to(_sequential_best_matches(ious, min_iou, ground_truth_to_ignore).tolist()))
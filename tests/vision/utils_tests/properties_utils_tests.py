@@ -9,13 +9,14 @@
 # ----------------------------------------------------------------------------
 #
 # pylint: disable=inconsistent-quotes, redefined-builtin
+import numpy as np
 from hamcrest import assert_that, calling, close_to, contains_exactly, equal_to, is_, raises
 
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.vision import Suite
 from deepchecks.vision.checks import ImagePropertyOutliers
-from deepchecks.vision.utils.image_properties import (calc_default_image_properties, default_image_properties,
-                                                      texture_level)
+from deepchecks.vision.utils.image_properties import (brightness, calc_default_image_properties,
+                                                      default_image_properties, texture_level)
 from deepchecks.vision.utils.label_prediction_properties import (DEFAULT_CLASSIFICATION_LABEL_PROPERTIES,
                                                                  DEFAULT_CLASSIFICATION_PREDICTION_PROPERTIES,
                                                                  DEFAULT_OBJECT_DETECTION_LABEL_PROPERTIES,
@@ -134,3 +135,20 @@ def test_suite_different_properties_per_check(coco_visiondata_train):
     result = suite.run(coco_visiondata_train)
     assert_that(list(result.results[0].value.keys()), contains_exactly('texture'))
     assert_that(sorted(result.results[1].value.keys()), equal_to(sorted(x['name'] for x in default_image_properties)))
+
+
+def test_image_properties_of_stacked_batch_same_as_per_image():
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, 256, (40, 50, 3)).astype(np.uint8) for _ in range(6)]
+    np.random.seed(0)
+    batch_results = calc_default_image_properties(images)
+    batch_results['Texture Level'] = texture_level(images)
+    batch_results['Brightness'] = brightness(images)
+    np.random.seed(0)
+    per_image_results = [calc_default_image_properties([image]) for image in images]
+    for image, result in zip(images, per_image_results):
+        result['Texture Level'] = texture_level([image])
+        result['Brightness'] = brightness([image])
+    for name, values in batch_results.items():
+        for index, value in enumerate(values):
+            assert_that(value, close_to(per_image_results[index][name][0], 1e-9))